@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for Ark Settings Generator
+
+Times the paths users wait on and writes the numbers to JSON:
+
+    python bench.py --output results.json
+    python bench.py --quick --only import,generate
+    python bench.py compare old.json new.json --threshold 0.2
+
+Benchmarks:
+    cold_start_engine   fresh interpreter: import engine and write one INI pair
+    cold_start_gui      fresh interpreter: import the GUI module (no window)
+    gui_tabs_basic      build the app window with the Basic tabs
+    gui_tabs_advanced   switch the window to the Advanced tabs
+    calculations        calculation_inputs + calculate, per call
+    import_ini          load_ini_files on a synthetic Game.ini with spawn containers
+    generate_ini        render and write one INI pair (changed and unchanged)
+    emit_ini            render a Game.ini section of mixed synthetic values, per key/value pair
+    generate_fleet      batch-generate a synthetic fleet of servers
+    rcon_push           push admin commands to stand-in RCON servers at once
+
+The GUI benchmarks need a display. Without DISPLAY they run under Xvfb when it
+is installed, and are reported as skipped otherwise.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(os.path.dirname(BENCH_DIR), 'source')
+if SOURCE_DIR not in sys.path:
+    sys.path.insert(0, SOURCE_DIR)
+
+import corpus
+import engine
+from version import __version__
+
+RESULTS_FORMAT = 1
+
+# Corpus sizes: (spawn container lines, fleet servers)
+FULL_SIZES = (100000, 10000)
+QUICK_SIZES = (5000, 50)
+
+
+def summarize(samples_ms, operations=1):
+    """Summarize timing samples in ms; operations is the work done per sample"""
+    median = statistics.median(samples_ms)
+    return {
+        'runs': len(samples_ms),
+        'min_ms': round(min(samples_ms), 4),
+        'median_ms': round(median, 4),
+        'mean_ms': round(statistics.fmean(samples_ms), 4),
+        'max_ms': round(max(samples_ms), 4),
+        'ops_per_s': round(operations / (median / 1000), 1) if median else None,
+    }
+
+
+def measure(func, repeat=5, operations=1, setup=None):
+    """Run func `repeat` times (setup untimed before each run) and summarize"""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples, operations)
+
+
+def skipped(reason):
+    return {'skipped': reason}
+
+
+def _run_python(code, args=()):
+    subprocess.run([sys.executable, '-c', code] + list(args), cwd=SOURCE_DIR, check=True,
+                   stdout=subprocess.DEVNULL)
+
+
+def bench_cold_start(context):
+    code = ("import sys, engine\n"
+            "engine.emit_files(engine.load_defaults(), 'advanced', sys.argv[1])\n")
+    directory = os.path.join(context['workdir'], 'cold')
+    return {
+        'cold_start_engine': measure(lambda: _run_python(code, [directory]), context['repeat']),
+        'cold_start_gui': measure(lambda: _run_python('import main'), context['repeat']),
+    }
+
+
+def bench_calculations(context):
+    settings = engine.load_defaults()
+    names = ['Argentavis', 'Rex', 'Giga', 'Unknown']
+    calls = context['calculations']
+
+    def run():
+        for index in range(calls):
+            engine.calculate(engine.calculation_inputs(settings), names[index % len(names)])
+    return {'calculations': measure(run, context['repeat'], operations=calls)}
+
+
+def bench_import(context):
+    workdir = context['workdir']
+    gus = corpus.write_game_user_settings(os.path.join(workdir, 'GameUserSettings.ini'))
+    game = corpus.write_game_ini(os.path.join(workdir, 'Game.ini'), context['spawn_lines'])
+    result = measure(lambda: engine.load_ini_files(engine.load_defaults(), gus, game),
+                     context['repeat'], operations=context['spawn_lines'])
+    result['spawn_lines'] = context['spawn_lines']
+    result['bytes'] = os.path.getsize(gus) + os.path.getsize(game)
+    return {'import_ini': result}
+
+
+def bench_generate(context):
+    import batch
+
+    directory = os.path.join(context['workdir'], 'generate')
+    settings = engine.load_defaults()
+    toggle = [0]
+
+    def change():
+        toggle[0] += 1
+        settings[engine.SERVER_SECTION]['ServerName'] = f"Bench {toggle[0]}"
+
+    results = {
+        'generate_ini': measure(lambda: engine.emit_files(settings, 'advanced', directory),
+                                context['repeat'], setup=change),
+        'generate_ini_unchanged': measure(lambda: engine.emit_files(settings, 'advanced', directory),
+                                          context['repeat']),
+    }
+
+    servers = context['fleet_servers']
+    manifest_path = corpus.write_fleet(os.path.join(context['workdir'], 'fleet'), servers)
+    manifest = batch.load_manifest(manifest_path)
+    # A fleet run is long, so it is timed once; the second run hits the unchanged path
+    report = batch.run_batch(manifest, context['workers'])
+    results['generate_fleet'] = summarize([report.elapsed_ms], servers)
+    results['generate_fleet'].update(servers=servers, workers=report.workers,
+                                     errors=sum(1 for r in report.results if r.error))
+    report = batch.run_batch(manifest, context['workers'])
+    results['generate_fleet_unchanged'] = summarize([report.elapsed_ms], servers)
+    return results
+
+
+def bench_emit(context):
+    pairs = context['emit_pairs']
+    values = corpus.section_values(pairs)
+    keys = list(values)
+    result = measure(lambda: engine.render_section(values, engine.GAME_SECTION, keys),
+                     context['repeat'], operations=pairs)
+    result['pairs'] = pairs
+    return {'emit_ini': result}
+
+
+def bench_rcon(context):
+    import asyncio
+    import rcon
+    import rcon_server
+
+    servers = context['rcon_servers']
+    commands = ['Broadcast Rates changed', rcon.RELOAD_DYNAMIC_CONFIG, 'SaveWorld']
+
+    async def run():
+        stand_ins = await rcon_server.start_servers(servers, 'bench')
+        targets = [rcon.RconTarget(f'server-{i}', '127.0.0.1', server.port, 'bench')
+                   for i, server in enumerate(stand_ins)]
+        samples = []
+        errors = 0
+        try:
+            for _ in range(context['repeat']):
+                report = await rcon.push_async(targets, commands)
+                samples.append(report.elapsed_ms)
+                errors += sum(1 for result in report.results if result.error)
+        finally:
+            for server in stand_ins:
+                await server.stop()
+        return samples, errors
+
+    # Every push opens fresh connections, so the numbers include connect and auth
+    samples, errors = asyncio.run(run())
+    result = summarize(samples, servers)
+    result.update(servers=servers, commands=len(commands), errors=errors)
+    return {'rcon_push': result}
+
+
+def _start_virtual_display():
+    """Start Xvfb on a free display; returns the process or None"""
+    xvfb = shutil.which('Xvfb')
+    if not xvfb:
+        return None
+    for number in range(90, 100):
+        if os.path.exists(f'/tmp/.X{number}-lock'):
+            continue
+        process = subprocess.Popen([xvfb, f':{number}', '-screen', '0', '1920x1080x24', '-nolisten', 'tcp'],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(50):
+            if os.path.exists(f'/tmp/.X11-unix/X{number}'):
+                os.environ['DISPLAY'] = f':{number}'
+                return process
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+        process.terminate()
+    return None
+
+
+def bench_gui(context):
+    xvfb = None
+    if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+        xvfb = _start_virtual_display()
+        if xvfb is None:
+            reason = "no DISPLAY and Xvfb is not installed"
+            return {'gui_tabs_basic': skipped(reason), 'gui_tabs_advanced': skipped(reason),
+                    'gui_calculations': skipped(reason)}
+    try:
+        import tkinter as tk
+        import main
+
+        basic = []
+        advanced = []
+        calculations = []
+        for _ in range(context['repeat']):
+            root = tk.Tk()
+            app = None
+            try:
+                start = time.perf_counter()
+                app = main.ArkSettingsGenerator(root)
+                root.update_idletasks()
+                basic.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                app.mode.set('advanced')
+                app.switch_mode()
+                root.update_idletasks()
+                advanced.append((time.perf_counter() - start) * 1000)
+
+                start = time.perf_counter()
+                for _ in range(100):
+                    app.update_calculations()
+                calculations.append((time.perf_counter() - start) * 1000)
+            finally:
+                if app is not None:
+                    app.scheduler.close()
+                root.destroy()
+        return {
+            'gui_tabs_basic': summarize(basic),
+            'gui_tabs_advanced': summarize(advanced),
+            'gui_calculations': summarize(calculations, 100),
+        }
+    except tk.TclError as e:
+        reason = f"Tk unavailable: {e}"
+        return {'gui_tabs_basic': skipped(reason), 'gui_tabs_advanced': skipped(reason),
+                'gui_calculations': skipped(reason)}
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait()
+            os.environ.pop('DISPLAY', None)
+
+
+# Benchmark group name -> function returning {benchmark name: result}
+BENCHMARKS = {
+    'cold_start': bench_cold_start,
+    'gui': bench_gui,
+    'calculations': bench_calculations,
+    'import': bench_import,
+    'generate': bench_generate,
+    'emit': bench_emit,
+    'rcon': bench_rcon,
+}
+
+
+def metadata():
+    """Describe the machine and build the results came from"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'format': RESULTS_FORMAT,
+        'version': __version__,
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def run_suite(groups=None, quick=False, repeat=None, workers=1, workdir=None):
+    """
+    Run benchmark groups and return the results document.
+
+    Args:
+        groups: Names from BENCHMARKS to run (default: all)
+        quick: Use small corpora and fewer repeats, e.g. for CI smoke runs
+        repeat: Timed runs per benchmark (default 5, or 3 when quick)
+        workers: Worker processes for the fleet benchmark
+        workdir: Folder for generated corpora (default: a temporary folder)
+
+    Returns:
+        {'meta': {...}, 'sizes': {...}, 'results': {name: summary}}
+    """
+    spawn_lines, fleet_servers = QUICK_SIZES if quick else FULL_SIZES
+    with tempfile.TemporaryDirectory(prefix='ark-bench-') as temp_dir:
+        context = {
+            'workdir': workdir or temp_dir,
+            'repeat': repeat or (3 if quick else 5),
+            'spawn_lines': spawn_lines,
+            'fleet_servers': fleet_servers,
+            'calculations': 1000 if quick else 10000,
+            'emit_pairs': 10000 if quick else 100000,
+            'rcon_servers': 50 if quick else 250,
+            'workers': workers,
+        }
+        os.makedirs(context['workdir'], exist_ok=True)
+        results = {}
+        for name in groups or BENCHMARKS:
+            results.update(BENCHMARKS[name](context))
+    return {
+        'meta': metadata(),
+        'sizes': {'spawn_lines': spawn_lines, 'fleet_servers': fleet_servers},
+        'results': results,
+    }
+
+
+def compare(old, new, threshold=0.2):
+    """
+    Compare two results documents by median time.
+
+    Returns:
+        (lines, regressions) where regressions lists benchmarks whose median
+        grew by more than threshold (0.2 = 20%)
+    """
+    lines = []
+    regressions = []
+    for name, result in new['results'].items():
+        before = old['results'].get(name, {})
+        if 'median_ms' not in result or 'median_ms' not in before:
+            lines.append(f"{name:<28} {'n/a':>12}")
+            continue
+        change = (result['median_ms'] - before['median_ms']) / before['median_ms'] if before['median_ms'] else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        lines.append(f"{name:<28} {before['median_ms']:10.2f} ms -> {result['median_ms']:10.2f} ms "
+                     f"({change:+.1%}){flag}")
+    return lines, regressions
+
+
+def format_results(document):
+    lines = []
+    for name, result in document['results'].items():
+        if 'skipped' in result:
+            lines.append(f"{name:<28} skipped: {result['skipped']}")
+        else:
+            rate = f"{result['ops_per_s']:>14,.0f} ops/s" if result['ops_per_s'] else ''
+            lines.append(f"{name:<28} {result['median_ms']:10.2f} ms median  {rate}")
+    return '\n'.join(lines)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Ark Settings Generator benchmarks")
+    commands = parser.add_subparsers(dest='command')
+
+    compare_parser = commands.add_parser('compare', help="Compare two results files")
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help="Slowdown that counts as a regression (default 0.2 = 20%%)")
+
+    parser.add_argument('--output', help="Write results JSON here (default: print only)")
+    parser.add_argument('--only', help=f"Comma-separated groups: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--quick', action='store_true', help="Small corpora and fewer repeats")
+    parser.add_argument('--repeat', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes for the fleet benchmark")
+    parser.add_argument('--workdir', help="Keep generated corpora in this folder")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == 'compare':
+        with open(args.old, 'r', encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args.new, 'r', encoding='utf-8') as f:
+            new = json.load(f)
+        lines, regressions = compare(old, new, args.threshold)
+        print('\n'.join(lines))
+        return 1 if regressions else 0
+
+    groups = args.only.split(',') if args.only else None
+    unknown = set(groups or ()) - set(BENCHMARKS)
+    if unknown:
+        print(f"Unknown benchmark groups: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+    document = run_suite(groups, args.quick, args.repeat, args.workers, args.workdir)
+    print(format_results(document))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
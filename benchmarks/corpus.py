@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Synthetic corpus generator for the Ark Settings Generator benchmarks
+
+Writes inputs that look like real server files, only much bigger:
+
+    python corpus.py game-ini --lines 100000 corpus/Game.ini
+    python corpus.py game-user-settings corpus/GameUserSettings.ini
+    python corpus.py fleet --servers 10000 corpus/fleet
+
+Output is deterministic for a given --seed so runs can be compared.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'source')
+if SOURCE_DIR not in sys.path:
+    sys.path.insert(0, SOURCE_DIR)
+
+import schema
+
+CREATURES = (
+    'Rex', 'Raptor', 'Argent', 'Spino', 'Giga', 'Trike', 'Stego', 'Ptero', 'Carno', 'Allo',
+    'Thyla', 'Theri', 'Yutyrannus', 'Megalodon', 'Mosa', 'Plesiosaur', 'Dodo', 'Parasaur',
+)
+SPAWN_KEYS = (
+    'ConfigOverrideNPCSpawnEntriesContainer',
+    'ConfigAddNPCSpawnEntriesContainer',
+    'ConfigSubtractNPCSpawnEntriesContainer',
+)
+
+
+def spawn_container_line(rng, index):
+    """Return one spawn container override line with nested entries"""
+    creature = rng.choice(CREATURES)
+    entries = ','.join(
+        f'(AnEntryName="{creature}{index}_{n}",EntryWeight={rng.uniform(0.01, 1.0):.3f},'
+        f'NPCsToSpawnStrings=("{creature}_Character_BP_C"))'
+        for n in range(rng.randint(1, 3)))
+    return (f'{rng.choice(SPAWN_KEYS)}=(NPCSpawnEntriesContainerClassString='
+            f'"DinoSpawnEntries_{creature}{index}_C",NPCSpawnEntries=({entries}),'
+            f'NPCSpawnLimits=((NPCClassString="{creature}_Character_BP_C",'
+            f'MaxPercentageOfDesiredNumToAllow={rng.uniform(0.01, 0.5):.3f})))')
+
+
+def _random_value(rng, setting):
+    if setting.type is bool:
+        return rng.choice(('True', 'False', 'true', 'false'))
+    if setting.type is int:
+        return str(rng.randint(0, max(int(setting.default) * 2, 10)))
+    if setting.type is float:
+        return f'{rng.uniform(0.1, 10.0):.6f}'
+    return setting.default
+
+
+def _random_case(rng, key):
+    # Real files mix CamelCase and lowercase spellings of the same key
+    return key.lower() if rng.random() < 0.1 else key
+
+
+def write_game_ini(path, lines=100000, seed=0):
+    """Write a Game.ini with every schema key plus `lines` spawn container lines"""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('[/Script/ShooterGame.ShooterGameMode]\n')
+        for setting in schema.section_settings(schema.GAME_SECTION):
+            f.write(f'{_random_case(rng, setting.key)}={_random_value(rng, setting)}\n')
+        for index in range(lines):
+            f.write(spawn_container_line(rng, index) + '\n')
+            if index % 5000 == 0:
+                f.write('; generated block\n')
+    return path
+
+
+def write_game_user_settings(path, seed=0):
+    """Write a GameUserSettings.ini with every schema key and unrelated sections"""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('[SessionSettings]\nSessionName=Benchmark\nPort=7777\n\n')
+        f.write('[ServerSettings]\n')
+        for setting in schema.section_settings(schema.SERVER_SECTION):
+            f.write(f'{_random_case(rng, setting.key)}={_random_value(rng, setting)}\n')
+        f.write('\n[/Script/Engine.GameSession]\nMaxPlayers=70\n')
+    return path
+
+
+def section_values(pairs=100000, seed=0):
+    """Return a key -> value mapping of `pairs` typed values as the emitter sees them"""
+    rng = random.Random(seed)
+    values = {}
+    for index in range(pairs):
+        kind = index % 5
+        if kind == 0:
+            value = rng.random() < 0.5
+        elif kind == 1:
+            value = rng.randint(0, 5000)
+        elif kind == 2:
+            value = round(rng.uniform(0.0001, 100.0), rng.randint(1, 6))
+        elif kind == 3:
+            value = f'Server {index}'
+        else:
+            # Repeated key: a few spawn container values written as one line each
+            value = [spawn_container_line(rng, index * 3 + n) for n in range(3)]
+        values[f'BenchKey{index}'] = value
+    return values
+
+
+def fleet_manifest(servers=10000, seed=0, output_dir='servers'):
+    """Return a cluster manifest with `servers` servers that differ in a few settings"""
+    rng = random.Random(seed)
+    multipliers = [setting.key for setting in schema.SETTINGS
+                   if setting.type is float and setting.section == schema.SERVER_SECTION]
+    manifest = {
+        'mode': 'advanced',
+        'output_dir': output_dir,
+        'base': {'XPMultiplier': 2.0, 'TamingSpeedMultiplier': 3.0},
+        'servers': [],
+    }
+    for index in range(servers):
+        overrides = {
+            'ServerName': f'Benchmark Server {index:05d}',
+            'RCONPort': 27020 + index % 1000,
+            'MaxPlayers': rng.choice((10, 20, 40, 70)),
+        }
+        for key in rng.sample(multipliers, 3):
+            overrides[key] = round(rng.uniform(0.5, 5.0), 3)
+        manifest['servers'].append({'name': f'server-{index:05d}', 'overrides': overrides})
+    return manifest
+
+
+def write_fleet(directory, servers=10000, seed=0):
+    """Write fleet.json (output into directory/servers) and return its path"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, 'fleet.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(fleet_manifest(servers, seed), f, indent=1)
+    return path
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Generate synthetic benchmark inputs")
+    parser.add_argument('--seed', type=int, default=0)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    game = commands.add_parser('game-ini', help="Game.ini with many spawn container lines")
+    game.add_argument('path')
+    game.add_argument('--lines', type=int, default=100000)
+
+    gus = commands.add_parser('game-user-settings', help="GameUserSettings.ini with every key")
+    gus.add_argument('path')
+
+    fleet = commands.add_parser('fleet', help="Cluster manifest for a fleet of servers")
+    fleet.add_argument('directory')
+    fleet.add_argument('--servers', type=int, default=10000)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == 'game-ini':
+        print(write_game_ini(args.path, args.lines, args.seed))
+    elif args.command == 'game-user-settings':
+        print(write_game_user_settings(args.path, args.seed))
+    else:
+        print(write_fleet(args.directory, args.servers, args.seed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Cluster batch generation for Ark Settings Generator
+
+Reads a cluster manifest and writes one GameUserSettings.ini/Game.ini pair per
+server on a process pool. A manifest is a JSON file such as:
+
+    {
+        "mode": "advanced",
+        "output_dir": "cluster",
+        "base": {"DifficultyOffset": 1.0, "XPMultiplier": 2.0},
+        "servers": [
+            {"name": "island", "overrides": {"ServerName": "Island", "RCONPort": 27020}},
+            {"name": "scorched", "overrides": {"ServerName": "Scorched", "RCONPort": 27021}}
+        ]
+    }
+
+Each server is written to <output_dir>/<name>/. Servers may also name a JSON
+"profile" file whose overrides are applied before their inline "overrides", and
+the manifest may name a "base_profile" applied before "base". Relative paths
+are resolved against the manifest's folder.
+"""
+
+import collections
+import copy
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import engine
+
+ServerResult = collections.namedtuple('ServerResult', ['name', 'paths', 'changed', 'elapsed_ms', 'error'])
+BatchReport = collections.namedtuple('BatchReport', ['results', 'elapsed_ms', 'workers'])
+
+# Settings shared by every job in a worker process, built once by _init_worker
+_worker_base = None
+_worker_mode = 'advanced'
+
+
+def load_manifest(path):
+    """Load and normalize a cluster manifest from a JSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    folder = os.path.dirname(os.path.abspath(path))
+    manifest.setdefault('mode', 'advanced')
+    manifest.setdefault('base', {})
+    manifest['output_dir'] = os.path.join(folder, manifest.get('output_dir', '.'))
+    if manifest.get('base_profile'):
+        manifest['base_profile'] = os.path.join(folder, manifest['base_profile'])
+
+    names = set()
+    for server in manifest.get('servers', []):
+        name = server.get('name')
+        if not name:
+            raise ValueError("Every server in the manifest needs a name")
+        if name in names:
+            raise ValueError(f"Duplicate server name in manifest: {name}")
+        names.add(name)
+        server.setdefault('overrides', {})
+        if server.get('profile'):
+            server['profile'] = os.path.join(folder, server['profile'])
+    return manifest
+
+
+def resolve_base(manifest):
+    """Return the manifest's base overrides, with its base_profile applied first"""
+    if not manifest.get('base_profile'):
+        return manifest['base']
+    base = engine.load_profile(manifest['base_profile'])
+    base.update(manifest['base'])
+    return base
+
+
+def build_jobs(manifest, names=None):
+    """
+    Return (name, profile, overrides, directory) tuples for the servers in a manifest.
+
+    Args:
+        manifest: Manifest mapping as returned by load_manifest()
+        names: Only include these server names (default: every server)
+    """
+    return [
+        (server['name'], server.get('profile'), server['overrides'],
+         os.path.join(manifest['output_dir'], server['name']))
+        for server in manifest.get('servers', [])
+        if names is None or server['name'] in names
+    ]
+
+
+def resolve_servers(manifest, names=None):
+    """
+    Yield (server, settings) for the servers in a manifest.
+
+    settings is the server's full merged settings: defaults, base_profile,
+    base, profile, then overrides.
+    """
+    base = engine.merge_settings(engine.load_defaults(), resolve_base(manifest))
+    for server in manifest.get('servers', []):
+        if names is not None and server['name'] not in names:
+            continue
+        settings = copy.deepcopy(base)
+        if server.get('profile'):
+            engine.merge_settings(settings, engine.load_profile(server['profile']))
+        engine.merge_settings(settings, server['overrides'])
+        yield server, settings
+
+
+def _init_worker(base_overrides, mode):
+    """Merge the manifest base once per worker instead of once per server"""
+    global _worker_base, _worker_mode
+    _worker_base = engine.merge_settings(engine.load_defaults(), base_overrides)
+    _worker_mode = mode
+
+
+def _generate_server(job):
+    """Write one server's INI pair; errors are reported instead of raised"""
+    name, profile, overrides, directory = job
+    start = time.perf_counter()
+    try:
+        settings = copy.deepcopy(_worker_base)
+        if profile:
+            engine.merge_settings(settings, engine.load_profile(profile))
+        engine.merge_settings(settings, overrides)
+        results = engine.emit_files(settings, _worker_mode, directory)
+        paths = tuple(result.path for result in results)
+        changed = sum(1 for result in results if result.changed)
+        error = None
+    except Exception as e:
+        paths = ()
+        changed = 0
+        error = str(e)
+    return ServerResult(name, paths, changed, (time.perf_counter() - start) * 1000, error)
+
+
+def run_batch(manifest, workers=None, names=None):
+    """
+    Generate every server in a manifest.
+
+    Args:
+        manifest: Manifest mapping as returned by load_manifest()
+        workers: Number of worker processes (defaults to the CPU count). With a
+            single worker the batch runs in-process without a pool.
+        names: Only generate these servers (default: every server)
+
+    Returns:
+        BatchReport with one ServerResult per generated server, in manifest order
+    """
+    jobs = build_jobs(manifest, names)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    base = resolve_base(manifest)
+
+    if workers == 1 or len(jobs) <= 1:
+        _init_worker(base, manifest['mode'])
+        results = [_generate_server(job) for job in jobs]
+        workers = 1
+    else:
+        # Large chunks keep IPC overhead low for fleets of 1,000+ servers
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(base, manifest['mode'])) as executor:
+            results = list(executor.map(_generate_server, jobs, chunksize=chunksize))
+
+    return BatchReport(results, (time.perf_counter() - start) * 1000, workers)
+
+
+def format_report(report):
+    """Format a batch report as per-server timing lines plus a summary"""
+    lines = []
+    for result in report.results:
+        if result.error:
+            status = f"ERROR: {result.error}"
+        else:
+            status = f"{result.changed} file(s) written" if result.changed else "unchanged"
+        lines.append(f"{result.name:<24} {result.elapsed_ms:8.2f} ms  {status}")
+    failed = sum(1 for result in report.results if result.error)
+    total = len(report.results)
+    rate = total / (report.elapsed_ms / 1000) if report.elapsed_ms else 0.0
+    lines.append(f"{total} servers ({failed} failed) in {report.elapsed_ms:.1f} ms "
+                 f"on {report.workers} worker(s), {rate:.0f} servers/s")
+    return '\n'.join(lines)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Headless command line interface for Ark Settings Generator
+
+Generates GameUserSettings.ini and Game.ini without a display, e.g.:
+
+    python cli.py generate --profile server.json --mode advanced --output ./out
+    python cli.py generate --base ./server/Config --profile server.json --output ./server/Config
+    python cli.py batch cluster.json --workers 8
+    python cli.py watch cluster.json
+    python cli.py deploy targets.txt --source ./out --apply
+    python cli.py validate ./cluster --workers 8
+    python cli.py rcon cluster.json "Broadcast Rates doubled" --dynamic-config ./dynamic
+    python cli.py sweep --taming 0.5:10:20 --mature 1:50:50 --binary sweep.bin
+    python cli.py species rex
+    python cli.py species --pack data/species.tsv data/species.bin
+"""
+
+import time
+
+_START = time.perf_counter()
+
+import argparse
+import os
+import sys
+
+import batch
+import engine
+
+
+def cmd_generate(args):
+    """Generate one GameUserSettings.ini/Game.ini pair"""
+    settings = engine.load_defaults()
+    documents = None
+    if args.base:
+        # Start from the existing files and keep every line the settings do not change
+        documents = engine.load_ini_documents(
+            settings,
+            os.path.join(args.base, engine.GAME_USER_SETTINGS_FILE),
+            os.path.join(args.base, engine.GAME_INI_FILE))
+    if args.profile:
+        engine.merge_settings(settings, engine.load_profile(args.profile))
+    results = engine.emit_files(settings, args.mode, args.output, documents=documents)
+
+    elapsed_ms = (time.perf_counter() - _START) * 1000
+    for result in results:
+        print(f"{result.path} ({'written' if result.changed else 'unchanged'})")
+    print(f"Generated in {elapsed_ms:.1f} ms (budget {engine.STARTUP_BUDGET_MS} ms)")
+    return 0
+
+
+def cmd_batch(args):
+    """Generate every server in a cluster manifest on a process pool"""
+    report = batch.run_batch(batch.load_manifest(args.manifest), args.workers)
+    print(batch.format_report(report))
+    return 1 if any(result.error for result in report.results) else 0
+
+
+def print_watch_event(event):
+    """Print one watch-mode regeneration"""
+    if event.error:
+        print(f"ERROR: {event.error}", flush=True)
+        return
+    if event.changed:
+        print(f"Changed: {', '.join(sorted(os.path.basename(path) for path in event.changed))}")
+    failed = [result for result in event.report.results if result.error]
+    written = sum(1 for result in event.report.results if result.changed)
+    print(f"Regenerated {len(event.report.results)} server(s) in {event.report.elapsed_ms:.1f} ms, "
+          f"{written} with new files", flush=True)
+    for result in failed:
+        print(f"  {result.name}: ERROR: {result.error}", flush=True)
+
+
+def cmd_watch(args):
+    """Regenerate servers whenever the manifest or their profiles change"""
+    import watch
+    print(f"Watching {args.manifest} (Ctrl+C to stop)", flush=True)
+    try:
+        watch.watch_manifest(args.manifest, args.workers, print_watch_event, polling=args.poll)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_deploy(args):
+    """Show which target folders need new files, and copy them with --apply"""
+    import deploy
+    targets = deploy.load_targets(args.targets, args.source)
+    plan = deploy.build_plan(targets, args.workers)
+    print(deploy.format_plan(plan))
+    if not args.apply:
+        return 0
+    report = deploy.apply_plan(plan, args.workers)
+    print(deploy.format_report(report))
+    return 1 if any(result.error for result in report.results) else 0
+
+
+def cmd_validate(args):
+    """Validate every config folder under the given paths"""
+    import validate
+    folders = validate.find_config_folders(args.paths)
+    report = validate.validate_folders(folders, args.workers)
+    print(validate.format_report(report, args.verbose))
+    failed = any(result.error or any(finding.severity == validate.ERROR for finding in result.findings)
+                 for result in report.results)
+    return 1 if failed else 0
+
+
+def cmd_rcon(args):
+    """Send admin commands to every server in a cluster manifest over RCON"""
+    import rcon
+    manifest = batch.load_manifest(args.manifest)
+    names = set(args.only) if args.only else None
+    targets, skipped = rcon.targets_from_manifest(manifest, names)
+    commands = {target.name: list(args.commands) for target in targets}
+    if args.dynamic_config:
+        # Only servers whose live-changeable values changed need to reload
+        for name, changed in rcon.write_dynamic_configs(manifest, args.dynamic_config, names).items():
+            if changed and name in commands:
+                commands[name].append(rcon.RELOAD_DYNAMIC_CONFIG)
+    targets = [target for target in targets if commands[target.name]]
+    for name in skipped:
+        print(f"{name}: RCONEnabled is off, skipped")
+    if not targets:
+        print("Nothing to send")
+        return 0
+    report = rcon.push(targets, commands, args.timeout, args.max_connections)
+    print(rcon.format_report(report))
+    return 1 if any(result.error for result in report.results) else 0
+
+
+def parse_range(text):
+    """Parse a start:stop:steps multiplier range, or a single value"""
+    import sweep
+    parts = text.split(':')
+    if len(parts) == 1:
+        return (float(parts[0]),)
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError("Ranges look like start:stop:steps, e.g. 0.5:10:20")
+    return sweep.multiplier_range(float(parts[0]), float(parts[1]), int(parts[2]))
+
+
+def cmd_sweep(args):
+    """Compute a species x multiplier results table and export it"""
+    # Imported here so numpy never slows down the generate command's startup
+    import sweep
+    start = time.perf_counter()
+    ranges = {key: getattr(args, option) for option, key in SWEEP_OPTIONS.items()
+              if getattr(args, option) is not None}
+    result = sweep.run_sweep(ranges, args.species or None)
+    computed_ms = (time.perf_counter() - start) * 1000
+    if args.binary:
+        result.to_binary(args.binary)
+    if args.csv:
+        result.to_csv(args.csv)
+    print(f"{len(result)} rows x {len(sweep.RESULT_COLUMNS)} columns computed in {computed_ms:.1f} ms, "
+          f"exported in {(time.perf_counter() - start) * 1000 - computed_ms:.1f} ms")
+    return 0
+
+
+def cmd_species(args):
+    """Search the species catalog, or pack a tab-separated source into a catalog file"""
+    import species
+    if args.pack:
+        source, output = args.pack
+        entries = species.read_tsv(source)
+        species.pack_catalog(entries, output)
+        print(f"Packed {len(entries)} species into {output}")
+        return 0
+    catalog = species.get_catalog()
+    for name in catalog.search(args.query, args.limit):
+        print(catalog.display_name(name))
+    return 0
+
+
+# Command line option -> swept multiplier
+SWEEP_OPTIONS = {
+    'taming': 'TamingSpeedMultiplier',
+    'mature': 'BabyMatureSpeedMultiplier',
+    'hatch': 'EggHatchSpeedMultiplier',
+    'mating': 'MatingIntervalMultiplier',
+    'imprint': 'BabyImprintingStatScaleMultiplier',
+}
+
+
+def build_parser():
+    """Build the argument parser for all headless commands"""
+    parser = argparse.ArgumentParser(description="Headless Ark Survival Ascended settings generator")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generate = commands.add_parser('generate', help="Generate one INI file pair")
+    generate.add_argument('--profile', help="JSON file with setting overrides")
+    generate.add_argument('--base', metavar='DIR',
+                          help="Folder with existing GameUserSettings.ini/Game.ini to import and "
+                               "update in place, keeping their other sections, comments and unknown keys")
+    generate.add_argument('--mode', choices=['basic', 'advanced'], default='advanced')
+    generate.add_argument('--output', default=None, help="Output directory (default: current directory)")
+    generate.set_defaults(func=cmd_generate)
+
+    batch_parser = commands.add_parser('batch', help="Generate every server in a cluster manifest")
+    batch_parser.add_argument('manifest', help="JSON cluster manifest")
+    batch_parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    batch_parser.set_defaults(func=cmd_batch)
+
+    watch_parser = commands.add_parser('watch', help="Regenerate servers when their profiles change")
+    watch_parser.add_argument('manifest', help="JSON cluster manifest")
+    watch_parser.add_argument('--workers', type=int, default=1, help="Worker processes per regeneration")
+    watch_parser.add_argument('--poll', action='store_true', help="Poll files instead of using inotify")
+    watch_parser.set_defaults(func=cmd_watch)
+
+    deploy_parser = commands.add_parser('deploy', help="Copy generated files into server config folders")
+    deploy_parser.add_argument('targets', help="Text file with one target folder per line, or a JSON targets file")
+    deploy_parser.add_argument('--source', default=None,
+                               help="Folder with the generated files (default: current directory)")
+    deploy_parser.add_argument('--apply', action='store_true',
+                               help="Write the planned files (default: only show the plan)")
+    deploy_parser.add_argument('--workers', type=int, default=16, help="Concurrent target folders")
+    deploy_parser.set_defaults(func=cmd_deploy)
+
+    validate_parser = commands.add_parser('validate', help="Check config folders for invalid or conflicting settings")
+    validate_parser.add_argument('paths', nargs='+', help="Folders searched for GameUserSettings.ini/Game.ini")
+    validate_parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    validate_parser.add_argument('--verbose', action='store_true', help="List every finding instead of grouping")
+    validate_parser.set_defaults(func=cmd_validate)
+
+    rcon_parser = commands.add_parser('rcon', help="Send admin commands to running servers over RCON")
+    rcon_parser.add_argument('manifest', help="JSON cluster manifest (servers may set a \"host\")")
+    rcon_parser.add_argument('commands', nargs='*', help="Admin commands to send to every server")
+    rcon_parser.add_argument('--only', nargs='+', metavar='NAME', help="Only these servers")
+    rcon_parser.add_argument('--dynamic-config', metavar='DIR',
+                             help="Write each server's dynamic config to DIR/<name>.ini and reload it where changed")
+    rcon_parser.add_argument('--timeout', type=float, default=5.0, help="Seconds per server")
+    rcon_parser.add_argument('--max-connections', type=int, default=256, help="Connections open at once")
+    rcon_parser.set_defaults(func=cmd_rcon)
+
+    sweep_parser = commands.add_parser('sweep', help="Compute a species x multiplier results table")
+    for option, key in SWEEP_OPTIONS.items():
+        sweep_parser.add_argument(f'--{option}', type=parse_range, help=f"{key} range as start:stop:steps")
+    sweep_parser.add_argument('--species', nargs='*', help="Dinos to include (default: all)")
+    sweep_parser.add_argument('--csv', help="Write the table to a CSV file")
+    sweep_parser.add_argument('--binary', help="Write the table to a compact float32 binary file")
+    sweep_parser.set_defaults(func=cmd_sweep)
+
+    species_parser = commands.add_parser('species', help="Search or pack the species catalog")
+    species_parser.add_argument('query', nargs='?', default='', help="Type-ahead text (default: list all)")
+    species_parser.add_argument('--limit', type=int, default=None, help="Maximum number of results")
+    species_parser.add_argument('--pack', nargs=2, metavar=('TSV', 'OUTPUT'),
+                                help="Pack a tab-separated species source into a catalog file")
+    species_parser.set_defaults(func=cmd_species)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
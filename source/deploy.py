@@ -0,0 +1,270 @@
+"""
+Fleet deployment for Ark Settings Generator
+
+Copies generated GameUserSettings.ini/Game.ini files into server config
+folders (ShooterGame/Saved/Config/WindowsServer) in two steps:
+
+1. build_plan() compares checksums and lists which files differ. Each
+   source file is hashed once; a target file whose size differs from its
+   source costs one stat, any other one open and a hash.
+2. apply_plan() writes the differing files on a bounded thread pool. Each
+   target is locked for the duration and every file is replaced atomically.
+   If any file of a target changed since the plan was made, the target is
+   reported as a conflict and none of its files are written.
+
+Each target folder keeps an empty LOCK_FILE after the first deploy. It is
+not removed on exit: another deploy may already have it open and be waiting
+for the lock, and unlinking it would let a third one lock a new file at the
+same path while that one holds the old.
+
+Targets are listed in a text file (one folder per line, '#' comments) or a
+JSON file such as:
+
+    {"targets": [
+        {"path": "/srv/island/ShooterGame/Saved/Config/WindowsServer", "source": "cluster/island"},
+        {"path": "/srv/scorched/ShooterGame/Saved/Config/WindowsServer", "source": "cluster/scorched"}
+    ]}
+
+Targets without a "source" receive the files from the default source folder.
+Relative paths are resolved against the targets file's folder.
+"""
+
+import collections
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import engine
+import fileio
+
+DEPLOY_FILES = (engine.GAME_USER_SETTINGS_FILE, engine.GAME_INI_FILE)
+LOCK_FILE = '.ark-deploy.lock'
+LOCK_TIMEOUT_S = 30
+DEFAULT_WORKERS = 16
+
+Target = collections.namedtuple('Target', ['path', 'source'])
+PlanEntry = collections.namedtuple('PlanEntry', ['target', 'name', 'source_path', 'digest', 'before', 'action'])
+DeployResult = collections.namedtuple('DeployResult', ['target', 'written', 'skipped', 'error', 'elapsed_ms'])
+DeployReport = collections.namedtuple('DeployReport', ['results', 'elapsed_ms', 'workers'])
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class LockTimeout(OSError):
+    """Another deploy held a target's lock for longer than the timeout"""
+
+
+class TargetLock:
+    """
+    Exclusive lock on a target folder, shared across processes and threads.
+
+    Uses an OS file lock on LOCK_FILE inside the folder, so a lock held by a
+    crashed deploy is released with its process. The file itself is left in
+    place (see the module docstring).
+    """
+
+    def __init__(self, directory, timeout=LOCK_TIMEOUT_S):
+        self.path = os.path.join(directory, LOCK_FILE)
+        self.timeout = timeout
+        self._fd = None
+
+    def _try_lock(self, fd):
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def __enter__(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        while not self._try_lock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise LockTimeout(f"{os.path.dirname(self.path)} is locked by another deploy")
+            time.sleep(0.05)
+        self._fd = fd
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        os.close(self._fd)
+        self._fd = None
+        return False
+
+
+def load_targets(path, source=None):
+    """
+    Load deploy targets from a text or JSON file.
+
+    Args:
+        path: Targets file (JSON if it ends in .json, otherwise one folder per line)
+        source: Default folder holding the generated files (default: current directory)
+
+    Returns:
+        List of Target(path, source) with absolute paths
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    source = os.path.abspath(source or os.getcwd())
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.json'):
+            entries = json.load(f)['targets']
+        else:
+            entries = [{'path': line.strip()} for line in f
+                       if line.strip() and not line.lstrip().startswith('#')]
+    targets = []
+    seen = set()
+    for entry in entries:
+        target = Target(os.path.join(folder, entry['path']),
+                        os.path.join(folder, entry['source']) if entry.get('source') else source)
+        if target.path in seen:
+            raise ValueError(f"Duplicate deploy target: {target.path}")
+        seen.add(target.path)
+        targets.append(target)
+    return targets
+
+
+def _file_state(path, size):
+    """
+    Return what a target file is compared by: None if it is missing, its
+    (size, mtime, inode) if its size differs from the source's, so it is not
+    read, and otherwise its fingerprint
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    if stat.st_size != size:
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+    return fileio.file_fingerprint(path)
+
+
+def _plan_target(target, sources):
+    entries = []
+    for name in DEPLOY_FILES:
+        source_path = os.path.join(target.source, name)
+        digest, size = sources[source_path]
+        before = _file_state(os.path.join(target.path, name), size)
+        if before == digest:
+            action = 'skip'
+        else:
+            action = 'create' if before is None else 'update'
+        entries.append(PlanEntry(target.path, name, source_path, digest, before, action))
+    return entries
+
+
+def build_plan(targets, workers=DEFAULT_WORKERS):
+    """
+    Compare every target's files with their sources by checksum.
+
+    Returns:
+        List of PlanEntry(target, name, source_path, digest, before, action)
+        where action is 'create', 'update' or 'skip' and before is the
+        target file's state at planning time (see _file_state())
+    """
+    sources = {}
+    for target in targets:
+        for name in DEPLOY_FILES:
+            source_path = os.path.join(target.source, name)
+            if source_path not in sources:
+                digest = fileio.file_fingerprint(source_path)
+                if digest is None:
+                    raise FileNotFoundError(f"Generated file not found: {source_path}")
+                sources[source_path] = (digest, os.path.getsize(source_path))
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets) or 1))) as executor:
+        planned = executor.map(lambda target: _plan_target(target, sources), targets)
+        return [entry for entries in planned for entry in entries]
+
+
+def _apply_target(target, entries, source_data):
+    start = time.perf_counter()
+    written = []
+    skipped = []
+    try:
+        with TargetLock(target):
+            # Check every file before writing any, so a conflict leaves the target as it was
+            pending = []
+            for entry in entries:
+                destination = os.path.join(target, entry.name)
+                current = _file_state(destination, len(source_data[entry.source_path]))
+                if current == entry.digest:
+                    skipped.append(entry.name)
+                elif current != entry.before:
+                    raise RuntimeError(f"{destination} changed since the plan was made")
+                else:
+                    pending.append((destination, entry))
+            for destination, entry in pending:
+                fileio.write_atomic(destination, source_data[entry.source_path])
+                written.append(entry.name)
+        error = None
+    except (OSError, RuntimeError) as e:
+        error = str(e)
+    return DeployResult(target, tuple(written), tuple(skipped), error, (time.perf_counter() - start) * 1000)
+
+
+def apply_plan(plan, workers=DEFAULT_WORKERS):
+    """
+    Write every 'create'/'update' entry of a plan.
+
+    Targets are applied concurrently on at most `workers` threads; files of
+    one target are written under that target's lock.
+
+    Returns:
+        DeployReport with one DeployResult per target that had work, in plan order
+    """
+    start = time.perf_counter()
+    by_target = collections.OrderedDict()
+    for entry in plan:
+        if entry.action != 'skip':
+            by_target.setdefault(entry.target, []).append(entry)
+
+    source_data = {}
+    for entries in by_target.values():
+        for entry in entries:
+            if entry.source_path not in source_data:
+                with open(entry.source_path, 'rb') as f:
+                    data = f.read()
+                if fileio.fingerprint(data) != entry.digest:
+                    raise RuntimeError(f"{entry.source_path} changed since the plan was made")
+                source_data[entry.source_path] = data
+
+    workers = max(1, min(workers, len(by_target) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_apply_target, target, entries, source_data)
+                   for target, entries in by_target.items()]
+        results = [future.result() for future in futures]
+    return DeployReport(results, (time.perf_counter() - start) * 1000, workers)
+
+
+def format_plan(plan):
+    """Format a plan as one line per changed file plus a summary"""
+    lines = [f"{entry.action:<7} {os.path.join(entry.target, entry.name)}"
+             for entry in plan if entry.action != 'skip']
+    targets = {entry.target for entry in plan}
+    changed = {entry.target for entry in plan if entry.action != 'skip'}
+    lines.append(f"{len(lines)} file(s) to write on {len(changed)} of {len(targets)} target(s)")
+    return '\n'.join(lines)
+
+
+def format_report(report):
+    """Format a deploy report as per-target lines plus a summary"""
+    lines = []
+    for result in report.results:
+        status = f"ERROR: {result.error}" if result.error else f"{len(result.written)} file(s) written"
+        lines.append(f"{result.target}  {result.elapsed_ms:8.2f} ms  {status}")
+    failed = sum(1 for result in report.results if result.error)
+    lines.append(f"{len(report.results)} target(s) updated ({failed} failed) in {report.elapsed_ms:.1f} ms "
+                 f"on {report.workers} thread(s)")
+    return '\n'.join(lines)
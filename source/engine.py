@@ -0,0 +1,484 @@
+"""
+Headless settings engine for Ark Settings Generator
+
+Builds the default settings and descriptions from the schema registry and exposes
+plain functions to load, merge, calculate and emit the server INI files.
+This module must never import tkinter so it can run on headless build boxes.
+"""
+
+import json
+import math
+import os
+
+import fileio
+import inidoc
+import inifile
+import schema
+import species
+import tracing
+
+SERVER_SECTION = schema.SERVER_SECTION
+GAME_SECTION = schema.GAME_SECTION
+
+GAME_USER_SETTINGS_FILE = 'GameUserSettings.ini'
+GAME_INI_FILE = 'Game.ini'
+# File name and the section the app writes into it
+INI_FILES = ((GAME_USER_SETTINGS_FILE, SERVER_SECTION), (GAME_INI_FILE, GAME_SECTION))
+
+# Budget for importing this module and generating one config pair, in ms.
+# Checked by tests/test_engine.py so a slow import never sneaks back in.
+STARTUP_BUDGET_MS = 150
+# Lowest acceptable render_section throughput on one core, in key/value pairs per second.
+# Checked by tests/test_engine.py and reported by benchmarks/bench.py (emit_ini).
+EMIT_PAIRS_PER_S = 10000
+
+# Section -> key -> default and key -> description, derived from schema.py
+DEFAULT_SETTINGS = schema.defaults()
+DESCRIPTIONS = schema.descriptions()
+
+# Events data with status indicators
+EVENTS_DATA = {
+    'None': {'status': 'working', 'description': 'No active event'},
+    'WinterWonderland': {'status': 'working', 'description': 'Winter holiday event - cosmetics and bonuses'},
+    'WinterWonderland2': {'status': 'working', 'description': 'Winter 2nd year event'},
+    'WinterWonderland3': {'status': 'working', 'description': 'Winter 3rd year event'},
+    'WinterWonderland4': {'status': 'working', 'description': 'Winter 4th year event'},
+    'WinterWonderland5': {'status': 'working', 'description': 'Winter 5th year event'},
+    'WinterWonderland6': {'status': 'working', 'description': 'Winter 6th year event'},
+    'WinterWonderland7': {'status': 'working', 'description': 'Winter 7th year event'},
+    'Easter': {'status': 'working', 'description': 'Eggcellent Adventure - Easter egg hunt themes'},
+    'SummerBash': {'status': 'working', 'description': 'Summer vacation event - beach themes'},
+    'FearEvolved': {'status': 'working', 'description': 'Fear Evolved/Fear Ascended - Halloween spooky creatures'},
+    'TurkeyTrial': {'status': 'working', 'description': 'Turkey Trial - Thanksgiving event with challenges'},
+    'LoveEvolved': {'status': 'working', 'description': 'Love Evolved - Valentine breeding event bonuses'},
+    'Birthday': {'status': 'working', 'description': 'Birthday/Anniversary event - celebration bonuses'},
+    'EvolutionEvent': {'status': 'working', 'description': 'Evolution Event - creature variant spawns'},
+    'ExtraLife': {'status': 'working', 'description': 'Extra Life event - charity event bonuses'},
+    'ARKaeology': {'status': 'working', 'description': 'ARKaeology - artifact discovery event'},
+    'ARKdependenceDay': {'status': 'working', 'description': 'ARKdependence Day - July 4th themed event'},
+}
+
+# Basic settings subsets
+BASIC_SERVER = list(schema.BASIC_SERVER)
+BASIC_GAME = list(schema.BASIC_GAME)
+
+# Default multipliers used when a calculation input is missing
+CALCULATION_DEFAULTS = {
+    'TamingSpeedMultiplier': 1.0,
+    'BabyMatureSpeedMultiplier': 1.0,
+    'BabyImprintingStatScaleMultiplier': 1.0,
+    'EggHatchSpeedMultiplier': 1.0,
+    'MatingIntervalMultiplier': 1.0,
+    'DifficultyOffset': 0.2,
+}
+
+
+def load_defaults():
+    """Return a fresh, mutable copy of the default settings"""
+    return schema.defaults()
+
+
+def load_profile(path):
+    """Load a JSON profile of setting overrides from disk"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def coerce_value(default_value, value):
+    """Convert a raw INI string to the type of the matching default"""
+    if not isinstance(value, str):
+        return value
+    if isinstance(default_value, bool):
+        return value.lower() in ['true', '1', 'yes']
+    if isinstance(default_value, int):
+        return int(value)
+    if isinstance(default_value, float):
+        return float(value)
+    return value
+
+
+def merge_settings(settings, overrides):
+    """
+    Merge overrides into settings in place.
+
+    Args:
+        settings: Section -> key -> value mapping, e.g. from load_defaults()
+        overrides: Either section -> key -> value mappings, or flat key -> value
+            pairs. Flat keys are applied to every section that defines them and
+            fall back to ServerSettings for keys the schema does not know.
+
+    Returns:
+        The updated settings mapping
+    """
+    for key, value in overrides.items():
+        if isinstance(value, dict):
+            section = settings.setdefault(key, {})
+            for sub_key, sub_value in value.items():
+                section[sub_key] = coerce_value(section.get(sub_key), sub_value)
+            continue
+        targets = [(section, key) for section in settings.values() if key in section]
+        if not targets:
+            # Other spellings of schema keys (e.g. serverForceNoHud) go to the schema key
+            targets = [(settings.setdefault(setting.section, {}), setting.key)
+                       for setting in schema.find(key)]
+        if not targets:
+            targets = [(settings.setdefault(SERVER_SECTION, {}), key)]
+        for section, target_key in targets:
+            section[target_key] = coerce_value(section.get(target_key), value)
+    return settings
+
+
+def calculation_inputs(settings):
+    """Collect the values update_calculations needs from a settings mapping"""
+    values = {}
+    for section in (SERVER_SECTION, GAME_SECTION):
+        for key in CALCULATION_DEFAULTS:
+            if key in settings.get(section, {}):
+                values.setdefault(key, settings[section][key])
+    override = settings.get(SERVER_SECTION, {}).get('OverrideOfficialDifficulty')
+    if override is not None:
+        values['OverrideOfficialDifficulty'] = override
+    return values
+
+
+def calculate(values, dino_name):
+    """
+    Calculate taming, breeding and level numbers for one dino.
+
+    Args:
+        values: Flat key -> value mapping of the current multipliers
+        dino_name: Name of a species in the catalog (falls back to Argentavis)
+
+    Returns:
+        Dict with taming/incubation times in minutes, maturation/imprint/mating
+        times in hours, max imprint %, max wild dino level and difficulty.
+        A time is None when its multiplier is 0 or less (the schema allows 0.0)
+    """
+    def value(key):
+        return values.get(key, CALCULATION_DEFAULTS[key])
+
+    def scaled(time, key):
+        multiplier = value(key)
+        return time / multiplier if multiplier > 0 else None
+
+    catalog = species.get_catalog()
+    dino_stats = catalog.stats(dino_name if dino_name in catalog else species.DEFAULT_SPECIES)
+    imprint_mult = value('BabyImprintingStatScaleMultiplier')
+
+    difficulty_offset = value('DifficultyOffset')
+    override_difficulty = values.get('OverrideOfficialDifficulty')
+    if override_difficulty is not None and override_difficulty > 0:
+        difficulty_offset = override_difficulty
+
+    return {
+        'taming_time': scaled(dino_stats['taming_time'], 'TamingSpeedMultiplier'),
+        'maturation_time': scaled(dino_stats['maturation_time'], 'BabyMatureSpeedMultiplier'),
+        'imprint_interval': scaled(dino_stats['imprint_interval'],
+                                   'BabyImprintingStatScaleMultiplier'),
+        'max_imprint': dino_stats['max_imprint'] * imprint_mult,
+        'incubation_time': scaled(dino_stats['incubation_time'], 'EggHatchSpeedMultiplier'),
+        'mating_cooldown': scaled(dino_stats['mating_cooldown'], 'MatingIntervalMultiplier'),
+        # Ark dino level formula: base level + (difficulty * multiplier)
+        # Base max level is typically 150, difficulty multiplier is usually 30
+        'max_dino_level': 150 + (difficulty_offset * 30),
+        'difficulty': difficulty_offset,
+    }
+
+
+# Keys written per (section, mode), resolved from schema ids once at import
+_WRITE_KEYS = {
+    (section, mode): tuple(setting.key for setting in schema.section_settings(section, mode))
+    for section in (SERVER_SECTION, GAME_SECTION) for mode in ('basic', 'advanced')
+}
+# ActiveMods is always written regardless of mode
+_WRITE_KEYS[(SERVER_SECTION, 'basic')] += ('ActiveMods',)
+_SCHEMA_KEYS = {section: frozenset(_WRITE_KEYS[(section, 'advanced')])
+                for section in (SERVER_SECTION, GAME_SECTION)}
+
+
+def section_keys(settings, section, mode):
+    """Return the keys of a section that are written in the given mode"""
+    if mode == 'basic':
+        return list(_WRITE_KEYS[(section, 'basic')])
+    values = settings[section]
+    keys = list(_WRITE_KEYS.get((section, 'advanced'), ()))
+    # Keys the schema does not know (e.g. from a profile) follow in insertion order
+    extra = values.keys() - _SCHEMA_KEYS.get(section, frozenset())
+    if extra:
+        keys.extend(key for key in values if key in extra)
+    return keys
+
+
+def format_float(value):
+    """
+    Return the canonical INI text of a float.
+
+    The shortest text that reads back as the same float, always with a decimal
+    point and never in exponent notation (1.0, 0.00001, 100000000000000000000.0),
+    since the game does not read exponents. -0.0 is written as 0.0.
+    """
+    if not math.isfinite(value):
+        raise ValueError(f"{value!r} cannot be written to an INI file")
+    text = repr(value + 0.0)
+    if 'e' in text:
+        import decimal
+        text = format(decimal.Decimal(text), 'f')
+        if '.' not in text:
+            text += '.0'
+    return text
+
+
+def format_value(value):
+    """Return the INI text of one value: True/False, canonical floats, other values as str()"""
+    kind = type(value)
+    if kind is str:
+        return value
+    if kind is bool:
+        return 'True' if value else 'False'
+    if kind is float:
+        return format_float(value)
+    return str(value)
+
+
+def entry_lines(key, value):
+    """Return the INI lines written for one key"""
+    if isinstance(value, list):
+        # Repeated keys (e.g. imported spawn overrides) are written once per value
+        return [f'{key} = {format_value(item)}' for item in value]
+    return [f'{key} = {format_value(value)}']
+
+
+def render_section(values, section, keys):
+    """
+    Render one INI section into a single string.
+
+    Args:
+        values: Key -> value mapping of the section
+        section: Section name written in the header
+        keys: Keys to write, in order; missing keys are written empty
+
+    Returns:
+        The section text, the same lines entry_lines() gives for each key
+    """
+    # One list of fragments joined once; plain values skip the per-key line list
+    parts = [f'[{section}]\n']
+    append = parts.append
+    for key in keys:
+        value = values.get(key, '')
+        kind = type(value)
+        if kind is str:
+            append(f'{key} = {value}\n')
+        elif kind is list:
+            for item in value:
+                append(f'{key} = {format_value(item)}\n')
+        else:
+            append(f'{key} = {format_value(value)}\n')
+    append('\n')
+    return ''.join(parts)
+
+
+def _render(settings, section, mode):
+    with tracing.span('render', 'generate', section=section, mode=mode):
+        return render_section(settings[section], section, section_keys(settings, section, mode))
+
+
+def render_game_user_settings(settings, mode='advanced'):
+    """Render GameUserSettings.ini content as a string"""
+    return _render(settings, SERVER_SECTION, mode)
+
+
+def render_game_ini(settings, mode='advanced'):
+    """Render Game.ini content as a string"""
+    return _render(settings, GAME_SECTION, mode)
+
+
+@tracing.traced('emit_files', 'generate')
+def emit_files(settings, mode='advanced', directory=None, rendered=None, documents=None):
+    """
+    Write GameUserSettings.ini and Game.ini into a directory.
+
+    Files whose content already matches are left untouched; changed files are
+    replaced atomically.
+
+    Args:
+        settings: Section -> key -> value mapping
+        mode: 'basic' writes only the basic subsets, anything else writes all keys
+        directory: Target directory (defaults to the current working directory)
+        rendered: Optional file name -> text already rendered for these settings
+                  and mode (e.g. by the live preview); those files are not re-rendered.
+                  For files in documents this must be the update_document() text
+        documents: Optional file name -> inidoc.IniDocument of imported files;
+                   those files keep every line and only changed values are
+                   rewritten (see update_document)
+
+    Returns:
+        Tuple of fileio.WriteResult for (GameUserSettings.ini, Game.ini)
+    """
+    directory = directory or os.getcwd()
+    os.makedirs(directory, exist_ok=True)
+    rendered = rendered or {}
+    documents = documents or {}
+    results = []
+    for name, section in INI_FILES:
+        if name in rendered:
+            content = rendered[name]
+            if name in documents:
+                content = documents[name].encode(content)
+        elif name in documents:
+            document = documents[name]
+            content = document.encode(update_document(document, settings, section, mode))
+        else:
+            content = _render(settings, section, mode)
+        results.append(fileio.write_if_changed(os.path.join(directory, name), content))
+    return tuple(results)
+
+
+def _unchanged(section, key, raw, value):
+    """
+    True if a key line can stay as it is: the game reads the raw text as value
+    (1.000000 as 1.0, 70.000000 as 70, true as True), or the import skipped the
+    raw text because it could not be read and the value was not edited since.
+    """
+    if raw == format_value(value):
+        return True
+    setting = schema.get(section, key)
+    if setting is None or isinstance(value, str):
+        return False
+    try:
+        coerced = setting.coerce(raw)
+    except ValueError:
+        # Import left the default in place of the unreadable text
+        return value == setting.default and type(value) is type(setting.default)
+    if isinstance(value, bool) or isinstance(coerced, bool):
+        return coerced is value
+    return coerced == value
+
+
+def update_document(document, settings, section, mode='advanced'):
+    """
+    Write one section into an imported INI document, keeping every other line.
+
+    Keys are matched case-insensitively, as on import. A key whose value the
+    game would read the same keeps its line untouched; changed values are
+    rewritten in place, values a repeated key gained or lost are added after
+    its last line or removed, and keys the file lacks are added at the end of
+    the section unless they hold the default. Other sections, comments,
+    unknown keys, order and spelling are left as they are.
+
+    Args:
+        document: inidoc.IniDocument of the imported file
+        settings: Section -> key -> value mapping
+        section: Section to write
+        mode: 'basic' writes only the basic subsets, anything else writes all keys
+
+    Returns:
+        The new document text
+    """
+    replace, tail = document_edits(document, settings, section, mode)
+    if not replace and not tail:
+        return document.text()
+    return '\n'.join(document.lines_with(replace, tail))
+
+
+def document_edits(document, settings, section, mode='advanced'):
+    """Return the (replace, tail) edits update_document() applies, as IniDocument.edits() does"""
+    values = settings[section]
+    index = KEY_INDEX[section.lower()]
+    with tracing.span('render', 'generate', section=section, mode=mode, document=True):
+        # Lowercase canonical key -> its key lines in file order
+        found = {}
+        for entry in document.entries(section):
+            ids = index.get(entry.key.lower())
+            name = schema.SETTINGS[ids[0]].key if ids else entry.key
+            found.setdefault(name.lower(), []).append(entry)
+        replace = {}
+        added = []
+        for key in section_keys(settings, section, mode):
+            value = values.get(key, '')
+            entries = found.get(key.lower(), ())
+            if not isinstance(value, list):
+                if not entries:
+                    # A missing key already reads as its default
+                    setting = schema.get(section, key)
+                    at_default = (setting is not None and value == setting.default
+                                  and type(value) is type(setting.default))
+                    if not at_default:
+                        added.append(document.new_line(key, format_value(value)))
+                elif not _unchanged(section, key, entries[-1].value, value):
+                    last = entries[-1].line
+                    replace[last] = [document.key_line(last, format_value(value))]
+                continue
+            texts = [format_value(item) for item in value]
+            for entry, text in zip(entries, texts):
+                if entry.value != text:
+                    replace[entry.line] = [document.key_line(entry.line, text)]
+            for entry in entries[len(texts):]:
+                replace[entry.line] = []
+            extra = [document.new_line(entries[0].key if entries else key, text)
+                     for text in texts[len(entries):]]
+            if extra and entries:
+                last = entries[-1].line
+                replace[last] = replace.get(last, [document.lines[last]]) + extra
+            else:
+                added.extend(extra)
+        return document.edits(replace, {section: added})
+
+
+# Built once at import so every INI import reuses it
+KEY_INDEX = schema.build_key_index()
+
+
+def load_ini_section(settings, path, section):
+    """
+    Import one section of an INI file into settings.
+
+    Keys are matched case-insensitively through KEY_INDEX to schema ids.
+    Repeated string keys keep every value, in file order, as a list; repeated
+    scalar keys keep the last value. Values that cannot be converted to the
+    setting's type are skipped.
+    """
+    with tracing.span('import.parse', 'import', section=section, path=path):
+        found = inifile.read_section(path, section, KEY_INDEX[section.lower()])
+    _import_values(settings[section], found, section)
+    return settings
+
+
+def _import_values(target, found, section):
+    with tracing.span('import.coerce', 'import', section=section, keys=len(found)):
+        for setting_id, values in found.items():
+            setting = schema.SETTINGS[setting_id]
+            if setting.type is str and len(values) > 1:
+                target[setting.key] = values
+                continue
+            try:
+                target[setting.key] = setting.coerce(values[-1])
+            except ValueError:
+                pass
+
+
+@tracing.traced('load_ini_files', 'import')
+def load_ini_files(settings, game_user_path, game_path):
+    """Import existing GameUserSettings.ini and Game.ini values into settings"""
+    load_ini_section(settings, game_user_path, SERVER_SECTION)
+    load_ini_section(settings, game_path, GAME_SECTION)
+    return settings
+
+
+@tracing.traced('load_ini_documents', 'import')
+def load_ini_documents(settings, game_user_path, game_path):
+    """
+    Import INI files like load_ini_files() and keep them whole.
+
+    Returns:
+        Dict of file name -> inidoc.IniDocument, to pass to emit_files() so the
+        generated files keep every other section, comment and unknown key
+    """
+    documents = {}
+    for (name, section), path in zip(INI_FILES, (game_user_path, game_path)):
+        with tracing.span('import.parse', 'import', section=section, path=path):
+            document = inidoc.IniDocument.read(path)
+            found = inifile.collect_section(document.iter_entries(), section,
+                                            KEY_INDEX[section.lower()])
+        _import_values(settings[section], found, section)
+        documents[name] = document
+    return documents
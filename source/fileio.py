@@ -0,0 +1,102 @@
+"""
+Fingerprinted, atomic file writing for Ark Settings Generator
+
+Rendered INI content is hashed and compared to the file already on disk. An
+unchanged file costs a stat and a hash; a changed file is written to a temp
+file in the same folder, fsynced and renamed over the target so a crash can
+never leave a truncated config behind.
+"""
+
+import collections
+import hashlib
+import itertools
+import os
+
+import tracing
+
+WriteResult = collections.namedtuple('WriteResult', ['path', 'changed', 'digest'])
+
+_CHUNK_SIZE = 1024 * 1024
+_temp_counter = itertools.count()
+
+
+def encode_text(text):
+    """Encode rendered text the way a text-mode write would, with native newlines"""
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    return text.encode('utf-8')
+
+
+def fingerprint(data):
+    """Return the hex digest used to compare file contents"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_fingerprint(path):
+    """Return the fingerprint of a file on disk, or None if it does not exist"""
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def _fsync_directory(directory):
+    # Persist the rename itself; directories cannot be opened on Windows
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path, data):
+    """Write bytes to path via a temp file, fsync and rename"""
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = os.path.join(directory,
+                             f".{os.path.basename(path)}.{os.getpid()}.{next(_temp_counter)}.tmp")
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def write_if_changed(path, text):
+    """
+    Write text to path unless the file already holds the same content.
+
+    Args:
+        path: Target file path
+        text: Rendered file content, or bytes written exactly as given
+
+    Returns:
+        WriteResult(path, changed, digest) where changed is False when the
+        existing file already matched and nothing was written
+    """
+    with tracing.span('write', 'io', path=path) as span:
+        data = text if isinstance(text, bytes) else encode_text(text)
+        digest = fingerprint(data)
+        try:
+            same_size = os.stat(path).st_size == len(data)
+        except FileNotFoundError:
+            same_size = False
+        if same_size and file_fingerprint(path) == digest:
+            span.set(changed=False, bytes=len(data))
+            return WriteResult(path, False, digest)
+        write_atomic(path, data)
+        span.set(changed=True, bytes=len(data))
+        return WriteResult(path, True, digest)
@@ -0,0 +1,247 @@
+"""
+Undo/redo history for Ark Settings Generator
+
+Every step is a persistent settings snapshot: an immutable trie over schema
+setting ids. Recording an edit copies only the path from the root to the
+changed values and shares everything else with the previous snapshot, so a
+step costs memory in proportion to the keys it changed rather than a copy of
+the ~300-key settings dicts. Undo and redo diff two snapshots (skipping
+shared subtrees) and write back just the keys that differ, so the GUI can
+refresh those rows instead of rebuilding its tabs.
+"""
+
+import collections
+import time
+
+import schema
+
+# Trie fan-out: 8 children per node, three levels for the current schema
+BITS = 3
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+DEFAULT_LIMIT = 10000
+# Repeated edits of the same keys within this window (e.g. one slider drag) form one step
+COALESCE_MS = 1000
+
+_MISSING = object()
+
+
+def _depth_shift(count):
+    shift = 0
+    while (WIDTH << shift) < count:
+        shift += BITS
+    return shift
+
+
+_SHIFT = _depth_shift(len(schema.SETTINGS))
+
+
+def _build(values, shift):
+    if shift == 0:
+        return tuple(values)
+    step = 1 << shift
+    return tuple(_build(values[i:i + step], shift - BITS) for i in range(0, len(values), step))
+
+
+def _get(node, shift, index):
+    while shift > 0:
+        node = node[(index >> shift) & MASK]
+        shift -= BITS
+    return node[index & MASK]
+
+
+def _assoc(node, shift, index, value):
+    """Return a copy of node with index set to value, sharing untouched children"""
+    slot = (index >> shift) & MASK
+    child = value if shift == 0 else _assoc(node[slot], shift - BITS, index, value)
+    return node[:slot] + (child,) + node[slot + 1:]
+
+
+def _diff(a, b, shift, base, out):
+    if a is b:
+        return
+    for slot, (left, right) in enumerate(zip(a, b)):
+        if left is right:
+            continue
+        index = base + (slot << shift)
+        if shift == 0:
+            if left != right or type(left) is not type(right):
+                out.append(index)
+        else:
+            _diff(left, right, shift - BITS, index, out)
+
+
+def _freeze(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _thaw(value):
+    return list(value) if isinstance(value, tuple) else value
+
+
+class Snapshot:
+    """
+    An immutable view of all settings.
+
+    Schema settings live in the trie, indexed by setting id; keys the schema
+    does not know (e.g. from a profile) live in a small extras dict that is
+    copied when they change. Repeated-key lists are stored as tuples.
+    """
+
+    __slots__ = ('root', 'extras')
+
+    def __init__(self, root, extras):
+        self.root = root
+        self.extras = extras
+
+    @classmethod
+    def from_settings(cls, settings):
+        values = [_freeze(settings.get(setting.section, {}).get(setting.key, setting.default))
+                  for setting in schema.SETTINGS]
+        values += [None] * ((WIDTH << _SHIFT) - len(values))
+        extras = {(section, key): _freeze(value)
+                  for section, section_values in settings.items()
+                  for key, value in section_values.items() if schema.get(section, key) is None}
+        return cls(_build(values, _SHIFT), extras)
+
+    def get(self, section, key):
+        setting = schema.get(section, key)
+        if setting is None:
+            return _thaw(self.extras.get((section, key)))
+        return _thaw(_get(self.root, _SHIFT, setting.id))
+
+    def set_many(self, changes):
+        """
+        Return a snapshot with ((section, key), value) changes applied.
+
+        Unchanged values are skipped; if nothing changed, self is returned.
+        A value of _MISSING removes an extra key.
+        """
+        root = self.root
+        extras = None
+        for (section, key), value in changes:
+            value = _freeze(value)
+            setting = schema.get(section, key)
+            if setting is None:
+                current = (self.extras if extras is None else extras).get((section, key), _MISSING)
+                if current == value and type(current) is type(value):
+                    continue
+                if extras is None:
+                    extras = dict(self.extras)
+                if value is _MISSING:
+                    del extras[(section, key)]
+                else:
+                    extras[(section, key)] = value
+                continue
+            if value is _MISSING:
+                continue
+            current = _get(root, _SHIFT, setting.id)
+            if current == value and type(current) is type(value):
+                continue
+            root = _assoc(root, _SHIFT, setting.id, value)
+        if root is self.root and extras is None:
+            return self
+        return Snapshot(root, self.extras if extras is None else extras)
+
+    def diff(self, other):
+        """Return the (section, key) pairs whose values differ between two snapshots"""
+        indexes = []
+        _diff(self.root, other.root, _SHIFT, 0, indexes)
+        changed = [(schema.SETTINGS[index].section, schema.SETTINGS[index].key) for index in indexes]
+        if self.extras is not other.extras:
+            for name in self.extras.keys() | other.extras.keys():
+                if self.extras.get(name, _MISSING) != other.extras.get(name, _MISSING):
+                    changed.append(name)
+        return changed
+
+    def restore(self, settings, keys):
+        """Write this snapshot's values for keys back into a live settings mapping"""
+        for section, key in keys:
+            values = settings.setdefault(section, {})
+            if schema.get(section, key) is None and (section, key) not in self.extras:
+                values.pop(key, None)
+            else:
+                values[key] = self.get(section, key)
+
+
+class History:
+    """
+    Undo/redo stacks of settings snapshots.
+
+    Args:
+        settings: The live settings mapping the history starts from
+        limit: Most undo steps kept; the oldest are dropped
+        coalesce_ms: Window in which edits of the same keys merge into one step
+    """
+
+    def __init__(self, settings, limit=DEFAULT_LIMIT, coalesce_ms=COALESCE_MS, clock=time.monotonic):
+        self.current = Snapshot.from_settings(settings)
+        self.coalesce_ms = coalesce_ms
+        self._clock = clock
+        self._undo = collections.deque(maxlen=limit)
+        self._redo = []
+        self._last = None
+
+    def _push(self, snapshot, label, keys):
+        now = self._clock()
+        last = self._last
+        if (keys is not None and last is not None and last[0] == keys and self._undo
+                and (now - last[1]) * 1000 < self.coalesce_ms):
+            # Same keys again right away: extend the newest step instead of adding one
+            self.current = snapshot
+        else:
+            self._undo.append((self.current, label))
+            self.current = snapshot
+        self._redo.clear()
+        self._last = None if keys is None else (keys, now)
+
+    def record(self, settings, keys, label=None):
+        """
+        Record an edit of some (section, key) pairs.
+
+        Returns:
+            True if a value actually changed and the history moved
+        """
+        keys = frozenset(keys)
+        snapshot = self.current.set_many(
+            ((section, key), settings.get(section, {}).get(key, _MISSING)) for section, key in keys)
+        if snapshot is self.current:
+            return False
+        self._push(snapshot, label, keys)
+        return True
+
+    def _move(self, source, target, settings):
+        if not source:
+            return []
+        snapshot, label = source.pop()
+        changed = self.current.diff(snapshot)
+        target.append((self.current, label))
+        snapshot.restore(settings, changed)
+        self.current = snapshot
+        self._last = None
+        return changed
+
+    def undo(self, settings):
+        """Step back; returns the (section, key) pairs that changed in settings"""
+        return self._move(self._undo, self._redo, settings)
+
+    def redo(self, settings):
+        """Step forward again; returns the (section, key) pairs that changed in settings"""
+        return self._move(self._redo, self._undo, settings)
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    @property
+    def undo_label(self):
+        return self._undo[-1][1] if self._undo else None
+
+    @property
+    def redo_label(self):
+        return self._redo[-1][1] if self._redo else None
@@ -0,0 +1,151 @@
+"""
+Lossless INI documents for Ark Settings Generator
+
+A server's GameUserSettings.ini and Game.ini hold much more than the two
+sections the app edits: [SessionSettings], [MessageOfTheDay], comments, mod
+keys the schema does not know, and the server's own key order and spelling.
+IniDocument keeps every line of an imported file exactly as read (line
+endings and byte order mark included) and renders copies in which only given
+lines are replaced, so writing back an untouched import gives the same bytes.
+"""
+
+import collections
+
+from inifile import COMMENT_PREFIXES
+
+# One key line: 0-based line number, key as spelled in the file, stripped value
+Entry = collections.namedtuple('Entry', ['line', 'key', 'value'])
+
+_BOM = b'\xef\xbb\xbf'
+
+
+class IniDocument:
+    """
+    Every line of an INI file, with its key lines indexed by section.
+
+    Args:
+        text: File content; lines are split on '\\n' only, so a '\\r' of a
+              CRLF file stays part of its line and is written back as read
+        bom: Whether the file started with a UTF-8 byte order mark
+    """
+
+    def __init__(self, text='', bom=False):
+        self.bom = bom
+        # '\n'.join(self.lines) is always the original text
+        self.lines = text.split('\n')
+        self.newline = '\r\n' if self.lines[0].endswith('\r') else '\n'
+        self._entries = {}
+        # Lowercase section -> last header or key line, where new keys are added
+        self._ends = {}
+        self.separator = None
+        section = None
+        for number, line in enumerate(self.lines):
+            stripped = line.strip()
+            if not stripped or stripped.startswith(COMMENT_PREFIXES):
+                continue
+            if stripped[0] == '[' and stripped[-1] == ']':
+                section = stripped[1:-1].strip().lower()
+                self._entries.setdefault(section, [])
+                self._ends[section] = number
+                continue
+            key, sep, value = stripped.partition('=')
+            if not sep:
+                continue
+            if self.separator is None:
+                self.separator = ' = ' if key.endswith(' ') and value.startswith(' ') else '='
+            self._entries.setdefault(section, []).append(Entry(number, key.strip(), value.strip()))
+            self._ends[section] = number
+        if self.separator is None:
+            self.separator = '='
+
+    @classmethod
+    def read(cls, path):
+        """Read a file; bytes that are not UTF-8 survive the round trip unchanged"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        bom = data.startswith(_BOM)
+        return cls(data[len(_BOM) if bom else 0:].decode('utf-8', 'surrogateescape'), bom)
+
+    def encode(self, text):
+        """Encode text rendered from this document the way the file was stored"""
+        return (_BOM if self.bom else b'') + text.encode('utf-8', 'surrogateescape')
+
+    def entries(self, section=None):
+        """Return the Entry records of a section (matched case-insensitively), in file order"""
+        return self._entries.get(None if section is None else section.lower(), [])
+
+    def iter_entries(self):
+        """Yield (lowercase section, key, value) for every key line, like inifile.iter_entries"""
+        for section, entries in self._entries.items():
+            for entry in entries:
+                yield section, entry.key, entry.value
+
+    def key_line(self, line, value):
+        """Return key line `line` with a new value, keeping its spelling, spacing and line ending"""
+        text = self.lines[line]
+        end = '\r' if text.endswith('\r') else ''
+        head, _, rest = text.partition('=')
+        stripped = rest.lstrip(' \t')
+        return f'{head}={rest[:len(rest) - len(stripped)]}{value}{end}'
+
+    def new_line(self, key, value):
+        """Return a new key line in the style of this file"""
+        return f'{key}{self.separator}{value}{self.newline[:-1]}'
+
+    def text(self):
+        return '\n'.join(self.lines)
+
+    def edits(self, replace=None, append=None):
+        """
+        Resolve line replacements and added keys into the edits lines_with() applies.
+
+        Args:
+            replace: Line number -> list of lines that take its place (empty
+                     to delete it); lines carry no '\\n'
+            append: Section name -> lines added after the section's last key
+                    line; sections the file lacks are added at the end
+
+        Returns:
+            (replace, tail): replace with the added keys folded in, and the
+            lines of new sections for the end of the file
+        """
+        replace = dict(replace or {})
+        tail = []
+        for section, lines in (append or {}).items():
+            if not lines:
+                continue
+            end = self._ends.get(section.lower())
+            if end is None:
+                tail.append(f'[{section}]{self.newline[:-1]}')
+                tail.extend(lines)
+            else:
+                replace[end] = replace.get(end, [self.lines[end]]) + list(lines)
+        return replace, tail
+
+    def lines_with(self, replace, tail):
+        """Return the document lines with edits from edits() applied; other lines are shared"""
+        out = []
+        start = 0
+        for number in sorted(replace):
+            out.extend(self.lines[start:number])
+            out.extend(replace[number])
+            start = number + 1
+        out.extend(self.lines[start:])
+        if tail:
+            # Keep the final newline after the new sections, and a blank line before them
+            final = out and out[-1] == ''
+            if final:
+                out.pop()
+            if out and out[-1].strip():
+                out.append(self.newline[:-1])
+            out.extend(tail)
+            if final:
+                out.append('')
+        return out
+
+    def render(self, replace=None, append=None):
+        """Return the document text with some lines replaced and keys added (see edits())"""
+        replace, tail = self.edits(replace, append)
+        if not replace and not tail:
+            return self.text()
+        return '\n'.join(self.lines_with(replace, tail))
@@ -0,0 +1,83 @@
+"""
+INI file reading for Ark Settings Generator
+
+A single-pass streaming reader for Unreal-style INI files. Unlike configparser
+it keeps repeated keys (as used by ConfigOverrideNPCSpawnEntriesContainer and
+friends) in file order, never folds key case, and only holds one line in
+memory at a time.
+"""
+
+COMMENT_PREFIXES = (';', '#')
+
+
+def iter_numbered_lines(lines):
+    """
+    Yield (line number, section, key, value) for every key line in an iterable of lines.
+
+    Line numbers start at 1. Section is None for keys that appear before the
+    first section header. Blank lines, comments and lines without '=' are skipped.
+    """
+    section = None
+    for number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith(COMMENT_PREFIXES):
+            continue
+        if stripped[0] == '[' and stripped[-1] == ']':
+            section = stripped[1:-1].strip()
+            continue
+        key, sep, value = stripped.partition('=')
+        if not sep:
+            continue
+        yield number, section, key.strip(), value.strip()
+
+
+def iter_lines_entries(lines):
+    """Yield (section, key, value) for every key line, like iter_numbered_lines() without numbers"""
+    for _, section, key, value in iter_numbered_lines(lines):
+        yield section, key, value
+
+
+def iter_entries(path):
+    """Stream (section, key, value) entries from an INI file on disk"""
+    with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        yield from iter_lines_entries(f)
+
+
+def iter_numbered_entries(path):
+    """Stream (line number, section, key, value) entries from an INI file on disk"""
+    with open(path, 'r', encoding='utf-8-sig', errors='replace') as f:
+        yield from iter_numbered_lines(f)
+
+
+def read_section(path, section, key_index):
+    """
+    Collect the values of one section, mapped to canonical key names.
+
+    Args:
+        path: INI file to read
+        section: Section name, matched case-insensitively
+        key_index: Mapping of lowercase key -> sequence of canonical keys
+            (names or schema ids); keys missing from the index are skipped
+            without being stored
+
+    Returns:
+        Dict of canonical key -> list of raw string values in file order
+    """
+    return collect_section(iter_entries(path), section, key_index)
+
+
+def collect_section(entries, section, key_index):
+    """Like read_section(), for (section, key, value) entries from any source"""
+    wanted = section.lower()
+    values = {}
+    current = None
+    matches = False
+    for entry_section, key, value in entries:
+        if entry_section is not current:
+            current = entry_section
+            matches = current is not None and current.lower() == wanted
+        if not matches:
+            continue
+        for canonical in key_index.get(key.lower(), ()):
+            values.setdefault(canonical, []).append(value)
+    return values
@@ -0,0 +1,230 @@
+"""
+Crash-safe session journal for Ark Settings Generator
+
+Keeps the last session (settings, mode, mod list, selected dino) across
+restarts in two files in the session folder:
+
+    session.json   snapshot: everything that differs from the defaults
+    journal.log    append-only edits made since that snapshot
+
+Each edit is one checksummed line. Lines are written as edits happen but
+fsynced in batches (the GUI syncs at most every SYNC_MS), and once the
+journal grows past COMPACT_RECORDS lines it is folded into a new snapshot.
+An import or reset is journaled like an edit, as the keys it changed; the
+journal is only compacted at that size and when the session is closed.
+On startup the snapshot is loaded and the journal tail replayed; a line torn
+by a crash fails its checksum and ends the replay.
+
+The session folder is ARK_SESSION_DIR if set, otherwise a per-user folder.
+"""
+
+import collections
+import json
+import os
+import sys
+import zlib
+
+import fileio
+import schema
+
+ENV_VAR = 'ARK_SESSION_DIR'
+SNAPSHOT_FILE = 'session.json'
+JOURNAL_FILE = 'journal.log'
+SNAPSHOT_FORMAT = 1
+COMPACT_RECORDS = 5000
+# Longest delay between an edit and the fsync that makes it durable
+SYNC_MS = 500
+
+Session = collections.namedtuple('Session', ['settings', 'mode', 'dino'])
+
+
+def default_directory():
+    """Return the folder the session is kept in"""
+    if os.environ.get(ENV_VAR):
+        return os.environ[ENV_VAR]
+    if sys.platform.startswith('win'):
+        base = os.environ.get('APPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_STATE_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'state')
+    return os.path.join(base, 'ArkSettingsGenerator')
+
+
+def _encode(record):
+    payload = json.dumps(record, separators=(',', ':'), ensure_ascii=False)
+    return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n".encode('utf-8')
+
+
+def _decode(line):
+    """Return the record on a journal line, or None if the line is torn or corrupt"""
+    if not line.endswith(b'\n') or len(line) < 10 or line[8:9] != b' ':
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload.decode('utf-8'))
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def _changes(settings):
+    """Return the values that differ from the schema defaults, per section"""
+    changes = {}
+    for section, values in settings.items():
+        for key, value in values.items():
+            setting = schema.get(section, key)
+            if setting is None or value != setting.default or type(value) is not setting.type:
+                changes.setdefault(section, {})[key] = value
+    return changes
+
+
+def _apply(session, record):
+    op = record[1]
+    if op == 'set':
+        session.settings.setdefault(record[2], {})[record[3]] = record[4]
+    elif op == 'del':
+        session.settings.get(record[2], {}).pop(record[3], None)
+    elif op == 'mode':
+        session = session._replace(mode=record[2])
+    elif op == 'dino':
+        session = session._replace(dino=record[2])
+    return session
+
+
+class Journal:
+    """
+    Append-only edit journal plus snapshot for one session folder.
+
+    Args:
+        directory: Session folder (created if missing)
+        state: Callable returning the current Session, used for compaction
+        compact_records: Journal lines after which the journal is compacted
+    """
+
+    def __init__(self, directory, state=None, compact_records=COMPACT_RECORDS):
+        self.directory = directory
+        self.state = state
+        self.compact_records = compact_records
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.seq = 0
+        self.records = 0
+        self.dirty = False
+        self._file = None
+
+    def restore(self, defaults, mode='basic', dino=None):
+        """
+        Load the snapshot and replay the journal tail.
+
+        Args:
+            defaults: Fresh default settings to apply the session to
+            mode, dino: Values used when the session does not set them
+
+        Returns:
+            Session, or None if there is no saved session
+        """
+        session = Session(defaults, mode, dino)
+        found = False
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get('format') == SNAPSHOT_FORMAT:
+                for section, values in snapshot['changes'].items():
+                    defaults.setdefault(section, {}).update(values)
+                session = session._replace(mode=snapshot.get('mode', mode), dino=snapshot.get('dino', dino))
+                self.seq = snapshot['seq']
+                found = True
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError):
+            # An unreadable snapshot is ignored; the journal may still hold edits
+            pass
+
+        snapshot_seq = self.seq
+        try:
+            with open(self.journal_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b''
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            record = _decode(line)
+            if record is None:
+                break
+            offset += len(line)
+            self.records += 1
+            if record[0] <= snapshot_seq:
+                continue
+            session = _apply(session, record)
+            self.seq = record[0]
+            found = True
+        if offset < len(data):
+            # Drop a torn tail so new edits are not appended after garbage
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(offset)
+        return session if found else None
+
+    def _append(self, record):
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.journal_path, 'ab')
+        self.seq += 1
+        self._file.write(_encode([self.seq] + record))
+        self.records += 1
+        self.dirty = True
+        if self.records >= self.compact_records and self.state is not None:
+            self.compact(self.state())
+
+    def record_settings(self, settings, keys):
+        """Append the current values of (section, key) pairs"""
+        for section, key in sorted(keys):
+            values = settings.get(section, {})
+            if key in values:
+                self._append(['set', section, key, values[key]])
+            else:
+                self._append(['del', section, key])
+
+    def record_mode(self, mode):
+        self._append(['mode', mode])
+
+    def record_dino(self, dino):
+        self._append(['dino', dino])
+
+    def sync(self):
+        """Flush and fsync appended edits; returns True if anything was written"""
+        if not self.dirty:
+            return False
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.dirty = False
+        return True
+
+    def compact(self, session):
+        """Write session as the new snapshot and start an empty journal"""
+        os.makedirs(self.directory, exist_ok=True)
+        snapshot = {
+            'format': SNAPSHOT_FORMAT,
+            'seq': self.seq,
+            'mode': session.mode,
+            'dino': session.dino,
+            'changes': _changes(session.settings),
+        }
+        fileio.write_atomic(self.snapshot_path, json.dumps(snapshot, ensure_ascii=False).encode('utf-8'))
+        # The snapshot covers every journal line up to seq, so a crash before
+        # the truncate only leaves lines that restore() skips
+        if self._file is not None:
+            self._file.close()
+        self._file = open(self.journal_path, 'wb')
+        os.fsync(self._file.fileno())
+        self.records = 0
+        self.dirty = False
+
+    def close(self, session=None):
+        """Compact into a final snapshot if session is given, otherwise sync; then close"""
+        if session is not None:
+            self.compact(session)
+        else:
+            self.sync()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
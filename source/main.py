@@ -3,40 +3,22 @@
 import os
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import configparser
-
-class ToolTip:
-    """Create a tooltip for a given widget"""
-    def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
-        self.tooltip = None
-        self.widget.bind("<Enter>", self.show_tooltip)
-        self.widget.bind("<Leave>", self.hide_tooltip)
-    
-    def show_tooltip(self, event=None):
-        if self.tooltip or not self.text:
-            return
-        x, y, _, _ = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0, 0, 0, 0)
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 25
-        
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-        
-        label = tk.Label(self.tooltip, text=self.text, 
-                        background="#2b2b2b", foreground="#00bfa5",
-                        relief="solid", borderwidth=1,
-                        font=("Segoe UI", 9),
-                        padx=8, pady=6,
-                        wraplength=300)
-        label.pack()
-    
-    def hide_tooltip(self, event=None):
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+
+import engine
+import history
+import journal
+import preview
+import schema
+import search
+import species
+import store
+import tracing
+import validate
+from scheduler import FrameScheduler
+from widgets import IniPreview, ToolTip, VirtualSettingsList
+
+# Most species shown in the dropdown at once; typing narrows the list
+SPECIES_CHOICES_LIMIT = 200
 
 class ArkSettingsGenerator:
     def __init__(self, root):
@@ -158,667 +140,83 @@ class ArkSettingsGenerator:
                        relief='flat',
                        borderwidth=1)
 
-        # Default settings
-        self.settings = {
-            'ServerSettings': {
-                'DifficultyOffset': 0.2,
-                'MaxPlayers': 70,
-                'ServerPassword': '',
-                'ServerAdminPassword': '',
-                'ServerName': '',
-                'ServerHardcore': False,
-                'DisablePvEGamma': False,
-                'EnablePvPGamma': False,
-                'AdminLogging': True,
-                'RCONEnabled': True,
-                'RCONPort': 32330,
-                'RCONServerGameLogBuffer': 600,
-                'DinoDamageMultiplier': 1.0,
-                'PlayerDamageMultiplier': 1.0,
-                'StructureDamageMultiplier': 1.0,
-                'PlayerResistanceMultiplier': 1.0,
-                'DinoResistanceMultiplier': 1.0,
-                'StructureResistanceMultiplier': 1.0,
-                'XPMultiplier': 1.0,
-                'TamingSpeedMultiplier': 1.0,
-                'HarvestAmountMultiplier': 1.0,
-                'HarvestHealthMultiplier': 1.0,
-                'DinoCountMultiplier': 1.0,
-                'ResourcesRespawnPeriodMultiplier': 1.0,
-                'PlayerCharacterWaterDrainMultiplier': 1.0,
-                'PlayerCharacterFoodDrainMultiplier': 1.0,
-                'PlayerCharacterStaminaDrainMultiplier': 1.0,
-                'PlayerCharacterHealthRecoveryMultiplier': 1.0,
-                'DinoCharacterFoodDrainMultiplier': 1.0,
-                'DinoCharacterStaminaDrainMultiplier': 1.0,
-                'DinoCharacterHealthRecoveryMultiplier': 1.0,
-                'DayCycleSpeedScale': 1.0,
-                'NightTimeSpeedScale': 1.0,
-                'DayTimeSpeedScale': 1.0,
-                'DisableWeatherFog': False,
-                'serverPVE': False,
-                'TheMaxStructuresInRange': 10500,
-                'bAllowPlatformSaddleMultiFloors': False,
-                'AllowCaveBuildingPvE': False,
-                'AllowCaveBuildingPvP': False,
-                'PvEDinoDecayPeriodMultiplier': 1.0,
-                'DisableDinoDecayPvE': False,
-                'DisableStructureDecayPvE': False,
-                'MaxTributeDinos': 20,
-                'MaxTributeItems': 50,
-                'TributeItemExpirationSeconds': 86400,
-                'TributeDinoExpirationSeconds': 86400,
-                'noTributeDownloads': False,
-                'alwaysNotifyPlayerJoined': False,
-                'alwaysNotifyPlayerLeft': False,
-                'allowThirdPersonPlayer': False,
-                'globalVoiceChat': False,
-                'proximityChat': False,
-                'ShowMapPlayerLocation': False,
-                'serverForceNoHud': False,
-                'AllowFlyerCarryPvE': False,
-                'RandomSupplyCratePoints': False,
-                'SupplyCrateLootQualityMultiplier': 1.0,
-                'FishingLootQualityMultiplier': 1.0,
-                'ItemStackSizeMultiplier': 1.0,
-                'ActiveEvent': 'None',
-                # Add more advanced settings here
-                'ActiveMods': '',
-                'AllowAnyoneBabyImprintCuddle': True,
-                'AlwaysAllowStructurePickup': False,
-                'AlwaysNotifyPlayerLeft': False,
-                'ArmadoggoDeathCooldown': 3600,
-                'AutoDestroyDecayedDinos': False,
-                'AutoDestroyOldStructuresMultiplier': 0.0,
-                'AutoSavePeriodMinutes': 15.0,
-                'BanListURL': 'https://cdn2.arkdedicated.com/asa/BanList.txt',
-                'bForceCanRideFliers': False,
-                'ClampItemSpoilingTimes': False,
-                'ClampItemStats': False,
-                'ClampResourceHarvestDamage': False,
-                'CosmeticWhitelistOverride': '',
-                'CosmoWeaponAmmoReloadAmount': 1,
-                'CustomDynamicConfigUrl': '',
-                'CustomLiveTuningUrl': 'https://cdn2.arkdedicated.com/asa/livetuningoverloads.json',
-                'DayCycleSpeedScale': 1.0,
-                'DayTimeSpeedScale': 1.0,
-                'DestroyTamesOverTheSoftTameLimit': False,
-                'DisableCryopodEnemyCheck': False,
-                'DisableCryopodFridgeRequirement': False,
-                'DisableDinoDecayPvE': False,
-                'DisableImprintDinoBuff': False,
-                'DisablePvEGamma': False,
-                'DisableStructureDecayPvE': False,
-                'DisableWeatherFog': False,
-                'DontAlwaysNotifyPlayerJoined': False,
-                'EnableExtraStructurePreventionVolumes': False,
-                'EnablePvPGamma': False,
-                'ExtinctionEventTimeInterval': 0,
-                'FastDecayUnsnappedCoreStructures': False,
-                'ForceAllStructureLocking': False,
-                'ForceGachaUnhappyInCaves': True,
-                'globalVoiceChat': False,
-                'IgnoreLimitMaxStructuresInRangeTypeFlag': False,
-                'ImplantSuicideCD': 28800,
-                'KickIdlePlayersPeriod': 3600.0,
-                'MaxCosmoWeaponAmmo': -1,
-                'MaxPersonalTamedDinos': 0,
-                'MaxPlatformSaddleStructureLimit': 75,
-                'MaxTamedDinos': 5000.0,
-                'MaxTamedDinos_SoftTameLimit': 5000,
-                'MaxTamedDinos_SoftTameLimit_CountdownForDeletionDuration': 604800,
-                'MaxTrainCars': 8,
-                'MaxTributeCharacters': 10,
-                'MaxTributeDinos': 20,
-                'MaxTributeItems': 50,
-                'NightTimeSpeedScale': 1.0,
-                'NonPermanentDiseases': False,
-                'NPCNetworkStasisRangeScalePlayerCountStart': 0,
-                'NPCNetworkStasisRangeScalePlayerCountEnd': 0,
-                'NPCNetworkStasisRangeScalePercentEnd': 0.55,
-                'OnlyAutoDestroyCoreStructures': False,
-                'OnlyDecayUnsnappedCoreStructures': False,
-                'OverrideOfficialDifficulty': 0.0,
-                'PerPlatformMaxStructuresMultiplier': 1.0,
-                'PersonalTamedDinosSaddleStructureCost': 0,
-                'PlatformSaddleBuildAreaBoundsMultiplier': 1.0,
-                'PlayerCharacterFoodDrainMultiplier': 1.0,
-                'PlayerCharacterHealthRecoveryMultiplier': 1.0,
-                'PlayerCharacterStaminaDrainMultiplier': 1.0,
-                'PlayerResistanceMultiplier': 1.0,
-                'PreventDiseases': False,
-                'PreventMateBoost': False,
-                'PreventOfflinePvP': False,
-                'PreventOfflinePvPInterval': 0.0,
-                'PreventSpawnAnimations': False,
-                'PreventTribeAlliances': False,
-                'PvEStructureDecayPeriodMultiplier': 1.0,
-                'PvPDinoDecay': False,
-                'PvPStructureDecay': False,
-                'RaidDinoCharacterFoodDrainMultiplier': 1.0,
-                'RandomSupplyCratePoints': False,
-                'RCONEnabled': True,
-                'RCONPort': 27020,
-                'RCONServerGameLogBuffer': 600.0,
-                'ResourcesRespawnPeriodMultiplier': 1.0,
-                'ServerAdminPassword': '',
-                'ServerAutoForceRespawnWildDinosInterval': 0.0,
-                'ServerCrosshair': True,
-                'ServerForceNoHUD': False,
-                'ServerHardcore': False,
-                'ServerPassword': '',
-                'serverPVE': False,
-                'ShowFloatingDamageText': False,
-                'ShowMapPlayerLocation': True,
-                'SpectatorPassword': '',
-                'StructureDamageMultiplier': 1.0,
-                'StructurePickupHoldDuration': 0.5,
-                'StructurePickupTimeAfterPlacement': 30.0,
-                'StructurePreventResourceRadiusMultiplier': 1.0,
-                'TheMaxStructuresInRange': 10500,
-                'TribeLogDestroyedEnemyStructures': False,
-                'TribeNameChangeCooldown': 15.0,
-                'UseFjordurTraversalBuff': False,
-                'UseOptimizedHarvestingHealth': False,
-                'XPMultiplier': 1.0,
-                'YoungIceFoxDeathCooldown': 3600,
-            },
-            '/script/shootergame.shootergamemode': {
-                'MatingIntervalMultiplier': 1.0,
-                'EggHatchSpeedMultiplier': 1.0,
-                'BabyMatureSpeedMultiplier': 1.0,
-                'BabyFoodConsumptionSpeedMultiplier': 1.0,
-                'BabyImprintingStatScaleMultiplier': 1.0,
-                'BabyCuddleIntervalMultiplier': 1.0,
-                'BabyCuddleGracePeriodMultiplier': 1.0,
-                'BabyCuddleLoseImprintQualitySpeedMultiplier': 1.0,
-                'MaxTamedDinos': 4000,
-                'MaxNumberOfPlayersInTribe': 0,
-                'MaxAlliancesPerTribe': 0,
-                'MaxTribesPerAlliance': 0,
-                'bOnlyAllowSpecifiedEngrams': False,
-                'CustomRecipeEffectivenessMultiplier': 1.0,
-                'CustomRecipeSkillMultiplier': 1.0,
-                'bDisableLootCrates': False,
-                'bAppendItemSets': False,
-                'GlobalSpoilingTimeMultiplier': 1.0,
-                'GlobalItemDecompositionTimeMultiplier': 1.0,
-                'GlobalCorpseDecompositionTimeMultiplier': 1.0,
-                'PvEStructureDecayPeriodMultiplier': 1.0,
-                'PvEDinoDecayPeriodMultiplier': 1.0,
-                'bAutoPvETimer': False,
-                'bPvEDisableFriendlyFire': False,
-                'bDisableFriendlyFire': False,
-                'bAllowCustomRecipes': True,
-                'bAutoUnlockAllEngrams': False,
-                # Add more Game.ini settings
-                'AutoPvEStartTimeSeconds': 0.0,
-                'bAllowFlyerSpeedLeveling': False,
-                'bAllowPlatformSaddleMultiFloors': False,
-                'bAllowSpeedLeveling': False,
-                'bAutoPvEUseSystemTime': False,
-                'bDisableDinoBreeding': False,
-                'bDisableDinoRiding': False,
-                'bDisableDinoTaming': False,
-                'bIncreasePvPRespawnInterval': True,
-                'bPassiveDefensesDamageRiderlessDinos': False,
-                'bUseCorpseLocator': True,
-                'bUseDinoLevelUpAnimations': True,
-                'bUseSingleplayerSettings': False,
-                'bUseTameLimitForStructuresOnly': False,
-                'CheatTeleportLocations': '',
-                'ConfigAddNPCSpawnEntriesContainer': '',
-                'ConfigOverrideItemCraftingCosts': '',
-                'ConfigOverrideItemMaxQuantity': '',
-                'ConfigOverrideNPCSpawnEntriesContainer': '',
-                'ConfigOverrideSupplyCrateItems': '',
-                'ConfigSubtractNPCSpawnEntriesContainer': '',
-                'CraftingSkillBonusMultiplier': 1.0,
-                'CraftXPMultiplier': 1.0,
-                'CropGrowthSpeedMultiplier': 1.0,
-                'ExcludeItemIndices': '',
-                'FastDecayInterval': 43200,
-                'FishingLootQualityMultiplier': 1.0,
-                'FuelConsumptionIntervalMultiplier': 1.0,
-                'GenericXPMultiplier': 1.0,
-                'HairGrowthSpeedMultiplier': 1.0,
-                'HarvestResourceItemAmountClassMultipliers': '',
-                'HarvestXPMultiplier': 1.0,
-                'IncreasePvPRespawnIntervalBaseAmount': 60.0,
-                'IncreasePvPRespawnIntervalCheckPeriod': 300.0,
-                'LayEggIntervalMultiplier': 1.0,
-                'LevelExperienceRampOverrides': '',
-                'LimitNonPlayerDroppedItemsCount': 0,
-                'LimitNonPlayerDroppedItemsRange': 0,
-                'MatingIntervalMultiplier': 1.0,
-                'MaxFallSpeedMultiplier': 1.0,
-                'MaxNumberOfPlayersInTribe': 0,
-                'MaxStructuresInSmallRadius': 0,
-                'MaxStructuresToProcess': 0,
-                'NPCReplacements': '',
-                'OverrideMaxExperiencePointsDino': 0,
-                'OverrideMaxExperiencePointsPlayer': 0,
-                'OverridePlayerLevelEngramPoints': '',
-                'PassiveTameIntervalMultiplier': 1.0,
-                'PerLevelStatsMultiplier_Player': '',
-                'PerLevelStatsMultiplier_DinoTamed': '',
-                'PerLevelStatsMultiplier_DinoWild': '',
-                'PhotoModeRangeLimit': 3000,
-                'PlayerBaseStatMultipliers': '',
-                'PlayerHarvestingDamageMultiplier': 1.0,
-                'PoopIntervalMultiplier': 1.0,
-                'PreventBreedingForClassNames': '',
-                'PreventDinoTameClassNames': '',
-                'PreventOfflinePvPConnectionInvincibleInterval': 5.0,
-                'ResourceNoReplenishRadiusPlayers': 1.0,
-                'ResourceNoReplenishRadiusStructures': 1.0,
-                'SpecialXPMultiplier': 1.0,
-                'TribeSlotReuseCooldown': 0.0,
-                'UseCorpseLifeSpanMultiplier': 1.0,
-                'WildDinoCharacterFoodDrainMultiplier': 1.0,
-                'LimitTurretsRange': 10000.0,
-                'ValgueroMemorialEntries': '',
-                'AdjustableMutagenSpawnDelayMultiplier': 1.0,
-                'BaseHexagonRewardMultiplier': 1.0,
-                'bDisableHexagonStore': False,
-                'bDisableDefaultMapItemSets': False,
-                'bDisableGenesisMissions': False,
-                'bDisableWorldBuffs': False,
-                'bEnableWorldBuffScaling': False,
-                'bGenesisUseStructuresPreventionVolumes': False,
-                'bHexStoreAllowOnlyEngramTradeOption': False,
-                'HexagonCostMultiplier': 1.0,
-            }
-        }
-
-        # Descriptions for settings
-        self.descriptions = {
-            'DifficultyOffset': 'Base difficulty level (0.0-1.0+); higher increases dino levels and aggression.',
-            'MaxPlayers': 'Maximum concurrent players.',
-            'ServerPassword': 'Password to join (leave empty for open server).',
-            'ServerAdminPassword': 'Password for admin commands.',
-            'ServerName': 'Name displayed in server browser.',
-            'ServerHardcore': 'Enables hardcore mode; players reset to level 1 on death.',
-            'DisablePvEGamma': 'Prevents gamma/console commands in PvE.',
-            'EnablePvPGamma': 'Allows gamma/console commands in PvP.',
-            'AdminLogging': 'Logs admin commands to chat.',
-            'RCONEnabled': 'Enables RCON for remote admin.',
-            'RCONPort': 'Port for RCON connections.',
-            'RCONServerGameLogBuffer': 'Lines of gamelogs sent over RCON.',
-            'DinoDamageMultiplier': 'Dino attack damage (>1.0 increases).',
-            'PlayerDamageMultiplier': 'Player attack damage (>1.0 increases).',
-            'StructureDamageMultiplier': 'Structure attack damage (>1.0 increases).',
-            'PlayerResistanceMultiplier': 'Player damage resistance (>1.0 increases taken damage).',
-            'DinoResistanceMultiplier': 'Dino damage resistance (>1.0 increases taken damage).',
-            'StructureResistanceMultiplier': 'Structure damage resistance (>1.0 increases taken damage).',
-            'XPMultiplier': 'Experience points earned (>1.0 increases XP).',
-            'TamingSpeedMultiplier': 'Dino taming speed (>1.0 speeds up taming).',
-            'HarvestAmountMultiplier': 'Harvest yield (>1.0 increases resources).',
-            'HarvestHealthMultiplier': 'Harvestable object durability (>1.0 makes harder to destroy).',
-            'DinoCountMultiplier': 'Dino spawn count (>1.0 increases spawns).',
-            'ResourcesRespawnPeriodMultiplier': 'Resource respawn time (>1.0 slows respawns).',
-            'PlayerCharacterWaterDrainMultiplier': 'Player water consumption (>1.0 increases thirst).',
-            'PlayerCharacterFoodDrainMultiplier': 'Player food consumption (>1.0 increases hunger).',
-            'PlayerCharacterStaminaDrainMultiplier': 'Player stamina consumption (>1.0 increases fatigue).',
-            'PlayerCharacterHealthRecoveryMultiplier': 'Player health regen (>1.0 speeds up healing).',
-            'DinoCharacterFoodDrainMultiplier': 'Dino food consumption (>1.0 increases hunger).',
-            'DinoCharacterStaminaDrainMultiplier': 'Dino stamina consumption (>1.0 increases fatigue).',
-            'DinoCharacterHealthRecoveryMultiplier': 'Dino health regen (>1.0 speeds up healing).',
-            'DayCycleSpeedScale': 'Day/night cycle speed (>1.0 accelerates).',
-            'NightTimeSpeedScale': 'Night duration relative to day (>1.0 lengthens nights).',
-            'DayTimeSpeedScale': 'Day duration relative to night (>1.0 lengthens days).',
-            'DisableWeatherFog': 'Disables fog effects.',
-            'serverPVE': 'Enables PvE mode; disables PvP.',
-            'TheMaxStructuresInRange': 'Max structures per player/tribe in an area.',
-            'bAllowPlatformSaddleMultiFloors': 'Allows multiple floors on platform saddles.',
-            'AllowCaveBuildingPvE': 'Allows building in caves in PvE.',
-            'AllowCaveBuildingPvP': 'Allows building in caves in PvP.',
-            'PvEDinoDecayPeriodMultiplier': 'Dino ownership decay time in PvE (>1.0 slows decay).',
-            'DisableDinoDecayPvE': 'Disables dino ownership decay in PvE.',
-            'DisableStructureDecayPvE': 'Disables structure decay in PvE.',
-            'MaxTributeDinos': 'Max dinos transferable via tributes.',
-            'MaxTributeItems': 'Max items transferable via tributes.',
-            'TributeItemExpirationSeconds': 'Tribute expiration time in seconds.',
-            'TributeDinoExpirationSeconds': 'Dino tribute expiration time in seconds.',
-            'noTributeDownloads': 'Disables downloading tributes.',
-            'alwaysNotifyPlayerJoined': 'Notifies all players of joins.',
-            'alwaysNotifyPlayerLeft': 'Notifies all players of leaves.',
-            'allowThirdPersonPlayer': 'Enables third-person view.',
-            'globalVoiceChat': 'Makes voice chat global.',
-            'proximityChat': 'Limits chat to nearby players.',
-            'ShowMapPlayerLocation': 'Shows player locations on map.',
-            'serverForceNoHud': 'Forces HUD off.',
-            'AllowFlyerCarryPvE': 'Allows flyers to carry dinos/players in PvE.',
-            'RandomSupplyCratePoints': 'Randomizes supply crate locations.',
-            'SupplyCrateLootQualityMultiplier': 'Loot quality in crates (>1.0 improves).',
-            'FishingLootQualityMultiplier': 'Fishing loot quality (>1.0 improves).',
-            'ItemStackSizeMultiplier': 'Global item stack sizes (>1.0 increases stacks).',
-            'ActiveEvent': 'Enables a specified event (e.g., WinterWonderland for colors).',
-            'ActiveMods': 'Comma-separated list of mod IDs to load.',
-            'AllowAnyoneBabyImprintCuddle': 'Allows anyone to cuddle imprinted babies.',
-            'AllowCrateSpawnsOnTopOfStructures': 'Allows supply crates on structures.',
-            'AllowCryoFridgeOnSaddle': 'Allows cryofridges on platform saddles.',
-            'AllowFlyingStaminaRecovery': 'Allows stamina recovery while flying.',
-            'AllowHideDamageSourceFromLogs': 'Hides damage sources in tribe logs.',
-            'AllowHitMarkers': 'Enables hit markers for ranged attacks.',
-            'AllowIntegratedSPlusStructures': 'Enables S+ structures.',
-            'AllowMultipleAttachedC4': 'Allows multiple C4 per dino.',
-            'AllowRaidDinoFeeding': 'Allows feeding Titanosaurs.',
-            'AllowSharedConnections': 'Allows family sharing connections.',
-            'AllowTekSuitPowersInGenesis': 'Enables Tek suit powers in Genesis.',
-            'AllowThirdPersonPlayer': 'Enables third-person view.',
-            'AlwaysAllowStructurePickup': 'Disables pickup timer.',
-            'AlwaysNotifyPlayerLeft': 'Always notifies of player leaves.',
-            'ArmadoggoDeathCooldown': 'Cooldown for Armadoggo respawn.',
-            'AutoDestroyDecayedDinos': 'Auto-destroys decayed dinos.',
-            'AutoDestroyOldStructuresMultiplier': 'Multiplier for auto-destroying old structures.',
-            'AutoSavePeriodMinutes': 'Auto-save interval in minutes.',
-            'BanListURL': 'URL for global ban list.',
-            'bForceCanRideFliers': 'Forces flyer riding on maps where disabled.',
-            'ClampItemSpoilingTimes': 'Clamps spoiling times to max.',
-            'ClampItemStats': 'Enables stat clamping for items.',
-            'ClampResourceHarvestDamage': 'Limits harvest damage to resources.',
-            'CosmeticWhitelistOverride': 'URL for whitelisted cosmetics.',
-            'CosmoWeaponAmmoReloadAmount': 'Ammo reload amount for Cosmo weapon.',
-            'CustomDynamicConfigUrl': 'URL for dynamic config.',
-            'CustomLiveTuningUrl': 'URL for live tuning.',
-            'DestroyTamesOverTheSoftTameLimit': 'Destroys dinos over soft tame limit.',
-            'DisableCryopodEnemyCheck': 'Allows cryopods near enemies.',
-            'DisableCryopodFridgeRequirement': 'Allows cryopods without fridge.',
-            'DisableImprintDinoBuff': 'Disables imprint stat bonuses.',
-            'DontAlwaysNotifyPlayerJoined': 'Disables global join notifications.',
-            'EnableExtraStructurePreventionVolumes': 'Prevents building in resource areas.',
-            'ExtinctionEventTimeInterval': 'Time interval for extinction event.',
-            'FastDecayUnsnappedCoreStructures': 'Fast decay for unsnapped structures.',
-            'ForceAllStructureLocking': 'Forces all structures to lock.',
-            'ForceGachaUnhappyInCaves': 'Makes Gachas unhappy in caves.',
-            'IgnoreLimitMaxStructuresInRangeTypeFlag': 'Ignores decorative structure limits.',
-            'ImplantSuicideCD': 'Cooldown for implant respawn.',
-            'KickIdlePlayersPeriod': 'Idle kick time in seconds.',
-            'MaxCosmoWeaponAmmo': 'Max ammo for Cosmo weapon.',
-            'MaxPersonalTamedDinos': 'Per-tribe dino limit.',
-            'MaxPlatformSaddleStructureLimit': 'Max structures on platform saddles.',
-            'MaxTamedDinos': 'Global tamed dino cap.',
-            'MaxTamedDinos_SoftTameLimit': 'Soft tame limit.',
-            'MaxTamedDinos_SoftTameLimit_CountdownForDeletionDuration': 'Deletion countdown for over-limit dinos.',
-            'MaxTrainCars': 'Max cars per train.',
-            'MaxTributeCharacters': 'Max characters transferable.',
-            'NightTimeSpeedScale': 'Night duration relative to day.',
-            'NonPermanentDiseases': 'Makes diseases non-permanent.',
-            'NPCNetworkStasisRangeScalePlayerCountStart': 'Min players for stasis scaling.',
-            'NPCNetworkStasisRangeScalePlayerCountEnd': 'Max players for stasis scaling.',
-            'NPCNetworkStasisRangeScalePercentEnd': 'Max scale percentage.',
-            'OnlyAutoDestroyCoreStructures': 'Only auto-destroys core structures.',
-            'OnlyDecayUnsnappedCoreStructures': 'Only decays unsnapped core structures.',
-            'OverrideOfficialDifficulty': 'Overrides official difficulty.',
-            'PerPlatformMaxStructuresMultiplier': 'Multiplier for max structures on saddles.',
-            'PersonalTamedDinosSaddleStructureCost': 'Tame slots used by platform saddles.',
-            'PlatformSaddleBuildAreaBoundsMultiplier': 'Build area multiplier for saddles.',
-            'PlayerResistanceMultiplier': 'Player damage resistance.',
-            'PreventDiseases': 'Disables diseases.',
-            'PreventMateBoost': 'Disables mate boosting.',
-            'PreventOfflinePvP': 'Enables offline raid prevention.',
-            'PreventOfflinePvPInterval': 'Time before ORP activates.',
-            'PreventSpawnAnimations': 'Disables spawn animations.',
-            'PreventTribeAlliances': 'Disables tribe alliances.',
-            'PvEStructureDecayPeriodMultiplier': 'Structure decay in PvE.',
-            'PvPDinoDecay': 'Enables dino decay in PvP during ORP.',
-            'PvPStructureDecay': 'Enables structure decay in PvP during ORP.',
-            'RaidDinoCharacterFoodDrainMultiplier': 'Food drain for raid dinos.',
-            'RCONServerGameLogBuffer': 'RCON game log buffer.',
-            'ResourcesRespawnPeriodMultiplier': 'Resource respawn time.',
-            'ServerAutoForceRespawnWildDinosInterval': 'Force respawn interval for wild dinos.',
-            'ServerCrosshair': 'Enables crosshair.',
-            'ServerForceNoHUD': 'Forces no HUD.',
-            'ServerHardcore': 'Hardcore mode.',
-            'ServerPassword': 'Server password.',
-            'ShowFloatingDamageText': 'Enables floating damage text.',
-            'SpectatorPassword': 'Password for spectator mode.',
-            'StructurePickupHoldDuration': 'Pickup hold duration.',
-            'StructurePickupTimeAfterPlacement': 'Pickup time after placement.',
-            'StructurePreventResourceRadiusMultiplier': 'Resource radius multiplier.',
-            'TribeLogDestroyedEnemyStructures': 'Logs enemy structure destruction.',
-            'TribeNameChangeCooldown': 'Cooldown for tribe name changes.',
-            'UseFjordurTraversalBuff': 'Enables traversal buff in Fjordur.',
-            'UseOptimizedHarvestingHealth': 'Optimizes harvesting health.',
-            'XPMultiplier': 'XP multiplier.',
-            'YoungIceFoxDeathCooldown': 'Cooldown for Veilwyn respawn.',
-            'MatingIntervalMultiplier': 'Time between mating attempts (>1.0 increases interval).',
-            'EggHatchSpeedMultiplier': 'Egg hatching speed (>1.0 speeds up).',
-            'BabyMatureSpeedMultiplier': 'Baby growth speed (>1.0 speeds up maturation).',
-            'BabyFoodConsumptionSpeedMultiplier': 'Baby food consumption (>1.0 increases hunger).',
-            'BabyImprintingStatScaleMultiplier': 'Imprinting stat bonus (>1.0 increases bonuses).',
-            'BabyCuddleIntervalMultiplier': 'Cuddle frequency (>1.0 increases intervals).',
-            'BabyCuddleGracePeriodMultiplier': 'Grace period before imprint loss (>1.0 extends).',
-            'BabyCuddleLoseImprintQualitySpeedMultiplier': 'Imprint loss speed (>1.0 speeds up loss).',
-            'MaxTamedDinos': 'Global tamed dino cap.',
-            'MaxNumberOfPlayersInTribe': 'Tribe size limit (0 = unlimited).',
-            'MaxAlliancesPerTribe': 'Alliance limit per tribe (0 = unlimited).',
-            'MaxTribesPerAlliance': 'Tribes per alliance (0 = unlimited).',
-            'bOnlyAllowSpecifiedEngrams': 'Hides unspecified engrams.',
-            'CustomRecipeEffectivenessMultiplier': 'Custom recipe efficiency (>1.0 improves output).',
-            'CustomRecipeSkillMultiplier': 'Crafting skill impact on recipes (>1.0 increases impact).',
-            'bDisableLootCrates': 'Disables loot crates.',
-            'bAppendItemSets': 'Appends to crate items instead of overriding.',
-            'GlobalSpoilingTimeMultiplier': 'Item spoilage time (>1.0 prolongs).',
-            'GlobalItemDecompositionTimeMultiplier': 'Dropped item decay (>1.0 slows).',
-            'GlobalCorpseDecompositionTimeMultiplier': 'Corpse decay (>1.0 slows).',
-            'PvEStructureDecayPeriodMultiplier': 'Structure decay in PvE (>1.0 slows).',
-            'PvEDinoDecayPeriodMultiplier': 'Dino decay in PvE (>1.0 slows).',
-            'bAutoPvETimer': 'Enables timed PvE/PvP switches.',
-            'bPvEDisableFriendlyFire': 'Disables friendly fire in PvE.',
-            'bDisableFriendlyFire': 'Disables friendly fire in PvP.',
-            'bAllowCustomRecipes': 'Enables custom recipes.',
-            'bAutoUnlockAllEngrams': 'Unlocks all engrams.',
-            'AutoPvEStartTimeSeconds': 'PvE start time in seconds.',
-            'bAllowFlyerSpeedLeveling': 'Enables flyer speed leveling.',
-            'bAllowPlatformSaddleMultiFloors': 'Allows multiple floors on saddles.',
-            'bAllowSpeedLeveling': 'Enables speed leveling.',
-            'bAutoPvEUseSystemTime': 'Uses system time for PvE timer.',
-            'bDisableDinoBreeding': 'Disables dino breeding.',
-            'bDisableDinoRiding': 'Disables dino riding.',
-            'bDisableDinoTaming': 'Disables dino taming.',
-            'bIncreasePvPRespawnInterval': 'Increases PvP respawn interval.',
-            'bPassiveDefensesDamageRiderlessDinos': 'Allows defenses to damage riderless dinos.',
-            'bUseCorpseLocator': 'Enables corpse locator.',
-            'bUseDinoLevelUpAnimations': 'Enables level up animations.',
-            'bUseSingleplayerSettings': 'Uses singleplayer settings.',
-            'bUseTameLimitForStructuresOnly': 'Applies tame limit only to structures.',
-            'CheatTeleportLocations': 'Teleport locations for cheat commands.',
-            'ConfigAddNPCSpawnEntriesContainer': 'Adds NPC spawn entries.',
-            'ConfigOverrideItemCraftingCosts': 'Overrides crafting costs.',
-            'ConfigOverrideItemMaxQuantity': 'Overrides item max quantities.',
-            'ConfigOverrideNPCSpawnEntriesContainer': 'Overrides NPC spawns.',
-            'ConfigOverrideSupplyCrateItems': 'Overrides supply crate items.',
-            'ConfigSubtractNPCSpawnEntriesContainer': 'Subtracts NPC spawn entries.',
-            'CraftingSkillBonusMultiplier': 'Crafting skill bonus.',
-            'CraftXPMultiplier': 'XP from crafting.',
-            'CropGrowthSpeedMultiplier': 'Crop growth speed.',
-            'ExcludeItemIndices': 'Excludes items from crates.',
-            'FastDecayInterval': 'Fast decay interval.',
-            'FuelConsumptionIntervalMultiplier': 'Fuel consumption interval.',
-            'GenericXPMultiplier': 'Generic XP multiplier.',
-            'HairGrowthSpeedMultiplier': 'Hair growth speed.',
-            'HarvestResourceItemAmountClassMultipliers': 'Harvest multipliers by class.',
-            'HarvestXPMultiplier': 'XP from harvesting.',
-            'IncreasePvPRespawnIntervalBaseAmount': 'Base PvP respawn increase.',
-            'IncreasePvPRespawnIntervalCheckPeriod': 'Check period for respawn increase.',
-            'LayEggIntervalMultiplier': 'Egg laying interval.',
-            'LevelExperienceRampOverrides': 'Custom XP ramps.',
-            'LimitNonPlayerDroppedItemsCount': 'Limit for dropped items.',
-            'LimitNonPlayerDroppedItemsRange': 'Range for dropped items limit.',
-            'MaxFallSpeedMultiplier': 'Fall speed multiplier.',
-            'MaxStructuresInSmallRadius': 'Max structures in small radius.',
-            'MaxStructuresToProcess': 'Max structures to process per tick.',
-            'NPCReplacements': 'Replaces NPCs.',
-            'OverrideMaxExperiencePointsDino': 'Max XP for dinos.',
-            'OverrideMaxExperiencePointsPlayer': 'Max XP for players.',
-            'OverridePlayerLevelEngramPoints': 'Engram points per level.',
-            'PassiveTameIntervalMultiplier': 'Passive tame interval.',
-            'PerLevelStatsMultiplier_Player': 'Player stat multipliers per level.',
-            'PerLevelStatsMultiplier_DinoTamed': 'Tamed dino stat multipliers.',
-            'PerLevelStatsMultiplier_DinoWild': 'Wild dino stat multipliers.',
-            'PhotoModeRangeLimit': 'Photo mode range limit.',
-            'PlayerBaseStatMultipliers': 'Base stat multipliers for players.',
-            'PlayerHarvestingDamageMultiplier': 'Player harvesting damage.',
-            'PoopIntervalMultiplier': 'Poop interval.',
-            'PreventBreedingForClassNames': 'Prevents breeding for classes.',
-            'PreventDinoTameClassNames': 'Prevents taming for classes.',
-            'PreventOfflinePvPConnectionInvincibleInterval': 'Invincible interval after login.',
-            'ResourceNoReplenishRadiusPlayers': 'Resource radius around players.',
-            'ResourceNoReplenishRadiusStructures': 'Resource radius around structures.',
-            'SpecialXPMultiplier': 'Special XP multiplier.',
-            'TribeSlotReuseCooldown': 'Tribe slot reuse cooldown.',
-            'UseCorpseLifeSpanMultiplier': 'Corpse lifespan multiplier.',
-            'WildDinoCharacterFoodDrainMultiplier': 'Wild dino food drain.',
-            'LimitTurretsRange': 'Turret range limit.',
-            'ValgueroMemorialEntries': 'Memorial entries for Valguero.',
-            'AdjustableMutagenSpawnDelayMultiplier': 'Mutagen spawn delay.',
-            'BaseHexagonRewardMultiplier': 'Hexagon reward multiplier.',
-            'bDisableHexagonStore': 'Disables hexagon store.',
-            'bDisableDefaultMapItemSets': 'Disables default map item sets.',
-            'bDisableGenesisMissions': 'Disables Genesis missions.',
-            'bDisableWorldBuffs': 'Disables world buffs.',
-            'bEnableWorldBuffScaling': 'Enables world buff scaling.',
-            'bGenesisUseStructuresPreventionVolumes': 'Uses prevention volumes in Genesis.',
-            'bHexStoreAllowOnlyEngramTradeOption': 'Allows only engram trades in store.',
-            'HexagonCostMultiplier': 'Hexagon cost multiplier.',
-        }
+        # Settings come from the headless engine; keys, types and descriptions from the schema.
+        # The last session (snapshot plus journal tail) is restored on top of the defaults.
+        settings = engine.load_defaults()
+        self.events_data = engine.EVENTS_DATA
+        self.journal = journal.Journal(journal.default_directory(), state=self.session_state)
+        try:
+            session = self.journal.restore(settings, 'basic', species.DEFAULT_SPECIES)
+        except OSError:
+            session = None
+        if session is None:
+            session = journal.Session(settings, 'basic', species.DEFAULT_SPECIES)
+        self._journal_sync_id = None
 
-        # Dino data for calculations
-        self.dino_data = {
-            'Argentavis': {
-                'taming_time': 180,  # minutes
-                'maturation_time': 48,  # hours
-                'imprint_interval': 8,  # hours between imprints
-                'max_imprint': 100,  # max imprint %
-                'incubation_time': 120,  # minutes
-                'mating_cooldown': 18,  # hours
-                'status': 'working'
-            },
-            'Rex': {
-                'taming_time': 240,
-                'maturation_time': 72,
-                'imprint_interval': 8,
-                'max_imprint': 100,
-                'incubation_time': 180,
-                'mating_cooldown': 18,
-                'status': 'working'
-            },
-            'Spino': {
-                'taming_time': 300,
-                'maturation_time': 96,
-                'imprint_interval': 8,
-                'max_imprint': 100,
-                'incubation_time': 240,
-                'mating_cooldown': 18,
-                'status': 'working'
-            },
-            'Giga': {
-                'taming_time': 360,
-                'maturation_time': 120,
-                'imprint_interval': 8,
-                'max_imprint': 100,
-                'incubation_time': 300,
-                'mating_cooldown': 18,
-                'status': 'working'
-            },
-            'Titanosaur': {
-                'taming_time': 480,
-                'maturation_time': 168,
-                'imprint_interval': 12,
-                'max_imprint': 100,
-                'incubation_time': 480,
-                'mating_cooldown': 24,
-                'status': 'working'
-            },
-            'Megalodon': {
-                'taming_time': 120,
-                'maturation_time': 36,
-                'imprint_interval': 6,
-                'max_imprint': 100,
-                'incubation_time': 90,
-                'mating_cooldown': 12,
-                'status': 'working'
-            },
-            'Mosasaurus': {
-                'taming_time': 180,
-                'maturation_time': 60,
-                'imprint_interval': 8,
-                'max_imprint': 100,
-                'incubation_time': 150,
-                'mating_cooldown': 18,
-                'status': 'working'
-            },
-            'Plesiosaur': {
-                'taming_time': 150,
-                'maturation_time': 48,
-                'imprint_interval': 6,
-                'max_imprint': 100,
-                'incubation_time': 120,
-                'mating_cooldown': 15,
-                'status': 'working'
-            },
-            'Therizino': {
-                'taming_time': 210,
-                'maturation_time': 84,
-                'imprint_interval': 8,
-                'max_imprint': 100,
-                'incubation_time': 180,
-                'mating_cooldown': 18,
-                'status': 'working'
-            },
-            'Thylacoleo': {
-                'taming_time': 90,
-                'maturation_time': 30,
-                'imprint_interval': 6,
-                'max_imprint': 100,
-                'incubation_time': 75,
-                'mating_cooldown': 12,
-                'status': 'working'
-            }
-        }
-
-        # Events data with status indicators
-        self.events_data = {
-            'None': {'status': 'working', 'description': 'No active event'},
-            'WinterWonderland': {'status': 'working', 'description': 'Winter holiday event - cosmetics and bonuses'},
-            'WinterWonderland2': {'status': 'working', 'description': 'Winter 2nd year event'},
-            'WinterWonderland3': {'status': 'working', 'description': 'Winter 3rd year event'},
-            'WinterWonderland4': {'status': 'working', 'description': 'Winter 4th year event'},
-            'WinterWonderland5': {'status': 'working', 'description': 'Winter 5th year event'},
-            'WinterWonderland6': {'status': 'working', 'description': 'Winter 6th year event'},
-            'WinterWonderland7': {'status': 'working', 'description': 'Winter 7th year event'},
-            'Easter': {'status': 'working', 'description': 'Eggcellent Adventure - Easter egg hunt themes'},
-            'SummerBash': {'status': 'working', 'description': 'Summer vacation event - beach themes'},
-            'FearEvolved': {'status': 'working', 'description': 'Fear Evolved/Fear Ascended - Halloween spooky creatures'},
-            'TurkeyTrial': {'status': 'working', 'description': 'Turkey Trial - Thanksgiving event with challenges'},
-            'LoveEvolved': {'status': 'working', 'description': 'Love Evolved - Valentine breeding event bonuses'},
-            'Birthday': {'status': 'working', 'description': 'Birthday/Anniversary event - celebration bonuses'},
-            'EvolutionEvent': {'status': 'working', 'description': 'Evolution Event - creature variant spawns'},
-            'ExtraLife': {'status': 'working', 'description': 'Extra Life event - charity event bonuses'},
-            'ARKaeology': {'status': 'working', 'description': 'ARKaeology - artifact discovery event'},
-            'ARKdependenceDay': {'status': 'working', 'description': 'ARKdependence Day - July 4th themed event'},
-        }
+        # Every write goes through the store, which tracks the keys that differ from the defaults
+        self.store = store.SettingsStore(settings)
+        self.settings = self.store.values
 
         # Selected dino variable
-        self.selected_dino = tk.StringVar(value='Argentavis')
+        self.selected_dino = tk.StringVar(value=session.dino)
 
         # Mode: 'basic' or 'advanced'
-        self.mode = tk.StringVar(value='basic')
+        self.mode = tk.StringVar(value=session.mode)
 
-        # Basic settings subsets
-        self.basic_server = [
-            'DifficultyOffset', 'MaxPlayers', 'ServerPassword', 'ServerAdminPassword', 'ServerName', 'ServerHardcore',
-            'DinoDamageMultiplier', 'PlayerDamageMultiplier', 'XPMultiplier', 'TamingSpeedMultiplier', 'HarvestAmountMultiplier',
-            'DayCycleSpeedScale', 'serverPVE', 'ShowMapPlayerLocation', 'TheMaxStructuresInRange', 'ActiveEvent'
-        ]
-        self.basic_game = [
-            'MatingIntervalMultiplier', 'EggHatchSpeedMultiplier', 'BabyMatureSpeedMultiplier', 'BabyImprintingStatScaleMultiplier',
-            'MaxTamedDinos', 'GlobalSpoilingTimeMultiplier', 'PvEStructureDecayPeriodMultiplier'
-        ]
+        # Slider, entry and resize work is coalesced and run at most once per frame
+        self.scheduler = FrameScheduler(self.root)
+
+        # Built settings views per (section, mode) and keys edited while a view was hidden
+        self._settings_views = {}
+        self._stale_keys = {}
+
+        # Undo/redo snapshots; edits are recorded once per frame
+        self.history = history.History(self.settings)
+        self._history_keys = set()
+        # Set while an undo or redo is applied, so it is not recorded as a new step
+        self._restoring = False
+
+        # Keys edited since the preview was last patched
+        self._preview_keys = set()
+
+        # Imported files by name; generate updates them in place instead of writing fresh files
+        self.imported_files = {}
+        self.store.subscribe(self.on_settings_changed)
 
         self.create_widgets()
+        self.root.protocol('WM_DELETE_WINDOW', self.on_close)
+
+    def session_state(self):
+        return journal.Session(self.settings, self.mode.get(), self.selected_dino.get())
+
+    def schedule_journal_sync(self):
+        """fsync journaled edits at most once per journal.SYNC_MS, instead of once per edit"""
+        if self._journal_sync_id is None:
+            self._journal_sync_id = self.root.after(journal.SYNC_MS, self.sync_journal)
+
+    def sync_journal(self):
+        self._journal_sync_id = None
+        try:
+            self.journal.sync()
+        except OSError:
+            pass
+
+    def journal_edit(self, record, *args):
+        """Append to the session journal; a read-only session folder only disables saving"""
+        try:
+            record(*args)
+        except OSError:
+            return
+        self.schedule_journal_sync()
+
+    def on_close(self):
+        """Save the session as a compact snapshot, then close the window"""
+        self.scheduler.flush()
+        try:
+            self.journal.close(self.session_state())
+        except OSError:
+            pass
+        self.root.destroy()
 
     def create_widgets(self):
         # Header frame with title
@@ -846,6 +244,19 @@ class ArkSettingsGenerator:
         ttk.Radiobutton(mode_inner, text="Basic", variable=self.mode, value='basic', command=self.switch_mode).pack(side=tk.LEFT, padx=15)
         ttk.Radiobutton(mode_inner, text="Advanced", variable=self.mode, value='advanced', command=self.switch_mode).pack(side=tk.LEFT, padx=15)
 
+        # Search filters the rows of every settings view through the inverted index
+        ttk.Label(mode_inner, text="🔍 Search:", style='Subtitle.TLabel').pack(side=tk.LEFT, padx=(30, 10))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(mode_inner, textvariable=self.search_var, width=28)
+        self.search_entry.pack(side=tk.LEFT)
+        ToolTip(self.search_entry, "Filter settings by key name or description (Ctrl+F, Esc clears)")
+        self.search_var.trace_add('write', lambda *args: self.scheduler.schedule('search', self.apply_search))
+        self.search_entry.bind('<Escape>', lambda e: self.search_var.set(''))
+        self.root.bind('<Control-f>', lambda e: self.search_entry.focus_set())
+        self._search_ids = None
+        # Build the index while idle so the first keystroke does not pay for it
+        self.root.after_idle(search.get_index().warm)
+
         # Button frame at top (pack before main_frame so it's visible)
         button_frame = ttk.Frame(self.root, style='TFrame')
         button_frame.pack(pady=(10, 15))
@@ -868,6 +279,24 @@ class ArkSettingsGenerator:
                                     width=22)
         self.reset_btn.pack(side=tk.LEFT, padx=10)
 
+        self.undo_btn = ttk.Button(button_frame,
+                                   text="↩ Undo",
+                                   command=self.undo,
+                                   width=10,
+                                   state='disabled')
+        self.undo_btn.pack(side=tk.LEFT, padx=(10, 4))
+
+        self.redo_btn = ttk.Button(button_frame,
+                                   text="↪ Redo",
+                                   command=self.redo,
+                                   width=10,
+                                   state='disabled')
+        self.redo_btn.pack(side=tk.LEFT, padx=(4, 10))
+
+        self.root.bind('<Control-z>', self.undo)
+        self.root.bind('<Control-y>', self.redo)
+        self.root.bind('<Control-Z>', self.redo)
+
         # Main content area with notebook and calculations
         main_frame = ttk.Frame(self.root)
         main_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
@@ -892,33 +321,23 @@ class ArkSettingsGenerator:
         
         ttk.Label(dino_frame, text="🦖 Select Dino:", style='TLabel').pack(anchor='w', pady=(5, 8))
         
-        # Format dino options with status indicators
-        dino_display_names = []
-        for dino_name in self.dino_data.keys():
-            status = self.dino_data[dino_name].get('status', 'unknown')
-            if status == 'working':
-                display_name = f"✅ {dino_name}"
-            else:
-                display_name = f"⏰ {dino_name} (Coming Soon)"
-            dino_display_names.append(display_name)
-        
-        dino_combo = ttk.Combobox(dino_frame, 
-                                 values=dino_display_names, 
-                                 state='readonly', 
-                                 width=20,
-                                 font=('Segoe UI', 10))
-        dino_combo.set("✅ Argentavis")  # Set default with status indicator
-        dino_combo.pack(fill='x', pady=(0, 5))
-        
-        # Handle combobox selection - extract actual dino name and update
-        def on_dino_select(event):
-            selected_text = dino_combo.get()
-            # Extract dino name from the display format
-            dino_name = selected_text.replace("✅ ", "").replace("⏰ ", "").replace(" (Coming Soon)", "")
-            self.selected_dino.set(dino_name)
-            self.update_calculations()
-        
-        dino_combo.bind('<<ComboboxSelected>>', on_dino_select)
+        # Species come from the packed catalog, which is only read when the
+        # dropdown is opened or the first calculation runs. Typing filters the
+        # list through the catalog's prefix index.
+        self.dino_combo = ttk.Combobox(dino_frame,
+                                       postcommand=lambda: self.fill_species_choices(self.dino_combo.get()),
+                                       width=20,
+                                       font=('Segoe UI', 10))
+        # Set the restored (or default) dino with its status indicator
+        catalog = species.get_catalog()
+        dino = self.selected_dino.get()
+        self.dino_combo.set(catalog.display_name(dino) if dino in catalog else f"✅ {dino}")
+        self.dino_combo.pack(fill='x', pady=(0, 5))
+        self._species_labels = {}
+
+        self.dino_combo.bind('<<ComboboxSelected>>', self.on_dino_select)
+        self.dino_combo.bind('<Return>', self.on_dino_select)
+        self.dino_combo.bind('<KeyRelease>', self.on_dino_typed)
 
         # Scrollable calculations frame
         calc_scrollable = ttk.Frame(self.calc_frame, style='Card.TFrame')
@@ -967,135 +386,76 @@ class ArkSettingsGenerator:
         self.mods_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.mods_tab, text='🎮 Mods')
 
+        # Preview of the files Generate would write, patched as settings change
+        self.preview_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.preview_tab, text='📄 Preview')
+
         # Populate tabs
         self.populate_tabs()
         self.create_mods_tab()
+        self.create_preview_tab()
 
         # Initial calculation (after variables are created)
         self.update_calculations()
-        
-        # Optimize window movement performance
-        self._configure_timer = None
-        self._canvases = []  # Track canvases for optimization
-        
-        def throttle_window_updates(event):
-            # Cancel pending timer if exists
-            if self._configure_timer:
-                self.root.after_cancel(self._configure_timer)
-            
-            # Disable canvas updates during window movement
-            for canvas in self._canvases:
-                if canvas.winfo_exists():
-                    canvas.configure(scrollregion=canvas.bbox("all"))
-            
-            # Re-enable after movement stops (100ms delay)
-            self._configure_timer = self.root.after(100, lambda: None)
-        
-        self.root.bind('<Configure>', throttle_window_updates)
 
+    @tracing.traced('update_calculations', 'gui')
     def update_calculations(self):
-        # Get current values (use default if variable doesn't exist yet)
-        taming_mult = getattr(self, 'server_TamingSpeedMultiplier', None)
-        if taming_mult is None:
-            taming_mult = 1.0
-        else:
-            taming_mult = taming_mult.get()
-
-        maturation_mult = getattr(self, 'game_BabyMatureSpeedMultiplier', None)
-        if maturation_mult is None:
-            maturation_mult = 1.0
-        else:
-            maturation_mult = maturation_mult.get()
-
-        imprint_mult = getattr(self, 'game_BabyImprintingStatScaleMultiplier', None)
-        if imprint_mult is None:
-            imprint_mult = 1.0
-        else:
-            imprint_mult = imprint_mult.get()
-
-        hatch_mult = getattr(self, 'game_EggHatchSpeedMultiplier', None)
-        if hatch_mult is None:
-            hatch_mult = 1.0
-        else:
-            hatch_mult = hatch_mult.get()
-
-        mating_mult = getattr(self, 'game_MatingIntervalMultiplier', None)
-        if mating_mult is None:
-            mating_mult = 1.0
-        else:
-            mating_mult = mating_mult.get()
-
-        # Get selected dino data
-        dino_name = self.selected_dino.get()
-        dino_stats = self.dino_data.get(dino_name, self.dino_data['Argentavis'])
+        values = engine.calculation_inputs(self.settings)
+        results = engine.calculate(values, self.selected_dino.get())
 
-        # Calculate adjusted times
-        taming_time = dino_stats['taming_time'] / taming_mult
-        maturation_time = dino_stats['maturation_time'] / maturation_mult
-        imprint_interval = dino_stats['imprint_interval'] / imprint_mult
-        max_imprint = dino_stats['max_imprint'] * imprint_mult
-        incubation_time = dino_stats['incubation_time'] / hatch_mult
-        mating_cooldown = dino_stats['mating_cooldown'] / mating_mult
+        def time_text(key, unit):
+            # A multiplier of 0 has no finite time
+            return 'n/a' if results[key] is None else f"{results[key]:.1f} {unit}"
 
         # Update labels
-        self.taming_values.config(text=f"{taming_time:.1f} minutes")
-        self.maturation_values.config(text=f"{maturation_time:.1f} hours")
+        self.taming_values.config(text=time_text('taming_time', 'minutes'))
+        self.maturation_values.config(text=time_text('maturation_time', 'hours'))
 
-        imprint_text = f"Interval: {imprint_interval:.1f} hrs\nMax Imprint: {max_imprint:.1f}%"
+        imprint_text = (f"Interval: {time_text('imprint_interval', 'hrs')}\n"
+                        f"Max Imprint: {results['max_imprint']:.1f}%")
         self.imprint_values.config(text=imprint_text)
 
-        self.incubation_values.config(text=f"{incubation_time:.1f} minutes")
-        self.mating_values.config(text=f"{mating_cooldown:.1f} hours")
-
-        # Calculate max wild dino level based on difficulty
-        difficulty_offset = getattr(self, 'server_DifficultyOffset', None)
-        if difficulty_offset is None:
-            difficulty_offset = 0.2
-        else:
-            difficulty_offset = difficulty_offset.get()
-
-        override_difficulty = getattr(self, 'server_OverrideOfficialDifficulty', None)
-        if override_difficulty is not None:
-            override_difficulty = override_difficulty.get()
-            if override_difficulty > 0:
-                difficulty_offset = override_difficulty
+        self.incubation_values.config(text=time_text('incubation_time', 'minutes'))
+        self.mating_values.config(text=time_text('mating_cooldown', 'hours'))
 
-        # Ark dino level formula: base level + (difficulty * multiplier)
-        # Base max level is typically 150, difficulty multiplier is usually 30
-        max_dino_level = 150 + (difficulty_offset * 30)
-        
-        level_text = f"Level: {max_dino_level:.0f}\nDifficulty: {difficulty_offset:.2f}"
+        level_text = f"Level: {results['max_dino_level']:.0f}\nDifficulty: {results['difficulty']:.2f}"
         self.level_values.config(text=level_text)
 
+    def fill_species_choices(self, text=''):
+        """Show the species matching typed text in the dropdown, with status indicators"""
+        catalog = species.get_catalog()
+        if text.startswith(('✅', '⏰')):
+            # The box holds a chosen label, so opening it lists everything again
+            text = ''
+        names = catalog.search(text, SPECIES_CHOICES_LIMIT)
+        self._species_labels = {catalog.display_name(name): name for name in names}
+        self.dino_combo.configure(values=list(self._species_labels))
+
+    def on_dino_typed(self, event):
+        if event.keysym in ('Return', 'Up', 'Down', 'Escape', 'Tab'):
+            return
+        self.scheduler.schedule('species_filter', lambda: self.fill_species_choices(self.dino_combo.get()))
+
+    def on_dino_select(self, event=None):
+        # Labels map straight back to catalog names; typed text picks the best match
+        text = self.dino_combo.get()
+        name = self._species_labels.get(text)
+        if name is None:
+            matches = species.get_catalog().search(text, 1)
+            if not matches:
+                return
+            name = matches[0]
+            self.dino_combo.set(species.get_catalog().display_name(name))
+        self.selected_dino.set(name)
+        self.journal_edit(self.journal.record_dino, name)
+        self.update_calculations()
+
     def switch_mode(self):
-        # Clear canvas tracking list
-        if hasattr(self, '_canvases'):
-            self._canvases.clear()
-        
-        # Destroy existing content and repopulate
-        for widget in self.server_tab.winfo_children():
-            widget.destroy()
-        for widget in self.game_tab.winfo_children():
-            widget.destroy()
+        # Built views are cached per mode, so switching only swaps which one is packed
         self.populate_tabs()
+        self.refresh_preview()
+        self.journal_edit(self.journal.record_mode, self.mode.get())
 
-    def format_slider_value(self, value):
-        """Format slider value to show thousands decimal (e.g., 1.000)"""
-        try:
-            return f"{float(value):.3f}"
-        except:
-            return "0.000"
-    
-    def validate_numeric_only(self, P):
-        """Validate that input is numeric only"""
-        if P == "":
-            return True
-        try:
-            float(P)
-            return True
-        except ValueError:
-            return False
-    
     def import_ini_files(self):
         """Import existing INI files to populate settings"""
         # Ask user to select GameUserSettings.ini
@@ -1117,69 +477,18 @@ class ArkSettingsGenerator:
             return
         
         try:
-            # Parse GameUserSettings.ini
-            config1 = configparser.ConfigParser()
-            config1.read(game_user_path)
-            
-            if 'ServerSettings' in config1:
-                for key, value in config1['ServerSettings'].items():
-                    if key in self.settings['ServerSettings']:
-                        # Convert to appropriate type
-                        default_value = self.settings['ServerSettings'][key]
-                        if isinstance(default_value, bool):
-                            self.settings['ServerSettings'][key] = value.lower() in ['true', '1', 'yes']
-                        elif isinstance(default_value, int):
-                            try:
-                                self.settings['ServerSettings'][key] = int(value)
-                            except:
-                                pass
-                        elif isinstance(default_value, float):
-                            try:
-                                self.settings['ServerSettings'][key] = float(value)
-                            except:
-                                pass
-                        else:
-                            self.settings['ServerSettings'][key] = value
-            
-            # Parse Game.ini
-            config2 = configparser.ConfigParser()
-            config2.read(game_path)
+            self.scheduler.flush()
+            imported = {schema.SERVER_SECTION: {}, schema.GAME_SECTION: {}}
+            self.imported_files = engine.load_ini_documents(imported, game_user_path, game_path)
+            # One transaction and one undo step; only rows whose values changed are re-read
+            with self.store.transaction("Import INI files"):
+                self.store.update(imported)
+            # The preview now shows the imported files as generate will update them
+            self.refresh_preview()
             
-            if '/script/shootergame.shootergamemode' in config2:
-                for key, value in config2['/script/shootergame.shootergamemode'].items():
-                    if key in self.settings['/script/shootergame.shootergamemode']:
-                        # Convert to appropriate type
-                        default_value = self.settings['/script/shootergame.shootergamemode'][key]
-                        if isinstance(default_value, bool):
-                            self.settings['/script/shootergame.shootergamemode'][key] = value.lower() in ['true', '1', 'yes']
-                        elif isinstance(default_value, int):
-                            try:
-                                self.settings['/script/shootergame.shootergamemode'][key] = int(value)
-                            except:
-                                pass
-                        elif isinstance(default_value, float):
-                            try:
-                                self.settings['/script/shootergame.shootergamemode'][key] = float(value)
-                            except:
-                                pass
-                        else:
-                            self.settings['/script/shootergame.shootergamemode'][key] = value
-            
-            # Update GUI with imported values
-            for section, settings in self.settings.items():
-                prefix = 'server_' if section == 'ServerSettings' else 'game_'
-                for key, value in settings.items():
-                    var_name = f'{prefix}{key}'
-                    if hasattr(self, var_name):
-                        var = getattr(self, var_name)
-                        if hasattr(var, 'set'):
-                            var.set(value)
-            
-            # Load mods if present
-            if hasattr(self, 'mods_listbox'):
-                self.load_mods_to_listbox()
-            
-            messagebox.showinfo("Success", "INI files imported successfully!")
+            messagebox.showinfo("Success", "INI files imported successfully!\n\n"
+                                           "Generate keeps their other sections, comments and "
+                                           "unknown keys and only rewrites changed values.")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import INI files: {str(e)}")
@@ -1200,11 +509,41 @@ class ArkSettingsGenerator:
         except:
             pass
 
+    @tracing.traced('populate_tabs', 'gui')
     def populate_tabs(self):
-        self.create_server_settings()
-        self.create_game_settings()
+        mode = self.mode.get()
+        self.server_list = self.show_settings_view(schema.SERVER_SECTION, mode)
+        self.game_list = self.show_settings_view(schema.GAME_SECTION, mode)
         # Mods tab is created separately and persists across mode switches
 
+    def show_settings_view(self, section, mode):
+        """Show the cached settings view for a section and mode, building it on first use"""
+        view = self._settings_views.get((section, mode))
+        if view is None:
+            if section == schema.SERVER_SECTION:
+                view = self.create_server_settings(mode)
+            else:
+                view = self.create_game_settings(mode)
+            self._settings_views[(section, mode)] = view
+            view[1].set_filter(self._search_ids)
+
+        for (other_section, _), (container, _) in self._settings_views.items():
+            if other_section == section and container is not view[0]:
+                container.pack_forget()
+        container, settings_list = view
+        container.pack(fill='both', expand=True)
+
+        # Only rows edited while this view was hidden are re-read
+        settings_list.refresh_keys(self._stale_keys.pop((section, mode), set()))
+        return settings_list
+
+    def apply_search(self):
+        """Show only the settings matching the search box, best matches first"""
+        text = self.search_var.get()
+        self._search_ids = [setting.id for setting in search.get_index().search(text)] if text.strip() else None
+        for _, settings_list in self._settings_views.values():
+            settings_list.set_filter(self._search_ids)
+
     def create_mods_tab(self):
         # Clear existing widgets if any
         for widget in self.mods_tab.winfo_children():
@@ -1317,7 +656,7 @@ class ArkSettingsGenerator:
     def load_mods_to_listbox(self):
         """Load mods from ActiveMods setting to listbox"""
         self.mods_listbox.delete(0, tk.END)
-        active_mods = self.settings['ServerSettings'].get('ActiveMods', '')
+        active_mods = self.settings[schema.SERVER_SECTION].get('ActiveMods', '')
         if active_mods:
             mod_list = [mod.strip() for mod in active_mods.split(',') if mod.strip()]
             for mod in mod_list:
@@ -1380,177 +719,12 @@ class ArkSettingsGenerator:
     def update_active_mods(self):
         """Update ActiveMods setting from listbox"""
         mods = self.mods_listbox.get(0, tk.END)
-        self.settings['ServerSettings']['ActiveMods'] = ','.join(mods)
-
-    def create_server_settings(self):
-        canvas = tk.Canvas(self.server_tab, bg=self.colors['bg_dark'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.server_tab, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='TFrame')
-
-        # Register canvas for performance optimization
-        if hasattr(self, '_canvases'):
-            self._canvases.append(canvas)
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Removed scrollbar bindings to prevent lag during window moves
-        # Canvas handles scrolling automatically
-
-        canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
-        scrollbar.pack(side="right", fill="y", pady=10)
-
-        # Update scroll region when content changes
-        def update_scroll_region():
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        scrollable_frame.bind('<Configure>', lambda e: canvas.after_idle(update_scroll_region))
-
-        # Enable mouse wheel scrolling
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
-        # Unbind when leaving the canvas to avoid conflicts
-        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
-
-        settings_to_show = self.basic_server if self.mode.get() == 'basic' else list(self.settings['ServerSettings'].keys())
-
-        row = 0
-        for key in settings_to_show:
-            if key in self.descriptions:
-                # Setting name with modern styling and tooltip
-                label = tk.Label(scrollable_frame, 
-                                text=f"ℹ️ {key}", 
-                                font=('Segoe UI', 10, 'bold'),
-                                fg=self.colors['text_primary'],
-                                bg=self.colors['bg_dark'],
-                                cursor='hand2')
-                label.grid(row=row, column=0, sticky='w', padx=10, pady=(15, 5))
-                
-                # Add tooltip to label
-                desc = self.descriptions.get(key, '')
-                ToolTip(label, desc)
-                
-                # Description with better visibility
-                desc_label = tk.Label(scrollable_frame, 
-                                     text=desc, 
-                                     font=('Segoe UI', 9),
-                                     fg=self.colors['text_secondary'],
-                                     bg=self.colors['bg_dark'],
-                                     wraplength=500,
-                                     justify='left')
-                desc_label.grid(row=row+1, column=0, columnspan=4, sticky='w', padx=10, pady=(0, 5))
-                value = self.settings['ServerSettings'].get(key, 0)
-                if isinstance(value, bool):
-                    var = tk.BooleanVar(value=value)
-                    chk = ttk.Checkbutton(scrollable_frame, variable=var)
-                    chk.grid(row=row, column=1, padx=5, pady=2)
-                    setattr(self, f'server_{key}', var)
-                elif isinstance(value, int):
-                    var = tk.IntVar(value=value)
-                    # Add numeric validation
-                    vcmd = (scrollable_frame.register(self.validate_numeric_only), '%P')
-                    spin = ttk.Spinbox(scrollable_frame, from_=0, to=100000, textvariable=var, width=10,
-                                      validate='key', validatecommand=vcmd)
-                    spin.grid(row=row, column=1, padx=5, pady=2)
-                    setattr(self, f'server_{key}', var)
-                elif isinstance(value, float):
-                    var = tk.DoubleVar(value=value)
-                    # Create StringVar for formatted display in label
-                    display_var = tk.StringVar(value=self.format_slider_value(value))
-                    # Create StringVar for formatted display in entry
-                    entry_display_var = tk.StringVar(value=self.format_slider_value(value))
-                    
-                    # Determine if this key needs calculation updates
-                    needs_calc_update = key in ['DifficultyOffset', 'TamingSpeedMultiplier', 'OverrideOfficialDifficulty']
-                    
-                    def update_display(val, var=var, display_var=display_var, entry_var=entry_display_var, needs_calc=needs_calc_update):
-                        formatted = self.format_slider_value(var.get())
-                        display_var.set(formatted)
-                        entry_var.set(formatted)
-                        if needs_calc:
-                            self.update_calculations()
-                    
-                    scale = ttk.Scale(scrollable_frame, from_=0.0, to=10.0, variable=var, orient='horizontal',
-                                     command=lambda val, v=var, d=display_var, e=entry_display_var, n=needs_calc_update: update_display(val, v, d, e, n))
-                    scale.grid(row=row, column=1, padx=5, pady=2)
-                    
-                    # Display label with formatted thousands
-                    display_label = ttk.Label(scrollable_frame, textvariable=display_var, width=8)
-                    display_label.grid(row=row, column=2, padx=5, pady=2)
-                    
-                    # Entry with formatted display
-                    vcmd = (scrollable_frame.register(self.validate_numeric_only), '%P')
-                    entry = ttk.Entry(scrollable_frame, textvariable=entry_display_var, width=10,
-                                     validate='key', validatecommand=vcmd)
-                    entry.grid(row=row, column=3, padx=5, pady=2)
-                    
-                    # Update actual var and displays when entry changes
-                    def on_entry_change(event, var=var, display_var=display_var, entry_var=entry_display_var, needs_calc=needs_calc_update):
-                        try:
-                            value_str = entry_var.get()
-                            if value_str:
-                                value_float = float(value_str)
-                                var.set(value_float)
-                                formatted = self.format_slider_value(value_float)
-                                display_var.set(formatted)
-                                if needs_calc:
-                                    self.update_calculations()
-                        except:
-                            pass
-                    
-                    entry.bind('<KeyRelease>', on_entry_change)
-                    setattr(self, f'server_{key}', var)
-                else:  # string
-                    var = tk.StringVar(value=value)
-                    if key == 'ActiveEvent':
-                        # Format event options with status indicators
-                        event_display_names = []
-                        for event_name in sorted(self.events_data.keys()):
-                            status = self.events_data[event_name].get('status', 'unknown')
-                            if status == 'working':
-                                display_name = f"✅ {event_name}"
-                            else:
-                                display_name = f"⏰ {event_name} (Coming Soon)"
-                            event_display_names.append(display_name)
-                        
-                        combo = ttk.Combobox(scrollable_frame, values=event_display_names, state='readonly', width=35)
-                        combo.grid(row=row, column=1, columnspan=2, padx=5, pady=2, sticky='w')
-                        
-                        # Create a closure to capture combo properly
-                        def make_event_handler(c, v):
-                            def on_event_select(event_obj):
-                                selected_text = c.get()
-                                # Remove indicators to get actual event name
-                                event_name = selected_text.replace("✅ ", "").replace("⏰ ", "").replace(" (Coming Soon)", "")
-                                v.set(event_name)
-                            return on_event_select
-                        
-                        # Set default value based on current value
-                        default_value = "✅ None" if value == 'None' else f"✅ {value}"
-                        if default_value in event_display_names:
-                            combo.set(default_value)
-                        else:
-                            combo.set(event_display_names[0] if event_display_names else "✅ None")
-                        
-                        combo.bind('<<ComboboxSelected>>', make_event_handler(combo, var))
-                        setattr(self, f'server_{key}_combo', combo)
-                    else:
-                        entry = ttk.Entry(scrollable_frame, textvariable=var, width=15)
-                        entry.grid(row=row, column=1, padx=5, pady=2)
-                    setattr(self, f'server_{key}', var)
-                row += 2
+        if self.store.set(schema.SERVER_SECTION, 'ActiveMods', ','.join(mods)):
+            # Keep the ActiveMods row in the shown settings view in sync
+            self.server_list.refresh_keys({'ActiveMods'})
 
-        # Add footer with tips
-        row += 1
-        ttk.Separator(scrollable_frame, orient='horizontal').grid(row=row, column=0, columnspan=4, sticky='ew', pady=20, padx=10)
-        row += 1
-        ttk.Label(scrollable_frame, 
-                 text="💡 Server Settings Tips:", 
-                 font=('Segoe UI', 11, 'bold'),
-                 foreground=self.colors['accent'],
-                 background=self.colors['bg_dark']).grid(row=row, column=0, sticky='w', padx=10, pady=(10, 8))
-        row += 1
+    def create_server_settings(self, mode):
+        settings_to_show = schema.section_settings(schema.SERVER_SECTION, mode)
         tips = [
             "• DifficultyOffset 1.0 = 150 max level. Each 0.033 adds ~1 level (5.0 = 300)",
             "• XP multiplier affects both players and dinos - higher = faster leveling",
@@ -1558,156 +732,11 @@ class ArkSettingsGenerator:
             "• TamingSpeed 10.0+ allows instant tames but may skip feeding animations",
             "• Set MaxTributeDinos=0 to disable cross-server dino transfers"
         ]
-        for tip in tips:
-            ttk.Label(scrollable_frame, 
-                     text=tip, 
-                     font=('Segoe UI', 9),
-                     foreground=self.colors['text_secondary'],
-                     background=self.colors['bg_dark']).grid(row=row, column=0, columnspan=4, sticky='w', padx=10, pady=3)
-            row += 1
-
-        # Removed scroll region update entirely to prevent any canvas performance issues
-        # Canvas should handle scrolling automatically without explicit scrollregion
-
-    def create_game_settings(self):
-        canvas = tk.Canvas(self.game_tab, bg=self.colors['bg_dark'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.game_tab, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style='TFrame')
-
-        # Register canvas for performance optimization
-        if hasattr(self, '_canvases'):
-            self._canvases.append(canvas)
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Removed scrollbar bindings to prevent lag during window moves
-        # Canvas handles scrolling automatically
-
-        canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
-        scrollbar.pack(side="right", fill="y", pady=10)
-
-        # Update scroll region when content changes
-        def update_scroll_region():
-            canvas.configure(scrollregion=canvas.bbox("all"))
-        scrollable_frame.bind('<Configure>', lambda e: canvas.after_idle(update_scroll_region))
-
-        # Enable mouse wheel scrolling
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
-        # Unbind when leaving the canvas to avoid conflicts
-        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", on_mousewheel))
-        canvas.bind("<Leave>", lambda e: canvas.unbind_all("<MouseWheel>"))
-
-        settings_to_show = self.basic_game if self.mode.get() == 'basic' else list(self.settings['/script/shootergame.shootergamemode'].keys())
-
-        row = 0
-        for key in settings_to_show:
-            if key in self.descriptions:
-                # Setting name with tooltip
-                label = tk.Label(scrollable_frame, 
-                                text=f"ℹ️ {key}", 
-                                font=('Segoe UI', 10, 'bold'),
-                                fg=self.colors['text_primary'],
-                                bg=self.colors['bg_dark'],
-                                cursor='hand2')
-                label.grid(row=row, column=0, sticky='w', padx=10, pady=(15, 5))
-                
-                # Add tooltip
-                desc = self.descriptions.get(key, '')
-                ToolTip(label, desc)
-                
-                # Description
-                desc_label = tk.Label(scrollable_frame, 
-                                     text=desc, 
-                                     font=('Segoe UI', 9),
-                                     fg=self.colors['text_secondary'],
-                                     bg=self.colors['bg_dark'],
-                                     wraplength=500,
-                                     justify='left')
-                desc_label.grid(row=row+1, column=0, columnspan=4, sticky='w', padx=10, pady=(0, 5))
-                
-                value = self.settings['/script/shootergame.shootergamemode'].get(key, 0)
-                if isinstance(value, bool):
-                    var = tk.BooleanVar(value=value)
-                    chk = ttk.Checkbutton(scrollable_frame, variable=var)
-                    chk.grid(row=row, column=1, padx=5, pady=2)
-                    setattr(self, f'game_{key}', var)
-                elif isinstance(value, int):
-                    var = tk.IntVar(value=value)
-                    # Add numeric validation
-                    vcmd = (scrollable_frame.register(self.validate_numeric_only), '%P')
-                    spin = ttk.Spinbox(scrollable_frame, from_=0, to=100000, textvariable=var, width=10,
-                                      validate='key', validatecommand=vcmd)
-                    spin.grid(row=row, column=1, padx=5, pady=2)
-                    setattr(self, f'game_{key}', var)
-                elif isinstance(value, float):
-                    var = tk.DoubleVar(value=value)
-                    # Create StringVar for formatted display in label
-                    display_var = tk.StringVar(value=self.format_slider_value(value))
-                    # Create StringVar for formatted display in entry
-                    entry_display_var = tk.StringVar(value=self.format_slider_value(value))
-                    
-                    # Determine if this key needs calculation updates
-                    needs_calc_update = key in ['BabyMatureSpeedMultiplier', 'BabyImprintingStatScaleMultiplier', 
-                                               'EggHatchSpeedMultiplier', 'MatingIntervalMultiplier']
-                    
-                    def update_display(val, var=var, display_var=display_var, entry_var=entry_display_var, needs_calc=needs_calc_update):
-                        formatted = self.format_slider_value(var.get())
-                        display_var.set(formatted)
-                        entry_var.set(formatted)
-                        if needs_calc:
-                            self.update_calculations()
-                    
-                    scale = ttk.Scale(scrollable_frame, from_=0.0, to=10.0, variable=var, orient='horizontal',
-                                     command=lambda val, v=var, d=display_var, e=entry_display_var, n=needs_calc_update: update_display(val, v, d, e, n))
-                    scale.grid(row=row, column=1, padx=5, pady=2)
-                    
-                    # Display label with formatted thousands
-                    display_label = ttk.Label(scrollable_frame, textvariable=display_var, width=8)
-                    display_label.grid(row=row, column=2, padx=5, pady=2)
-                    
-                    # Entry with formatted display
-                    vcmd = (scrollable_frame.register(self.validate_numeric_only), '%P')
-                    entry = ttk.Entry(scrollable_frame, textvariable=entry_display_var, width=10,
-                                     validate='key', validatecommand=vcmd)
-                    entry.grid(row=row, column=3, padx=5, pady=2)
-                    
-                    # Update actual var and displays when entry changes
-                    def on_entry_change(event, var=var, display_var=display_var, entry_var=entry_display_var, needs_calc=needs_calc_update):
-                        try:
-                            value_str = entry_var.get()
-                            if value_str:
-                                value_float = float(value_str)
-                                var.set(value_float)
-                                formatted = self.format_slider_value(value_float)
-                                display_var.set(formatted)
-                                if needs_calc:
-                                    self.update_calculations()
-                        except:
-                            pass
-                    
-                    entry.bind('<KeyRelease>', on_entry_change)
-                    setattr(self, f'game_{key}', var)
-                else:  # string
-                    var = tk.StringVar(value=value)
-                    # Add numeric validation for string fields that represent numbers
-                    entry = ttk.Entry(scrollable_frame, textvariable=var, width=15)
-                    entry.grid(row=row, column=1, padx=5, pady=2)
-                    setattr(self, f'game_{key}', var)
-                row += 2
+        return self.create_settings_view(self.server_tab, schema.SERVER_SECTION, settings_to_show,
+                                         "💡 Server Settings Tips:", tips)
 
-        # Add footer with tips
-        row += 1
-        ttk.Separator(scrollable_frame, orient='horizontal').grid(row=row, column=0, columnspan=4, sticky='ew', pady=20, padx=10)
-        row += 1
-        ttk.Label(scrollable_frame, 
-                 text="💡 Game Settings Tips:", 
-                 font=('Segoe UI', 11, 'bold'),
-                 foreground=self.colors['accent'],
-                 background=self.colors['bg_dark']).grid(row=row, column=0, sticky='w', padx=10, pady=(10, 8))
-        row += 1
+    def create_game_settings(self, mode):
+        settings_to_show = schema.section_settings(schema.GAME_SECTION, mode)
         tips = [
             "• BabyMatureSpeed 36.0 + EggHatch 36.0 = ~10min raise (official: ~6hrs)",
             "• MatingInterval 0.01 = ~18sec cooldown (official: 18-48hrs per species)",
@@ -1715,132 +744,197 @@ class ArkSettingsGenerator:
             "• CuddleInterval multiplier doesn't exist - use MatureSpeed to adjust",
             "• MaxTamedDinos affects server performance - 5000+ causes lag spikes"
         ]
+        return self.create_settings_view(self.game_tab, schema.GAME_SECTION, settings_to_show,
+                                         "💡 Game Settings Tips:", tips)
+
+    def create_settings_view(self, tab, section, settings, tips_title, tips):
+        """Build a virtualized settings list with a tips footer; returns (container, list)"""
+        container = ttk.Frame(tab, style='TFrame')
+
+        # Add footer with tips
+        footer = ttk.Frame(container, style='TFrame')
+        footer.pack(side='bottom', fill='x')
+        ttk.Separator(footer, orient='horizontal').pack(fill='x', pady=(10, 5), padx=10)
+        ttk.Label(footer, 
+                 text=tips_title, 
+                 font=('Segoe UI', 11, 'bold'),
+                 foreground=self.colors['accent'],
+                 background=self.colors['bg_dark']).pack(anchor='w', padx=10, pady=(5, 8))
         for tip in tips:
-            ttk.Label(scrollable_frame, 
+            ttk.Label(footer, 
                      text=tip, 
                      font=('Segoe UI', 9),
                      foreground=self.colors['text_secondary'],
-                     background=self.colors['bg_dark']).grid(row=row, column=0, columnspan=4, sticky='w', padx=10, pady=3)
-            row += 1
-
-        # Removed scroll region update entirely to prevent any canvas performance issues
-        # Canvas should handle scrolling automatically without explicit scrollregion
+                     background=self.colors['bg_dark']).pack(anchor='w', padx=10, pady=3)
+
+        # Only rows in the viewport are built; they are recycled while scrolling
+        settings_list = VirtualSettingsList(container,
+                                            settings,
+                                            self.settings[section],
+                                            self.colors,
+                                            choices={'ActiveEvent': self.event_choices()},
+                                            scheduler=self.scheduler,
+                                            store=self.store)
+        settings_list.pack(side='top', fill='both', expand=True)
+        return container, settings_list
+
+    def event_choices(self):
+        """Return (display name, event name) pairs with status indicators"""
+        choices = []
+        for event_name in sorted(self.events_data.keys()):
+            status = self.events_data[event_name].get('status', 'unknown')
+            if status == 'working':
+                display_name = f"✅ {event_name}"
+            else:
+                display_name = f"⏰ {event_name} (Coming Soon)"
+            choices.append((display_name, event_name))
+        return choices
+
+    def on_settings_changed(self, changed, label):
+        """
+        Follow store changes. A row edit (no label) is recorded as history once
+        per frame; a transaction such as an import, reset or undo re-reads only
+        the rows of the changed keys and becomes one undo step.
+        """
+        keys = {key for _, key in changed}
+        if label is None:
+            # The edited row already shows its value; views of the other mode catch up when shown
+            mode = self.mode.get()
+            for section, view_mode in self._settings_views:
+                if view_mode != mode:
+                    self._stale_keys.setdefault((section, view_mode), set()).update(keys)
+            self._history_keys.update(changed)
+            self.scheduler.schedule('history', self.record_history)
+        else:
+            for _, settings_list in self._settings_views.values():
+                settings_list.refresh_keys(keys)
+            if self._restoring or self.history.record(self.settings, changed, label):
+                self.journal_edit(self.journal.record_settings, self.settings, changed)
+            self.update_history_buttons()
+            if 'ActiveMods' in keys and hasattr(self, 'mods_listbox'):
+                self.load_mods_to_listbox()
+        if not keys.isdisjoint(schema.CALCULATION_KEYS):
+            self.scheduler.schedule('calculations', self.update_calculations)
+        self._preview_keys.update(keys)
+        self.scheduler.schedule('preview', self.update_preview)
+
+    def create_preview_tab(self):
+        """Build the GameUserSettings.ini and Game.ini preview panes"""
+        files = ttk.Notebook(self.preview_tab)
+        files.pack(fill='both', expand=True, padx=10, pady=10)
+        self.previews = []
+        for name, section in preview.PREVIEW_FILES:
+            pane = IniPreview(files, self.preview_document(name, section), self.colors)
+            files.add(pane, text=name)
+            self.previews.append(pane)
+
+    def preview_document(self, name, section):
+        """Return the preview of a file: fresh, or the imported file updated in place"""
+        if name in self.imported_files:
+            return preview.ImportedPreviewDocument(self.imported_files[name], self.settings,
+                                                   section, self.mode.get())
+        return preview.PreviewDocument(self.settings, section, self.mode.get())
+
+    def update_preview(self):
+        """Patch the preview lines of the keys edited since the last frame"""
+        keys, self._preview_keys = self._preview_keys, set()
+        for pane in self.previews:
+            pane.apply(pane.document.update(keys))
+
+    def refresh_preview(self):
+        """Re-render the preview after a mode switch, an import or a reset"""
+        self._preview_keys.clear()
+        for (name, section), pane in zip(preview.PREVIEW_FILES, self.previews):
+            pane.document = self.preview_document(name, section)
+            pane.render()
+
+    def record_history(self):
+        """Record the keys edited since the last frame as one undo step"""
+        keys, self._history_keys = self._history_keys, set()
+        label = f"Edit {', '.join(sorted({key for _, key in keys}))}"
+        if self.history.record(self.settings, keys, label):
+            self.update_history_buttons()
+            self.journal_edit(self.journal.record_settings, self.settings, keys)
+
+    def update_history_buttons(self):
+        self.undo_btn.configure(state='normal' if self.history.can_undo else 'disabled')
+        self.redo_btn.configure(state='normal' if self.history.can_redo else 'disabled')
+
+    def undo(self, event=None):
+        # Record an edit still waiting for its frame before stepping back
+        self.scheduler.flush()
+        self.restore(self.history.undo, "Undo")
+
+    def redo(self, event=None):
+        self.scheduler.flush()
+        self.restore(self.history.redo, "Redo")
+
+    def restore(self, step, label):
+        """Apply an undo or redo step as one store transaction"""
+        self._restoring = True
+        try:
+            with self.store.transaction(label):
+                self.store.mark_changed(step(self.settings))
+        finally:
+            self._restoring = False
+        self.update_history_buttons()
 
     def generate_files(self):
-        # Update calculations before generating files
-        self.update_calculations()
-        
         current_mode = self.mode.get()
         
-        # Update settings from GUI based on current mode
-        if current_mode == 'basic':
-            # Only update basic server settings
-            for key in self.basic_server:
-                var_name = f'server_{key}'
-                if hasattr(self, var_name):
-                    var = getattr(self, var_name)
-                    if hasattr(var, 'get'):
-                        self.settings['ServerSettings'][key] = var.get()
-            
-            # Only update basic game settings
-            for key in self.basic_game:
-                var_name = f'game_{key}'
-                if hasattr(self, var_name):
-                    var = getattr(self, var_name)
-                    if hasattr(var, 'get'):
-                        self.settings['/script/shootergame.shootergamemode'][key] = var.get()
-        else:
-            # Update all settings for advanced mode
-            for key in self.settings['ServerSettings']:
-                var_name = f'server_{key}'
-                if hasattr(self, var_name):
-                    var = getattr(self, var_name)
-                    if hasattr(var, 'get'):
-                        self.settings['ServerSettings'][key] = var.get()
-
-            for key in self.settings['/script/shootergame.shootergamemode']:
-                var_name = f'game_{key}'
-                if hasattr(self, var_name):
-                    var = getattr(self, var_name)
-                    if hasattr(var, 'get'):
-                        self.settings['/script/shootergame.shootergamemode'][key] = var.get()
-
+        # Settings rows and the mods list write through the store, so nothing to copy back
         try:
-            # Generate GameUserSettings.ini
-            config1 = configparser.ConfigParser(allow_no_value=True)
-            config1.optionxform = str
-            config1.add_section('ServerSettings')
-            
-            # Always include ActiveMods regardless of mode
-            mods = self.mods_listbox.get(0, tk.END)
-            self.settings['ServerSettings']['ActiveMods'] = ','.join(mods)
-            
-            if current_mode == 'basic':
-                for key in self.basic_server:
-                    value = self.settings['ServerSettings'].get(key, '')
-                    config1.set('ServerSettings', key, str(value))
-                # Always add ActiveMods
-                config1.set('ServerSettings', 'ActiveMods', self.settings['ServerSettings']['ActiveMods'])
-            else:
-                for key, value in self.settings['ServerSettings'].items():
-                    config1.set('ServerSettings', key, str(value))
-
-            with open('GameUserSettings.ini', 'w') as f:
-                config1.write(f)
+            # Apply any pending slider/entry work, then update calculations before generating files
+            self.scheduler.flush()
+            self.update_calculations()
 
-            # Generate Game.ini
-            config2 = configparser.ConfigParser(allow_no_value=True)
-            config2.optionxform = str
-            config2.add_section('/script/shootergame.shootergamemode')
-            
-            if current_mode == 'basic':
-                for key in self.basic_game:
-                    value = self.settings['/script/shootergame.shootergamemode'].get(key, '')
-                    config2.set('/script/shootergame.shootergamemode', key, str(value))
-            else:
-                for key, value in self.settings['/script/shootergame.shootergamemode'].items():
-                    config2.set('/script/shootergame.shootergamemode', key, str(value))
+            findings = validate.get_rules().validate_settings(self.settings)
+            if findings:
+                problems = "\n".join(f"• {finding.key}: {finding.message}" for finding in findings[:15])
+                more = f"\n...and {len(findings) - 15} more" if len(findings) > 15 else ""
+                if not messagebox.askyesno("Check Settings",
+                                           f"Some settings look wrong:\n\n{problems}{more}\n\n"
+                                           f"Generate the files anyway?"):
+                    return
 
-            with open('Game.ini', 'w') as f:
-                config2.write(f)
+            # Write into the current working directory
+            current_dir = os.getcwd()
+            # The preview already holds the rendered files, patched per edit
+            rendered = {name: pane.document.text()
+                        for (name, _), pane in zip(preview.PREVIEW_FILES, self.previews)}
+            results = engine.emit_files(self.settings, current_mode, current_dir, rendered,
+                                        documents=self.imported_files)
+            file_lines = "\n".join(
+                f"• {os.path.basename(result.path)}{'' if result.changed else ' (unchanged)'}"
+                for result in results)
 
             mode_text = "Basic" if current_mode == 'basic' else "Advanced"
-            # Get the current working directory and absolute paths of the generated files
-            current_dir = os.getcwd()
-            game_user_settings_path = os.path.join(current_dir, 'GameUserSettings.ini')
-            game_ini_path = os.path.join(current_dir, 'Game.ini')
-            
             messagebox.showinfo("Success", 
                               f"INI files generated successfully in {mode_text} mode!\n\n"
                               f"Files saved to:\n{current_dir}\n\n"
                               f"Generated files:\n"
-                              f"• GameUserSettings.ini\n"
-                              f"• Game.ini\n\n"
+                              f"{file_lines}\n\n"
                               f"Full paths:\n"
-                              f"{game_user_settings_path}\n"
-                              f"{game_ini_path}")
+                              f"{results[0].path}\n"
+                              f"{results[1].path}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate INI files: {str(e)}")
 
     def reset_to_defaults(self):
+        # Record any edit still waiting for its frame so it stays a separate undo step
+        self.scheduler.flush()
         # Reset mode to basic
         self.mode.set('basic')
-        # Reset GUI controls to default values
-        for section, settings in self.settings.items():
-            prefix = 'server_' if section == 'ServerSettings' else 'game_'
-            for key, default_value in settings.items():
-                var_name = f'{prefix}{key}'
-                if hasattr(self, var_name):
-                    var = getattr(self, var_name)
-                    if hasattr(var, 'set'):
-                        var.set(default_value)
-        # Clear mods list
-        if hasattr(self, 'mods_listbox'):
-            self.mods_listbox.delete(0, tk.END)
-            self.settings['ServerSettings']['ActiveMods'] = ''
-        # Repopulate tabs to reflect basic mode
+        # Only keys that differ from the defaults are written back, as one undo step;
+        # the mods list follows ActiveMods
+        with self.store.transaction("Reset to defaults"):
+            self.store.reset()
+        # Generate writes fresh files again instead of updating the imported ones
+        self.imported_files = {}
+        # Show the basic views
         self.switch_mode()
-        messagebox.showinfo("Reset", "All settings reset to defaults and mode set to Basic!")
+        messagebox.showinfo("Reset", "All settings reset to defaults and mode set to Basic!\n\n"
+                                     "Press Undo (Ctrl+Z) to get them back.")
 
 if __name__ == '__main__':
     root = tk.Tk()
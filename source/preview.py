@@ -0,0 +1,170 @@
+"""
+Live INI preview for Ark Settings Generator
+
+A PreviewDocument holds the rendered lines of one INI file and where each
+key's lines start. When settings change, update() re-renders just those keys
+and returns line patches, so the preview pane replaces a few lines instead of
+re-inserting the whole file. Lines come from engine.entry_lines(), the same
+function the writer uses, so text() always equals what generate would write.
+
+After an import, generate updates the imported file in place instead, and
+ImportedPreviewDocument shows that text: it keeps the edits
+engine.document_edits() makes to the imported lines and patches the lines
+whose edits changed since the last update.
+"""
+
+import collections
+
+import engine
+
+# Replace count lines starting at 0-based line first with lines
+Patch = collections.namedtuple('Patch', ['first', 'count', 'lines'])
+
+PREVIEW_FILES = (
+    (engine.GAME_USER_SETTINGS_FILE, engine.SERVER_SECTION),
+    (engine.GAME_INI_FILE, engine.GAME_SECTION),
+)
+
+
+class PreviewDocument:
+    """
+    Rendered lines of one INI file, patched per key.
+
+    Args:
+        settings: The live section -> key -> value mapping
+        section: Section this file holds
+        mode: 'basic' or 'advanced', as passed to the writer
+    """
+
+    def __init__(self, settings, section, mode='advanced'):
+        self.settings = settings
+        self.section = section
+        self.mode = mode
+        self.rebuild()
+
+    def rebuild(self, mode=None):
+        """Re-render every key, e.g. after an import or a mode switch"""
+        if mode is not None:
+            self.mode = mode
+        self.keys = engine.section_keys(self.settings, self.section, self.mode)
+        values = self.settings[self.section]
+        self.entries = {key: engine.entry_lines(key, values.get(key, '')) for key in self.keys}
+        self._index_lines()
+
+    def _index_lines(self):
+        # Line 0 is the [section] header
+        self.starts = {}
+        line = 1
+        for key in self.keys:
+            self.starts[key] = line
+            line += len(self.entries[key])
+
+    def lines(self):
+        lines = [f'[{self.section}]']
+        for key in self.keys:
+            lines.extend(self.entries[key])
+        return lines
+
+    def text(self):
+        """Return the file content exactly as the writer renders it"""
+        return '\n'.join(self.lines()) + '\n\n'
+
+    def update(self, keys):
+        """
+        Re-render the given keys.
+
+        Args:
+            keys: Keys whose values may have changed
+
+        Returns:
+            List of Patch in document order, each relative to the document
+            with the earlier patches applied; None if the set of written keys
+            changed and the document was rebuilt instead
+        """
+        if engine.section_keys(self.settings, self.section, self.mode) != self.keys:
+            self.rebuild()
+            return None
+        values = self.settings[self.section]
+        patches = []
+        shift = 0
+        for key in sorted((key for key in keys if key in self.starts), key=self.starts.get):
+            lines = engine.entry_lines(key, values.get(key, ''))
+            old = self.entries[key]
+            if lines == old:
+                continue
+            patches.append(Patch(self.starts[key] + shift, len(old), lines))
+            shift += len(lines) - len(old)
+            self.entries[key] = lines
+        if shift:
+            self._index_lines()
+        return patches
+
+
+class ImportedPreviewDocument:
+    """
+    Imported INI file as generate writes it back, patched per edit.
+
+    Has the same interface as PreviewDocument; text() is what
+    engine.update_document() returns for the same settings and mode.
+
+    Args:
+        document: inidoc.IniDocument of the imported file
+        settings: The live section -> key -> value mapping
+        section: Section this file holds
+        mode: 'basic' or 'advanced', as passed to the writer
+    """
+
+    def __init__(self, document, settings, section, mode='advanced'):
+        self.document = document
+        self.settings = settings
+        self.section = section
+        self.mode = mode
+        self.rebuild()
+
+    def rebuild(self, mode=None):
+        if mode is not None:
+            self.mode = mode
+        self.replace, self.tail = engine.document_edits(self.document, self.settings, self.section,
+                                                        self.mode)
+
+    def lines(self):
+        return self.document.lines_with(self.replace, self.tail)
+
+    def text(self):
+        return '\n'.join(self.lines())
+
+    def update(self, keys):
+        """
+        Re-apply the settings to the imported lines.
+
+        Returns:
+            List of Patch in document order, like PreviewDocument.update(); None
+            if new sections or the last line changed and the text was rebuilt
+        """
+        replace, tail = engine.document_edits(self.document, self.settings, self.section, self.mode)
+        old, self.replace = self.replace, replace
+        original = self.document.lines
+        last = len(original) - 1
+        if tail != self.tail:
+            self.tail = tail
+            return None
+        patches = []
+        shift = 0
+        # Original line n sits at n plus the lines earlier edits added or removed
+        for number in sorted(old.keys() | replace.keys()):
+            before = old.get(number, [original[number]])
+            after = replace.get(number, [original[number]])
+            if before != after:
+                if number == last:
+                    # The pane always ends in a newline; the file's last line may not
+                    return None
+                patches.append(Patch(number + shift, len(before), after))
+            shift += len(after) - 1
+        return patches
+
+
+def apply_patches(lines, patches):
+    """Apply patches to a list of lines in place (the same steps the preview pane takes)"""
+    for patch in patches:
+        lines[patch.first:patch.first + patch.count] = patch.lines
+    return lines
@@ -0,0 +1,338 @@
+"""
+Asyncio RCON client for Ark Settings Generator
+
+Sends admin commands to many running servers at once over the Source RCON
+protocol that ARK servers speak on RCONPort. Commands for one server are
+pipelined on a single authenticated connection (all packets are written
+before any reply is read), connections are kept in a pool for reuse, and
+every server gets its own result, so one slow or unreachable server never
+holds up the others.
+
+ARK has no RCON command that sets rate multipliers directly. The values it
+can change without a restart are the ones in its dynamic config (served from
+CustomDynamicConfigUrl), which ForceUpdateDynamicConfig reloads; see
+dynamic_config() and write_dynamic_configs().
+
+rcon_server.py is a local stand-in server for tests and benchmarks.
+"""
+
+import asyncio
+import collections
+import os
+import struct
+import time
+
+import batch
+import engine
+import fileio
+
+# Packet types from the Source RCON protocol
+SERVERDATA_AUTH = 3
+SERVERDATA_AUTH_RESPONSE = 2
+SERVERDATA_EXECCOMMAND = 2
+SERVERDATA_RESPONSE_VALUE = 0
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_TIMEOUT_S = 5.0
+MAX_CONNECTIONS = 256
+MAX_PACKET_SIZE = 4096 + 10
+
+# Game.ini/GameUserSettings.ini keys ARK's dynamic config can change while running
+DYNAMIC_CONFIG_KEYS = (
+    'TamingSpeedMultiplier', 'HarvestAmountMultiplier', 'XPMultiplier', 'MatingIntervalMultiplier',
+    'BabyMatureSpeedMultiplier', 'EggHatchSpeedMultiplier', 'BabyFoodConsumptionSpeedMultiplier',
+    'CropGrowthSpeedMultiplier', 'BabyCuddleIntervalMultiplier', 'CustomRecipeEffectivenessMultiplier',
+    'GlobalSpoilingTimeMultiplier', 'GlobalCorpseDecompositionTimeMultiplier',
+)
+RELOAD_DYNAMIC_CONFIG = 'ForceUpdateDynamicConfig'
+
+_HEADER = struct.Struct('<iii')
+
+RconTarget = collections.namedtuple('RconTarget', ['name', 'host', 'port', 'password'])
+PushResult = collections.namedtuple('PushResult', ['name', 'responses', 'elapsed_ms', 'error'])
+PushReport = collections.namedtuple('PushReport', ['results', 'elapsed_ms'])
+
+
+class RconError(Exception):
+    """An RCON connection failed or the server broke the protocol"""
+
+
+class RconAuthError(RconError):
+    """The server rejected the admin password"""
+
+
+def encode_packet(request_id, kind, body):
+    """Encode one RCON packet"""
+    payload = body.encode('utf-8') + b'\0\0'
+    return _HEADER.pack(len(payload) + 8, request_id, kind) + payload
+
+
+async def read_packet(reader):
+    """Read one RCON packet and return (request_id, kind, body)"""
+    size, = struct.unpack('<i', await reader.readexactly(4))
+    if not 10 <= size <= MAX_PACKET_SIZE * 64:
+        raise RconError(f"Invalid RCON packet size {size}")
+    data = await reader.readexactly(size)
+    request_id, kind = struct.unpack_from('<ii', data)
+    return request_id, kind, data[8:-2].decode('utf-8', 'replace')
+
+
+class RconConnection:
+    """
+    One authenticated RCON connection.
+
+    A background task reads replies and hands each to the command waiting on
+    its request id, so any number of commands can be in flight at once.
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 1
+        self._pending = {}
+        self._read_task = None
+        self.key = None
+        self.closed = False
+
+    @classmethod
+    async def open(cls, host, port, password, timeout=DEFAULT_TIMEOUT_S):
+        """Connect and authenticate; raises RconAuthError, RconError or asyncio.TimeoutError"""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        connection = cls(reader, writer)
+        try:
+            await asyncio.wait_for(connection._authenticate(password), timeout)
+        except BaseException:
+            connection.close()
+            raise
+        connection._read_task = asyncio.ensure_future(connection._read_replies())
+        return connection
+
+    def _take_id(self):
+        request_id = self._next_id
+        self._next_id = 1 if request_id >= 0x7fffffff else request_id + 1
+        return request_id
+
+    async def _authenticate(self, password):
+        request_id = self._take_id()
+        self._writer.write(encode_packet(request_id, SERVERDATA_AUTH, password))
+        await self._writer.drain()
+        while True:
+            try:
+                reply_id, kind, _ = await read_packet(self._reader)
+            except asyncio.IncompleteReadError:
+                raise RconError("Connection closed during authentication")
+            # Servers send an empty RESPONSE_VALUE before the auth response
+            if kind != SERVERDATA_AUTH_RESPONSE:
+                continue
+            if reply_id == -1:
+                raise RconAuthError("Admin password rejected")
+            if reply_id != request_id:
+                raise RconError(f"Unexpected auth response id {reply_id}")
+            return
+
+    async def _read_replies(self):
+        error = RconError("Connection closed")
+        try:
+            while True:
+                reply_id, _, body = await read_packet(self._reader)
+                future = self._pending.pop(reply_id, None)
+                if future is not None and not future.done():
+                    future.set_result(body)
+        except (asyncio.IncompleteReadError, ConnectionError, RconError) as e:
+            if isinstance(e, RconError):
+                error = e
+        finally:
+            self.closed = True
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def execute_many(self, commands, timeout=DEFAULT_TIMEOUT_S):
+        """
+        Send commands back to back and return their replies in order.
+
+        The whole batch shares one timeout; on timeout the connection is
+        closed, since late replies would arrive out of step.
+        """
+        if self.closed:
+            raise RconError("Connection closed")
+        loop = asyncio.get_event_loop()
+        futures = []
+        packets = []
+        for command in commands:
+            request_id = self._take_id()
+            future = loop.create_future()
+            self._pending[request_id] = future
+            futures.append(future)
+            packets.append(encode_packet(request_id, SERVERDATA_EXECCOMMAND, command))
+        self._writer.write(b''.join(packets))
+        try:
+            return await asyncio.wait_for(self._drain_and_gather(futures), timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    async def _drain_and_gather(self, futures):
+        await self._writer.drain()
+        return await asyncio.gather(*futures)
+
+    async def execute(self, command, timeout=DEFAULT_TIMEOUT_S):
+        """Send one command and return its reply"""
+        return (await self.execute_many([command], timeout))[0]
+
+    def close(self):
+        self.closed = True
+        if self._read_task is not None:
+            self._read_task.cancel()
+        self._writer.close()
+
+
+class RconPool:
+    """
+    Reusable authenticated connections, keyed by (host, port, password).
+
+    At most max_connections connections are in use at once; further acquires
+    wait for one to be released. Create pools inside the running event loop.
+    """
+
+    def __init__(self, max_connections=MAX_CONNECTIONS, timeout=DEFAULT_TIMEOUT_S):
+        self.timeout = timeout
+        self._idle = {}
+        self._limit = asyncio.Semaphore(max_connections)
+
+    async def acquire(self, host, port, password):
+        await self._limit.acquire()
+        idle = self._idle.get((host, port, password), [])
+        while idle:
+            connection = idle.pop()
+            if not connection.closed:
+                return connection
+        try:
+            connection = await RconConnection.open(host, port, password, self.timeout)
+        except BaseException:
+            self._limit.release()
+            raise
+        connection.key = (host, port, password)
+        return connection
+
+    def release(self, connection):
+        if not connection.closed:
+            self._idle.setdefault(connection.key, []).append(connection)
+        self._limit.release()
+
+    def close(self):
+        for connections in self._idle.values():
+            for connection in connections:
+                connection.close()
+        self._idle.clear()
+
+
+async def _push_one(pool, target, commands):
+    start = time.perf_counter()
+    try:
+        connection = await pool.acquire(target.host, target.port, target.password)
+        try:
+            responses = await connection.execute_many(commands, pool.timeout)
+        finally:
+            pool.release(connection)
+        error = None
+    except asyncio.TimeoutError:
+        responses, error = (), "Timed out"
+    except (OSError, RconError) as e:
+        responses, error = (), str(e) or type(e).__name__
+    return PushResult(target.name, tuple(responses), (time.perf_counter() - start) * 1000, error)
+
+
+async def push_async(targets, commands, pool=None, timeout=DEFAULT_TIMEOUT_S, max_connections=MAX_CONNECTIONS):
+    """
+    Send commands to every target concurrently.
+
+    Args:
+        targets: RconTarget tuples
+        commands: List of commands for every target, or {name: [commands]}
+        pool: RconPool to reuse (default: a pool closed when the push ends)
+        timeout: Seconds allowed for connecting and for each target's commands
+        max_connections: Connections in use at once when no pool is given
+
+    Returns:
+        PushReport with one PushResult per target, in target order
+    """
+    start = time.perf_counter()
+    own_pool = pool is None
+    if own_pool:
+        pool = RconPool(max_connections, timeout)
+    try:
+        results = await asyncio.gather(*[
+            _push_one(pool, target, commands[target.name] if isinstance(commands, dict) else commands)
+            for target in targets
+        ])
+    finally:
+        if own_pool:
+            pool.close()
+    return PushReport(list(results), (time.perf_counter() - start) * 1000)
+
+
+def push(targets, commands, timeout=DEFAULT_TIMEOUT_S, max_connections=MAX_CONNECTIONS):
+    """Blocking wrapper around push_async() for scripts and the CLI"""
+    return asyncio.run(push_async(targets, commands, timeout=timeout, max_connections=max_connections))
+
+
+def targets_from_manifest(manifest, names=None):
+    """
+    Return (targets, skipped) for the servers in a cluster manifest.
+
+    Each server's RCONPort and ServerAdminPassword come from its merged
+    settings and its address from an optional "host" entry in the manifest.
+    Servers with RCONEnabled off are listed in skipped.
+    """
+    targets = []
+    skipped = []
+    for server, settings in batch.resolve_servers(manifest, names):
+        server_settings = settings[engine.SERVER_SECTION]
+        if not server_settings['RCONEnabled']:
+            skipped.append(server['name'])
+            continue
+        targets.append(RconTarget(server['name'], server.get('host', DEFAULT_HOST),
+                                  int(server_settings['RCONPort']), server_settings['ServerAdminPassword']))
+    return targets, skipped
+
+
+def dynamic_config(settings):
+    """Return the dynamic config text (key=value lines) for the live-changeable settings"""
+    lines = []
+    for key in DYNAMIC_CONFIG_KEYS:
+        for section in (engine.SERVER_SECTION, engine.GAME_SECTION):
+            if key in settings[section]:
+                lines.append(f"{key}={engine.format_value(settings[section][key])}")
+                break
+    return '\n'.join(lines) + '\n'
+
+
+def write_dynamic_configs(manifest, directory, names=None):
+    """
+    Write <directory>/<server name>.ini dynamic config files for a manifest.
+
+    Returns:
+        {server name: True if its file changed}
+    """
+    os.makedirs(directory, exist_ok=True)
+    return {
+        server['name']: fileio.write_if_changed(os.path.join(directory, f"{server['name']}.ini"),
+                                                dynamic_config(settings)).changed
+        for server, settings in batch.resolve_servers(manifest, names)
+    }
+
+
+def format_report(report):
+    """Format a push report as per-server lines plus a summary"""
+    lines = []
+    for result in report.results:
+        if result.error:
+            status = f"ERROR: {result.error}"
+        else:
+            status = ' | '.join(response.strip() for response in result.responses) or 'ok'
+        lines.append(f"{result.name:<24} {result.elapsed_ms:8.2f} ms  {status}")
+    failed = sum(1 for result in report.results if result.error)
+    lines.append(f"{len(report.results)} servers ({failed} failed) in {report.elapsed_ms:.1f} ms")
+    return '\n'.join(lines)
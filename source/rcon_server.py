@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Local stand-in RCON server for Ark Settings Generator
+
+Speaks the same Source RCON protocol as an ARK server's RCONPort, so the
+RCON client can be tested and benchmarked without a game server:
+
+    python rcon_server.py --port 27020 --password secret
+
+Every command is recorded and answered like ARK answers commands that print
+nothing ("Server received, But no response!!"). Tests can pass a handler to
+give other replies, add latency, or return None to never reply.
+"""
+
+import argparse
+import asyncio
+import sys
+
+import rcon
+
+NO_RESPONSE = 'Server received, But no response!! \n '
+
+
+class StandInRconServer:
+    """
+    An asyncio RCON server that records the commands it receives.
+
+    Args:
+        password: Admin password clients must authenticate with
+        handler: Optional callable(command) -> reply text, or None to not reply
+        delay: Seconds before each reply, to simulate network latency
+    """
+
+    def __init__(self, password, handler=None, delay=0.0):
+        self.password = password
+        self.handler = handler
+        self.delay = delay
+        self.commands = []
+        self.connections = 0
+        self.port = None
+        self._server = None
+        self._handlers = {}
+
+    async def start(self, host='127.0.0.1', port=0):
+        self._server = await asyncio.start_server(self._serve, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def _reply(self, writer, request_id, command):
+        reply = self.handler(command) if self.handler else NO_RESPONSE
+        if reply is not None and not writer.is_closing():
+            writer.write(rcon.encode_packet(request_id, rcon.SERVERDATA_RESPONSE_VALUE, reply))
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        loop = asyncio.get_event_loop()
+        task = asyncio.current_task()
+        self._handlers[task] = writer
+        authenticated = False
+        try:
+            while True:
+                request_id, kind, body = await rcon.read_packet(reader)
+                if kind == rcon.SERVERDATA_AUTH:
+                    authenticated = body == self.password
+                    writer.write(rcon.encode_packet(request_id, rcon.SERVERDATA_RESPONSE_VALUE, ''))
+                    writer.write(rcon.encode_packet(request_id if authenticated else -1,
+                                                    rcon.SERVERDATA_AUTH_RESPONSE, ''))
+                elif not authenticated:
+                    break
+                else:
+                    self.commands.append(body)
+                    if self.delay:
+                        # Equal delays fire in order, so replies keep the command order
+                        loop.call_later(self.delay, self._reply, writer, request_id, body)
+                    else:
+                        self._reply(writer, request_id, body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, rcon.RconError):
+            pass
+        finally:
+            del self._handlers[task]
+            writer.close()
+
+    async def stop(self):
+        """Stop listening, drop open connections and wait for their handlers"""
+        if self._server is not None:
+            self._server.close()
+        for writer in self._handlers.values():
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+
+async def start_servers(count, password, **options):
+    """Start count stand-in servers on free ports and return them"""
+    return [await StandInRconServer(password, **options).start() for _ in range(count)]
+
+
+async def _serve_forever(args):
+    server = await StandInRconServer(args.password, delay=args.delay / 1000).start(args.host, args.port)
+    print(f"Stand-in RCON server listening on {args.host}:{server.port} (Ctrl+C to stop)", flush=True)
+    await server._server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in ARK RCON server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=27020)
+    parser.add_argument('--password', required=True, help="Admin password clients must send")
+    parser.add_argument('--delay', type=float, default=0.0, help="Milliseconds before each reply")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve_forever(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
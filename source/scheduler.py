@@ -0,0 +1,71 @@
+"""
+Frame scheduler for Ark Settings Generator
+
+Slider drags, keystrokes and window resizes can fire dozens of events per
+frame. Instead of reacting to each one, handlers schedule work under a key;
+pending work is deduplicated by key and run once on the next frame tick.
+"""
+
+import sys
+import traceback
+
+FRAME_MS = 16
+
+
+class FrameScheduler:
+    """
+    Coalesce UI work so each keyed task runs at most once per frame.
+
+    Works with any object providing Tk's after/after_cancel, normally the root
+    window. Scheduling the same key again before the tick replaces the pending
+    callback, so the latest value wins.
+    """
+
+    def __init__(self, root, frame_ms=FRAME_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self._pending = {}
+        self._after_id = None
+
+    def schedule(self, key, callback):
+        """Run callback on the next frame, replacing any pending task with the same key"""
+        self._pending[key] = callback
+        if self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._tick)
+
+    def cancel(self, key):
+        """Drop a pending task"""
+        self._pending.pop(key, None)
+
+    def is_pending(self, key):
+        return key in self._pending
+
+    def flush(self):
+        """Run every pending task now, e.g. before generating files"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._tick()
+
+    def _tick(self):
+        self._after_id = None
+        pending, self._pending = self._pending, {}
+        for callback in pending.values():
+            # A failing task is reported and the rest of the frame still runs
+            try:
+                callback()
+            except Exception:
+                self._report(*sys.exc_info())
+
+    def _report(self, exc_type, exc, tb):
+        report = getattr(self.root, 'report_callback_exception', None)
+        if report is not None:
+            report(exc_type, exc, tb)
+        else:
+            traceback.print_exception(exc_type, exc, tb)
+
+    def close(self):
+        """Cancel the pending tick and forget queued work"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._pending.clear()
@@ -0,0 +1,431 @@
+"""
+Settings schema registry for Ark Settings Generator
+
+Every setting is declared once below, per INI section, as (key, default,
+description). At import the tables are compiled into one Setting record per
+key with a stable integer id, and building fails loudly if a key is declared
+twice in a section, even with different casing, or with different types in
+the two sections. Everything else (defaults, descriptions, basic subsets,
+import key index) is derived from the records.
+"""
+
+import tracing
+
+SERVER_SECTION = 'ServerSettings'
+GAME_SECTION = '/script/shootergame.shootergamemode'
+
+# GameUserSettings.ini [ServerSettings]: (key, default, description) in write order
+SERVER_SETTINGS = (
+    ('DifficultyOffset', 0.2, 'Base difficulty level (0.0-1.0+); higher increases dino levels and aggression.'),
+    ('MaxPlayers', 70, 'Maximum concurrent players.'),
+    ('ServerPassword', '', 'Password to join (leave empty for open server).'),
+    ('ServerAdminPassword', '', 'Password for admin commands.'),
+    ('ServerName', '', 'Name displayed in server browser.'),
+    ('ServerHardcore', False, 'Enables hardcore mode; players reset to level 1 on death.'),
+    ('DisablePvEGamma', False, 'Prevents gamma/console commands in PvE.'),
+    ('EnablePvPGamma', False, 'Allows gamma/console commands in PvP.'),
+    ('AdminLogging', True, 'Logs admin commands to chat.'),
+    ('RCONEnabled', True, 'Enables RCON for remote admin.'),
+    ('RCONPort', 27020, 'Port for RCON connections.'),
+    ('RCONServerGameLogBuffer', 600, 'Lines of gamelogs sent over RCON.'),
+    ('DinoDamageMultiplier', 1.0, 'Dino attack damage (>1.0 increases).'),
+    ('PlayerDamageMultiplier', 1.0, 'Player attack damage (>1.0 increases).'),
+    ('StructureDamageMultiplier', 1.0, 'Structure attack damage (>1.0 increases).'),
+    ('PlayerResistanceMultiplier', 1.0, 'Player damage resistance (>1.0 increases taken damage).'),
+    ('DinoResistanceMultiplier', 1.0, 'Dino damage resistance (>1.0 increases taken damage).'),
+    ('StructureResistanceMultiplier', 1.0, 'Structure damage resistance (>1.0 increases taken damage).'),
+    ('XPMultiplier', 1.0, 'Experience points earned (>1.0 increases XP).'),
+    ('TamingSpeedMultiplier', 1.0, 'Dino taming speed (>1.0 speeds up taming).'),
+    ('HarvestAmountMultiplier', 1.0, 'Harvest yield (>1.0 increases resources).'),
+    ('HarvestHealthMultiplier', 1.0, 'Harvestable object durability (>1.0 makes harder to destroy).'),
+    ('DinoCountMultiplier', 1.0, 'Dino spawn count (>1.0 increases spawns).'),
+    ('ResourcesRespawnPeriodMultiplier', 1.0, 'Resource respawn time (>1.0 slows respawns).'),
+    ('PlayerCharacterWaterDrainMultiplier', 1.0, 'Player water consumption (>1.0 increases thirst).'),
+    ('PlayerCharacterFoodDrainMultiplier', 1.0, 'Player food consumption (>1.0 increases hunger).'),
+    ('PlayerCharacterStaminaDrainMultiplier', 1.0, 'Player stamina consumption (>1.0 increases fatigue).'),
+    ('PlayerCharacterHealthRecoveryMultiplier', 1.0, 'Player health regen (>1.0 speeds up healing).'),
+    ('DinoCharacterFoodDrainMultiplier', 1.0, 'Dino food consumption (>1.0 increases hunger).'),
+    ('DinoCharacterStaminaDrainMultiplier', 1.0, 'Dino stamina consumption (>1.0 increases fatigue).'),
+    ('DinoCharacterHealthRecoveryMultiplier', 1.0, 'Dino health regen (>1.0 speeds up healing).'),
+    ('DayCycleSpeedScale', 1.0, 'Day/night cycle speed (>1.0 accelerates).'),
+    ('NightTimeSpeedScale', 1.0, 'Night duration relative to day (>1.0 lengthens nights).'),
+    ('DayTimeSpeedScale', 1.0, 'Day duration relative to night (>1.0 lengthens days).'),
+    ('DisableWeatherFog', False, 'Disables fog effects.'),
+    ('serverPVE', False, 'Enables PvE mode; disables PvP.'),
+    ('TheMaxStructuresInRange', 10500, 'Max structures per player/tribe in an area.'),
+    ('bAllowPlatformSaddleMultiFloors', False, 'Allows multiple floors on platform saddles.'),
+    ('AllowCaveBuildingPvE', False, 'Allows building in caves in PvE.'),
+    ('AllowCaveBuildingPvP', False, 'Allows building in caves in PvP.'),
+    ('PvEDinoDecayPeriodMultiplier', 1.0, 'Dino ownership decay time in PvE (>1.0 slows decay).'),
+    ('DisableDinoDecayPvE', False, 'Disables dino ownership decay in PvE.'),
+    ('DisableStructureDecayPvE', False, 'Disables structure decay in PvE.'),
+    ('MaxTributeDinos', 20, 'Max dinos transferable via tributes.'),
+    ('MaxTributeItems', 50, 'Max items transferable via tributes.'),
+    ('TributeItemExpirationSeconds', 86400, 'Tribute expiration time in seconds.'),
+    ('TributeDinoExpirationSeconds', 86400, 'Dino tribute expiration time in seconds.'),
+    ('noTributeDownloads', False, 'Disables downloading tributes.'),
+    ('alwaysNotifyPlayerJoined', False, 'Notifies all players of joins.'),
+    ('allowThirdPersonPlayer', False, 'Enables third-person view.'),
+    ('globalVoiceChat', False, 'Makes voice chat global.'),
+    ('proximityChat', False, 'Limits chat to nearby players.'),
+    ('ShowMapPlayerLocation', True, 'Shows player locations on map.'),
+    ('AllowFlyerCarryPvE', False, 'Allows flyers to carry dinos/players in PvE.'),
+    ('RandomSupplyCratePoints', False, 'Randomizes supply crate locations.'),
+    ('SupplyCrateLootQualityMultiplier', 1.0, 'Loot quality in crates (>1.0 improves).'),
+    ('FishingLootQualityMultiplier', 1.0, 'Fishing loot quality (>1.0 improves).'),
+    ('ItemStackSizeMultiplier', 1.0, 'Global item stack sizes (>1.0 increases stacks).'),
+    ('ActiveEvent', 'None', 'Enables a specified event (e.g., WinterWonderland for colors).'),
+    ('ActiveMods', '', 'Comma-separated list of mod IDs to load.'),
+    ('AllowAnyoneBabyImprintCuddle', True, 'Allows anyone to cuddle imprinted babies.'),
+    ('AlwaysAllowStructurePickup', False, 'Disables pickup timer.'),
+    ('AlwaysNotifyPlayerLeft', False, 'Always notifies of player leaves.'),
+    ('ArmadoggoDeathCooldown', 3600, 'Cooldown for Armadoggo respawn.'),
+    ('AutoDestroyDecayedDinos', False, 'Auto-destroys decayed dinos.'),
+    ('AutoDestroyOldStructuresMultiplier', 0.0, 'Multiplier for auto-destroying old structures.'),
+    ('AutoSavePeriodMinutes', 15.0, 'Auto-save interval in minutes.'),
+    ('BanListURL', 'https://cdn2.arkdedicated.com/asa/BanList.txt', 'URL for global ban list.'),
+    ('bForceCanRideFliers', False, 'Forces flyer riding on maps where disabled.'),
+    ('ClampItemSpoilingTimes', False, 'Clamps spoiling times to max.'),
+    ('ClampItemStats', False, 'Enables stat clamping for items.'),
+    ('ClampResourceHarvestDamage', False, 'Limits harvest damage to resources.'),
+    ('CosmeticWhitelistOverride', '', 'URL for whitelisted cosmetics.'),
+    ('CosmoWeaponAmmoReloadAmount', 1, 'Ammo reload amount for Cosmo weapon.'),
+    ('CustomDynamicConfigUrl', '', 'URL for dynamic config.'),
+    ('CustomLiveTuningUrl', 'https://cdn2.arkdedicated.com/asa/livetuningoverloads.json', 'URL for live tuning.'),
+    ('DestroyTamesOverTheSoftTameLimit', False, 'Destroys dinos over soft tame limit.'),
+    ('DisableCryopodEnemyCheck', False, 'Allows cryopods near enemies.'),
+    ('DisableCryopodFridgeRequirement', False, 'Allows cryopods without fridge.'),
+    ('DisableImprintDinoBuff', False, 'Disables imprint stat bonuses.'),
+    ('DontAlwaysNotifyPlayerJoined', False, 'Disables global join notifications.'),
+    ('EnableExtraStructurePreventionVolumes', False, 'Prevents building in resource areas.'),
+    ('ExtinctionEventTimeInterval', 0, 'Time interval for extinction event.'),
+    ('FastDecayUnsnappedCoreStructures', False, 'Fast decay for unsnapped structures.'),
+    ('ForceAllStructureLocking', False, 'Forces all structures to lock.'),
+    ('ForceGachaUnhappyInCaves', True, 'Makes Gachas unhappy in caves.'),
+    ('IgnoreLimitMaxStructuresInRangeTypeFlag', False, 'Ignores decorative structure limits.'),
+    ('ImplantSuicideCD', 28800, 'Cooldown for implant respawn.'),
+    ('KickIdlePlayersPeriod', 3600.0, 'Idle kick time in seconds.'),
+    ('MaxCosmoWeaponAmmo', -1, 'Max ammo for Cosmo weapon.'),
+    ('MaxPersonalTamedDinos', 0, 'Per-tribe dino limit.'),
+    ('MaxPlatformSaddleStructureLimit', 75, 'Max structures on platform saddles.'),
+    ('MaxTamedDinos', 5000, 'Global tamed dino cap.'),
+    ('MaxTamedDinos_SoftTameLimit', 5000, 'Soft tame limit.'),
+    ('MaxTamedDinos_SoftTameLimit_CountdownForDeletionDuration', 604800, 'Deletion countdown for over-limit dinos.'),
+    ('MaxTrainCars', 8, 'Max cars per train.'),
+    ('MaxTributeCharacters', 10, 'Max characters transferable.'),
+    ('NonPermanentDiseases', False, 'Makes diseases non-permanent.'),
+    ('NPCNetworkStasisRangeScalePlayerCountStart', 0, 'Min players for stasis scaling.'),
+    ('NPCNetworkStasisRangeScalePlayerCountEnd', 0, 'Max players for stasis scaling.'),
+    ('NPCNetworkStasisRangeScalePercentEnd', 0.55, 'Max scale percentage.'),
+    ('OnlyAutoDestroyCoreStructures', False, 'Only auto-destroys core structures.'),
+    ('OnlyDecayUnsnappedCoreStructures', False, 'Only decays unsnapped core structures.'),
+    ('OverrideOfficialDifficulty', 0.0, 'Overrides official difficulty.'),
+    ('PerPlatformMaxStructuresMultiplier', 1.0, 'Multiplier for max structures on saddles.'),
+    ('PersonalTamedDinosSaddleStructureCost', 0, 'Tame slots used by platform saddles.'),
+    ('PlatformSaddleBuildAreaBoundsMultiplier', 1.0, 'Build area multiplier for saddles.'),
+    ('PreventDiseases', False, 'Disables diseases.'),
+    ('PreventMateBoost', False, 'Disables mate boosting.'),
+    ('PreventOfflinePvP', False, 'Enables offline raid prevention.'),
+    ('PreventOfflinePvPInterval', 0.0, 'Time before ORP activates.'),
+    ('PreventSpawnAnimations', False, 'Disables spawn animations.'),
+    ('PreventTribeAlliances', False, 'Disables tribe alliances.'),
+    ('PvEStructureDecayPeriodMultiplier', 1.0, 'Structure decay in PvE (>1.0 slows).'),
+    ('PvPDinoDecay', False, 'Enables dino decay in PvP during ORP.'),
+    ('PvPStructureDecay', False, 'Enables structure decay in PvP during ORP.'),
+    ('RaidDinoCharacterFoodDrainMultiplier', 1.0, 'Food drain for raid dinos.'),
+    ('ServerAutoForceRespawnWildDinosInterval', 0.0, 'Force respawn interval for wild dinos.'),
+    ('ServerCrosshair', True, 'Enables crosshair.'),
+    ('ServerForceNoHUD', False, 'Forces no HUD.'),
+    ('ShowFloatingDamageText', False, 'Enables floating damage text.'),
+    ('SpectatorPassword', '', 'Password for spectator mode.'),
+    ('StructurePickupHoldDuration', 0.5, 'Pickup hold duration.'),
+    ('StructurePickupTimeAfterPlacement', 30.0, 'Pickup time after placement.'),
+    ('StructurePreventResourceRadiusMultiplier', 1.0, 'Resource radius multiplier.'),
+    ('TribeLogDestroyedEnemyStructures', False, 'Logs enemy structure destruction.'),
+    ('TribeNameChangeCooldown', 15.0, 'Cooldown for tribe name changes.'),
+    ('UseFjordurTraversalBuff', False, 'Enables traversal buff in Fjordur.'),
+    ('UseOptimizedHarvestingHealth', False, 'Optimizes harvesting health.'),
+    ('YoungIceFoxDeathCooldown', 3600, 'Cooldown for Veilwyn respawn.'),
+)
+
+# Game.ini [/Script/ShooterGame.ShooterGameMode]
+GAME_SETTINGS = (
+    ('MatingIntervalMultiplier', 1.0, 'Time between mating attempts (>1.0 increases interval).'),
+    ('EggHatchSpeedMultiplier', 1.0, 'Egg hatching speed (>1.0 speeds up).'),
+    ('BabyMatureSpeedMultiplier', 1.0, 'Baby growth speed (>1.0 speeds up maturation).'),
+    ('BabyFoodConsumptionSpeedMultiplier', 1.0, 'Baby food consumption (>1.0 increases hunger).'),
+    ('BabyImprintingStatScaleMultiplier', 1.0, 'Imprinting stat bonus (>1.0 increases bonuses).'),
+    ('BabyCuddleIntervalMultiplier', 1.0, 'Cuddle frequency (>1.0 increases intervals).'),
+    ('BabyCuddleGracePeriodMultiplier', 1.0, 'Grace period before imprint loss (>1.0 extends).'),
+    ('BabyCuddleLoseImprintQualitySpeedMultiplier', 1.0, 'Imprint loss speed (>1.0 speeds up loss).'),
+    ('MaxTamedDinos', 4000, 'Global tamed dino cap.'),
+    ('MaxNumberOfPlayersInTribe', 0, 'Tribe size limit (0 = unlimited).'),
+    ('MaxAlliancesPerTribe', 0, 'Alliance limit per tribe (0 = unlimited).'),
+    ('MaxTribesPerAlliance', 0, 'Tribes per alliance (0 = unlimited).'),
+    ('bOnlyAllowSpecifiedEngrams', False, 'Hides unspecified engrams.'),
+    ('CustomRecipeEffectivenessMultiplier', 1.0, 'Custom recipe efficiency (>1.0 improves output).'),
+    ('CustomRecipeSkillMultiplier', 1.0, 'Crafting skill impact on recipes (>1.0 increases impact).'),
+    ('bDisableLootCrates', False, 'Disables loot crates.'),
+    ('bAppendItemSets', False, 'Appends to crate items instead of overriding.'),
+    ('GlobalSpoilingTimeMultiplier', 1.0, 'Item spoilage time (>1.0 prolongs).'),
+    ('GlobalItemDecompositionTimeMultiplier', 1.0, 'Dropped item decay (>1.0 slows).'),
+    ('GlobalCorpseDecompositionTimeMultiplier', 1.0, 'Corpse decay (>1.0 slows).'),
+    ('PvEStructureDecayPeriodMultiplier', 1.0, 'Structure decay in PvE (>1.0 slows).'),
+    ('PvEDinoDecayPeriodMultiplier', 1.0, 'Dino ownership decay time in PvE (>1.0 slows decay).'),
+    ('bAutoPvETimer', False, 'Enables timed PvE/PvP switches.'),
+    ('bPvEDisableFriendlyFire', False, 'Disables friendly fire in PvE.'),
+    ('bDisableFriendlyFire', False, 'Disables friendly fire in PvP.'),
+    ('bAllowCustomRecipes', True, 'Enables custom recipes.'),
+    ('bAutoUnlockAllEngrams', False, 'Unlocks all engrams.'),
+    ('AutoPvEStartTimeSeconds', 0.0, 'PvE start time in seconds.'),
+    ('bAllowFlyerSpeedLeveling', False, 'Enables flyer speed leveling.'),
+    ('bAllowPlatformSaddleMultiFloors', False, 'Allows multiple floors on platform saddles.'),
+    ('bAllowSpeedLeveling', False, 'Enables speed leveling.'),
+    ('bAutoPvEUseSystemTime', False, 'Uses system time for PvE timer.'),
+    ('bDisableDinoBreeding', False, 'Disables dino breeding.'),
+    ('bDisableDinoRiding', False, 'Disables dino riding.'),
+    ('bDisableDinoTaming', False, 'Disables dino taming.'),
+    ('bIncreasePvPRespawnInterval', True, 'Increases PvP respawn interval.'),
+    ('bPassiveDefensesDamageRiderlessDinos', False, 'Allows defenses to damage riderless dinos.'),
+    ('bUseCorpseLocator', True, 'Enables corpse locator.'),
+    ('bUseDinoLevelUpAnimations', True, 'Enables level up animations.'),
+    ('bUseSingleplayerSettings', False, 'Uses singleplayer settings.'),
+    ('bUseTameLimitForStructuresOnly', False, 'Applies tame limit only to structures.'),
+    ('CheatTeleportLocations', '', 'Teleport locations for cheat commands.'),
+    ('ConfigAddNPCSpawnEntriesContainer', '', 'Adds NPC spawn entries.'),
+    ('ConfigOverrideItemCraftingCosts', '', 'Overrides crafting costs.'),
+    ('ConfigOverrideItemMaxQuantity', '', 'Overrides item max quantities.'),
+    ('ConfigOverrideNPCSpawnEntriesContainer', '', 'Overrides NPC spawns.'),
+    ('ConfigOverrideSupplyCrateItems', '', 'Overrides supply crate items.'),
+    ('ConfigSubtractNPCSpawnEntriesContainer', '', 'Subtracts NPC spawn entries.'),
+    ('CraftingSkillBonusMultiplier', 1.0, 'Crafting skill bonus.'),
+    ('CraftXPMultiplier', 1.0, 'XP from crafting.'),
+    ('CropGrowthSpeedMultiplier', 1.0, 'Crop growth speed.'),
+    ('ExcludeItemIndices', '', 'Excludes items from crates.'),
+    ('FastDecayInterval', 43200, 'Fast decay interval.'),
+    ('FishingLootQualityMultiplier', 1.0, 'Fishing loot quality (>1.0 improves).'),
+    ('FuelConsumptionIntervalMultiplier', 1.0, 'Fuel consumption interval.'),
+    ('GenericXPMultiplier', 1.0, 'Generic XP multiplier.'),
+    ('HairGrowthSpeedMultiplier', 1.0, 'Hair growth speed.'),
+    ('HarvestResourceItemAmountClassMultipliers', '', 'Harvest multipliers by class.'),
+    ('HarvestXPMultiplier', 1.0, 'XP from harvesting.'),
+    ('IncreasePvPRespawnIntervalBaseAmount', 60.0, 'Base PvP respawn increase.'),
+    ('IncreasePvPRespawnIntervalCheckPeriod', 300.0, 'Check period for respawn increase.'),
+    ('LayEggIntervalMultiplier', 1.0, 'Egg laying interval.'),
+    ('LevelExperienceRampOverrides', '', 'Custom XP ramps.'),
+    ('LimitNonPlayerDroppedItemsCount', 0, 'Limit for dropped items.'),
+    ('LimitNonPlayerDroppedItemsRange', 0, 'Range for dropped items limit.'),
+    ('MaxFallSpeedMultiplier', 1.0, 'Fall speed multiplier.'),
+    ('MaxStructuresInSmallRadius', 0, 'Max structures in small radius.'),
+    ('MaxStructuresToProcess', 0, 'Max structures to process per tick.'),
+    ('NPCReplacements', '', 'Replaces NPCs.'),
+    ('OverrideMaxExperiencePointsDino', 0, 'Max XP for dinos.'),
+    ('OverrideMaxExperiencePointsPlayer', 0, 'Max XP for players.'),
+    ('OverridePlayerLevelEngramPoints', '', 'Engram points per level.'),
+    ('PassiveTameIntervalMultiplier', 1.0, 'Passive tame interval.'),
+    ('PerLevelStatsMultiplier_Player', '', 'Player stat multipliers per level.'),
+    ('PerLevelStatsMultiplier_DinoTamed', '', 'Tamed dino stat multipliers.'),
+    ('PerLevelStatsMultiplier_DinoWild', '', 'Wild dino stat multipliers.'),
+    ('PhotoModeRangeLimit', 3000, 'Photo mode range limit.'),
+    ('PlayerBaseStatMultipliers', '', 'Base stat multipliers for players.'),
+    ('PlayerHarvestingDamageMultiplier', 1.0, 'Player harvesting damage.'),
+    ('PoopIntervalMultiplier', 1.0, 'Poop interval.'),
+    ('PreventBreedingForClassNames', '', 'Prevents breeding for classes.'),
+    ('PreventDinoTameClassNames', '', 'Prevents taming for classes.'),
+    ('PreventOfflinePvPConnectionInvincibleInterval', 5.0, 'Invincible interval after login.'),
+    ('ResourceNoReplenishRadiusPlayers', 1.0, 'Resource radius around players.'),
+    ('ResourceNoReplenishRadiusStructures', 1.0, 'Resource radius around structures.'),
+    ('SpecialXPMultiplier', 1.0, 'Special XP multiplier.'),
+    ('TribeSlotReuseCooldown', 0.0, 'Tribe slot reuse cooldown.'),
+    ('UseCorpseLifeSpanMultiplier', 1.0, 'Corpse lifespan multiplier.'),
+    ('WildDinoCharacterFoodDrainMultiplier', 1.0, 'Wild dino food drain.'),
+    ('LimitTurretsRange', 10000.0, 'Turret range limit.'),
+    ('ValgueroMemorialEntries', '', 'Memorial entries for Valguero.'),
+    ('AdjustableMutagenSpawnDelayMultiplier', 1.0, 'Mutagen spawn delay.'),
+    ('BaseHexagonRewardMultiplier', 1.0, 'Hexagon reward multiplier.'),
+    ('bDisableHexagonStore', False, 'Disables hexagon store.'),
+    ('bDisableDefaultMapItemSets', False, 'Disables default map item sets.'),
+    ('bDisableGenesisMissions', False, 'Disables Genesis missions.'),
+    ('bDisableWorldBuffs', False, 'Disables world buffs.'),
+    ('bEnableWorldBuffScaling', False, 'Enables world buff scaling.'),
+    ('bGenesisUseStructuresPreventionVolumes', False, 'Uses prevention volumes in Genesis.'),
+    ('bHexStoreAllowOnlyEngramTradeOption', False, 'Allows only engram trades in store.'),
+    ('HexagonCostMultiplier', 1.0, 'Hexagon cost multiplier.'),
+)
+
+# Keys shown in Basic mode, in display order
+BASIC_SERVER = (
+    'DifficultyOffset', 'MaxPlayers', 'ServerPassword', 'ServerAdminPassword', 'ServerName', 'ServerHardcore',
+    'DinoDamageMultiplier', 'PlayerDamageMultiplier', 'XPMultiplier', 'TamingSpeedMultiplier', 'HarvestAmountMultiplier',
+    'DayCycleSpeedScale', 'serverPVE', 'ShowMapPlayerLocation', 'TheMaxStructuresInRange', 'ActiveEvent'
+)
+BASIC_GAME = (
+    'MatingIntervalMultiplier', 'EggHatchSpeedMultiplier', 'BabyMatureSpeedMultiplier', 'BabyImprintingStatScaleMultiplier',
+    'MaxTamedDinos', 'GlobalSpoilingTimeMultiplier', 'PvEStructureDecayPeriodMultiplier'
+)
+
+# Keys that feed the calculations panel
+CALCULATION_KEYS = (
+    'TamingSpeedMultiplier', 'BabyMatureSpeedMultiplier', 'BabyImprintingStatScaleMultiplier',
+    'EggHatchSpeedMultiplier', 'MatingIntervalMultiplier', 'DifficultyOffset', 'OverrideOfficialDifficulty',
+)
+
+# Nested (Key=Value,...) values that can run to hundreds of kilobytes; edited in the structured editor
+STRUCTURED_KEYS = (
+    'ConfigAddNPCSpawnEntriesContainer', 'ConfigOverrideItemCraftingCosts', 'ConfigOverrideItemMaxQuantity',
+    'ConfigOverrideNPCSpawnEntriesContainer', 'ConfigOverrideSupplyCrateItems', 'ConfigSubtractNPCSpawnEntriesContainer',
+    'HarvestResourceItemAmountClassMultipliers', 'LevelExperienceRampOverrides', 'NPCReplacements',
+    'OverridePlayerLevelEngramPoints',
+)
+
+# Editor limits for numeric settings; defaults outside them widen them (-1 often means "no limit")
+INT_RANGE = (0, 100000)
+FLOAT_RANGE = (0.0, 10.0)
+
+
+class Setting:
+    """One compiled schema record"""
+
+    __slots__ = ('id', 'section', 'key', 'type', 'default', 'range', 'description', 'tags')
+
+    def __init__(self, setting_id, section, key, default, description, tags):
+        self.id = setting_id
+        self.section = section
+        self.key = key
+        self.type = type(default)
+        self.default = default
+        self.range = _default_range(default)
+        self.description = description
+        self.tags = tags
+
+    def coerce(self, value):
+        """Convert a raw INI string to this setting's type"""
+        if not isinstance(value, str):
+            return value
+        if self.type is bool:
+            return value.lower() in ['true', '1', 'yes']
+        if self.type is int:
+            try:
+                return int(value)
+            except ValueError:
+                # The game writes whole numbers as floats too, e.g. MaxTamedDinos=5000.000000
+                number = float(value)
+                if not number.is_integer():
+                    raise
+                return int(number)
+        if self.type is float:
+            return float(value)
+        return value
+
+    def __repr__(self):
+        return f"Setting({self.id}, {self.section!r}, {self.key!r}, {self.default!r})"
+
+
+def _default_range(default):
+    if isinstance(default, bool) or not isinstance(default, (int, float)):
+        return None
+    low, high = INT_RANGE if isinstance(default, int) else FLOAT_RANGE
+    if default > high:
+        high = default * 10
+    if default < low:
+        low = default
+    return (low, high)
+
+
+def _compile(tables):
+    settings = []
+    ids = {}
+    types = {}
+    for section, rows in tables:
+        basic = BASIC_SERVER if section == SERVER_SECTION else BASIC_GAME
+        seen = {}
+        for key, default, description in rows:
+            if key.lower() in seen:
+                raise ValueError(f"{section} declares {key} twice (also as {seen[key.lower()]})")
+            seen[key.lower()] = key
+            if types.setdefault(key, type(default)) is not type(default):
+                raise ValueError(f"{key} is {types[key].__name__} in one section and "
+                                 f"{type(default).__name__} in another")
+            tags = set()
+            if key in basic:
+                tags.add('basic')
+            if key in CALCULATION_KEYS:
+                tags.add('calculation')
+            if key in STRUCTURED_KEYS:
+                tags.add('structured')
+            if 'Password' in key:
+                tags.add('secret')
+            ids[(section, key)] = len(settings)
+            settings.append(Setting(len(settings), section, key, default, description, frozenset(tags)))
+    return tuple(settings), ids
+
+
+def _index_lower_keys(settings):
+    index = {}
+    for setting in settings:
+        index.setdefault(setting.key.lower(), []).append(setting.id)
+    return index
+
+
+with tracing.span('schema.build', 'schema'):
+    SETTINGS, _IDS = _compile(((SERVER_SECTION, SERVER_SETTINGS), (GAME_SECTION, GAME_SETTINGS)))
+
+# Setting ids per section, in write order
+SECTION_IDS = {
+    section: tuple(setting.id for setting in SETTINGS if setting.section == section)
+    for section in (SERVER_SECTION, GAME_SECTION)
+}
+_BY_LOWER_KEY = _index_lower_keys(SETTINGS)
+BASIC_IDS = {
+    SERVER_SECTION: tuple(_IDS[(SERVER_SECTION, key)] for key in BASIC_SERVER),
+    GAME_SECTION: tuple(_IDS[(GAME_SECTION, key)] for key in BASIC_GAME),
+}
+
+
+def setting_id(section, key):
+    """Return the integer id of a setting; raises KeyError if unknown"""
+    return _IDS[(section, key)]
+
+
+def get(section, key):
+    """Return the Setting record for a section and key, or None"""
+    setting_id = _IDS.get((section, key))
+    return None if setting_id is None else SETTINGS[setting_id]
+
+
+def find(key):
+    """Return the Setting records for a key in any section, ignoring case"""
+    return [SETTINGS[setting_id] for setting_id in _BY_LOWER_KEY.get(key.lower(), ())]
+
+
+def section_settings(section, mode='advanced'):
+    """Return the Setting records shown and written for a section in a mode"""
+    ids = BASIC_IDS[section] if mode == 'basic' else SECTION_IDS.get(section, ())
+    return [SETTINGS[setting_id] for setting_id in ids]
+
+
+def defaults():
+    """Return a fresh section -> key -> default mapping"""
+    values = {section: {} for section in SECTION_IDS}
+    for setting in SETTINGS:
+        values[setting.section][setting.key] = setting.default
+    return values
+
+
+def descriptions():
+    """Return a key -> description mapping (keys in both sections share one text)"""
+    return {setting.key: setting.description for setting in SETTINGS}
+
+
+def build_key_index():
+    """
+    Map lowercase section and key names to setting ids.
+
+    Returns:
+        Dict of lowercase section -> dict of lowercase key -> tuple of ids, in
+        the shape inifile.read_section() expects
+    """
+    index = {}
+    for setting in SETTINGS:
+        index.setdefault(setting.section.lower(), {})[setting.key.lower()] = (setting.id,)
+    return index
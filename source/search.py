@@ -0,0 +1,169 @@
+"""
+Settings search for Ark Settings Generator
+
+An inverted index over setting key names and descriptions, used by the
+search box above the settings tabs. Key names are split on CamelCase, so
+"tamed" finds MaxTamedDinos, and every word start of a key is indexed as a
+prefix, so "flyercarry" finds AllowFlyerCarryPvE. Description words are
+indexed too but rank below key matches.
+
+Each query word matches index terms by prefix with two bisects of a sorted
+term list. A word that matches nothing falls back to fuzzy matching: one
+typo, missing or extra letter, or swapped pair, through a deletion
+neighbourhood index built by warm() or on first use. All query words must
+match.
+"""
+
+import bisect
+import re
+
+import schema
+
+# CamelCase words: "NPCNetworkStasis" -> NPC, Network, Stasis; "serverPVE" -> server, PVE
+_CAMEL_WORD = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+_TEXT_WORD = re.compile(r'\w+')
+
+# Shortest query word that is matched fuzzily; shorter words are too ambiguous
+FUZZY_MIN_LENGTH = 4
+
+# Score per matched query word
+KEY_START_SCORE = 8
+KEY_WORD_SCORE = 4
+DESCRIPTION_SCORE = 1
+FUZZY_FACTOR = 0.5
+
+_STOP_WORDS = frozenset(('a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'if', 'in',
+                         'is', 'it', 'of', 'on', 'or', 'the', 'this', 'to', 'when', 'with'))
+
+_index = None
+
+
+def split_key(key):
+    """Split a setting key into lowercase CamelCase words"""
+    return [word.lower() for word in _CAMEL_WORD.findall(key)]
+
+
+def _deletions(word):
+    """The word plus every variant with one letter removed"""
+    return {word} | {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+class _TermIndex:
+    """Sorted terms with the setting ids of each, searched by prefix"""
+
+    def __init__(self, postings):
+        self.terms = sorted(postings)
+        self.ids = [postings[term] for term in self.terms]
+
+    def prefix(self, text):
+        start = bisect.bisect_left(self.terms, text)
+        # U+FFFF sorts after any character that can follow the prefix
+        stop = bisect.bisect_right(self.terms, text + '\uffff', start)
+        return self.ids[start:stop]
+
+
+class SettingsIndex:
+    """
+    Inverted index over schema settings.
+
+    Args:
+        settings: Setting records to index (default: the whole schema)
+    """
+
+    def __init__(self, settings=None):
+        self.settings = tuple(schema.SETTINGS if settings is None else settings)
+        key_postings = {}
+        word_postings = {}
+        description_postings = {}
+        for position, setting in enumerate(self.settings):
+            lowered = setting.key.lower()
+            offset = 0
+            for word in split_key(setting.key):
+                # Index the rest of the key from each word start, e.g. "tameddinos"
+                offset = lowered.index(word, offset)
+                key_postings.setdefault(lowered[offset:], set()).add(position)
+                word_postings.setdefault(word, set()).add(position)
+                offset += len(word)
+            for word in _TEXT_WORD.findall((setting.description or '').lower()):
+                if word not in _STOP_WORDS:
+                    description_postings.setdefault(word, set()).add(position)
+        self._keys = _TermIndex(key_postings)
+        self._descriptions = _TermIndex(description_postings)
+        self._words = word_postings
+        self._description_words = description_postings
+        self._fuzzy = None
+
+    def warm(self):
+        """Build the fuzzy index now (e.g. when idle) instead of on the first typo"""
+        if self._fuzzy is not None:
+            return
+        fuzzy = {}
+        for word in set(self._words) | set(self._description_words):
+            # Every prefix, so a half-typed word with a typo still matches
+            for end in range(FUZZY_MIN_LENGTH - 1, len(word) + 1):
+                for variant in _deletions(word[:end]):
+                    fuzzy.setdefault(variant, set()).add(word)
+        self._fuzzy = fuzzy
+
+    def _fuzzy_scores(self, term):
+        self.warm()
+        words = set()
+        for variant in _deletions(term):
+            words.update(self._fuzzy.get(variant, ()))
+        scores = {}
+        for word in words:
+            for position in self._words.get(word, ()):
+                scores[position] = max(scores.get(position, 0), KEY_WORD_SCORE * FUZZY_FACTOR)
+            for position in self._description_words.get(word, ()):
+                scores.setdefault(position, DESCRIPTION_SCORE * FUZZY_FACTOR)
+        return scores
+
+    def _term_scores(self, term):
+        scores = {}
+        for ids in self._descriptions.prefix(term):
+            for position in ids:
+                scores[position] = DESCRIPTION_SCORE
+        for ids in self._keys.prefix(term):
+            for position in ids:
+                scores[position] = KEY_WORD_SCORE
+        for position in list(scores):
+            if self.settings[position].key.lower().startswith(term):
+                scores[position] = KEY_START_SCORE
+        if not scores and len(term) >= FUZZY_MIN_LENGTH:
+            scores = self._fuzzy_scores(term)
+        return scores
+
+    def search(self, text, limit=None):
+        """
+        Return the settings matching typed text, best matches first.
+
+        Args:
+            text: Typed text; words are matched by prefix, then fuzzily
+            limit: Maximum number of settings to return (default: no limit)
+
+        Returns:
+            List of Setting records; blank text returns every setting in schema order
+        """
+        terms = _TEXT_WORD.findall(text.lower())
+        if not terms:
+            return list(self.settings[:limit])
+        total = None
+        for term in terms:
+            scores = self._term_scores(term)
+            if total is None:
+                total = scores
+            else:
+                total = {position: score + scores[position]
+                         for position, score in total.items() if position in scores}
+            if not total:
+                return []
+        ranked = sorted(total, key=lambda position: (-total[position], position))
+        return [self.settings[position] for position in ranked[:limit]]
+
+
+def get_index():
+    """Return the index over the whole schema, building it on first use"""
+    global _index
+    if _index is None:
+        _index = SettingsIndex()
+    return _index
@@ -0,0 +1,234 @@
+"""
+Species catalog for Ark Settings Generator
+
+Creature stats used by the calculations panel and sweeps live in packed data
+files (data/*.bin) instead of a dict in the source. The catalog is read on
+first use, so headless generation never pays for it, and type-ahead search
+goes through a sorted prefix index that stays instant at thousands of species.
+
+Packed layout: CATALOG_MAGIC, a little-endian uint32 species count and uint32
+name table length, the UTF-8 name table ("name<TAB>source" per line) and one
+RECORD per species in name table order. Mod packs dropped into data/ next to
+species.bin are merged in file name order; later files win on name clashes.
+Catalogs are built from a tab-separated source with pack_catalog().
+"""
+
+import bisect
+import glob
+import os
+import re
+import struct
+import sys
+
+# Per-species stats in record order
+STATS = (
+    'taming_time',  # minutes
+    'maturation_time',  # hours
+    'imprint_interval',  # hours between imprints
+    'max_imprint',  # max imprint %
+    'incubation_time',  # minutes
+    'mating_cooldown',  # hours
+)
+STATUSES = ('working', 'coming_soon')
+RECORD = struct.Struct('<6fB')
+CATALOG_MAGIC = b'ARKDINO1'
+
+DEFAULT_SPECIES = 'Argentavis'
+VANILLA_SOURCE = 'ASA'
+
+DATA_DIR = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), 'data')
+CATALOG_FILE = os.path.join(DATA_DIR, 'species.bin')
+
+# Word starts inside a name: "Tek Rex" and "Rex (Alpha)" both match "rex"
+_WORD_START = re.compile(r'(?:^|(?<=[\s\-_(\[]))\w')
+
+_catalog = None
+
+
+class SpeciesCatalog:
+    """
+    Species names plus packed stat records, decoded one species at a time.
+
+    Names map to integer ids in catalog order. The prefix index used by
+    search() is built on the first search, not at load.
+    """
+
+    def __init__(self, names, sources, records):
+        self.names = list(names)
+        self.sources = list(sources)
+        self._records = bytes(records)
+        self._ids = {name: species_id for species_id, name in enumerate(self.names)}
+        self._prefix_keys = None
+        self._prefix_ids = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._ids
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def _unpack(self, name):
+        return RECORD.unpack_from(self._records, self._ids[name] * RECORD.size)
+
+    def stats(self, name):
+        """Return {stat: value} for one species; raises KeyError if unknown"""
+        record = self._unpack(name)
+        return dict(zip(STATS, record[:len(STATS)]))
+
+    def status(self, name):
+        return STATUSES[self._unpack(name)[len(STATS)]]
+
+    def source(self, name):
+        return self.sources[self._ids[name]]
+
+    def display_name(self, name):
+        """Combobox label with the status indicator and, for mod creatures, the mod"""
+        label = name if self.source(name) == VANILLA_SOURCE else f"{name} [{self.source(name)}]"
+        if self.status(name) == 'working':
+            return f"✅ {label}"
+        return f"⏰ {label} (Coming Soon)"
+
+    def _build_prefix_index(self):
+        entries = []
+        for species_id, name in enumerate(self.names):
+            lowered = name.lower()
+            for match in _WORD_START.finditer(lowered):
+                entries.append((lowered[match.start():], species_id))
+        entries.sort()
+        self._prefix_keys = [key for key, _ in entries]
+        self._prefix_ids = [species_id for _, species_id in entries]
+
+    def search(self, text, limit=None):
+        """
+        Return species names matching typed text, best matches first.
+
+        Matches any word start in a name, case-insensitively. Names that start
+        with the text come before names that only contain a matching word.
+
+        Args:
+            text: Typed text; blank text returns every name
+            limit: Maximum number of names to return (default: no limit)
+
+        Returns:
+            List of species names
+        """
+        prefix = text.strip().lower()
+        if not prefix:
+            return self.names[:limit]
+        if self._prefix_keys is None:
+            self._build_prefix_index()
+
+        start = bisect.bisect_left(self._prefix_keys, prefix)
+        # U+FFFF sorts after any character that can follow the prefix
+        stop = bisect.bisect_right(self._prefix_keys, prefix + '\uffff', start)
+        ids = set(self._prefix_ids[start:stop])
+        matches = sorted(ids, key=lambda species_id: (
+            not self.names[species_id].lower().startswith(prefix), self.names[species_id].lower()))
+        return [self.names[species_id] for species_id in matches[:limit]]
+
+
+def read_tsv(path):
+    """
+    Read a tab-separated species source file.
+
+    Columns are name, source, status and the STATS in order; blank lines and
+    lines starting with '#' are skipped. Returns a list of entry dicts.
+    """
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            fields = line.split('\t')
+            if len(fields) != 3 + len(STATS):
+                raise ValueError(f"{path}:{line_number}: expected {3 + len(STATS)} columns, got {len(fields)}")
+            name, source, status = fields[:3]
+            if status not in STATUSES:
+                raise ValueError(f"{path}:{line_number}: unknown status {status!r}")
+            entries.append({
+                'name': name,
+                'source': source,
+                'status': status,
+                'stats': dict(zip(STATS, (float(value) for value in fields[3:]))),
+            })
+    return entries
+
+
+def pack_catalog(entries, path):
+    """Write entry dicts (as returned by read_tsv) to a packed catalog file"""
+    names = []
+    records = bytearray()
+    seen = set()
+    for entry in entries:
+        name = entry['name']
+        if name in seen:
+            raise ValueError(f"Duplicate species in catalog: {name}")
+        if '\t' in name or '\n' in name or '\t' in entry['source'] or '\n' in entry['source']:
+            raise ValueError(f"Species names and sources cannot contain tabs or newlines: {name!r}")
+        seen.add(name)
+        names.append(f"{name}\t{entry['source']}")
+        records += RECORD.pack(*(entry['stats'][stat] for stat in STATS),
+                               STATUSES.index(entry['status']))
+    name_table = '\n'.join(names).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(CATALOG_MAGIC)
+        f.write(struct.pack('<II', len(names), len(name_table)))
+        f.write(name_table)
+        f.write(records)
+
+
+def _read_packed(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:len(CATALOG_MAGIC)] != CATALOG_MAGIC:
+        raise ValueError(f"{path} is not a species catalog")
+    offset = len(CATALOG_MAGIC)
+    count, table_length = struct.unpack_from('<II', data, offset)
+    offset += 8
+    rows = data[offset:offset + table_length].decode('utf-8').split('\n') if count else []
+    offset += table_length
+    records = data[offset:offset + count * RECORD.size]
+    if len(rows) != count or len(records) != count * RECORD.size:
+        raise ValueError(f"{path} is truncated")
+    return [row.split('\t', 1) for row in rows], records
+
+
+def load_catalog(paths):
+    """Load and merge packed catalog files; later files replace earlier species"""
+    names = []
+    sources = []
+    records = bytearray()
+    positions = {}
+    for path in paths:
+        rows, packed = _read_packed(path)
+        for index, (name, source) in enumerate(rows):
+            record = packed[index * RECORD.size:(index + 1) * RECORD.size]
+            if name in positions:
+                position = positions[name]
+                sources[position] = source
+                records[position * RECORD.size:(position + 1) * RECORD.size] = record
+                continue
+            positions[name] = len(names)
+            names.append(name)
+            sources.append(source)
+            records += record
+    return SpeciesCatalog(names, sources, records)
+
+
+def catalog_paths(directory=DATA_DIR):
+    """Return species.bin followed by any mod packs in the data folder"""
+    base = os.path.join(directory, os.path.basename(CATALOG_FILE))
+    packs = sorted(path for path in glob.glob(os.path.join(directory, '*.bin')) if path != base)
+    return [base] + packs
+
+
+def get_catalog():
+    """Return the shared catalog, loading it on first use"""
+    global _catalog
+    if _catalog is None:
+        _catalog = load_catalog(catalog_paths())
+    return _catalog
@@ -0,0 +1,154 @@
+"""
+Observable settings store for Ark Settings Generator
+
+Holds the live section -> key -> value mapping that the settings lists,
+preview and writer read, next to a read-only defaults table. Every write
+through the store keeps the set of keys that differ from the defaults (the
+dirty keys) up to date, so a reset only touches those, and notifies
+observers with the (section, key) pairs that changed.
+
+Bulk writes such as an import, reset or undo go in a transaction: observers
+are suspended until it ends and then called once with every pair that
+actually changed, so the GUI refreshes only those rows.
+"""
+
+import contextlib
+import types
+
+import schema
+
+_MISSING = object()
+
+
+def freeze(values):
+    """Return a read-only copy of a section -> key -> value mapping"""
+    return types.MappingProxyType({section: types.MappingProxyType(dict(keys)) for section, keys in values.items()})
+
+
+DEFAULTS = freeze(schema.defaults())
+
+
+def _same(a, b):
+    return a == b and type(a) is type(b)
+
+
+class SettingsStore:
+    """
+    Live settings with dirty tracking and batched change notifications.
+
+    Args:
+        values: Initial section -> key -> value mapping, used in place
+                (default: a fresh copy of the defaults)
+        defaults: Read-only defaults table the dirty keys are measured against
+    """
+
+    def __init__(self, values=None, defaults=DEFAULTS):
+        self.defaults = defaults
+        self.values = {section: dict(keys) for section, keys in defaults.items()} if values is None else values
+        self.dirty = {(section, key) for section, keys in self.values.items() for key in keys
+                      if self._differs(section, key)}
+        self._observers = []
+        self._depth = 0
+        self._label = None
+        self._pending = set()
+
+    def _differs(self, section, key):
+        return not _same(self.values.get(section, {}).get(key, _MISSING),
+                         self.defaults.get(section, {}).get(key, _MISSING))
+
+    def subscribe(self, callback):
+        """Call callback(changed, label) after changes; label is None outside transactions"""
+        self._observers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._observers.remove(callback)
+
+    def _changed(self, pairs):
+        for section, key in pairs:
+            if self._differs(section, key):
+                self.dirty.add((section, key))
+            else:
+                self.dirty.discard((section, key))
+        if self._depth:
+            self._pending.update(pairs)
+        else:
+            self._notify(set(pairs), None)
+
+    def _notify(self, changed, label):
+        for callback in list(self._observers):
+            callback(changed, label)
+
+    def get(self, section, key, default=None):
+        return self.values.get(section, {}).get(key, default)
+
+    def set(self, section, key, value):
+        """Write one value; returns True if it changed"""
+        values = self.values.setdefault(section, {})
+        if _same(values.get(key, _MISSING), value):
+            return False
+        values[key] = value
+        self._changed(((section, key),))
+        return True
+
+    def delete(self, section, key):
+        """Remove a key the schema does not know (e.g. from a profile); returns True if it existed"""
+        if key not in self.values.get(section, {}):
+            return False
+        del self.values[section][key]
+        self._changed(((section, key),))
+        return True
+
+    def update(self, values):
+        """Write a section -> key -> value mapping; returns the pairs that changed"""
+        return [(section, key) for section, keys in values.items() for key, value in keys.items()
+                if self.set(section, key, value)]
+
+    def mark_changed(self, pairs):
+        """Report values that were written into self.values directly, e.g. by History.undo"""
+        pairs = list(pairs)
+        if pairs:
+            self._changed(pairs)
+
+    def is_dirty(self, section, key):
+        return (section, key) in self.dirty
+
+    def changes(self):
+        """Return the values that differ from the defaults, per section"""
+        changes = {}
+        for section, key in self.dirty:
+            value = self.values.get(section, {}).get(key, _MISSING)
+            if value is not _MISSING:
+                changes.setdefault(section, {})[key] = value
+        return changes
+
+    def reset(self):
+        """Restore the defaults, touching only dirty keys; returns the pairs that changed"""
+        changed = []
+        for section, key in sorted(self.dirty):
+            default = self.defaults.get(section, {}).get(key, _MISSING)
+            if default is _MISSING:
+                self.delete(section, key)
+            else:
+                self.set(section, key, default)
+            changed.append((section, key))
+        return changed
+
+    @contextlib.contextmanager
+    def transaction(self, label=None):
+        """
+        Batch writes: observers are suspended and called once when the
+        outermost transaction ends, with every pair written inside it.
+        """
+        if not self._depth:
+            self._label = label
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                changed = self._pending
+                self._pending = set()
+                label, self._label = self._label, None
+                if changed:
+                    self._notify(changed, label)
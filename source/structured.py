@@ -0,0 +1,221 @@
+"""
+Structured values for Ark Settings Generator
+
+Keys like ConfigOverrideNPCSpawnEntriesContainer hold nested
+(Key=Value,...) values that can run to hundreds of kilobytes on one INI
+line. For editing, format_value() breaks a value into indented lines (groups
+shorter than WRAP_WIDTH stay on one line) and compact_value() joins them
+back into the single line the INI file needs. That round trip drops spaces
+after commas and the like, so saving goes through edited_value() and
+edited_values(), which keep the original text when only its layout changed.
+
+The editor highlights only the lines in view. tokenize() colours one line
+given the bracket depth at its start, and LineDepths keeps those start
+depths: computed lazily up to the lines asked for, and patched after an edit
+so that lines below are only recomputed when the edit changed the bracket
+balance.
+"""
+
+import re
+
+# Groups at most this long are kept on one line
+WRAP_WIDTH = 100
+INDENT = '  '
+# Bracket colours cycle through this many depth tags
+BRACKET_LEVELS = 4
+
+# Quoted strings (possibly unterminated on this line), brackets and commas, and everything else
+_CHUNK = re.compile(r'"[^"]*"?|[(),]|[^"(),]+')
+_BRACKET = re.compile(r'"[^"]*"?|[()]')
+_BREAK = re.compile(r'[ \t]*\r?\n[ \t]*')
+_BLANK_LINE = re.compile(r'\r?\n[ \t]*\r?\n')
+_TOKEN = re.compile(r'(?P<string>"[^"]*"?)|(?P<bracket>[()])|(?P<key>[A-Za-z_][\w.]*)(?=\s*=)'
+                    r'|(?P<number>(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w.]))')
+
+TAGS = ('string', 'key', 'number', 'unmatched') + tuple(f'bracket{level}' for level in range(BRACKET_LEVELS))
+
+
+def _group_ends(value):
+    """Map each '(' offset to the offset of its matching ')' (len(value) if unmatched)"""
+    ends = {}
+    stack = []
+    for match in _BRACKET.finditer(value):
+        char = match.group()
+        if char == '(':
+            stack.append(match.start())
+        elif char == ')' and stack:
+            ends[stack.pop()] = match.start()
+    for start in stack:
+        ends[start] = len(value)
+    return ends
+
+
+def format_value(value, width=WRAP_WIDTH, indent=INDENT):
+    """
+    Break a one-line structured value into indented lines.
+
+    Args:
+        value: INI value, e.g. "(NPCSpawnEntriesContainerClassString=...,NPCSpawnEntries=(...))"
+        width: Groups up to this many characters stay on one line
+
+    Returns:
+        Multi-line text; compact_value() turns it back into value
+    """
+    ends = _group_ends(value)
+    out = []
+    depth = 0
+    inline_until = -1
+    line_start = False
+    for match in _CHUNK.finditer(value):
+        chunk = match.group()
+        start = match.start()
+        if start < inline_until:
+            out.append(chunk)
+            continue
+        if chunk == '(':
+            end = ends[start]
+            if end - start < width:
+                inline_until = end + 1
+                out.append(chunk)
+                line_start = False
+                continue
+            depth += 1
+            out.append('(\n' + indent * depth)
+            line_start = True
+        elif chunk == ')':
+            depth = max(depth - 1, 0)
+            out.append('\n' + indent * depth + ')')
+            line_start = False
+        elif chunk == ',':
+            out.append(',\n' + indent * depth)
+            line_start = True
+        else:
+            if line_start:
+                chunk = chunk.lstrip(' \t')
+                if not chunk:
+                    continue
+            out.append(chunk)
+            line_start = False
+    return ''.join(out)
+
+
+def compact_value(text):
+    """Join formatted lines back into a one-line value, dropping the indentation"""
+    return _BREAK.sub('', text)
+
+
+def format_values(values, width=WRAP_WIDTH):
+    """Format the values of a repeated key, separated by blank lines"""
+    return '\n\n'.join(format_value(value, width) for value in values)
+
+
+def parse_values(text):
+    """Split blank-line separated text back into compact values of a repeated key"""
+    values = (compact_value(part) for part in _BLANK_LINE.split(text))
+    return [value for value in values if value]
+
+
+def _structure(value):
+    """Chunks of a value with the spaces around unquoted chunks dropped"""
+    chunks = (chunk if chunk.startswith('"') else chunk.strip() for chunk in _CHUNK.findall(value))
+    return tuple(chunk for chunk in chunks if chunk)
+
+
+def edited_value(text, original):
+    """compact_value(text), or original itself when text only re-formats it"""
+    value = compact_value(text)
+    return original if _structure(value) == _structure(original) else value
+
+
+def edited_values(text, originals):
+    """parse_values(text), keeping each original value whose text only re-formats it"""
+    unchanged = {_structure(value): value for value in originals}
+    return [unchanged.get(_structure(value), value) for value in parse_values(text)]
+
+
+def end_depth(line, depth):
+    """Return the bracket depth after a line that starts at depth"""
+    if '"' not in line:
+        return depth + line.count('(') - line.count(')')
+    for match in _BRACKET.finditer(line):
+        char = match.group()
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+    return depth
+
+
+def tokenize(line, depth):
+    """
+    Colour one line.
+
+    Args:
+        line: Line text
+        depth: Bracket depth at the start of the line
+
+    Returns:
+        (spans, depth) with spans as (tag, start, end) tuples and the depth after the line
+    """
+    spans = []
+    for match in _TOKEN.finditer(line):
+        kind = match.lastgroup
+        if kind == 'bracket':
+            if match.group() == '(':
+                tag = f'bracket{depth % BRACKET_LEVELS}'
+                depth += 1
+            else:
+                depth -= 1
+                tag = 'unmatched' if depth < 0 else f'bracket{depth % BRACKET_LEVELS}'
+        else:
+            tag = kind
+        spans.append((tag, match.start(), match.end()))
+    return spans, depth
+
+
+class LineDepths:
+    """
+    Bracket depth at the start of each line of a document.
+
+    Args:
+        fetch: Callable(first, stop) returning the text of lines first..stop-1
+               (0-based); only called for lines whose depth is not known yet
+    """
+
+    def __init__(self, fetch):
+        self._fetch = fetch
+        # depths[i] is the depth at the start of line i; only a valid prefix is kept
+        self.depths = [0]
+
+    def depth(self, line):
+        """Return the depth at the start of a line, scanning forward from the last known line"""
+        if line >= len(self.depths):
+            depth = self.depths[-1]
+            for text in self._fetch(len(self.depths) - 1, line):
+                depth = end_depth(text, depth)
+                self.depths.append(depth)
+        return self.depths[line]
+
+    def edited(self, first, old_last, new_last):
+        """
+        Patch depths after lines first..old_last were replaced by first..new_last.
+
+        Returns:
+            True if lines below the edit keep their depths, False if they were
+            dropped and will be recomputed when next asked for
+        """
+        if first >= len(self.depths):
+            return True
+        known_after = self.depths[old_last + 1] if old_last + 1 < len(self.depths) else None
+        depth = self.depths[first]
+        patched = []
+        for text in self._fetch(first, new_last + 1):
+            depth = end_depth(text, depth)
+            patched.append(depth)
+        if patched and known_after is not None and patched[-1] == known_after:
+            # Same balance as before: lines below only shift
+            self.depths[first + 1:old_last + 2] = patched
+            return True
+        del self.depths[first + 1:]
+        self.depths.extend(patched)
+        return False
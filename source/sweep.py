@@ -0,0 +1,212 @@
+"""
+Species x multiplier calculation sweeps for Ark Settings Generator
+
+Computes the update_calculations numbers for every species in the catalog across
+ranges of breeding and taming multipliers in one batched operation. Each
+result column depends on a single multiplier, so only species x axis values
+are computed; the full grid is a broadcast view that is expanded on export.
+
+numpy is used when installed; otherwise the stdlib array module is used and
+columns are expanded with sequence repetition instead of per-cell loops.
+"""
+
+import array
+import csv
+import itertools
+import json
+import struct
+
+import species as species_catalog
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Sweep axes in grid order
+SWEEP_KEYS = (
+    'TamingSpeedMultiplier',
+    'BabyMatureSpeedMultiplier',
+    'EggHatchSpeedMultiplier',
+    'MatingIntervalMultiplier',
+    'BabyImprintingStatScaleMultiplier',
+)
+
+# Result column -> (dino stat, driving multiplier, divide by multiplier?)
+RESULT_COLUMNS = {
+    'taming_time': ('taming_time', 'TamingSpeedMultiplier', True),
+    'maturation_time': ('maturation_time', 'BabyMatureSpeedMultiplier', True),
+    'incubation_time': ('incubation_time', 'EggHatchSpeedMultiplier', True),
+    'mating_cooldown': ('mating_cooldown', 'MatingIntervalMultiplier', True),
+    'imprint_interval': ('imprint_interval', 'BabyImprintingStatScaleMultiplier', True),
+    'max_imprint': ('max_imprint', 'BabyImprintingStatScaleMultiplier', False),
+}
+
+BINARY_MAGIC = b'ARKSWP1\n'
+
+
+def multiplier_range(start, stop, steps):
+    """Return `steps` evenly spaced multipliers from start to stop inclusive"""
+    if steps < 1:
+        raise ValueError("A multiplier range needs at least one step")
+    if start <= 0 or stop <= 0:
+        raise ValueError("Multipliers must be positive")
+    if steps == 1:
+        return (float(start),)
+    step = (stop - start) / (steps - 1)
+    return tuple(start + step * i for i in range(steps))
+
+
+class SweepResult:
+    """
+    Read-only view over a sweep grid.
+
+    The grid has shape (species, *axes) in SWEEP_KEYS order. Column tables
+    hold one value per species and driving-axis value; column() expands a
+    column to the full grid in C (row-major) order.
+    """
+
+    def __init__(self, species, axes, tables):
+        self.species = list(species)
+        self.axes = axes
+        self.tables = tables
+        self.shape = (len(self.species),) + tuple(len(axes[key]) for key in SWEEP_KEYS)
+
+    def __len__(self):
+        size = 1
+        for dim in self.shape:
+            size *= dim
+        return size
+
+    def _axis_position(self, column):
+        # Grid dimension driven by a column (0 is species)
+        return 1 + SWEEP_KEYS.index(RESULT_COLUMNS[column][1])
+
+    def column(self, name):
+        """Return one result column expanded to the full grid, flattened"""
+        table = self.tables[name]
+        position = self._axis_position(name)
+        if np is not None:
+            view_shape = [1] * len(self.shape)
+            view_shape[0] = self.shape[0]
+            view_shape[position] = self.shape[position]
+            return np.broadcast_to(np.asarray(table, dtype=np.float32).reshape(view_shape),
+                                   self.shape).ravel()
+
+        # Each value repeats once per cell of the faster-varying dimensions, and
+        # each species' block of axis values repeats for the dimensions in between
+        inner = 1
+        for dim in self.shape[position + 1:]:
+            inner *= dim
+        outer = 1
+        for dim in self.shape[1:position]:
+            outer *= dim
+        flat = array.array('f')
+        for row in table:
+            block = array.array('f')
+            for value in row:
+                block.extend(array.array('f', [value]) * inner)
+            flat.extend(block * outer)
+        return flat
+
+    def iter_rows(self):
+        """Yield (species, *multipliers, *results) tuples in grid order"""
+        columns = [self.column(name) for name in RESULT_COLUMNS]
+        axes = [self.axes[key] for key in SWEEP_KEYS]
+        index = 0
+        for species in self.species:
+            for combo in itertools.product(*axes):
+                yield (species,) + combo + tuple(float(column[index]) for column in columns)
+                index += 1
+
+    def to_csv(self, path):
+        """Export every row to a CSV file"""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(('species',) + SWEEP_KEYS + tuple(RESULT_COLUMNS))
+            writer.writerows(self.iter_rows())
+
+    def to_binary(self, path):
+        """
+        Export to a compact binary file.
+
+        Layout: BINARY_MAGIC, a little-endian uint32 header length, a JSON header
+        (species, axes, shape, columns) and then each column as float32 values in
+        grid order. Axis values are stored once in the header, not per row.
+        """
+        header = json.dumps({
+            'species': self.species,
+            'axes': {key: list(self.axes[key]) for key in SWEEP_KEYS},
+            'shape': list(self.shape),
+            'columns': list(RESULT_COLUMNS),
+        }).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(BINARY_MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            for name in RESULT_COLUMNS:
+                column = self.column(name)
+                if np is not None:
+                    f.write(column.astype('<f4').tobytes())
+                else:
+                    if struct.pack('=f', 1.0) != struct.pack('<f', 1.0):
+                        column.byteswap()
+                    column.tofile(f)
+
+
+def load_binary(path):
+    """Read a file written by SweepResult.to_binary; returns (header, columns)"""
+    with open(path, 'rb') as f:
+        if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a sweep file")
+        (header_length,) = struct.unpack('<I', f.read(4))
+        header = json.loads(f.read(header_length).decode('utf-8'))
+        size = 1
+        for dim in header['shape']:
+            size *= dim
+        columns = {}
+        for name in header['columns']:
+            column = array.array('f')
+            column.frombytes(f.read(size * 4))
+            if struct.pack('=f', 1.0) != struct.pack('<f', 1.0):
+                column.byteswap()
+            columns[name] = column
+    return header, columns
+
+
+def run_sweep(ranges, species=None):
+    """
+    Compute the results table for every species over multiplier ranges.
+
+    Args:
+        ranges: Mapping of SWEEP_KEYS entries to sequences of multipliers;
+            missing keys are held at 1.0
+        species: Dino names to include (defaults to every species in the catalog)
+
+    Returns:
+        SweepResult view over the grid
+    """
+    unknown = set(ranges) - set(SWEEP_KEYS)
+    if unknown:
+        raise ValueError(f"Cannot sweep {', '.join(sorted(unknown))}")
+    axes = {key: tuple(float(v) for v in ranges.get(key, (1.0,))) for key in SWEEP_KEYS}
+    for key, values in axes.items():
+        if not values or min(values) <= 0:
+            raise ValueError(f"{key} needs at least one positive multiplier")
+
+    catalog = species_catalog.get_catalog()
+    species = list(species) if species is not None else list(catalog)
+    stats = [catalog.stats(dino) for dino in species]
+    tables = {}
+    for name, (stat, key, divide) in RESULT_COLUMNS.items():
+        base = [float(dino_stats[stat]) for dino_stats in stats]
+        multipliers = axes[key]
+        if np is not None:
+            base_array = np.asarray(base)[:, None]
+            axis_array = np.asarray(multipliers)[None, :]
+            tables[name] = base_array / axis_array if divide else base_array * axis_array
+        elif divide:
+            tables[name] = [[value / m for m in multipliers] for value in base]
+        else:
+            tables[name] = [[value * m for m in multipliers] for value in base]
+    return SweepResult(species, axes, tables)
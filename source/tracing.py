@@ -0,0 +1,155 @@
+"""
+Phase tracing for Ark Settings Generator
+
+Records timed spans around the slow phases (schema build, tab population,
+INI import, calculations, rendering and file writes) and exports them as
+Chrome trace JSON, which chrome://tracing and https://ui.perfetto.dev open.
+
+Tracing is off unless the ARK_TRACE environment variable is set:
+
+    ARK_TRACE=trace.json python cli.py generate --output out
+
+The trace is written when the process exits. While disabled, span() returns
+a shared no-op context manager, so instrumented code pays one flag check.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+ENV_VAR = 'ARK_TRACE'
+DEFAULT_TRACE_FILE = 'ark_trace.json'
+
+_enabled = False
+_output = None
+_events = []
+_origin_ns = time.perf_counter_ns()
+
+
+class _Span:
+    """A recording span; becomes a Chrome 'complete' event on exit"""
+
+    __slots__ = ('name', 'cat', 'args', 'start_ns')
+
+    def __init__(self, name, cat, args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        _events.append({
+            'name': self.name,
+            'cat': self.cat,
+            'ph': 'X',
+            'ts': (self.start_ns - _origin_ns) / 1000,
+            'dur': (end_ns - self.start_ns) / 1000,
+            'pid': os.getpid(),
+            'tid': threading.get_ident(),
+            'args': self.args,
+        })
+        return False
+
+    def set(self, **args):
+        """Attach arguments known only once the work is done"""
+        self.args.update(args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, cat='app', **args):
+    """Return a context manager that records one span while tracing is enabled"""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args)
+
+
+def traced(name=None, cat='app'):
+    """Decorator that records a span for every call while tracing is enabled"""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, cat, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable(output=None):
+    """Start recording; with an output path the trace is written at exit"""
+    global _enabled, _output
+    _enabled = True
+    if output and _output is None:
+        atexit.register(_write_at_exit)
+    _output = output or _output
+
+
+def disable():
+    """Stop recording; spans already recorded are kept"""
+    global _enabled
+    _enabled = False
+
+
+def events():
+    return list(_events)
+
+
+def clear():
+    del _events[:]
+
+
+def to_chrome_trace():
+    """Return the recorded spans as a Chrome trace / Perfetto JSON document"""
+    pid = os.getpid()
+    metadata = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                 'args': {'name': 'Ark Settings Generator'}}]
+    return {'traceEvents': metadata + _events, 'displayTimeUnit': 'ms'}
+
+
+def write_trace(path):
+    """Write the recorded spans to a JSON file and return its path"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(to_chrome_trace(), f)
+    return path
+
+
+def _write_at_exit():
+    if _output and _events:
+        write_trace(_output)
+
+
+_env_value = os.environ.get(ENV_VAR)
+if _env_value and _env_value != '0':
+    enable(DEFAULT_TRACE_FILE if _env_value == '1' else _env_value)
@@ -0,0 +1,355 @@
+"""
+Settings validation for Ark Settings Generator
+
+Checks settings against rules compiled once from the schema:
+
+- type rules: values must convert to the setting's type
+- range rules: numbers outside a setting's usual range are warnings, and
+  numbers outside a hard limit (KEY_LIMITS) are errors
+- cross-field rules: settings that override or contradict each other
+- duplicate, misplaced and conflicting keys across GameUserSettings.ini and
+  Game.ini
+
+validate_settings() checks a settings mapping (the GUI runs it before
+generating), validate_files() checks a config pair on disk and reports line
+numbers, and validate_folders() checks thousands of config folders on a
+process pool.
+"""
+
+import collections
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import engine
+import inifile
+import schema
+
+ERROR = 'error'
+WARNING = 'warning'
+
+SERVER_SECTION = schema.SERVER_SECTION
+GAME_SECTION = schema.GAME_SECTION
+SECTION_FILES = {SERVER_SECTION: engine.GAME_USER_SETTINGS_FILE, GAME_SECTION: engine.GAME_INI_FILE}
+
+# key -> (low, high, severity, reason) limits that replace the usual range
+KEY_LIMITS = {
+    'RCONPort': (1, 65535, ERROR, "not a valid TCP port"),
+    'DifficultyOffset': (0.0, 1.0, WARNING, "ARK clamps it to 0-1; use OverrideOfficialDifficulty for more"),
+}
+
+_BOOL_STRINGS = frozenset(('true', 'false', '1', '0', 'yes', 'no'))
+
+Finding = collections.namedtuple('Finding', ['severity', 'code', 'section', 'key', 'message', 'path', 'line'])
+FolderResult = collections.namedtuple('FolderResult', ['path', 'findings', 'error'])
+ValidationReport = collections.namedtuple('ValidationReport', ['results', 'elapsed_ms', 'workers'])
+
+
+class _Rule:
+    """Type and range check for one setting"""
+
+    __slots__ = ('setting', 'low', 'high', 'severity', 'reason')
+
+    def __init__(self, setting, limits):
+        self.setting = setting
+        self.low = self.high = None
+        self.severity = WARNING
+        self.reason = "outside the usual range"
+        if setting.key in limits:
+            self.low, self.high, self.severity, self.reason = limits[setting.key]
+        elif setting.range is not None:
+            # Sentinel defaults such as -1 ("unlimited") are always allowed
+            self.low, self.high = min(setting.range[0], setting.default), setting.range[1]
+
+    def parse(self, raw):
+        """Convert a raw INI string; returns (value, error message or None)"""
+        setting = self.setting
+        if setting.type is bool and raw.lower() not in _BOOL_STRINGS:
+            return None, f"{raw!r} is not True or False"
+        try:
+            return setting.coerce(raw), None
+        except ValueError:
+            return None, f"{raw!r} is not {'an integer' if setting.type is int else 'a number'}"
+
+    def check(self, value):
+        """Return (severity, code, message) for a typed value, or None"""
+        setting = self.setting
+        if isinstance(value, str) and setting.type is not str:
+            value, error = self.parse(value)
+            if error:
+                return ERROR, 'type', error
+        elif setting.type is float and isinstance(value, int) and not isinstance(value, bool):
+            pass
+        elif not isinstance(value, setting.type) and not (setting.type is str and isinstance(value, list)):
+            return ERROR, 'type', f"{value!r} is not {setting.type.__name__}"
+        if self.low is not None and not self.low <= value <= self.high:
+            return self.severity, 'range', f"{value} is {self.reason} ({self.low} to {self.high})"
+        return None
+
+
+class _Values:
+    """Settings seen by cross-field rules, with schema defaults for missing keys"""
+
+    __slots__ = ('values', 'explicit')
+
+    def __init__(self, values, explicit):
+        self.values = values
+        self.explicit = explicit
+
+    def get(self, section, key):
+        setting = schema.get(section, key)
+        value = self.values.get(section, {}).get(key)
+        if setting is None:
+            return value
+        # Values of the wrong type are reported by the type rules; rules see the default
+        if value is None or (setting.type in (int, float) and not isinstance(value, (int, float))):
+            return setting.default
+        return value
+
+    def is_set(self, section, key):
+        """True if the key was written in the file, or differs from its default in a mapping"""
+        if self.explicit is not None:
+            return (section, key) in self.explicit
+        setting = schema.get(section, key)
+        return setting is not None and self.get(section, key) != setting.default
+
+
+def _difficulty_override(values):
+    override = values.get(SERVER_SECTION, 'OverrideOfficialDifficulty')
+    if override and override > 0 and values.is_set(SERVER_SECTION, 'DifficultyOffset'):
+        yield (WARNING, 'overridden', SERVER_SECTION, 'DifficultyOffset',
+               f"ignored because OverrideOfficialDifficulty is {override}")
+
+
+def _tame_limits(values):
+    if not (values.is_set(SERVER_SECTION, 'MaxTamedDinos_SoftTameLimit')
+            or values.is_set(SERVER_SECTION, 'MaxTamedDinos')):
+        return
+    soft = values.get(SERVER_SECTION, 'MaxTamedDinos_SoftTameLimit')
+    hard = values.get(SERVER_SECTION, 'MaxTamedDinos')
+    if soft > hard:
+        yield (WARNING, 'limit', SERVER_SECTION, 'MaxTamedDinos_SoftTameLimit',
+               f"{soft} is above MaxTamedDinos ({hard}), so the soft limit is never reached")
+    personal = values.get(SERVER_SECTION, 'MaxPersonalTamedDinos')
+    if personal > hard:
+        yield (WARNING, 'limit', SERVER_SECTION, 'MaxPersonalTamedDinos',
+               f"{personal} is above MaxTamedDinos ({hard})")
+
+
+def _max_tamed_conflict(values):
+    if values.is_set(SERVER_SECTION, 'MaxTamedDinos') and values.is_set(GAME_SECTION, 'MaxTamedDinos'):
+        server = values.get(SERVER_SECTION, 'MaxTamedDinos')
+        game = values.get(GAME_SECTION, 'MaxTamedDinos')
+        # The schema defaults differ (5000/4000), so untouched defaults are not a conflict
+        edited = (server != schema.get(SERVER_SECTION, 'MaxTamedDinos').default
+                  or game != schema.get(GAME_SECTION, 'MaxTamedDinos').default)
+        if server != game and edited:
+            yield (WARNING, 'conflict', GAME_SECTION, 'MaxTamedDinos',
+                   f"{game} here but {server} in {engine.GAME_USER_SETTINGS_FILE}")
+
+
+def _rcon_password(values):
+    if (values.is_set(SERVER_SECTION, 'RCONEnabled') and values.get(SERVER_SECTION, 'RCONEnabled')
+            and not values.get(SERVER_SECTION, 'ServerAdminPassword')):
+        yield (WARNING, 'required', SERVER_SECTION, 'ServerAdminPassword',
+               "empty while RCONEnabled is on, so RCON logins will fail")
+
+
+def _active_mods(values):
+    mods = [mod.strip() for mod in str(values.get(SERVER_SECTION, 'ActiveMods') or '').split(',') if mod.strip()]
+    seen = set()
+    for mod in mods:
+        if not mod.isdigit():
+            yield ERROR, 'type', SERVER_SECTION, 'ActiveMods', f"mod ID {mod!r} is not a number"
+        elif mod in seen:
+            yield WARNING, 'duplicate', SERVER_SECTION, 'ActiveMods', f"mod ID {mod} is listed twice"
+        seen.add(mod)
+
+
+CROSS_RULES = (_difficulty_override, _tame_limits, _max_tamed_conflict, _rcon_password, _active_mods)
+
+
+class RuleSet:
+    """
+    Validation rules compiled once from the schema.
+
+    Args:
+        limits: key -> (low, high, severity, reason) hard limits
+        cross_rules: Callables taking the settings and yielding
+            (severity, code, section, key, message) tuples
+    """
+
+    def __init__(self, limits=None, cross_rules=CROSS_RULES):
+        limits = KEY_LIMITS if limits is None else limits
+        self.rules = tuple(_Rule(setting, limits) for setting in schema.SETTINGS)
+        self.cross_rules = tuple(cross_rules)
+        self._key_index = schema.build_key_index()
+
+    def _cross_check(self, values, explicit, locate=None):
+        findings = []
+        context = _Values(values, explicit)
+        for rule in self.cross_rules:
+            for severity, code, section, key, message in rule(context):
+                path, line = locate(section, key) if locate else (None, None)
+                findings.append(Finding(severity, code, section, key, message, path, line))
+        return findings
+
+    def validate_settings(self, settings):
+        """Validate a section -> key -> value mapping; returns a list of Findings"""
+        findings = []
+        for section, values in settings.items():
+            for key, value in values.items():
+                setting = schema.get(section, key)
+                if setting is None:
+                    continue
+                problem = self.rules[setting.id].check(value)
+                if problem:
+                    findings.append(Finding(problem[0], problem[1], section, key, problem[2], None, None))
+        return findings + self._cross_check(settings, None)
+
+    def validate_files(self, game_user_path, game_path):
+        """
+        Validate a GameUserSettings.ini/Game.ini pair on disk.
+
+        Missing files are skipped. Findings carry the file path and line number.
+        """
+        findings = []
+        values = {SERVER_SECTION: {}, GAME_SECTION: {}}
+        lines = {}
+        paths = {SERVER_SECTION: game_user_path, GAME_SECTION: game_path}
+        for section, path in paths.items():
+            if not os.path.exists(path):
+                continue
+            index = self._key_index[section.lower()]
+            wanted = section.lower()
+            current = None
+            matches = False
+            for line, entry_section, key, raw in inifile.iter_numbered_entries(path):
+                if entry_section is not current:
+                    current = entry_section
+                    matches = current is not None and current.lower() == wanted
+                if not matches:
+                    continue
+                ids = index.get(key.lower())
+                if ids is None:
+                    for other in schema.find(key):
+                        findings.append(Finding(WARNING, 'misplaced', section, key,
+                                                f"belongs in {SECTION_FILES[other.section]} [{other.section}]",
+                                                path, line))
+                    continue
+                rule = self.rules[ids[0]]
+                setting = rule.setting
+                if setting.key in values[section] and setting.type is not str:
+                    findings.append(Finding(WARNING, 'duplicate', section, key,
+                                            f"also set on line {lines[(section, setting.key)]}; the last value wins",
+                                            path, line))
+                lines[(section, setting.key)] = line
+                value, error = rule.parse(raw) if setting.type is not str else (raw, None)
+                if error:
+                    findings.append(Finding(ERROR, 'type', section, key, error, path, line))
+                    continue
+                values[section][setting.key] = value
+                problem = rule.check(value)
+                if problem:
+                    findings.append(Finding(problem[0], problem[1], section, key, problem[2], path, line))
+
+        def locate(section, key):
+            return paths[section], lines.get((section, key))
+
+        return findings + self._cross_check(values, set(lines), locate)
+
+
+_rules = None
+
+
+def get_rules():
+    """Return the default RuleSet, compiling it on first use"""
+    global _rules
+    if _rules is None:
+        _rules = RuleSet()
+    return _rules
+
+
+def find_config_folders(paths):
+    """Return every folder under paths that holds a GameUserSettings.ini or Game.ini"""
+    names = {engine.GAME_USER_SETTINGS_FILE, engine.GAME_INI_FILE}
+    folders = set()
+    for path in paths:
+        for folder, _, files in os.walk(path):
+            if names.intersection(files):
+                folders.add(folder)
+    return sorted(folders)
+
+
+def _validate_folder(folder):
+    """Validate one config folder; errors are reported instead of raised"""
+    try:
+        findings = get_rules().validate_files(os.path.join(folder, engine.GAME_USER_SETTINGS_FILE),
+                                              os.path.join(folder, engine.GAME_INI_FILE))
+        return FolderResult(folder, findings, None)
+    except Exception as e:
+        return FolderResult(folder, [], str(e))
+
+
+def validate_folders(folders, workers=None):
+    """
+    Validate many config folders.
+
+    Args:
+        folders: Folders holding GameUserSettings.ini and/or Game.ini
+        workers: Number of worker processes (defaults to the CPU count). With a
+            single worker the folders are validated in-process.
+
+    Returns:
+        ValidationReport with one FolderResult per folder, in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if workers == 1 or len(folders) <= 1:
+        results = [_validate_folder(folder) for folder in folders]
+        workers = 1
+    else:
+        chunksize = max(1, len(folders) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_folder, folders, chunksize=chunksize))
+    return ValidationReport(results, (time.perf_counter() - start) * 1000, workers)
+
+
+def format_finding(finding):
+    location = f"{finding.path}:{finding.line}: " if finding.path else ''
+    return f"{location}{finding.severity} [{finding.code}] {finding.key}: {finding.message}"
+
+
+def format_report(report, verbose=False, examples=3):
+    """
+    Format a validation report.
+
+    By default identical problems (same severity, code, section and key) are
+    grouped into one line with a count and a few example locations; verbose
+    lists every finding.
+    """
+    lines = []
+    groups = collections.OrderedDict()
+    counts = collections.Counter()
+    for result in report.results:
+        if result.error:
+            lines.append(f"{result.path}: ERROR: {result.error}")
+        for finding in result.findings:
+            counts[finding.severity] += 1
+            if verbose:
+                lines.append(format_finding(finding))
+            else:
+                groups.setdefault((finding.severity, finding.code, finding.section, finding.key), []).append(finding)
+
+    ordered = sorted(groups.items(), key=lambda item: (item[0][0] != ERROR, -len(item[1])))
+    for (severity, code, _, key), findings in ordered:
+        locations = ', '.join(f"{finding.path}:{finding.line}" if finding.line else finding.path
+                              for finding in findings[:examples])
+        more = f" (+{len(findings) - examples} more)" if len(findings) > examples else ''
+        lines.append(f"{severity:<7} {code:<10} {key:<36} x{len(findings):<6} {findings[0].message}")
+        lines.append(f"        {locations}{more}")
+
+    failed = sum(1 for result in report.results if result.error)
+    lines.append(f"{len(report.results)} config folder(s) ({failed} unreadable): {counts[ERROR]} error(s), "
+                 f"{counts[WARNING]} warning(s) in {report.elapsed_ms:.1f} ms on {report.workers} worker(s)")
+    return '\n'.join(lines)
@@ -0,0 +1,319 @@
+"""
+Watch mode for Ark Settings Generator
+
+Watches a cluster manifest and the profile files it references, and
+regenerates only the servers whose inputs changed. On Linux changes are
+picked up with inotify; elsewhere, or when inotify is unavailable, files are
+polled. Bursts of saves (editors often write a file several times) are
+debounced into one regeneration.
+"""
+
+import collections
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+
+import batch
+
+# Quiet period that ends a burst of saves, and the longest a burst may delay a rebuild
+DEBOUNCE_MS = 100
+MAX_DELAY_MS = 500
+POLL_INTERVAL_MS = 200
+
+WatchEvent = collections.namedtuple('WatchEvent', ['changed', 'servers', 'report', 'error'])
+
+
+class PollingWatcher:
+    """Detect changes by comparing each file's mtime and size"""
+
+    def __init__(self, paths, interval_ms=POLL_INTERVAL_MS):
+        self.interval = interval_ms / 1000
+        self._state = {}
+        self.set_paths(paths)
+
+    def set_paths(self, paths):
+        """Watch exactly these paths; returns the folders polled instead of watched (none)"""
+        state = {}
+        for path in map(os.path.abspath, paths):
+            state[path] = self._state[path] if path in self._state else self._stat(path)
+        self._state = state
+        return []
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def poll(self, timeout):
+        """Wait up to timeout seconds and return the set of changed paths"""
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path, previous in self._state.items():
+                current = self._stat(path)
+                if current != previous:
+                    self._state[path] = current
+                    changed.add(path)
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+# inotify constants from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0x00000800
+_IN_CLOEXEC = 0x00080000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """
+    Detect changes with Linux inotify.
+
+    Folders are watched rather than files, because editors usually save by
+    writing a temp file and renaming it over the original. Paths in folders
+    that cannot be watched (e.g. not created yet) are polled instead.
+    """
+
+    def __init__(self, paths):
+        libc_name = ctypes.util.find_library('c')
+        if not sys.platform.startswith('linux') or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._folders = {}
+        self._paths = set()
+        self._polled = PollingWatcher([])
+        self._polled_paths = []
+        self.set_paths(paths)
+
+    def set_paths(self, paths):
+        """
+        Watch exactly these paths.
+
+        Returns:
+            Sorted folders that could not be watched; their paths are polled
+            until a later set_paths() call can watch them
+        """
+        self._paths = {os.path.abspath(path) for path in paths}
+        folders = {os.path.dirname(path) for path in self._paths}
+        for wd, folder in list(self._folders.items()):
+            if folder not in folders:
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._folders[wd]
+        watched = set(self._folders.values())
+        unwatched = set()
+        for folder in folders - watched:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), _WATCH_MASK)
+            if wd < 0:
+                unwatched.add(folder)
+            else:
+                self._folders[wd] = folder
+        self._polled_paths = [path for path in self._paths if os.path.dirname(path) in unwatched]
+        self._polled.set_paths(self._polled_paths)
+        return sorted(unwatched)
+
+    def poll(self, timeout):
+        """Wait up to timeout seconds and return the set of changed paths"""
+        deadline = time.monotonic() + max(timeout, 0)
+        while True:
+            wait = max(deadline - time.monotonic(), 0)
+            if self._polled_paths:
+                wait = min(wait, self._polled.interval)
+            changed = self._read(wait)
+            if self._polled_paths:
+                changed |= self._polled.poll(0)
+            if changed or time.monotonic() >= deadline:
+                return changed
+
+    def _read(self, timeout):
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                folder = self._folders.get(wd)
+                if folder is not None and name:
+                    path = os.path.join(folder, os.fsdecode(name))
+                    if path in self._paths:
+                        changed.add(path)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(paths, polling=False):
+    """Return an inotify watcher where available, otherwise a polling watcher"""
+    if not polling:
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths)
+
+
+def collect_changes(watcher, timeout, debounce_ms=DEBOUNCE_MS, max_delay_ms=MAX_DELAY_MS):
+    """
+    Wait for a change, then keep collecting until saves go quiet.
+
+    Returns:
+        Set of changed paths (empty if nothing changed within timeout)
+    """
+    changed = watcher.poll(timeout)
+    if not changed:
+        return changed
+    deadline = time.monotonic() + max_delay_ms / 1000
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return changed
+        more = watcher.poll(min(debounce_ms / 1000, remaining))
+        if not more:
+            return changed
+        changed |= more
+
+
+def profile_files(manifest):
+    """Map each profile file in a manifest to the server names it affects (None means every server)"""
+    files = {}
+    for server in manifest.get('servers', []):
+        if server.get('profile'):
+            files.setdefault(os.path.abspath(server['profile']), set()).add(server['name'])
+    if manifest.get('base_profile'):
+        files[os.path.abspath(manifest['base_profile'])] = None
+    return files
+
+
+def _server_inputs(manifest):
+    # Everything from the manifest itself that feeds one server's files
+    shared = json.dumps([manifest['mode'], manifest['output_dir'], manifest['base'],
+                         manifest.get('base_profile')], sort_keys=True)
+    return {
+        server['name']: json.dumps([shared, server.get('profile'), server['overrides']], sort_keys=True)
+        for server in manifest.get('servers', [])
+    }
+
+
+def affected_servers(changed, old_manifest, new_manifest):
+    """
+    Return the server names to regenerate.
+
+    Args:
+        changed: Profile files that changed
+        old_manifest: Manifest before the change
+        new_manifest: Manifest after the change (the same object if the
+            manifest file itself did not change)
+    """
+    names = set()
+    if new_manifest is not old_manifest:
+        # Compare each server's manifest inputs so only edited entries are rebuilt
+        old_inputs = _server_inputs(old_manifest)
+        for name, inputs in _server_inputs(new_manifest).items():
+            if old_inputs.get(name) != inputs:
+                names.add(name)
+    files = profile_files(new_manifest)
+    for path in changed:
+        if path not in files:
+            continue
+        if files[path] is None:
+            return {server['name'] for server in new_manifest.get('servers', [])}
+        names |= files[path]
+    return names
+
+
+def watch_manifest(manifest_path, workers=1, on_event=None, stop=None, polling=False,
+                   timeout=0.5, debounce_ms=DEBOUNCE_MS):
+    """
+    Generate every server once, then regenerate servers as their inputs change.
+
+    Args:
+        manifest_path: Cluster manifest (see batch.py)
+        workers: Worker processes per regeneration
+        on_event: Called with a WatchEvent after each (re)generation
+        stop: Optional threading.Event that ends the loop
+        polling: Force the polling watcher instead of inotify
+        timeout: Seconds between checks of stop
+        debounce_ms: Quiet period that ends a burst of saves
+    """
+    manifest_path = os.path.abspath(manifest_path)
+    manifest = batch.load_manifest(manifest_path)
+    # Watch before the first build so saves made during it are not missed
+    watcher = make_watcher([manifest_path] + list(profile_files(manifest)), polling)
+    try:
+        report = batch.run_batch(manifest, workers)
+        if on_event:
+            on_event(WatchEvent(set(), {result.name for result in report.results}, report, None))
+
+        # Profile changes seen while the manifest could not be loaded
+        pending = set()
+        while stop is None or not stop.is_set():
+            changed = collect_changes(watcher, timeout, debounce_ms)
+            if not changed:
+                continue
+            changed |= pending
+            new_manifest = manifest
+            if manifest_path in changed:
+                try:
+                    new_manifest = batch.load_manifest(manifest_path)
+                except (OSError, ValueError) as e:
+                    # Usually a half-written save; the next save triggers another reload,
+                    # which also rebuilds the servers of profiles changed meanwhile
+                    pending = changed - {manifest_path}
+                    if on_event:
+                        on_event(WatchEvent(changed, set(), None, f"Cannot load {manifest_path}: {e}"))
+                    continue
+            pending = set()
+
+            names = affected_servers(changed, manifest, new_manifest)
+            if new_manifest is not manifest:
+                manifest = new_manifest
+                try:
+                    polled = watcher.set_paths([manifest_path] + list(profile_files(manifest)))
+                    error = f"Cannot watch {', '.join(polled)}; polling instead" if polled else None
+                except OSError as e:
+                    error = f"Cannot watch the manifest's profiles: {e}"
+                if error and on_event:
+                    on_event(WatchEvent(changed, set(), None, error))
+            if not names:
+                continue
+            try:
+                report = batch.run_batch(manifest, workers, names)
+                error = None
+            except (OSError, ValueError) as e:
+                report, error = None, str(e)
+            if on_event:
+                on_event(WatchEvent(changed, names, report, error))
+    finally:
+        watcher.close()
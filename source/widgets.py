@@ -0,0 +1,786 @@
+"""
+Reusable Tk widgets for Ark Settings Generator
+
+Holds the tooltip helper, the virtualized settings list used by the
+Server and Game settings tabs and the editor for large structured values.
+"""
+
+import tkinter as tk
+import weakref
+from tkinter import ttk, messagebox
+
+import structured
+
+
+class ToolTip:
+    """Create a tooltip for a given widget"""
+    def __init__(self, widget, text):
+        self.widget = widget
+        self.text = text
+        self.tooltip = None
+        self.widget.bind("<Enter>", self.show_tooltip)
+        self.widget.bind("<Leave>", self.hide_tooltip)
+
+    def show_tooltip(self, event=None):
+        if self.tooltip or not self.text:
+            return
+        x, y, _, _ = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0, 0, 0, 0)
+        x += self.widget.winfo_rootx() + 25
+        y += self.widget.winfo_rooty() + 25
+
+        self.tooltip = tk.Toplevel(self.widget)
+        self.tooltip.wm_overrideredirect(True)
+        self.tooltip.wm_geometry(f"+{x}+{y}")
+
+        label = tk.Label(self.tooltip, text=self.text,
+                        background="#2b2b2b", foreground="#00bfa5",
+                        relief="solid", borderwidth=1,
+                        font=("Segoe UI", 9),
+                        padx=8, pady=6,
+                        wraplength=300)
+        label.pack()
+
+    def hide_tooltip(self, event=None):
+        if self.tooltip:
+            self.tooltip.destroy()
+            self.tooltip = None
+
+
+def format_slider_value(value):
+    """Format slider value to show thousands decimal (e.g., 1.000)"""
+    try:
+        return f"{float(value):.3f}"
+    except (TypeError, ValueError):
+        return "0.000"
+
+
+def validate_numeric_only(P):
+    """Validate that input is numeric only"""
+    if P == "":
+        return True
+    try:
+        float(P)
+        return True
+    except ValueError:
+        return False
+
+
+def validate_integer_only(P):
+    """Validate that input is a whole number, or a sign typed ahead of one"""
+    if P in ("", "-"):
+        return True
+    try:
+        int(P)
+        return True
+    except ValueError:
+        return False
+
+
+def value_kind(value):
+    """Return the editor kind used for a setting value"""
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, list):
+        return 'multi'
+    return 'str'
+
+
+# Structured values longer than this are shown as a character count and edited in StructuredEditor
+PREVIEW_CHARS = 200
+
+
+def editor_text(kind, setting, value):
+    """
+    Return (text, locked): what a row's text field shows for a value of an
+    editor kind, and whether that field is read-only. Bool and choice rows
+    have no text field and get (None, False).
+    """
+    if kind == 'float':
+        return format_slider_value(value), False
+    if kind == 'int':
+        return str(value), False
+    if kind == 'multi':
+        return f"{len(value)} imported values", True
+    if kind == 'str':
+        # Long structured values are only edited in the editor; an Entry slows down on them
+        if 'structured' in setting.tags and len(value) > PREVIEW_CHARS:
+            return f"{len(value):,} characters", True
+        return value, False
+    return None, False
+
+# Highlight colours of the structured editor
+BRACKET_COLORS = ('#00bfa5', '#ffb74d', '#ba68c8', '#4fc3f7')
+TOKEN_COLORS = {'string': '#a5d6a7', 'key': '#90caf9', 'number': '#f48fb1'}
+
+
+def visible_range(top, height, row_height, count):
+    """Return the [first, last) row indices that intersect a viewport"""
+    first = max(0, int(top) // row_height)
+    last = min(count, (int(top) + max(int(height), 0)) // row_height + 1)
+    return first, max(first, last)
+
+
+class SettingRow:
+    """One pooled row of a VirtualSettingsList, rebound to new keys while scrolling"""
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.index = None
+        self.key = None
+        self.kind = None
+        self.range = None
+        self.visible = False
+        colors = owner.colors
+
+        self.frame = tk.Frame(owner.canvas, bg=colors['bg_dark'])
+        self.item = owner.canvas.create_window(0, -owner.ROW_HEIGHT, window=self.frame, anchor='nw',
+                                               height=owner.ROW_HEIGHT, state='hidden')
+
+        # Setting name with modern styling and tooltip
+        self.name_label = tk.Label(self.frame,
+                                   font=('Segoe UI', 10, 'bold'),
+                                   fg=colors['text_primary'],
+                                   bg=colors['bg_dark'],
+                                   cursor='hand2')
+        self.name_label.grid(row=0, column=0, sticky='w', padx=10, pady=(15, 5))
+        self.tooltip = ToolTip(self.name_label, '')
+
+        # Description with better visibility
+        self.desc_label = tk.Label(self.frame,
+                                   font=('Segoe UI', 9),
+                                   fg=colors['text_secondary'],
+                                   bg=colors['bg_dark'],
+                                   wraplength=500,
+                                   justify='left')
+        self.desc_label.grid(row=1, column=0, columnspan=4, sticky='w', padx=10, pady=(0, 5))
+
+        # Editors are created lazily, one set per kind, and swapped with grid_remove
+        self.bool_var = tk.BooleanVar(self.frame)
+        self.text_var = tk.StringVar(self.frame)
+        self.scale_var = tk.DoubleVar(self.frame)
+        self.entry_var = tk.StringVar(self.frame)
+        self.vcmd = (self.frame.register(validate_numeric_only), '%P')
+        self.int_vcmd = (self.frame.register(validate_integer_only), '%P')
+        self.editors = {}
+        self.text_locked = False
+
+    def _create_editors(self, kind):
+        frame = self.frame
+        if kind == 'bool':
+            chk = ttk.Checkbutton(frame, variable=self.bool_var,
+                                  command=lambda: self.commit(self.bool_var.get()))
+            chk.grid(row=0, column=1, padx=5, pady=2)
+            return [chk]
+        if kind == 'int':
+            spin = ttk.Spinbox(frame, from_=0, to=100000, textvariable=self.text_var, width=10,
+                               validate='key', validatecommand=self.int_vcmd,
+                               command=self._on_int_change)
+            spin.grid(row=0, column=1, padx=5, pady=2)
+            spin.bind('<KeyRelease>', self._on_int_change)
+            return [spin]
+        if kind == 'float':
+            scale = ttk.Scale(frame, from_=0.0, to=10.0, variable=self.scale_var, orient='horizontal',
+                              command=self._on_scale)
+            scale.grid(row=0, column=1, padx=5, pady=2)
+            # Display label with formatted thousands
+            self.display_label = ttk.Label(frame, width=8)
+            self.display_label.grid(row=0, column=2, padx=5, pady=2)
+            entry = ttk.Entry(frame, textvariable=self.entry_var, width=10,
+                              validate='key', validatecommand=self.vcmd)
+            entry.grid(row=0, column=3, padx=5, pady=2)
+            entry.bind('<KeyRelease>', self._on_float_entry)
+            return [scale, self.display_label, entry]
+        if kind == 'choice':
+            self.combo = ttk.Combobox(frame, state='readonly', width=35)
+            self.combo.grid(row=0, column=1, columnspan=2, padx=5, pady=2, sticky='w')
+            self.combo.bind('<<ComboboxSelected>>', self._on_choice)
+            return [self.combo]
+        if kind == 'multi':
+            # Repeated keys imported from a Game.ini are edited in the structured editor
+            entry = ttk.Entry(frame, textvariable=self.text_var, width=15, state='readonly')
+            entry.grid(row=0, column=1, padx=5, pady=2)
+            button = ttk.Button(frame, text="✎ Edit", width=7, command=self._open_editor)
+            button.grid(row=0, column=2, padx=5, pady=2)
+            return [entry, button]
+        entry = ttk.Entry(frame, textvariable=self.text_var, width=15)
+        entry.grid(row=0, column=1, padx=5, pady=2)
+        entry.bind('<KeyRelease>', self._on_text_change)
+        button = ttk.Button(frame, text="✎ Edit", width=7, command=self._open_editor)
+        button.grid(row=0, column=2, padx=5, pady=2)
+        return [entry, button]
+
+    def _show_editors(self, kind):
+        if kind == self.kind:
+            return
+        self.range = None
+        for widget in self.editors.get(self.kind, []):
+            widget.grid_remove()
+        if kind in self.editors:
+            for widget in self.editors[kind]:
+                widget.grid()
+        else:
+            self.editors[kind] = self._create_editors(kind)
+        self.kind = kind
+
+    def bind(self, index, key):
+        """Show the setting at index in this row"""
+        owner = self.owner
+        setting = owner.settings[index]
+        value = owner.values.get(key, 0)
+        self.index = index
+        self.key = key
+
+        desc = setting.description
+        self.name_label.config(text=f"ℹ️ {key}")
+        self.tooltip.text = desc
+        self.desc_label.config(text=desc)
+
+        kind = 'choice' if key in owner.choices else value_kind(value)
+        self._show_editors(kind)
+        if kind in ('int', 'float') and setting.range != self.range:
+            # Limits come from the schema, e.g. KickIdlePlayersPeriod goes past 10.0
+            self.editors[kind][0].configure(from_=setting.range[0], to=setting.range[1])
+            self.range = setting.range
+        text, locked = editor_text(kind, setting, value)
+        if kind == 'bool':
+            self.bool_var.set(value)
+        elif kind == 'float':
+            self.scale_var.set(value)
+            self.display_label.config(text=text)
+            self.entry_var.set(text)
+        elif kind == 'choice':
+            options = owner.choices[key]
+            self.combo.config(values=[display for display, _ in options])
+            displays = [display for display, choice in options if choice == value]
+            self.combo.set(displays[0] if displays else (options[0][0] if options else ''))
+        elif kind in ('int', 'multi'):
+            self.text_var.set(text)
+        else:
+            self.text_locked = locked
+            entry, button = self.editors[kind]
+            entry.configure(state='readonly' if locked else 'normal')
+            if 'structured' in setting.tags:
+                button.grid()
+            else:
+                button.grid_remove()
+            self.text_var.set(text)
+
+        owner.canvas.coords(self.item, 0, index * owner.ROW_HEIGHT)
+        if not self.visible:
+            owner.canvas.itemconfigure(self.item, state='normal')
+            self.visible = True
+
+    def destroy(self):
+        """Destroy the row's widgets and release its Tcl command and variables"""
+        self.tooltip.hide_tooltip()
+        self.frame.deletecommand(self.vcmd[0])
+        self.frame.deletecommand(self.int_vcmd[0])
+        self.owner.canvas.delete(self.item)
+        self.frame.destroy()
+        self.editors.clear()
+        self.kind = None
+        self.key = None
+        self.visible = False
+        # Dropping the last reference unsets each Tcl variable
+        self.bool_var = self.text_var = self.scale_var = self.entry_var = None
+        self.vcmd = self.int_vcmd = None
+
+    def hide(self):
+        """Hide this row until it is bound again"""
+        self.index = None
+        self.visible = False
+        self.owner.canvas.itemconfigure(self.item, state='hidden')
+
+    def commit(self, value):
+        if self.key is not None:
+            self.owner.set_value(self.key, value)
+
+    def _on_text_change(self, event=None):
+        if not self.text_locked:
+            self.commit(self.text_var.get())
+
+    def _open_editor(self):
+        if self.key is not None:
+            self.owner.edit_value(self.key)
+
+    def _on_int_change(self, event=None):
+        try:
+            self.commit(int(self.text_var.get()))
+        except ValueError:
+            pass
+
+    def _on_scale(self, val):
+        # The value is stored right away; formatting the label waits for the next frame
+        self.commit(self.scale_var.get())
+        self.owner.defer(('display', id(self)), self._refresh_float_display)
+
+    def _refresh_float_display(self):
+        if self.kind != 'float':
+            return
+        formatted = format_slider_value(self.scale_var.get())
+        self.display_label.config(text=formatted)
+        self.entry_var.set(formatted)
+
+    def _on_float_entry(self, event=None):
+        value_str = self.entry_var.get()
+        try:
+            value = float(value_str)
+        except ValueError:
+            return
+        self.scale_var.set(value)
+        self.commit(value)
+        self.owner.defer(('display', id(self)), self._update_display_label)
+
+    def _update_display_label(self):
+        if self.kind == 'float':
+            self.display_label.config(text=format_slider_value(self.scale_var.get()))
+
+    def _on_choice(self, event=None):
+        selected = self.combo.get()
+        for display, choice in self.owner.choices[self.key]:
+            if display == selected:
+                self.commit(choice)
+                return
+
+
+class VirtualSettingsList(ttk.Frame):
+    """
+    Scrollable list of setting rows that only builds the rows in view.
+
+    Rows are pooled and rebound to other keys while scrolling, so the number of
+    widgets depends on the viewport height rather than on the number of settings.
+    Rows are described by schema.Setting records and addressed by position;
+    values are read from the ``values`` mapping and written back through the
+    SettingsStore when one is given (otherwise straight into ``values``). With a
+    FrameScheduler, label formatting and resize layout run once per frame.
+    """
+
+    ROW_HEIGHT = 72
+
+    # The list under the pointer; one <MouseWheel> binding per Tk root scrolls it
+    _wheel_target = None
+    _wheel_roots = weakref.WeakSet()
+
+    def __init__(self, parent, settings, values, colors, choices=None, on_change=None,
+                 scheduler=None, store=None):
+        super().__init__(parent, style='TFrame')
+        self.all_settings = list(settings)
+        self.settings = self.all_settings
+        self.keys = [setting.key for setting in self.settings]
+        self.filter_ids = None
+        self._by_id = {setting.id: setting for setting in self.all_settings}
+        self._by_key = {setting.key: setting for setting in self.all_settings}
+        self.values = values
+        self.colors = colors
+        self.choices = choices or {}
+        self.on_change = on_change
+        self.scheduler = scheduler
+        self.store = store
+        self._rows = []
+
+        self.canvas = tk.Canvas(self, bg=colors['bg_dark'], highlightthickness=0,
+                                yscrollincrement=self.ROW_HEIGHT // 4)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
+        self.scrollbar.pack(side="right", fill="y", pady=10)
+        self.canvas.bind('<Configure>', self._on_canvas_configure)
+        self._update_scroll_region()
+
+        # Enable mouse wheel scrolling while the pointer is over the list. Rebinding
+        # bind_all on every <Enter> would register a new Tcl command each time.
+        root = self._root()
+        if root not in self._wheel_roots:
+            root.bind_all("<MouseWheel>", VirtualSettingsList._on_wheel_all, add='+')
+            self._wheel_roots.add(root)
+        self.canvas.bind("<Enter>", self._on_enter)
+        self.canvas.bind("<Leave>", self._on_leave)
+
+    def _update_scroll_region(self):
+        width = max(self.canvas.winfo_width(), 1)
+        self.canvas.configure(scrollregion=(0, 0, width, len(self.keys) * self.ROW_HEIGHT))
+
+    def defer(self, key, callback):
+        """Run callback on the next frame when a scheduler is attached, otherwise now"""
+        if self.scheduler is not None:
+            self.scheduler.schedule(key, callback)
+        else:
+            callback()
+
+    def _on_canvas_configure(self, event):
+        # Window drags fire many <Configure> events; re-layout once per frame
+        self.defer(('resize', id(self)), self._apply_resize)
+
+    def _apply_resize(self):
+        if self._rows is None:
+            return
+        width = self.canvas.winfo_width()
+        for row in self._rows:
+            self.canvas.itemconfigure(row.item, width=width)
+        self._update_scroll_region()
+        self.layout()
+
+    def _on_enter(self, event):
+        VirtualSettingsList._wheel_target = self
+
+    def _on_leave(self, event):
+        if VirtualSettingsList._wheel_target is self:
+            VirtualSettingsList._wheel_target = None
+
+    @staticmethod
+    def _on_wheel_all(event):
+        target = VirtualSettingsList._wheel_target
+        if target is not None:
+            target._on_mousewheel(event)
+
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        self.layout()
+
+    def yview(self, *args):
+        """Scroll the list (scrollbar command) and rebind the rows now in view"""
+        self.canvas.yview(*args)
+        self.layout()
+
+    def layout(self):
+        """Bind pooled rows to the keys intersecting the viewport"""
+        first, last = visible_range(self.canvas.canvasy(0), self.canvas.winfo_height(),
+                                    self.ROW_HEIGHT, len(self.keys))
+        width = self.canvas.winfo_width()
+        while len(self._rows) < last - first:
+            row = SettingRow(self)
+            self.canvas.itemconfigure(row.item, width=width)
+            self._rows.append(row)
+        if not self._rows:
+            return
+
+        # Each index maps to a fixed pool slot, so scrolling one row rebinds one row
+        pool_size = len(self._rows)
+        used = set()
+        for index in range(first, last):
+            slot = index % pool_size
+            row = self._rows[slot]
+            used.add(slot)
+            if row.index != index or row.key != self.keys[index]:
+                row.bind(index, self.keys[index])
+        for slot, row in enumerate(self._rows):
+            if slot not in used and row.visible:
+                row.hide()
+
+    def set_filter(self, ids):
+        """
+        Show only the settings whose schema id is in ids, in that order.
+
+        The pooled rows are rebound to the remaining settings; no widgets are
+        created or destroyed. None shows every setting again.
+        """
+        if ids == self.filter_ids:
+            return
+        self.filter_ids = ids
+        if ids is None:
+            self.settings = self.all_settings
+        else:
+            self.settings = [self._by_id[setting_id] for setting_id in ids if setting_id in self._by_id]
+        self.keys = [setting.key for setting in self.settings]
+        self._update_scroll_region()
+        self.canvas.yview_moveto(0)
+        self.layout()
+
+    def refresh_keys(self, keys):
+        """Re-read values only for the rows in view whose key is in keys"""
+        if not keys:
+            return
+        for row in self._rows:
+            if row.visible and row.key in keys:
+                row.bind(row.index, row.key)
+
+    def destroy(self):
+        """Destroy the pooled rows, releasing their Tcl commands and variables, then the list"""
+        self._on_leave(None)
+        for row in self._rows or ():
+            row.destroy()
+        self._rows = None
+        super().destroy()
+
+    def edit_value(self, key):
+        """Open the structured editor for a key; saving writes the value back"""
+        def save(value):
+            self.set_value(key, value)
+            self.refresh_keys({key})
+        return StructuredEditor(self, key, self.values.get(key, ''), self.colors, save, scheduler=self.scheduler)
+
+    def set_value(self, key, value):
+        if self.store is not None:
+            self.store.set(self._by_key[key].section, key, value)
+        else:
+            self.values[key] = value
+        if self.on_change:
+            self.on_change(key, value)
+
+
+class StructuredEditor(tk.Toplevel):
+    """
+    Multi-line editor for structured values such as ConfigOverrideSupplyCrateItems.
+
+    The value is shown broken into indented lines (structured.format_value) and
+    saved back as one line. Highlighting runs at most once per frame and only
+    for lines in view that are new or edited; bracket depths below an edit are
+    recomputed only when the edit changed the bracket balance. Repeated keys
+    are edited as blank-line separated values.
+
+    Args:
+        parent: Parent widget
+        key: Setting key, shown in the title
+        value: String value, or list of values for a repeated key
+        colors: The application's colour table
+        on_save: Callable(value) run with the compacted value on Save
+        scheduler: Optional FrameScheduler used to coalesce highlighting
+    """
+
+    # Lines above and below the viewport highlighted ahead of scrolling
+    MARGIN_LINES = 10
+
+    def __init__(self, parent, key, value, colors, on_save, scheduler=None):
+        super().__init__(parent)
+        self.title(f"Edit {key}")
+        self.geometry('900x650')
+        self.configure(bg=colors['bg_dark'])
+        self.key = key
+        self.value = value
+        self.repeated = isinstance(value, list)
+        self.on_save = on_save
+        self.scheduler = scheduler
+        self._highlighted = set()
+        self._highlight_id = None
+        self._before = None
+        self._unknown_edit = False
+
+        footer = tk.Frame(self, bg=colors['bg_dark'])
+        footer.pack(side='bottom', fill='x', padx=10, pady=8)
+        self.status = tk.Label(footer, font=('Segoe UI', 9), fg=colors['text_secondary'], bg=colors['bg_dark'])
+        self.status.pack(side='left')
+        ttk.Button(footer, text="Cancel", command=self.destroy).pack(side='right', padx=(5, 0))
+        ttk.Button(footer, text="💾 Save", command=self.save).pack(side='right')
+
+        body = tk.Frame(self, bg=colors['bg_dark'])
+        body.pack(fill='both', expand=True, padx=10, pady=(10, 0))
+        self.text = tk.Text(body, wrap='none', undo=True, font=('Consolas', 10),
+                            bg=colors.get('bg_medium', colors['bg_dark']), fg=colors['text_primary'],
+                            insertbackground=colors['text_primary'], borderwidth=0)
+        self.ybar = ttk.Scrollbar(body, orient='vertical', command=self.text.yview)
+        xbar = ttk.Scrollbar(body, orient='horizontal', command=self.text.xview)
+        self.text.configure(yscrollcommand=self._on_yscroll, xscrollcommand=xbar.set)
+        self.ybar.pack(side='right', fill='y')
+        xbar.pack(side='bottom', fill='x')
+        self.text.pack(side='left', fill='both', expand=True)
+
+        for level, color in enumerate(BRACKET_COLORS):
+            self.text.tag_configure(f'bracket{level}', foreground=color)
+        for tag, color in TOKEN_COLORS.items():
+            self.text.tag_configure(tag, foreground=color)
+        self.text.tag_configure('unmatched', foreground='#ffffff', background='#c62828')
+
+        if self.repeated:
+            self.text.insert('1.0', structured.format_values(value))
+        else:
+            self.text.insert('1.0', structured.format_value(value))
+        # Loading is not an undo step
+        self.text.edit_reset()
+        self.text.edit_modified(False)
+        self.depths = structured.LineDepths(self._fetch_lines)
+        self._line_count = self._last_line()
+        self._update_status()
+
+        # Note where an edit can land before it happens, then patch that range after it
+        for sequence in ('<KeyPress>', '<ButtonPress>', '<<Paste>>', '<<Cut>>'):
+            self.text.bind(sequence, self._remember_edit_range, add='+')
+        self.text.bind('<<Undo>>', self._on_undo_redo, add='+')
+        self.text.bind('<<Redo>>', self._on_undo_redo, add='+')
+        self.text.bind('<<Modified>>', self._on_modified)
+        self.text.bind('<Configure>', lambda e: self._schedule_highlight())
+        self.bind('<Control-s>', lambda e: self.save())
+        self.bind('<Escape>', lambda e: self.destroy())
+        self.text.focus_set()
+        self._schedule_highlight()
+
+    def _line(self, index):
+        return int(self.text.index(index).split('.')[0])
+
+    def _last_line(self):
+        return self._line('end-1c')
+
+    def _fetch_lines(self, first, stop):
+        """Text of 0-based lines first..stop-1, fetched in one call"""
+        if stop <= first:
+            return []
+        return self.text.get(f'{first + 1}.0', f'{stop}.end').split('\n')
+
+    def _update_status(self):
+        parts = "blank-line separated values, " if self.repeated else ""
+        self.status.config(text=f"{self._line_count:,} lines · {parts}saved as one line · Ctrl+S saves, Esc cancels")
+
+    def _remember_edit_range(self, event=None):
+        insert = self._line('insert')
+        try:
+            first, last = self._line('sel.first'), self._line('sel.last')
+        except tk.TclError:
+            first = last = insert
+        first, last = min(first, insert), max(last, insert)
+        if self._before is not None and self.text.edit_modified():
+            # An earlier edit has not been handled yet; cover both
+            first, last = min(first, self._before[0]), max(last, self._before[1])
+        self._before = (first, last)
+
+    def _on_undo_redo(self, event=None):
+        # Undo and redo can touch any lines
+        self._unknown_edit = True
+
+    def _on_modified(self, event=None):
+        if not self.text.edit_modified():
+            return
+        self.text.edit_modified(False)
+        count = self._last_line()
+        delta = count - self._line_count
+        insert = self._line('insert')
+        if self._unknown_edit or self._before is None:
+            self.depths = structured.LineDepths(self._fetch_lines)
+            self._highlighted.clear()
+        else:
+            # One line of slack each side covers joins by Backspace and Delete
+            first = max(1, min(self._before[0], insert - max(delta, 0)) - 1)
+            old_last = min(self._line_count, max(self._before[1], insert - delta) + 1)
+            new_last = max(first, min(count, old_last + delta))
+            unchanged_below = self.depths.edited(first - 1, old_last - 1, new_last - 1)
+            if delta or not unchanged_below:
+                # Line numbers or depths below moved; those lines are redone when in view
+                self._highlighted = {line for line in self._highlighted if line < first}
+            else:
+                self._highlighted.difference_update(range(first, new_last + 1))
+        self._unknown_edit = False
+        self._before = (insert, insert)
+        self._line_count = count
+        if delta:
+            self._update_status()
+        self._schedule_highlight()
+
+    def _on_yscroll(self, first, last):
+        self.ybar.set(first, last)
+        self._schedule_highlight()
+
+    def _schedule_highlight(self):
+        if self.scheduler is not None:
+            self.scheduler.schedule(('highlight', id(self)), self.highlight_visible)
+        elif self._highlight_id is None:
+            self._highlight_id = self.after_idle(self.highlight_visible)
+
+    def highlight_visible(self):
+        """Tokenize the lines in view that are not highlighted yet"""
+        self._highlight_id = None
+        if not self.winfo_exists():
+            return
+        first = max(1, self._line('@0,0') - self.MARGIN_LINES)
+        last = min(self._line_count, self._line(f'@0,{self.text.winfo_height()}') + self.MARGIN_LINES)
+        line = first
+        while line <= last:
+            if line in self._highlighted:
+                line += 1
+                continue
+            # Highlight each run of pending lines with one removal and one add per tag
+            stop = line
+            while stop + 1 <= last and stop + 1 not in self._highlighted:
+                stop += 1
+            self._highlight_run(line, stop)
+            line = stop + 1
+
+    def _highlight_run(self, first, last):
+        for tag in structured.TAGS:
+            self.text.tag_remove(tag, f'{first}.0', f'{last}.end')
+        ranges = {}
+        depth = self.depths.depth(first - 1)
+        for line, content in enumerate(self._fetch_lines(first - 1, last), first):
+            spans, depth = structured.tokenize(content, depth)
+            for tag, start, end in spans:
+                ranges.setdefault(tag, []).extend((f'{line}.{start}', f'{line}.{end}'))
+            self._highlighted.add(line)
+        for tag, indexes in ranges.items():
+            self.text.tag_add(tag, *indexes)
+
+    def destroy(self):
+        if self._highlight_id is not None:
+            self.after_cancel(self._highlight_id)
+            self._highlight_id = None
+        super().destroy()
+
+    def save(self):
+        """Compact the text back into the value, confirm unbalanced brackets, and close"""
+        content = self.text.get('1.0', 'end-1c')
+        if self.repeated:
+            value = structured.edited_values(content, self.value)
+        else:
+            value = structured.edited_value(content, self.value)
+        balance = structured.end_depth(content, 0)
+        if balance and not messagebox.askyesno(
+                "Unbalanced Brackets",
+                f"{self.key} has {abs(balance)} unmatched {'(' if balance > 0 else ')'}. Save anyway?",
+                parent=self):
+            return
+        self.on_save(value)
+        self.destroy()
+
+
+class IniPreview(ttk.Frame):
+    """
+    Read-only view of a preview.PreviewDocument.
+
+    render() loads the whole file; apply() replaces only the lines named in
+    a list of patches, so an edit costs a few line replacements rather than
+    re-inserting the file. The last patched lines are marked and scrolled to.
+    """
+
+    def __init__(self, parent, document, colors):
+        super().__init__(parent, style='TFrame')
+        self.document = document
+        self.text = tk.Text(self, wrap='none', font=('Consolas', 10), borderwidth=0,
+                            bg=colors.get('bg_medium', colors['bg_dark']), fg=colors['text_primary'])
+        ybar = ttk.Scrollbar(self, orient='vertical', command=self.text.yview)
+        xbar = ttk.Scrollbar(self, orient='horizontal', command=self.text.xview)
+        self.text.configure(yscrollcommand=ybar.set, xscrollcommand=xbar.set)
+        ybar.pack(side='right', fill='y')
+        xbar.pack(side='bottom', fill='x')
+        self.text.pack(side='left', fill='both', expand=True)
+        self.text.tag_configure('section', foreground=colors.get('accent', colors['text_primary']))
+        self.text.tag_configure('changed', background=colors.get('bg_light', colors['bg_dark']))
+        self.render()
+
+    def render(self):
+        """Show the whole document"""
+        self.text.configure(state='normal')
+        self.text.delete('1.0', 'end')
+        self.text.insert('1.0', self.document.text())
+        self.text.tag_add('section', '1.0', '1.end')
+        self.text.configure(state='disabled')
+
+    def apply(self, patches):
+        """Replace the patched lines; None (the document was rebuilt) re-renders everything"""
+        if patches is None:
+            self.render()
+            return
+        if not patches:
+            return
+        self.text.configure(state='normal')
+        self.text.tag_remove('changed', '1.0', 'end')
+        for first, count, lines in patches:
+            start = f'{first + 1}.0'
+            self.text.delete(start, f'{first + 1 + count}.0')
+            if lines:
+                self.text.insert(start, '\n'.join(lines) + '\n', 'changed')
+        self.text.configure(state='disabled')
+        self.text.see(f'{patches[-1].first + 1}.0')
+
+    def content(self):
+        """Return the text shown, which matches what the writer renders"""
+        return self.text.get('1.0', 'end-1c')
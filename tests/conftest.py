@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration
+
+Makes the modules in source/ and benchmarks/ importable from the tests.
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT_DIR, 'source')
+BENCHMARKS_DIR = os.path.join(ROOT_DIR, 'benchmarks')
+for path in (BENCHMARKS_DIR, SOURCE_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,62 @@
+"""
+Tests for cluster manifest batch generation
+"""
+
+import configparser
+import json
+
+import pytest
+
+import batch
+import engine
+
+
+def write_manifest(tmp_path, count):
+    manifest = {
+        'mode': 'advanced',
+        'output_dir': 'cluster',
+        'base': {'XPMultiplier': 2.0},
+        'servers': [
+            {'name': f'map{i}', 'overrides': {'ServerName': f'Map {i}', 'RCONPort': 27020 + i,
+                                              'ActiveMods': '928595,731604'}}
+            for i in range(count)
+        ],
+    }
+    path = tmp_path / 'cluster.json'
+    path.write_text(json.dumps(manifest))
+    return str(path)
+
+
+class TestBatch:
+    """Test manifest loading and per-server generation"""
+
+    def test_load_manifest_resolves_output_dir(self, tmp_path):
+        manifest = batch.load_manifest(write_manifest(tmp_path, 2))
+        assert manifest['output_dir'] == str(tmp_path / 'cluster')
+
+    def test_duplicate_server_names_rejected(self, tmp_path):
+        path = tmp_path / 'dup.json'
+        path.write_text(json.dumps({'servers': [{'name': 'a'}, {'name': 'a'}]}))
+        with pytest.raises(ValueError):
+            batch.load_manifest(str(path))
+
+    @pytest.mark.parametrize('workers', [1, 2])
+    def test_run_batch_writes_each_server(self, tmp_path, workers):
+        report = batch.run_batch(batch.load_manifest(write_manifest(tmp_path, 4)), workers)
+        assert [result.name for result in report.results] == ['map0', 'map1', 'map2', 'map3']
+        assert all(result.error is None for result in report.results)
+
+        config = configparser.ConfigParser(strict=False)
+        config.optionxform = str
+        config.read(report.results[3].paths[0])
+        assert config.get(engine.SERVER_SECTION, 'ServerName') == 'Map 3'
+        assert config.get(engine.SERVER_SECTION, 'RCONPort') == '27023'
+        assert config.get(engine.SERVER_SECTION, 'XPMultiplier') == '2.0'
+        assert 'servers/s' in batch.format_report(report)
+
+    def test_rerun_reports_unchanged(self, tmp_path):
+        manifest = batch.load_manifest(write_manifest(tmp_path, 3))
+        batch.run_batch(manifest, 1)
+        report = batch.run_batch(manifest, 1)
+        assert all(result.changed == 0 for result in report.results)
+        assert 'unchanged' in batch.format_report(report)
@@ -0,0 +1,57 @@
+"""
+Tests for the benchmark suite and synthetic corpus generator
+"""
+
+import json
+
+import batch
+import bench
+import corpus
+import engine
+import inifile
+
+
+class TestCorpus:
+    """Test that generated corpora have the requested size and parse cleanly"""
+
+    def test_game_ini_has_spawn_lines(self, tmp_path):
+        path = corpus.write_game_ini(str(tmp_path / 'Game.ini'), lines=2000)
+        spawn = [key for _, key, value in inifile.iter_entries(path)
+                 if value.startswith('(NPCSpawnEntriesContainerClassString="DinoSpawnEntries_')]
+        assert len(spawn) == 2000
+        settings = engine.load_ini_files(engine.load_defaults(),
+                                         corpus.write_game_user_settings(str(tmp_path / 'GUS.ini')), path)
+        assert len(settings[engine.GAME_SECTION]['ConfigOverrideNPCSpawnEntriesContainer']) > 1
+
+    def test_corpus_is_deterministic(self, tmp_path):
+        first = corpus.write_game_ini(str(tmp_path / 'a.ini'), lines=100, seed=3)
+        second = corpus.write_game_ini(str(tmp_path / 'b.ini'), lines=100, seed=3)
+        with open(first) as a, open(second) as b:
+            assert a.read() == b.read()
+
+    def test_fleet_manifest_loads(self, tmp_path):
+        manifest = batch.load_manifest(corpus.write_fleet(str(tmp_path), servers=25))
+        assert len(manifest['servers']) == 25
+        assert manifest['output_dir'] == str(tmp_path / 'servers')
+
+
+class TestSuite:
+    """Test the suite output format and comparison"""
+
+    def test_quick_run_writes_json(self, tmp_path):
+        output = tmp_path / 'results.json'
+        assert bench.main(['--quick', '--repeat', '1', '--only', 'calculations,import,generate',
+                           '--output', str(output)]) == 0
+        document = json.loads(output.read_text())
+        assert document['meta']['format'] == bench.RESULTS_FORMAT
+        for name in ('calculations', 'import_ini', 'generate_ini', 'generate_fleet'):
+            assert document['results'][name]['median_ms'] >= 0
+        assert document['results']['generate_fleet']['errors'] == 0
+
+    def test_compare_flags_regressions(self):
+        old = {'results': {'import_ini': {'median_ms': 10.0}, 'gui_tabs_basic': {'skipped': 'no display'}}}
+        new = {'results': {'import_ini': {'median_ms': 13.0}, 'gui_tabs_basic': {'skipped': 'no display'}}}
+        lines, regressions = bench.compare(old, new, threshold=0.2)
+        assert regressions == ['import_ini']
+        assert len(lines) == 2
+        assert bench.compare(old, old)[1] == []
@@ -0,0 +1,176 @@
+"""
+Tests for fleet deployment
+"""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+import cli
+import deploy
+import engine
+
+
+@pytest.fixture
+def source(tmp_path):
+    directory = tmp_path / 'generated'
+    settings = engine.load_defaults()
+    settings['ServerName'] = 'Fleet'
+    engine.emit_files(settings, 'advanced', str(directory))
+    return str(directory)
+
+
+def make_targets(tmp_path, source, count):
+    targets = []
+    for i in range(count):
+        path = tmp_path / 'servers' / f's{i}' / 'ShooterGame' / 'Saved' / 'Config' / 'WindowsServer'
+        path.mkdir(parents=True)
+        targets.append(deploy.Target(str(path), source))
+    return targets
+
+
+class TestPlan:
+    """Test checksum planning"""
+
+    def test_new_targets_are_created(self, tmp_path, source):
+        plan = deploy.build_plan(make_targets(tmp_path, source, 2))
+        assert len(plan) == 4
+        assert {entry.action for entry in plan} == {'create'}
+        assert all(entry.before is None for entry in plan)
+
+    def test_only_differing_files_are_planned(self, tmp_path, source):
+        targets = make_targets(tmp_path, source, 3)
+        deploy.apply_plan(deploy.build_plan(targets))
+        with open(os.path.join(targets[1].path, engine.GAME_INI_FILE), 'a') as f:
+            f.write('Extra=1\n')
+        plan = [entry for entry in deploy.build_plan(targets) if entry.action != 'skip']
+        assert [(entry.target, entry.name, entry.action) for entry in plan] == [
+            (targets[1].path, engine.GAME_INI_FILE, 'update')]
+        assert '1 file(s) to write on 1 of 3 target(s)' in deploy.format_plan(deploy.build_plan(targets))
+
+    def test_files_of_another_size_are_not_read(self, tmp_path, source, monkeypatch):
+        targets = make_targets(tmp_path, source, 2)
+        deploy.apply_plan(deploy.build_plan(targets))
+        edited = os.path.join(targets[0].path, engine.GAME_INI_FILE)
+        with open(edited, 'a') as f:
+            f.write('Extra=1\n')
+        read = []
+        fingerprint = deploy.fileio.file_fingerprint
+        monkeypatch.setattr(deploy.fileio, 'file_fingerprint',
+                            lambda path: read.append(path) or fingerprint(path))
+        plan = deploy.build_plan(targets)
+        actions = [entry.action for entry in plan if entry.target == targets[0].path]
+        assert actions == ['skip', 'update']
+        assert edited not in read and len(read) == 2 + 3
+
+    def test_missing_source_raises(self, tmp_path):
+        targets = make_targets(tmp_path, str(tmp_path / 'nothing'), 1)
+        with pytest.raises(FileNotFoundError):
+            deploy.build_plan(targets)
+
+    def test_load_targets(self, tmp_path, source):
+        text = tmp_path / 'targets.txt'
+        text.write_text('# fleet\nservers/a\n\n/srv/b\n')
+        assert deploy.load_targets(str(text), source) == [
+            deploy.Target(str(tmp_path / 'servers' / 'a'), source),
+            deploy.Target('/srv/b', source),
+        ]
+        config = tmp_path / 'targets.json'
+        config.write_text(json.dumps({'targets': [{'path': 'a', 'source': 'out/a'}, {'path': 'b'}]}))
+        assert deploy.load_targets(str(config), source) == [
+            deploy.Target(str(tmp_path / 'a'), str(tmp_path / 'out' / 'a')),
+            deploy.Target(str(tmp_path / 'b'), source),
+        ]
+        text.write_text('a\na\n')
+        with pytest.raises(ValueError):
+            deploy.load_targets(str(text), source)
+
+
+class TestApply:
+    """Test applying plans"""
+
+    def test_apply_copies_files(self, tmp_path, source):
+        targets = make_targets(tmp_path, source, 3)
+        report = deploy.apply_plan(deploy.build_plan(targets), workers=2)
+        assert [result.written for result in report.results] == [deploy.DEPLOY_FILES] * 3
+        for target in targets:
+            for name in deploy.DEPLOY_FILES:
+                with open(os.path.join(target.path, name), 'rb') as f, \
+                        open(os.path.join(source, name), 'rb') as expected:
+                    assert f.read() == expected.read()
+            assert sorted(os.listdir(target.path)) == sorted(deploy.DEPLOY_FILES + (deploy.LOCK_FILE,))
+
+    def test_unchanged_targets_are_not_touched(self, tmp_path, source):
+        targets = make_targets(tmp_path, source, 2)
+        deploy.apply_plan(deploy.build_plan(targets))
+        path = os.path.join(targets[0].path, engine.GAME_INI_FILE)
+        mtime = os.stat(path).st_mtime_ns
+        report = deploy.apply_plan(deploy.build_plan(targets))
+        assert report.results == []
+        assert os.stat(path).st_mtime_ns == mtime
+
+    def test_file_changed_after_planning_is_a_conflict(self, tmp_path, source):
+        targets = make_targets(tmp_path, source, 2)
+        plan = deploy.build_plan(targets)
+        path = os.path.join(targets[0].path, engine.GAME_USER_SETTINGS_FILE)
+        with open(path, 'w') as f:
+            f.write('edited by hand\n')
+        report = deploy.apply_plan(plan)
+        assert 'changed since the plan was made' in report.results[0].error
+        assert report.results[1].error is None
+        with open(path) as f:
+            assert f.read() == 'edited by hand\n'
+
+    def test_conflict_leaves_the_whole_target_unwritten(self, tmp_path, source):
+        targets = make_targets(tmp_path, source, 1)
+        plan = deploy.build_plan(targets)
+        path = os.path.join(targets[0].path, engine.GAME_INI_FILE)
+        with open(path, 'w') as f:
+            f.write('edited by hand\n')
+        report = deploy.apply_plan(plan)
+        assert 'changed since the plan was made' in report.results[0].error
+        assert report.results[0].written == ()
+        assert not os.path.exists(os.path.join(targets[0].path, engine.GAME_USER_SETTINGS_FILE))
+
+    def test_locked_target_waits_for_the_lock(self, tmp_path, source):
+        targets = make_targets(tmp_path, source, 1)
+        plan = deploy.build_plan(targets)
+        with deploy.TargetLock(targets[0].path, timeout=0.1):
+            with pytest.raises(deploy.LockTimeout):
+                with deploy.TargetLock(targets[0].path, timeout=0.1):
+                    pass
+
+        lock = deploy.TargetLock(targets[0].path)
+        lock.__enter__()
+        threading.Timer(0.2, lock.__exit__, (None, None, None)).start()
+        start = time.perf_counter()
+        report = deploy.apply_plan(plan)
+        assert time.perf_counter() - start >= 0.15
+        assert report.results[0].written == deploy.DEPLOY_FILES
+
+    def test_fleet_rollout_finishes_in_seconds(self, tmp_path, source):
+        targets = make_targets(tmp_path, source, 500)
+        start = time.perf_counter()
+        report = deploy.apply_plan(deploy.build_plan(targets))
+        assert not any(result.error for result in report.results)
+        assert len(report.results) == 500
+        assert time.perf_counter() - start < 10
+
+        start = time.perf_counter()
+        assert deploy.apply_plan(deploy.build_plan(targets)).results == []
+        assert time.perf_counter() - start < 2
+
+
+def test_cli_plans_then_applies(tmp_path, source, capsys):
+    targets = make_targets(tmp_path, source, 2)
+    listing = tmp_path / 'targets.txt'
+    listing.write_text('\n'.join(target.path for target in targets))
+    assert cli.main(['deploy', str(listing), '--source', source]) == 0
+    assert '4 file(s) to write on 2 of 2 target(s)' in capsys.readouterr().out
+    assert not os.path.exists(os.path.join(targets[0].path, engine.GAME_INI_FILE))
+    assert cli.main(['deploy', str(listing), '--source', source, '--apply']) == 0
+    assert '2 target(s) updated (0 failed)' in capsys.readouterr().out
+    assert os.path.exists(os.path.join(targets[0].path, engine.GAME_INI_FILE))
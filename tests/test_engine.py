@@ -0,0 +1,144 @@
+"""
+Tests for the headless settings engine
+Covers load/merge/calculate/emit without a display
+"""
+
+import configparser
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import corpus
+import engine
+from conftest import SOURCE_DIR
+
+
+class TestLoadAndMerge:
+    """Test loading defaults and merging overrides"""
+
+    def test_load_defaults_returns_independent_copy(self):
+        settings = engine.load_defaults()
+        settings[engine.SERVER_SECTION]['ServerName'] = 'Changed'
+        assert engine.DEFAULT_SETTINGS[engine.SERVER_SECTION]['ServerName'] == ''
+
+    def test_merge_flat_and_nested_overrides(self):
+        settings = engine.load_defaults()
+        engine.merge_settings(settings, {
+            'ServerName': 'Island',
+            'RCONPort': '27021',
+            engine.GAME_SECTION: {'EggHatchSpeedMultiplier': 5.0},
+        })
+        assert settings[engine.SERVER_SECTION]['ServerName'] == 'Island'
+        assert settings[engine.SERVER_SECTION]['RCONPort'] == 27021
+        assert settings[engine.GAME_SECTION]['EggHatchSpeedMultiplier'] == 5.0
+
+    def test_merge_unknown_flat_key_goes_to_server_settings(self):
+        settings = engine.merge_settings(engine.load_defaults(), {'SomeModSetting': 'x'})
+        assert settings[engine.SERVER_SECTION]['SomeModSetting'] == 'x'
+
+
+class TestCalculate:
+    """Test the pure calculation function"""
+
+    def test_multipliers_scale_times(self):
+        results = engine.calculate({'TamingSpeedMultiplier': 2.0}, 'Argentavis')
+        assert results['taming_time'] == 90
+        assert results['maturation_time'] == 48
+
+    def test_override_difficulty_wins(self):
+        results = engine.calculate({'DifficultyOffset': 1.0, 'OverrideOfficialDifficulty': 5.0}, 'Rex')
+        assert results['max_dino_level'] == 300
+        assert results['difficulty'] == 5.0
+
+    def test_zero_multipliers_have_no_time(self):
+        results = engine.calculate({'TamingSpeedMultiplier': 0.0, 'EggHatchSpeedMultiplier': 0.0,
+                                    'BabyImprintingStatScaleMultiplier': 0.0}, 'Rex')
+        assert results['taming_time'] is None and results['incubation_time'] is None
+        assert results['imprint_interval'] is None and results['max_imprint'] == 0
+        assert results['maturation_time'] > 0
+
+
+class TestEmit:
+    """Test INI rendering and writing"""
+
+    def test_emit_files_writes_both_files(self, tmp_path):
+        settings = engine.load_defaults()
+        settings[engine.SERVER_SECTION]['ServerName'] = 'Round Trip'
+        gus_result, game_result = engine.emit_files(settings, 'advanced', str(tmp_path))
+        gus_path, game_path = gus_result.path, game_result.path
+
+        config = configparser.ConfigParser(strict=False)
+        config.optionxform = str
+        config.read(gus_path)
+        assert config.get(engine.SERVER_SECTION, 'ServerName') == 'Round Trip'
+        assert os.path.basename(game_path) == engine.GAME_INI_FILE
+        assert os.path.getsize(game_path) > 0
+
+    def test_emit_files_uses_rendered_text(self, tmp_path):
+        settings = engine.load_defaults()
+        rendered = {engine.GAME_INI_FILE: engine.render_game_ini(settings, 'basic')}
+        _, game_result = engine.emit_files(settings, 'basic', str(tmp_path), rendered)
+        with open(game_result.path, encoding='utf-8') as f:
+            assert f.read() == rendered[engine.GAME_INI_FILE]
+        rendered[engine.GAME_INI_FILE] = '[/script/shootergame.shootergamemode]\n'
+        _, game_result = engine.emit_files(settings, 'basic', str(tmp_path), rendered)
+        assert game_result.changed
+
+    def test_basic_mode_writes_basic_subset_and_mods(self):
+        settings = engine.load_defaults()
+        settings[engine.SERVER_SECTION]['ActiveMods'] = '928595'
+        content = engine.render_game_user_settings(settings, 'basic')
+        assert 'ActiveMods = 928595' in content
+        assert 'BanListURL' not in content
+
+    def test_canonical_values(self):
+        assert engine.format_value(True) == 'True'
+        assert engine.format_value(False) == 'False'
+        assert engine.format_value(1.0) == '1.0'
+        assert engine.format_value(-0.0) == '0.0'
+        assert engine.format_value(0.00001) == '0.00001'
+        assert engine.format_value(1e22) == '10000000000000000000000.0'
+        assert engine.format_value(0.1 + 0.2) == '0.30000000000000004'
+        assert engine.format_value(5000) == '5000'
+        for text in ('0.00001', '123.456', '10000000000000000000000.0'):
+            assert float(engine.format_value(float(text))) == float(text)
+        with pytest.raises(ValueError):
+            engine.format_value(float('nan'))
+
+    def test_render_section_writes_repeated_keys_in_order(self):
+        values = {'B': 0.5, 'A': ['(X=1)', '(X=2)'], 'C': False, 'Empty': []}
+        text = engine.render_section(values, 'S', ['A', 'B', 'Missing', 'C', 'Empty'])
+        assert text == '[S]\nA = (X=1)\nA = (X=2)\nB = 0.5\nMissing = \nC = False\n\n'
+        lines = ['[S]']
+        for key in ['A', 'B', 'Missing', 'C', 'Empty']:
+            lines.extend(engine.entry_lines(key, values.get(key, '')))
+        assert text == '\n'.join(lines) + '\n\n'
+
+    def test_render_section_throughput(self):
+        values = corpus.section_values(20000)
+        keys = list(values)
+        start = time.perf_counter()
+        engine.render_section(values, engine.GAME_SECTION, keys)
+        elapsed = time.perf_counter() - start
+        assert len(keys) / elapsed > engine.EMIT_PAIRS_PER_S
+
+
+class TestStartup:
+    """Test that the engine stays headless and fast"""
+
+    def test_engine_import_and_generation_within_budget(self, tmp_path):
+        script = (
+            "import time, sys\n"
+            "start = time.perf_counter()\n"
+            "import engine\n"
+            "engine.emit_files(engine.load_defaults(), 'advanced', sys.argv[1])\n"
+            "print((time.perf_counter() - start) * 1000, 'tkinter' in sys.modules)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script, str(tmp_path)],
+                                cwd=SOURCE_DIR, capture_output=True, text=True, check=True)
+        elapsed_ms, tkinter_loaded = result.stdout.split()
+        assert tkinter_loaded == 'False'
+        assert float(elapsed_ms) < engine.STARTUP_BUDGET_MS
@@ -0,0 +1,52 @@
+"""
+Tests for the fingerprinted atomic writer
+"""
+
+import os
+
+import pytest
+
+import fileio
+
+
+class TestWriteIfChanged:
+    """Test skip-if-unchanged and atomic replacement"""
+
+    def test_first_write_then_unchanged(self, tmp_path):
+        path = str(tmp_path / 'Game.ini')
+        first = fileio.write_if_changed(path, "[Section]\nKey=1\n")
+        second = fileio.write_if_changed(path, "[Section]\nKey=1\n")
+        assert first.changed
+        assert not second.changed
+        assert first.digest == second.digest == fileio.file_fingerprint(path)
+
+    def test_changed_content_is_rewritten(self, tmp_path):
+        path = str(tmp_path / 'Game.ini')
+        fileio.write_if_changed(path, "Key=1\n")
+        mtime_before = os.stat(path).st_mtime_ns
+        result = fileio.write_if_changed(path, "Key=2\n")
+        assert result.changed
+        with open(path, 'rb') as f:
+            assert f.read() == fileio.encode_text("Key=2\n")
+        assert os.stat(path).st_mtime_ns >= mtime_before
+
+    def test_unchanged_write_leaves_file_untouched(self, tmp_path):
+        path = str(tmp_path / 'Game.ini')
+        fileio.write_if_changed(path, "Key=1\n")
+        inode = os.stat(path).st_ino
+        fileio.write_if_changed(path, "Key=1\n")
+        assert os.stat(path).st_ino == inode
+
+    def test_failed_write_keeps_original_and_no_temp_files(self, tmp_path, monkeypatch):
+        path = str(tmp_path / 'Game.ini')
+        fileio.write_if_changed(path, "Key=1\n")
+
+        def fail_replace(src, dst):
+            raise OSError("simulated crash")
+        monkeypatch.setattr(fileio.os, 'replace', fail_replace)
+
+        with pytest.raises(OSError):
+            fileio.write_if_changed(path, "Key=2\n")
+        with open(path, 'rb') as f:
+            assert f.read() == fileio.encode_text("Key=1\n")
+        assert os.listdir(str(tmp_path)) == ['Game.ini']
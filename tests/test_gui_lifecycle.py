@@ -0,0 +1,127 @@
+"""
+Memory regression tests for the GUI widget lifecycle
+
+These need a display; they are skipped when Tk cannot open one (set DISPLAY,
+e.g. under xvfb-run, to run them headless).
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+
+tk = pytest.importorskip('tkinter')
+
+import journal  # noqa: E402
+import schema  # noqa: E402
+import widgets  # noqa: E402
+
+TOGGLES = 500
+# Python allocations allowed to remain after TOGGLES mode switches
+MEMORY_SLACK = 256 * 1024
+
+
+@pytest.fixture
+def root():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    root.geometry('1200x900')
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def app(root, tmp_path, monkeypatch):
+    monkeypatch.setenv(journal.ENV_VAR, str(tmp_path))
+    import main
+    app = main.ArkSettingsGenerator(root)
+    root.update()
+    yield app
+    app.journal.close()
+
+
+def tcl_counts(root):
+    """Return the number of Tcl commands and global Tcl variables"""
+    return len(root.tk.splitlist(root.tk.call('info', 'commands'))), \
+        len(root.tk.splitlist(root.tk.call('info', 'globals')))
+
+
+def settle(app):
+    """Run pending frame work and the journal sync, whose after() timers hold Tcl commands"""
+    app.root.update()
+    app.scheduler.flush()
+    if app._journal_sync_id is not None:
+        app.root.after_cancel(app._journal_sync_id)
+        app.sync_journal()
+    app.root.update()
+
+
+def toggle_modes(app, times):
+    for step in range(times):
+        app.mode.set('advanced' if step % 2 == 0 else 'basic')
+        app.switch_mode()
+        app.scheduler.flush()
+        app.root.update()
+    settle(app)
+
+
+class TestModeToggling:
+    """Test that switching modes does not grow Tcl or Python state"""
+
+    def test_toggling_modes_is_flat(self, app):
+        # Build every view and open the journal before measuring
+        toggle_modes(app, 4)
+        gc.collect()
+        commands, variables = tcl_counts(app.root)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            toggle_modes(app, TOGGLES)
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        growth = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        assert tcl_counts(app.root) == (commands, variables)
+        assert growth < MEMORY_SLACK
+
+    def test_mouse_wheel_binding_is_not_rebound(self, app):
+        settings_list = app.server_list
+        settle(app)
+        commands, _ = tcl_counts(app.root)
+        for _ in range(TOGGLES):
+            settings_list._on_enter(None)
+            settings_list._on_leave(None)
+            settings_list.canvas.event_generate('<Enter>')
+            settings_list.canvas.event_generate('<Leave>')
+        app.root.update()
+        assert tcl_counts(app.root)[0] == commands
+
+
+class TestSettingsListLifecycle:
+    """Test that destroyed lists release their rows"""
+
+    def test_destroy_releases_commands_and_variables(self, root):
+        settings = schema.section_settings(schema.SERVER_SECTION)
+        values = schema.defaults()[schema.SERVER_SECTION]
+        colors = {'bg_dark': '#1a1a1a', 'text_primary': '#ffffff', 'text_secondary': '#b0b0b0'}
+
+        def build_and_destroy():
+            settings_list = widgets.VirtualSettingsList(root, settings, values, colors)
+            settings_list.pack(fill='both', expand=True)
+            root.update()
+            settings_list.layout()
+            settings_list.yview('moveto', 0.5)
+            assert settings_list._rows
+            settings_list.destroy()
+            root.update()
+
+        build_and_destroy()
+        gc.collect()
+        counts = tcl_counts(root)
+        for _ in range(20):
+            build_and_destroy()
+        gc.collect()
+        assert tcl_counts(root) == counts
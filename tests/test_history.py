@@ -0,0 +1,129 @@
+"""
+Tests for undo/redo history and persistent snapshots
+"""
+
+import tracemalloc
+
+import engine
+import history
+
+SERVER = engine.SERVER_SECTION
+GAME = engine.GAME_SECTION
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_history(**options):
+    settings = engine.load_defaults()
+    clock = FakeClock()
+    return settings, history.History(settings, clock=clock, **options), clock
+
+
+def edit(settings, log, clock, section, key, value, seconds=5.0):
+    clock.now += seconds
+    settings[section][key] = value
+    return log.record(settings, [(section, key)], f"Edit {key}")
+
+
+class TestSnapshot:
+    """Test structural sharing"""
+
+    def test_set_many_shares_untouched_nodes(self):
+        snapshot = history.Snapshot.from_settings(engine.load_defaults())
+        changed = snapshot.set_many([((SERVER, 'XPMultiplier'), 3.0)])
+        assert changed.get(SERVER, 'XPMultiplier') == 3.0
+        assert snapshot.get(SERVER, 'XPMultiplier') == 1.0
+        shared = sum(1 for a, b in zip(snapshot.root, changed.root) if a is b)
+        assert shared == len(snapshot.root) - 1
+        assert changed.diff(snapshot) == [(SERVER, 'XPMultiplier')]
+
+    def test_unchanged_values_return_same_snapshot(self):
+        snapshot = history.Snapshot.from_settings(engine.load_defaults())
+        assert snapshot.set_many([((SERVER, 'XPMultiplier'), 1.0)]) is snapshot
+
+    def test_lists_and_extra_keys(self):
+        settings = engine.load_defaults()
+        settings[SERVER]['CustomModKey'] = 'x'
+        snapshot = history.Snapshot.from_settings(settings)
+        changed = snapshot.set_many([((GAME, 'ConfigOverrideNPCSpawnEntriesContainer'), ['(A)', '(B)']),
+                                     ((SERVER, 'CustomModKey'), history._MISSING)])
+        assert changed.get(GAME, 'ConfigOverrideNPCSpawnEntriesContainer') == ['(A)', '(B)']
+        assert sorted(changed.diff(snapshot)) == [(GAME, 'ConfigOverrideNPCSpawnEntriesContainer'),
+                                                  (SERVER, 'CustomModKey')]
+        changed.restore(settings, changed.diff(snapshot))
+        assert 'CustomModKey' not in settings[SERVER]
+
+
+class TestHistory:
+    """Test undo, redo and coalescing"""
+
+    def test_undo_redo_restore_values(self):
+        settings, log, clock = make_history()
+        edit(settings, log, clock, SERVER, 'XPMultiplier', 2.0)
+        edit(settings, log, clock, GAME, 'MatingIntervalMultiplier', 0.5)
+        assert log.undo_label == 'Edit MatingIntervalMultiplier'
+        assert log.undo(settings) == [(GAME, 'MatingIntervalMultiplier')]
+        assert settings[GAME]['MatingIntervalMultiplier'] == 1.0
+        assert log.undo(settings) == [(SERVER, 'XPMultiplier')]
+        assert settings[SERVER]['XPMultiplier'] == 1.0
+        assert log.undo(settings) == []
+        assert not log.can_undo
+        log.redo(settings)
+        assert settings[SERVER]['XPMultiplier'] == 2.0
+        assert log.can_redo
+
+    def test_new_edit_clears_redo(self):
+        settings, log, clock = make_history()
+        edit(settings, log, clock, SERVER, 'XPMultiplier', 2.0)
+        log.undo(settings)
+        edit(settings, log, clock, SERVER, 'XPMultiplier', 4.0)
+        assert not log.can_redo
+
+    def test_slider_drag_is_one_step(self):
+        settings, log, clock = make_history()
+        for value in (1.5, 2.0, 2.5, 3.0):
+            edit(settings, log, clock, SERVER, 'XPMultiplier', value, seconds=0.016)
+        edit(settings, log, clock, SERVER, 'TamingSpeedMultiplier', 2.0, seconds=0.016)
+        log.undo(settings)
+        assert settings[SERVER]['XPMultiplier'] == 3.0
+        log.undo(settings)
+        assert settings[SERVER]['XPMultiplier'] == 1.0
+        assert not log.can_undo
+
+    def test_reset_can_be_undone(self):
+        settings, log, clock = make_history()
+        edit(settings, log, clock, SERVER, 'XPMultiplier', 2.0)
+        edit(settings, log, clock, SERVER, 'ServerName', 'Island')
+        settings[SERVER].update(XPMultiplier=1.0, ServerName='')
+        # The store reports only the keys a reset changed, recorded as one step
+        assert log.record(settings, {(SERVER, 'XPMultiplier'), (SERVER, 'ServerName')},
+                          "Reset to defaults")
+        assert sorted(log.undo(settings)) == [(SERVER, 'ServerName'), (SERVER, 'XPMultiplier')]
+        assert settings[SERVER]['ServerName'] == 'Island'
+
+    def test_limit_drops_oldest_steps(self):
+        settings, log, clock = make_history(limit=3)
+        for value in range(5):
+            edit(settings, log, clock, SERVER, 'MaxPlayers', value)
+        while log.can_undo:
+            log.undo(settings)
+        assert settings[SERVER]['MaxPlayers'] == 1
+
+    def test_thousands_of_steps_fit_in_a_few_megabytes(self):
+        settings, log, clock = make_history()
+        tracemalloc.start()
+        try:
+            for step in range(5000):
+                edit(settings, log, clock, SERVER, 'XPMultiplier', float(step))
+            used = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        assert used < 4 * 1024 * 1024
+        log.undo(settings)
+        assert settings[SERVER]['XPMultiplier'] == 4998.0
@@ -0,0 +1,177 @@
+"""
+Tests for lossless INI documents and in-place generation
+"""
+
+import time
+
+import cli
+import corpus
+import engine
+import inidoc
+
+SERVER = engine.SERVER_SECTION
+GAME = engine.GAME_SECTION
+
+GAME_USER_SETTINGS = (
+    "; exported by a server manager\r\n"
+    "[SessionSettings]\r\n"
+    "SessionName=My Island\r\n"
+    "\r\n"
+    "[ServerSettings]\r\n"
+    "DifficultyOffset=1.000000\r\n"
+    "serverpve=true\r\n"
+    "UnknownModKey=5\r\n"
+    "XPMultiplier=1.0\r\n"
+    "\r\n"
+    "[MessageOfTheDay]\r\n"
+    "Message=Welcome\r\n"
+)
+
+GAME_INI = (
+    "[/Script/ShooterGame.ShooterGameMode]\n"
+    "ConfigOverrideNPCSpawnEntriesContainer=(NPCSpawnEntriesContainerClassString=\"A\")\n"
+    "; keep me\n"
+    "ConfigOverrideNPCSpawnEntriesContainer=(NPCSpawnEntriesContainerClassString=\"B\")\n"
+    "BabyMatureSpeedMultiplier=12.5\n"
+    "\n"
+    "[ModSettings]\n"
+    "Something=1"
+)
+
+
+def write_pair(directory, gus=GAME_USER_SETTINGS, game=GAME_INI):
+    gus_path = directory / engine.GAME_USER_SETTINGS_FILE
+    game_path = directory / engine.GAME_INI_FILE
+    gus_path.write_bytes(b'\xef\xbb\xbf' + gus.encode('utf-8'))
+    game_path.write_bytes(game.encode('utf-8'))
+    return str(gus_path), str(game_path)
+
+
+def changed_lines(before, after):
+    before, after = before.split('\n'), after.split('\n')
+    return [(old, new) for old, new in zip(before, after) if old != new], len(after) - len(before)
+
+
+class TestIniDocument:
+    """Test that documents keep every byte and patch only given lines"""
+
+    def test_text_round_trips(self):
+        for text in (GAME_USER_SETTINGS, GAME_INI, '', 'no newline', 'a=1\n\n\n'):
+            assert inidoc.IniDocument(text).text() == text
+
+    def test_entries_and_style(self):
+        document = inidoc.IniDocument(GAME_USER_SETTINGS)
+        assert [entry.key for entry in document.entries('serversettings')] == \
+            ['DifficultyOffset', 'serverpve', 'UnknownModKey', 'XPMultiplier']
+        assert document.newline == '\r\n' and document.separator == '='
+        assert document.key_line(5, '2.0') == 'DifficultyOffset=2.0\r'
+        assert inidoc.IniDocument('[S]\nKey = 1\n').new_line('Other', 'x') == 'Other = x'
+
+    def test_render_adds_sections_at_the_end(self):
+        document = inidoc.IniDocument(GAME_INI)
+        text = document.render(append={'ModSettings': ['Extra=2'], 'NewSection': ['A=1']})
+        assert text == GAME_INI + '\nExtra=2\n\n[NewSection]\nA=1'
+        document = inidoc.IniDocument('[S]\nA=1\n')
+        assert document.render(append={'T': ['B=2']}) == '[S]\nA=1\n\n[T]\nB=2\n'
+
+    def test_read_keeps_bom_and_invalid_bytes(self, tmp_path):
+        path = tmp_path / 'GameUserSettings.ini'
+        data = b'\xef\xbb\xbf[ServerSettings]\r\nServerName=Caf\xe9\r\n'
+        path.write_bytes(data)
+        document = inidoc.IniDocument.read(str(path))
+        assert document.encode(document.text()) == data
+
+
+class TestUpdateDocument:
+    """Test generating into imported files"""
+
+    def test_untouched_import_is_written_back_unchanged(self, tmp_path):
+        gus_path, game_path = write_pair(tmp_path)
+        settings = engine.load_defaults()
+        documents = engine.load_ini_documents(settings, gus_path, game_path)
+        assert settings[SERVER]['serverPVE'] is True
+        results = engine.emit_files(settings, 'advanced', str(tmp_path / 'out'),
+                                    documents=documents)
+        with open(gus_path, 'rb') as original, open(results[0].path, 'rb') as written:
+            assert written.read() == original.read()
+        with open(game_path, 'rb') as original, open(results[1].path, 'rb') as written:
+            assert written.read() == original.read()
+
+    def test_only_changed_lines_are_rewritten(self):
+        document = inidoc.IniDocument(GAME_USER_SETTINGS)
+        settings = engine.load_defaults()
+        settings[SERVER].update(DifficultyOffset=2.0, serverPVE=True, XPMultiplier=1.0,
+                                MaxPlayers=32)
+        text = engine.update_document(document, settings, SERVER)
+        changes, added = changed_lines(GAME_USER_SETTINGS, text)
+        assert changes[0] == ('DifficultyOffset=1.000000\r', 'DifficultyOffset=2.0\r')
+        # MaxPlayers differs from the default, so it is added at the end of the section
+        assert 'XPMultiplier=1.0\r\nMaxPlayers=32\r\n\r\n[MessageOfTheDay]' in text
+        assert added == 1
+        assert text.startswith('; exported by a server manager\r\n'
+                               '[SessionSettings]\r\nSessionName=My Island\r\n')
+        assert 'UnknownModKey=5\r\n' in text and text.endswith('Message=Welcome\r\n')
+
+    def test_numerically_equal_values_keep_their_lines(self, tmp_path):
+        gus = ('[ServerSettings]\nMaxPlayers=70.000000\nRCONServerGameLogBuffer=600.000000\n'
+               'MaxTamedDinos=3000.000000\nXPMultiplier=2\nserverPVE=1\n')
+        gus_path, game_path = write_pair(tmp_path, gus=gus)
+        settings = engine.load_defaults()
+        documents = engine.load_ini_documents(settings, gus_path, game_path)
+        assert settings[SERVER]['MaxTamedDinos'] == 3000
+        document = documents[engine.GAME_USER_SETTINGS_FILE]
+        assert engine.update_document(document, settings, SERVER) == gus
+        settings[SERVER]['MaxTamedDinos'] = 3500
+        changes, _ = changed_lines(gus, engine.update_document(document, settings, SERVER))
+        assert changes == [('MaxTamedDinos=3000.000000', 'MaxTamedDinos=3500')]
+
+    def test_unreadable_values_keep_their_lines_until_edited(self):
+        gus = '[ServerSettings]\nMaxTamedDinos=lots\nMaxPlayers=70\n'
+        document = inidoc.IniDocument(gus)
+        settings = engine.load_defaults()
+        assert engine.update_document(document, settings, SERVER) == gus
+        settings[SERVER]['MaxTamedDinos'] = 4000
+        changes, _ = changed_lines(gus, engine.update_document(document, settings, SERVER))
+        assert changes == [('MaxTamedDinos=lots', 'MaxTamedDinos=4000')]
+
+    def test_repeated_keys_grow_and_shrink_in_place(self):
+        document = inidoc.IniDocument(GAME_INI)
+        settings = engine.load_defaults()
+        key = 'ConfigOverrideNPCSpawnEntriesContainer'
+        settings[GAME]['BabyMatureSpeedMultiplier'] = 12.5
+        settings[GAME][key] = ['(NPCSpawnEntriesContainerClassString="A")', '(C)', '(D)']
+        text = engine.update_document(document, settings, GAME)
+        assert text.split('\n')[:6] == [
+            '[/Script/ShooterGame.ShooterGameMode]',
+            f'{key}=(NPCSpawnEntriesContainerClassString="A")',
+            '; keep me',
+            f'{key}=(C)',
+            f'{key}=(D)',
+            'BabyMatureSpeedMultiplier=12.5',
+        ]
+        settings[GAME][key] = []
+        text = engine.update_document(document, settings, GAME)
+        assert key not in text and '; keep me' in text
+        assert text.endswith('[ModSettings]\nSomething=1')
+
+    def test_cli_updates_base_folder_in_place(self, tmp_path, capsys):
+        write_pair(tmp_path)
+        profile = tmp_path / 'profile.json'
+        profile.write_text('{"XPMultiplier": 3.0}')
+        assert cli.main(['generate', '--base', str(tmp_path), '--profile', str(profile),
+                         '--output', str(tmp_path)]) == 0
+        text = (tmp_path / engine.GAME_USER_SETTINGS_FILE).read_bytes().decode('utf-8-sig')
+        changes, added = changed_lines(GAME_USER_SETTINGS, text)
+        assert changes == [('XPMultiplier=1.0\r', 'XPMultiplier=3.0\r')] and added == 0
+        assert 'unchanged' in capsys.readouterr().out
+
+    def test_large_untouched_game_ini_is_a_near_no_op(self, tmp_path):
+        game_path = corpus.write_game_ini(str(tmp_path / engine.GAME_INI_FILE), lines=25000)
+        gus_path = corpus.write_game_user_settings(str(tmp_path / engine.GAME_USER_SETTINGS_FILE))
+        settings = engine.load_defaults()
+        documents = engine.load_ini_documents(settings, gus_path, game_path)
+        start = time.perf_counter()
+        results = engine.emit_files(settings, 'advanced', str(tmp_path), documents=documents)
+        elapsed = time.perf_counter() - start
+        assert [result.changed for result in results] == [False, False]
+        assert elapsed < 1.0
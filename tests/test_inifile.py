@@ -0,0 +1,111 @@
+"""
+Tests for the streaming INI reader and INI import
+"""
+
+import tracemalloc
+
+import engine
+import inifile
+
+GAME_USER_SETTINGS = """\
+; exported by a server manager
+[ServerSettings]
+DifficultyOffset=1.000000
+MaxPlayers=32
+serverpve=True
+RCONPort=27025
+ServerName=My Island
+UnknownModKey=5
+
+[SessionSettings]
+SessionName=Not Imported
+"""
+
+GAME_INI = """\
+[/Script/ShooterGame.ShooterGameMode]
+BabyMatureSpeedMultiplier=12.5
+ConfigOverrideNPCSpawnEntriesContainer=(NPCSpawnEntriesContainerClassString="A")
+ConfigOverrideNPCSpawnEntriesContainer=(NPCSpawnEntriesContainerClassString="B")
+MaxTamedDinos=not-a-number
+"""
+
+
+class TestStreamingReader:
+    """Test the single-pass reader"""
+
+    def test_repeated_keys_kept_in_order(self):
+        entries = list(inifile.iter_lines_entries(GAME_INI.splitlines()))
+        values = [value for _, key, value in entries if key == 'ConfigOverrideNPCSpawnEntriesContainer']
+        assert values == ['(NPCSpawnEntriesContainerClassString="A")',
+                          '(NPCSpawnEntriesContainerClassString="B")']
+
+    def test_comments_and_sections(self):
+        entries = list(inifile.iter_lines_entries(GAME_USER_SETTINGS.splitlines()))
+        assert entries[0] == ('ServerSettings', 'DifficultyOffset', '1.000000')
+        assert entries[-1] == ('SessionSettings', 'SessionName', 'Not Imported')
+
+    def test_numbered_entries_match_entries(self):
+        lines = GAME_USER_SETTINGS.splitlines()
+        numbered = list(inifile.iter_numbered_lines(lines))
+        assert [entry[1:] for entry in numbered] == list(inifile.iter_lines_entries(lines))
+        for number, _, key, _ in numbered:
+            assert lines[number - 1].strip().startswith(key)
+
+    def test_large_file_has_bounded_memory(self, tmp_path):
+        path = tmp_path / 'Game.ini'
+        line = 'UnknownSpawnContainer=(' + 'x' * 200 + ')\n'
+        with open(path, 'w') as f:
+            f.write('[/Script/ShooterGame.ShooterGameMode]\n')
+            for _ in range(25000):
+                f.write(line)
+
+        tracemalloc.start()
+        try:
+            values = inifile.read_section(str(path), engine.GAME_SECTION,
+                                          engine.KEY_INDEX[engine.GAME_SECTION])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert values == {}
+        assert path.stat().st_size > 5 * 1024 * 1024
+        assert peak < 512 * 1024
+
+
+class TestImport:
+    """Test importing INI files into settings"""
+
+    def test_camel_case_keys_and_real_section_names(self, tmp_path):
+        gus_path = tmp_path / 'GameUserSettings.ini'
+        game_path = tmp_path / 'Game.ini'
+        gus_path.write_text(GAME_USER_SETTINGS)
+        game_path.write_text(GAME_INI)
+
+        settings = engine.load_ini_files(engine.load_defaults(), str(gus_path), str(game_path))
+        server = settings[engine.SERVER_SECTION]
+        game = settings[engine.GAME_SECTION]
+        assert server['DifficultyOffset'] == 1.0
+        assert server['MaxPlayers'] == 32
+        assert server['serverPVE'] is True
+        assert server['RCONPort'] == 27025
+        assert server['ServerName'] == 'My Island'
+        assert 'UnknownModKey' not in server
+        assert game['BabyMatureSpeedMultiplier'] == 12.5
+        assert game['ConfigOverrideNPCSpawnEntriesContainer'] == [
+            '(NPCSpawnEntriesContainerClassString="A")',
+            '(NPCSpawnEntriesContainerClassString="B")']
+        assert game['MaxTamedDinos'] == 4000
+
+    def test_repeated_values_are_written_back(self):
+        settings = engine.load_defaults()
+        settings[engine.GAME_SECTION]['ConfigOverrideSupplyCrateItems'] = ['(A)', '(B)']
+        content = engine.render_game_ini(settings)
+        assert 'ConfigOverrideSupplyCrateItems = (A)\nConfigOverrideSupplyCrateItems = (B)\n' in content
+
+    def test_any_casing_maps_to_the_schema_key(self, tmp_path):
+        gus_path = tmp_path / 'GameUserSettings.ini'
+        game_path = tmp_path / 'Game.ini'
+        gus_path.write_text('[ServerSettings]\nALWAYSNOTIFYPLAYERLEFT=True\n')
+        game_path.write_text('')
+        settings = engine.load_ini_files(engine.load_defaults(), str(gus_path), str(game_path))
+        assert settings[engine.SERVER_SECTION]['AlwaysNotifyPlayerLeft'] is True
+        assert 'alwaysNotifyPlayerLeft' not in settings[engine.SERVER_SECTION]
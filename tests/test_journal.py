@@ -0,0 +1,132 @@
+"""
+Tests for the crash-safe session journal
+"""
+
+import os
+import time
+
+import engine
+import journal
+import schema
+
+SERVER = engine.SERVER_SECTION
+GAME = engine.GAME_SECTION
+
+
+def restore(directory, **options):
+    log = journal.Journal(str(directory), **options)
+    return log, log.restore(engine.load_defaults(), 'basic', 'Argentavis')
+
+
+class TestJournal:
+    """Test recording, restoring and compaction"""
+
+    def test_no_session(self, tmp_path):
+        log, session = restore(tmp_path)
+        assert session is None
+        log.close()
+
+    def test_round_trip(self, tmp_path):
+        settings = engine.load_defaults()
+        log = journal.Journal(str(tmp_path))
+        settings[SERVER]['XPMultiplier'] = 3.5
+        settings[GAME]['CustomNote'] = 'kept'
+        log.record_settings(settings, [(SERVER, 'XPMultiplier'), (GAME, 'CustomNote')])
+        log.record_mode('advanced')
+        log.record_dino('Rex')
+        del settings[GAME]['CustomNote']
+        log.record_settings(settings, [(GAME, 'CustomNote')])
+        log.close()
+
+        log, session = restore(tmp_path)
+        assert session.settings[SERVER]['XPMultiplier'] == 3.5
+        assert 'CustomNote' not in session.settings[GAME]
+        assert session.mode == 'advanced'
+        assert session.dino == 'Rex'
+        log.close()
+
+    def test_torn_tail_is_dropped(self, tmp_path):
+        settings = engine.load_defaults()
+        log = journal.Journal(str(tmp_path))
+        settings[SERVER]['XPMultiplier'] = 2.0
+        log.record_settings(settings, [(SERVER, 'XPMultiplier')])
+        settings[SERVER]['TamingSpeedMultiplier'] = 9.0
+        log.record_settings(settings, [(SERVER, 'TamingSpeedMultiplier')])
+        log.close()
+        path = tmp_path / journal.JOURNAL_FILE
+        data = path.read_bytes()
+        path.write_bytes(data[:-7])
+
+        log, session = restore(tmp_path)
+        assert session.settings[SERVER]['XPMultiplier'] == 2.0
+        assert session.settings[SERVER]['TamingSpeedMultiplier'] == schema.get(SERVER, 'TamingSpeedMultiplier').default
+        assert path.read_bytes() == data[:data.index(b'\n') + 1]
+        # New edits continue after the last good line
+        settings[SERVER]['HarvestAmountMultiplier'] = 4.0
+        log.record_settings(settings, [(SERVER, 'HarvestAmountMultiplier')])
+        log.close()
+        log, session = restore(tmp_path)
+        assert session.settings[SERVER]['HarvestAmountMultiplier'] == 4.0
+        log.close()
+
+    def test_compact_skips_covered_lines(self, tmp_path):
+        settings = engine.load_defaults()
+        log = journal.Journal(str(tmp_path))
+        settings[SERVER]['XPMultiplier'] = 2.0
+        log.record_settings(settings, [(SERVER, 'XPMultiplier')])
+        stale = (tmp_path / journal.JOURNAL_FILE)
+        log.sync()
+        before = stale.read_bytes()
+        settings[SERVER]['XPMultiplier'] = 5.0
+        log.compact(journal.Session(settings, 'basic', 'Rex'))
+        assert stale.read_bytes() == b''
+        # A crash between the snapshot and the truncate leaves lines the snapshot already covers
+        stale.write_bytes(before)
+        log.close()
+
+        log, session = restore(tmp_path)
+        assert session.settings[SERVER]['XPMultiplier'] == 5.0
+        assert session.dino == 'Rex'
+        log.close()
+
+    def test_auto_compaction(self, tmp_path):
+        settings = engine.load_defaults()
+        log = journal.Journal(str(tmp_path), compact_records=10,
+                              state=lambda: journal.Session(settings, 'advanced', 'Rex'))
+        for step in range(25):
+            settings[SERVER]['XPMultiplier'] = float(step)
+            log.record_settings(settings, [(SERVER, 'XPMultiplier')])
+        log.close()
+        lines = (tmp_path / journal.JOURNAL_FILE).read_bytes().count(b'\n')
+        assert lines < 10
+
+        log, session = restore(tmp_path)
+        assert session.settings[SERVER]['XPMultiplier'] == 24.0
+        assert session.mode == 'advanced'
+        log.close()
+
+    def test_restore_is_fast(self, tmp_path):
+        settings = engine.load_defaults()
+        for setting in schema.SETTINGS:
+            if setting.type is float:
+                settings[setting.section][setting.key] = setting.default + 1.5
+        log = journal.Journal(str(tmp_path))
+        log.compact(journal.Session(settings, 'advanced', 'Rex'))
+        for step in range(1000):
+            settings[SERVER]['XPMultiplier'] = float(step)
+            log.record_settings(settings, [(SERVER, 'XPMultiplier')])
+        log.close()
+
+        start = time.perf_counter()
+        log, session = restore(tmp_path)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert session.settings[SERVER]['XPMultiplier'] == 999.0
+        assert session.settings[SERVER]['TamingSpeedMultiplier'] == settings[SERVER]['TamingSpeedMultiplier']
+        assert elapsed_ms < 100
+        log.close()
+
+    def test_default_directory(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(journal.ENV_VAR, str(tmp_path))
+        assert journal.default_directory() == str(tmp_path)
+        monkeypatch.delenv(journal.ENV_VAR)
+        assert os.path.basename(journal.default_directory()) == 'ArkSettingsGenerator'
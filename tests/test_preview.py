@@ -0,0 +1,131 @@
+"""
+Tests for the incrementally patched INI preview
+"""
+
+import random
+
+import engine
+import fileio
+import preview
+
+SERVER = engine.SERVER_SECTION
+GAME = engine.GAME_SECTION
+
+
+def rendered(settings, section, mode):
+    if section == SERVER:
+        return engine.render_game_user_settings(settings, mode)
+    return engine.render_game_ini(settings, mode)
+
+
+def shown(lines):
+    """Text of a patched line list, as the preview pane holds it"""
+    return '\n'.join(lines) + '\n\n'
+
+
+class TestPreviewDocument:
+    """Test that patched previews match the writer byte for byte"""
+
+    def test_initial_text_matches_writer(self):
+        settings = engine.load_defaults()
+        for mode in ('basic', 'advanced'):
+            for _, section in preview.PREVIEW_FILES:
+                document = preview.PreviewDocument(settings, section, mode)
+                assert document.text() == rendered(settings, section, mode)
+
+    def test_patches_touch_only_edited_lines(self):
+        settings = engine.load_defaults()
+        document = preview.PreviewDocument(settings, SERVER)
+        settings[SERVER]['XPMultiplier'] = 4.5
+        patches = document.update({'XPMultiplier', 'MaxPlayers'})
+        assert patches == [preview.Patch(document.starts['XPMultiplier'], 1, ['XPMultiplier = 4.5'])]
+        assert document.update({'XPMultiplier'}) == []
+
+    def test_repeated_keys_shift_later_lines(self):
+        settings = engine.load_defaults()
+        document = preview.PreviewDocument(settings, GAME)
+        lines = document.lines()
+        settings[GAME]['ConfigOverrideNPCSpawnEntriesContainer'] = ['(A=1)', '(B=2)', '(C=3)']
+        settings[GAME]['MaxTamedDinos'] = 6000
+        patches = document.update({'ConfigOverrideNPCSpawnEntriesContainer', 'MaxTamedDinos'})
+        assert [patch.count for patch in patches] == [1, 1]
+        assert shown(preview.apply_patches(lines, patches)) == rendered(settings, GAME, 'advanced')
+
+    def test_new_key_rebuilds(self):
+        settings = engine.load_defaults()
+        document = preview.PreviewDocument(settings, SERVER)
+        settings[SERVER]['CustomFromProfile'] = 'x'
+        assert document.update({'CustomFromProfile'}) is None
+        assert document.text() == rendered(settings, SERVER, 'advanced')
+
+    def test_random_edits_match_writer(self):
+        rng = random.Random(7)
+        settings = engine.load_defaults()
+        for mode in ('basic', 'advanced'):
+            documents = {section: preview.PreviewDocument(settings, section, mode)
+                         for _, section in preview.PREVIEW_FILES}
+            lines = {section: document.lines() for section, document in documents.items()}
+            for _ in range(300):
+                section = rng.choice((SERVER, GAME))
+                keys = rng.sample(sorted(settings[section]), 3)
+                for key in keys:
+                    value = settings[section][key]
+                    if isinstance(value, bool):
+                        settings[section][key] = not value
+                    elif isinstance(value, (int, float)):
+                        settings[section][key] = value + rng.choice((1, 2.5))
+                    else:
+                        settings[section][key] = rng.choice(
+                            ['', 'text', [f'(Entry={i})' for i in range(rng.randint(0, 3))]])
+                patches = documents[section].update(keys)
+                preview.apply_patches(lines[section], patches)
+                text = shown(lines[section])
+                assert fileio.encode_text(text) == fileio.encode_text(rendered(settings, section, mode))
+
+
+class TestImportedPreviewDocument:
+    """Test that the preview of an imported file matches update_document() line for line"""
+
+    GAME_USER_SETTINGS = ('[SessionSettings]\r\nSessionName=Island\r\n\r\n[ServerSettings]\r\n'
+                          'XPMultiplier=1.0\r\nMaxPlayers=70.000000\r\nUnknownModKey=5\r\n')
+    GAME_INI = ('[/Script/ShooterGame.ShooterGameMode]\n'
+                'ConfigOverrideNPCSpawnEntriesContainer=(A)\n; keep me\nMaxTamedDinos=5000')
+
+    def test_random_edits_match_update_document(self, tmp_path):
+        rng = random.Random(11)
+        texts = {SERVER: self.GAME_USER_SETTINGS, GAME: self.GAME_INI}
+        paths = []
+        for name, section in preview.PREVIEW_FILES:
+            paths.append(tmp_path / name)
+            paths[-1].write_bytes(texts[section].encode('utf-8'))
+        settings = engine.load_defaults()
+        loaded = engine.load_ini_documents(settings, *paths)
+        files = {section: loaded[name] for name, section in preview.PREVIEW_FILES}
+        documents = {section: preview.ImportedPreviewDocument(files[section], settings, section)
+                     for section in files}
+        for section, document in documents.items():
+            assert document.text() == texts[section]
+        lines = {section: document.lines() for section, document in documents.items()}
+        for _ in range(300):
+            section = rng.choice((SERVER, GAME))
+            keys = rng.sample(sorted(settings[section]), 2) + \
+                [rng.choice(['XPMultiplier', 'MaxPlayers', 'MaxTamedDinos',
+                             'ConfigOverrideNPCSpawnEntriesContainer'])]
+            for key in keys:
+                value = settings[section].get(key)
+                if isinstance(value, bool):
+                    settings[section][key] = not value
+                elif isinstance(value, (int, float)):
+                    settings[section][key] = rng.choice((value + 1, engine.load_defaults()
+                                                         [section].get(key, value)))
+                else:
+                    settings[section][key] = rng.choice(
+                        ['', [f'(Entry={i})' for i in range(rng.randint(0, 3))]])
+            patches = documents[section].update(keys)
+            if patches is None:
+                lines[section] = documents[section].lines()
+            else:
+                preview.apply_patches(lines[section], patches)
+            expected = engine.update_document(files[section], settings, section)
+            assert '\n'.join(lines[section]) == expected
+            assert documents[section].text() == expected
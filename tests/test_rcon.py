@@ -0,0 +1,194 @@
+"""
+Tests for the RCON client against the local stand-in server
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+import batch
+import cli
+import engine
+import rcon
+import rcon_server
+
+PASSWORD = 'admin'
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def push_to_servers(count, commands, password=PASSWORD, **options):
+    servers = await rcon_server.start_servers(count, PASSWORD, **options)
+    try:
+        targets = [rcon.RconTarget(f's{i}', '127.0.0.1', server.port, password)
+                   for i, server in enumerate(servers)]
+        return await rcon.push_async(targets, commands, timeout=2.0), servers
+    finally:
+        for server in servers:
+            await server.stop()
+
+
+class TestProtocol:
+    """Test packet encoding"""
+
+    def test_packet_round_trip(self):
+        async def round_trip():
+            reader = asyncio.StreamReader()
+            reader.feed_data(rcon.encode_packet(7, rcon.SERVERDATA_EXECCOMMAND, 'SaveWorld'))
+            return await rcon.read_packet(reader)
+        assert run(round_trip()) == (7, rcon.SERVERDATA_EXECCOMMAND, 'SaveWorld')
+
+    def test_invalid_size_is_rejected(self):
+        async def read():
+            reader = asyncio.StreamReader()
+            reader.feed_data(b'\x02\x00\x00\x00\x00\x00')
+            return await rcon.read_packet(reader)
+        with pytest.raises(rcon.RconError):
+            run(read())
+
+
+class TestPush:
+    """Test pushing commands to servers"""
+
+    def test_commands_reach_every_server_in_order(self):
+        report, servers = run(push_to_servers(3, ['Broadcast hi', 'SaveWorld']))
+        assert [result.error for result in report.results] == [None] * 3
+        assert [result.name for result in report.results] == ['s0', 's1', 's2']
+        assert report.results[0].responses == (rcon_server.NO_RESPONSE,) * 2
+        for server in servers:
+            assert server.commands == ['Broadcast hi', 'SaveWorld']
+
+    def test_per_server_commands(self):
+        report, servers = run(push_to_servers(2, {'s0': ['A'], 's1': ['B', 'C']}))
+        assert [server.commands for server in servers] == [['A'], ['B', 'C']]
+
+    def test_replies_are_matched_to_commands(self):
+        report, _ = run(push_to_servers(1, [f'echo {i}' for i in range(50)], handler=lambda c: c.upper()))
+        assert report.results[0].responses == tuple(f'ECHO {i}' for i in range(50))
+
+    def test_wrong_password_is_reported(self):
+        report, servers = run(push_to_servers(1, ['SaveWorld'], password='wrong'))
+        assert report.results[0].error == 'Admin password rejected'
+        assert servers[0].commands == []
+
+    def test_unreachable_server_does_not_block_others(self):
+        async def push():
+            server = await rcon_server.StandInRconServer(PASSWORD).start()
+            closed = await rcon_server.StandInRconServer(PASSWORD).start()
+            await closed.stop()
+            targets = [rcon.RconTarget('down', '127.0.0.1', closed.port, PASSWORD),
+                       rcon.RconTarget('up', '127.0.0.1', server.port, PASSWORD)]
+            try:
+                return await rcon.push_async(targets, ['SaveWorld'], timeout=1.0)
+            finally:
+                await server.stop()
+        report = run(push())
+        assert report.results[0].error
+        assert report.results[1].error is None
+
+    def test_silent_server_times_out(self):
+        async def push():
+            silent = await rcon_server.StandInRconServer(PASSWORD, handler=lambda command: None).start()
+            server = await rcon_server.StandInRconServer(PASSWORD).start()
+            targets = [rcon.RconTarget('silent', '127.0.0.1', silent.port, PASSWORD),
+                       rcon.RconTarget('ok', '127.0.0.1', server.port, PASSWORD)]
+            try:
+                return await rcon.push_async(targets, ['SaveWorld'], timeout=0.2)
+            finally:
+                await silent.stop()
+                await server.stop()
+        report = run(push())
+        assert report.results[0].error == 'Timed out'
+        assert report.results[1].error is None
+
+    def test_pool_reuses_connections(self):
+        async def push_twice():
+            server = await rcon_server.StandInRconServer(PASSWORD).start()
+            pool = rcon.RconPool(timeout=1.0)
+            target = rcon.RconTarget('s', '127.0.0.1', server.port, PASSWORD)
+            try:
+                await rcon.push_async([target], ['A'], pool=pool)
+                await rcon.push_async([target], ['B'], pool=pool)
+            finally:
+                pool.close()
+                await server.stop()
+            return server
+        server = run(push_twice())
+        assert server.connections == 1
+        assert server.commands == ['A', 'B']
+
+    def test_commands_are_pipelined(self):
+        # Five commands behind 100 ms of latency take one round trip, not five
+        start = time.perf_counter()
+        report, _ = run(push_to_servers(1, ['A', 'B', 'C', 'D', 'E'], delay=0.1))
+        assert report.results[0].error is None
+        assert time.perf_counter() - start < 0.4
+
+    def test_many_concurrent_connections(self):
+        start = time.perf_counter()
+        report, servers = run(push_to_servers(250, ['Broadcast rates', 'SaveWorld'], delay=0.05))
+        assert not [result for result in report.results if result.error]
+        assert sum(server.connections for server in servers) == 250
+        assert time.perf_counter() - start < 5
+
+
+class TestManifest:
+    """Test targets and dynamic config from a cluster manifest"""
+
+    def write_manifest(self, tmp_path, port):
+        manifest = {
+            'base': {'ServerAdminPassword': PASSWORD, 'TamingSpeedMultiplier': 3.0},
+            'servers': [
+                {'name': 'island', 'overrides': {'RCONPort': port}},
+                {'name': 'offline', 'overrides': {'RCONEnabled': False}},
+            ],
+        }
+        path = tmp_path / 'cluster.json'
+        path.write_text(json.dumps(manifest))
+        return str(path)
+
+    def test_targets_from_manifest(self, tmp_path):
+        manifest = batch.load_manifest(self.write_manifest(tmp_path, 27031))
+        targets, skipped = rcon.targets_from_manifest(manifest)
+        assert targets == [rcon.RconTarget('island', rcon.DEFAULT_HOST, 27031, PASSWORD)]
+        assert skipped == ['offline']
+
+    def test_dynamic_configs_are_rewritten_only_when_changed(self, tmp_path):
+        manifest = batch.load_manifest(self.write_manifest(tmp_path, 27031))
+        assert rcon.write_dynamic_configs(manifest, str(tmp_path / 'dynamic')) == {'island': True, 'offline': True}
+        assert rcon.write_dynamic_configs(manifest, str(tmp_path / 'dynamic')) == {'island': False, 'offline': False}
+        text = (tmp_path / 'dynamic' / 'island.ini').read_text()
+        assert 'TamingSpeedMultiplier=3.0\n' in text
+        assert 'ServerAdminPassword' not in text
+
+    def test_dynamic_config_uses_canonical_values(self):
+        settings = engine.load_defaults()
+        settings[engine.SERVER_SECTION]['XPMultiplier'] = 0.00001
+        settings[engine.GAME_SECTION]['BabyMatureSpeedMultiplier'] = 1e22
+        text = rcon.dynamic_config(settings)
+        assert 'XPMultiplier=0.00001\n' in text
+        assert 'BabyMatureSpeedMultiplier=10000000000000000000000.0\n' in text
+
+    def test_cli_pushes_to_manifest_servers(self, tmp_path, capsys):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        server = asyncio.run_coroutine_threadsafe(
+            rcon_server.StandInRconServer(PASSWORD).start(), loop).result()
+        try:
+            path = self.write_manifest(tmp_path, server.port)
+            dynamic = str(tmp_path / 'dynamic')
+            assert cli.main(['rcon', path, 'Broadcast hello', '--dynamic-config', dynamic]) == 0
+            assert server.commands == ['Broadcast hello', rcon.RELOAD_DYNAMIC_CONFIG]
+            assert cli.main(['rcon', path, '--dynamic-config', dynamic]) == 0
+            assert 'Nothing to send' in capsys.readouterr().out
+        finally:
+            asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
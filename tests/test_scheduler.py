@@ -0,0 +1,92 @@
+"""
+Tests for the frame scheduler, using a fake Tk root
+"""
+
+from scheduler import FrameScheduler
+
+
+class FakeRoot:
+    """Stand-in for Tk's after/after_cancel that runs timers on demand"""
+
+    def __init__(self):
+        self.timers = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.timers[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def run_frame(self):
+        timers, self.timers = self.timers, {}
+        for callback in timers.values():
+            callback()
+
+
+class TestFrameScheduler:
+    """Test per-frame coalescing and dedupe by key"""
+
+    def test_repeated_events_run_once_per_frame(self):
+        root = FakeRoot()
+        scheduler = FrameScheduler(root)
+        calls = []
+        for value in range(100):
+            scheduler.schedule('calculations', lambda value=value: calls.append(value))
+        assert len(root.timers) == 1
+        root.run_frame()
+        assert calls == [99]
+
+    def test_distinct_keys_all_run_in_order(self):
+        root = FakeRoot()
+        scheduler = FrameScheduler(root)
+        calls = []
+        scheduler.schedule('a', lambda: calls.append('a'))
+        scheduler.schedule('b', lambda: calls.append('b'))
+        scheduler.schedule('a', lambda: calls.append('a2'))
+        root.run_frame()
+        assert calls == ['a2', 'b']
+
+    def test_failing_task_does_not_drop_the_frame(self):
+        root = FakeRoot()
+        errors = []
+        root.report_callback_exception = lambda exc_type, exc, tb: errors.append(exc_type)
+        scheduler = FrameScheduler(root)
+        calls = []
+        scheduler.schedule('calculations', lambda: 1 / 0)
+        scheduler.schedule('history', lambda: calls.append('history'))
+        scheduler.schedule('preview', lambda: calls.append('preview'))
+        scheduler.flush()
+        assert calls == ['history', 'preview']
+        assert errors == [ZeroDivisionError]
+
+    def test_flush_runs_now_and_cancels_tick(self):
+        root = FakeRoot()
+        scheduler = FrameScheduler(root)
+        calls = []
+        scheduler.schedule('a', lambda: calls.append('a'))
+        scheduler.flush()
+        assert calls == ['a']
+        assert root.timers == {}
+
+    def test_work_scheduled_during_tick_waits_for_next_frame(self):
+        root = FakeRoot()
+        scheduler = FrameScheduler(root)
+        calls = []
+        scheduler.schedule('a', lambda: scheduler.schedule('b', lambda: calls.append('b')))
+        root.run_frame()
+        assert calls == []
+        root.run_frame()
+        assert calls == ['b']
+
+    def test_cancel_and_close(self):
+        root = FakeRoot()
+        scheduler = FrameScheduler(root)
+        scheduler.schedule('a', lambda: None)
+        scheduler.cancel('a')
+        assert not scheduler.is_pending('a')
+        scheduler.schedule('b', lambda: None)
+        scheduler.close()
+        assert root.timers == {}
@@ -0,0 +1,85 @@
+"""
+Tests for the compiled settings schema registry
+"""
+
+import pytest
+
+import engine
+import schema
+
+
+class TestRegistry:
+    """Test that every setting is declared once with one type"""
+
+    def test_ids_index_settings(self):
+        for position, setting in enumerate(schema.SETTINGS):
+            assert setting.id == position
+            assert schema.setting_id(setting.section, setting.key) == position
+
+    def test_records_use_slots(self):
+        setting = schema.get(schema.SERVER_SECTION, 'RCONPort')
+        assert not hasattr(setting, '__dict__')
+
+    def test_no_duplicate_keys_in_any_casing(self):
+        for section, ids in schema.SECTION_IDS.items():
+            lowered = [schema.SETTINGS[setting_id].key.lower() for setting_id in ids]
+            assert len(lowered) == len(set(lowered)), section
+
+    def test_duplicates_resolved(self):
+        assert schema.get(schema.SERVER_SECTION, 'RCONPort').default == 27020
+        assert schema.get(schema.SERVER_SECTION, 'serverForceNoHud') is None
+        assert schema.get(schema.SERVER_SECTION, 'alwaysNotifyPlayerLeft') is None
+        for setting in schema.find('maxtameddinos'):
+            assert setting.type is int
+
+    def test_compile_rejects_duplicates_and_type_conflicts(self):
+        with pytest.raises(ValueError):
+            schema._compile(((schema.SERVER_SECTION, (('RCONPort', 1, ''), ('rconport', 2, ''))),))
+        with pytest.raises(ValueError):
+            schema._compile(((schema.SERVER_SECTION, (('MaxTamedDinos', 1, ''),)),
+                             (schema.GAME_SECTION, (('MaxTamedDinos', 1.0, ''),))))
+
+    def test_tags_and_ranges(self):
+        difficulty = schema.get(schema.SERVER_SECTION, 'DifficultyOffset')
+        assert {'basic', 'calculation'} <= difficulty.tags
+        assert difficulty.range == schema.FLOAT_RANGE
+        assert 'secret' in schema.get(schema.SERVER_SECTION, 'ServerAdminPassword').tags
+        kick = schema.get(schema.SERVER_SECTION, 'KickIdlePlayersPeriod')
+        assert kick.range[1] >= kick.default
+        assert schema.get(schema.SERVER_SECTION, 'ServerName').range is None
+        for section in (schema.SERVER_SECTION, schema.GAME_SECTION):
+            for setting in schema.section_settings(section):
+                if setting.range is not None:
+                    assert setting.range[0] <= setting.default <= setting.range[1], setting.key
+
+    def test_coerce_uses_setting_type(self):
+        assert schema.get(schema.SERVER_SECTION, 'RCONPort').coerce('27025') == 27025
+        assert schema.get(schema.SERVER_SECTION, 'serverPVE').coerce('True') is True
+        with pytest.raises(ValueError):
+            schema.get(schema.SERVER_SECTION, 'MaxPlayers').coerce('lots')
+
+    def test_coerce_accepts_integral_float_text(self):
+        tamed = schema.get(schema.SERVER_SECTION, 'MaxTamedDinos')
+        assert tamed.coerce('5000.000000') == 5000
+        assert type(tamed.coerce('5000.000000')) is int
+        for raw in ('5000.5', 'inf', 'nan'):
+            with pytest.raises(ValueError):
+                tamed.coerce(raw)
+
+
+class TestEngineUsesSchema:
+    """Test that generation and merging go through the registry"""
+
+    def test_basic_keys_follow_schema(self):
+        keys = engine.section_keys(engine.load_defaults(), engine.GAME_SECTION, 'basic')
+        assert keys == list(schema.BASIC_GAME)
+
+    def test_unknown_profile_keys_are_still_written(self):
+        settings = engine.merge_settings(engine.load_defaults(), {'CustomModSetting': 'x'})
+        content = engine.render_game_user_settings(settings)
+        assert content.rstrip().endswith('CustomModSetting = x')
+
+    def test_other_spellings_merge_into_schema_key(self):
+        settings = engine.merge_settings(engine.load_defaults(), {'serverForceNoHud': 'True'})
+        assert settings[engine.SERVER_SECTION]['ServerForceNoHUD'] is True
+        assert 'serverForceNoHud' not in settings[engine.SERVER_SECTION]
@@ -0,0 +1,68 @@
+"""
+Tests for the settings search index
+"""
+
+import time
+
+import schema
+import search
+
+
+def keys(results):
+    return [setting.key for setting in results]
+
+
+class TestSplitKey:
+    """Test CamelCase splitting"""
+
+    def test_split_key(self):
+        assert search.split_key('MaxTamedDinos') == ['max', 'tamed', 'dinos']
+        assert search.split_key('XPMultiplier') == ['xp', 'multiplier']
+        assert search.split_key('serverPVE') == ['server', 'pve']
+        assert search.split_key('PerLevelStatsMultiplier_Player') == ['per', 'level', 'stats', 'multiplier', 'player']
+
+
+class TestSearch:
+    """Test prefix, description and fuzzy matching"""
+
+    def test_matches_camel_case_words_with_key_starts_first(self):
+        index = search.SettingsIndex()
+        assert 'MaxTamedDinos' in keys(index.search('tamed'))
+        assert keys(index.search('xp'))[0] == 'XPMultiplier'
+        assert keys(index.search('flyercarry')) == ['AllowFlyerCarryPvE']
+
+    def test_words_must_all_match(self):
+        index = search.SettingsIndex()
+        assert keys(index.search('taming speed')) == ['TamingSpeedMultiplier']
+        assert index.search('taming xyzzy') == []
+
+    def test_matches_descriptions_below_keys(self):
+        index = search.SettingsIndex()
+        results = index.search('level')
+        in_key = ['level' in setting.key.lower() for setting in results]
+        assert any(in_key) and not all(in_key)
+        # Every key match ranks above every description-only match
+        assert in_key == sorted(in_key, reverse=True)
+
+    def test_fuzzy_matches_typos(self):
+        index = search.SettingsIndex()
+        assert 'HarvestAmountMultiplier' in keys(index.search('harvst'))
+        assert 'TamingSpeedMultiplier' in keys(index.search('tamnig speed'))
+        assert 'BabyImprintingStatScaleMultiplier' in keys(index.search('imprnt'))
+        assert index.search('qqqq') == []
+
+    def test_blank_and_limit(self):
+        index = search.SettingsIndex()
+        assert len(index.search('')) == len(schema.SETTINGS)
+        assert len(index.search('multiplier', 5)) == 5
+
+    def test_keystrokes_are_fast(self):
+        index = search.get_index()
+        index.warm()
+        typed = ['harvest amount', 'babymaturespeed', 'mutliplier', 'structure decay pve']
+        strokes = [text[:end] for text in typed for end in range(1, len(text) + 1)]
+        start = time.perf_counter()
+        for text in strokes:
+            index.search(text)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert elapsed_ms / len(strokes) < 5
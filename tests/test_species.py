@@ -0,0 +1,92 @@
+"""
+Tests for the packed species catalog and its type-ahead search
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import species
+from conftest import SOURCE_DIR
+
+
+def make_entry(name, source='ASA', status='working', base=100.0):
+    return {'name': name, 'source': source, 'status': status,
+            'stats': {stat: base for stat in species.STATS}}
+
+
+class TestCatalogFile:
+    """Test packing and loading catalog files"""
+
+    def test_pack_and_load_round_trip(self, tmp_path):
+        path = str(tmp_path / 'species.bin')
+        species.pack_catalog([make_entry('Rex', base=240.0), make_entry('Yutyrannus', status='coming_soon')], path)
+        catalog = species.load_catalog([path])
+        assert catalog.names == ['Rex', 'Yutyrannus']
+        assert catalog.stats('Rex')['taming_time'] == 240.0
+        assert catalog.status('Yutyrannus') == 'coming_soon'
+        assert catalog.display_name('Yutyrannus') == '⏰ Yutyrannus (Coming Soon)'
+
+    def test_mod_pack_adds_and_replaces_species(self, tmp_path):
+        base = str(tmp_path / 'species.bin')
+        mod = str(tmp_path / 'zz_mod.bin')
+        species.pack_catalog([make_entry('Rex'), make_entry('Giga')], base)
+        species.pack_catalog([make_entry('Rex', base=50.0), make_entry('Drake', source='MyMod')], mod)
+        catalog = species.load_catalog(species.catalog_paths(str(tmp_path)))
+        assert catalog.names == ['Rex', 'Giga', 'Drake']
+        assert catalog.stats('Rex')['taming_time'] == 50.0
+        assert catalog.display_name('Drake') == '✅ Drake [MyMod]'
+
+    def test_shipped_catalog_matches_tsv_source(self):
+        entries = species.read_tsv(os.path.join(species.DATA_DIR, 'species.tsv'))
+        catalog = species.load_catalog([species.CATALOG_FILE])
+        assert catalog.names == [entry['name'] for entry in entries]
+        for entry in entries:
+            assert catalog.stats(entry['name']) == entry['stats']
+            assert catalog.status(entry['name']) == entry['status']
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / 'notes.bin'
+        path.write_bytes(b'not a catalog')
+        with pytest.raises(ValueError):
+            species.load_catalog([str(path)])
+
+
+class TestSearch:
+    """Test prefix-index search"""
+
+    def test_matches_word_starts_with_name_prefix_first(self):
+        names = ['Tek Rex', 'Rex', 'Raptor', 'X-Rex', 'Rhyniognatha']
+        catalog = species.SpeciesCatalog(names, ['ASA'] * len(names),
+                                         b''.join(species.RECORD.pack(*[1.0] * 6, 0) for _ in names))
+        assert catalog.search('rex') == ['Rex', 'Tek Rex', 'X-Rex']
+        assert catalog.search('R', 2) == ['Raptor', 'Rex']
+        assert catalog.search('') == names
+        assert catalog.search('zzz') == []
+
+    def test_search_stays_instant_at_thousands_of_species(self):
+        names = [f"Species {i:05d} Mod{i % 37}" for i in range(5000)]
+        catalog = species.SpeciesCatalog(names, ['ASA'] * len(names), species.RECORD.pack(*[1.0] * 6, 0) * len(names))
+        catalog.search('s')
+        start = time.perf_counter()
+        for text in ('s', 'species 01', 'mod3', 'species 049'):
+            catalog.search(text, 200)
+        assert (time.perf_counter() - start) * 1000 < 50
+        assert catalog.search('species 04999') == ['Species 04999 Mod4']
+
+
+class TestLazyLoading:
+    """Test that headless generation never reads the catalog"""
+
+    def test_generate_does_not_load_catalog(self, tmp_path):
+        script = (
+            "import sys, engine, species\n"
+            "engine.emit_files(engine.load_defaults(), 'advanced', sys.argv[1])\n"
+            "print(species._catalog is None)\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script, str(tmp_path)],
+                                cwd=SOURCE_DIR, capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'True'
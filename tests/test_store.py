@@ -0,0 +1,108 @@
+"""
+Tests for the observable settings store
+"""
+
+import time
+
+import pytest
+
+import schema
+import store
+
+SERVER = schema.SERVER_SECTION
+GAME = schema.GAME_SECTION
+
+
+def observed(settings_store):
+    calls = []
+    settings_store.subscribe(lambda changed, label: calls.append((set(changed), label)))
+    return calls
+
+
+class TestSettingsStore:
+    """Test dirty tracking and change notifications"""
+
+    def test_defaults_are_read_only(self):
+        with pytest.raises(TypeError):
+            store.DEFAULTS[SERVER]['MaxPlayers'] = 1
+        with pytest.raises(TypeError):
+            store.DEFAULTS[SERVER] = {}
+
+    def test_dirty_keys_follow_writes(self):
+        settings = schema.defaults()
+        settings[SERVER]['MaxPlayers'] = 20
+        settings_store = store.SettingsStore(settings)
+        assert settings_store.dirty == {(SERVER, 'MaxPlayers')}
+
+        calls = observed(settings_store)
+        assert settings_store.set(SERVER, 'XPMultiplier', 2.0)
+        assert not settings_store.set(SERVER, 'XPMultiplier', 2.0)
+        assert calls == [({(SERVER, 'XPMultiplier')}, None)]
+        assert settings_store.is_dirty(SERVER, 'XPMultiplier')
+
+        default = store.DEFAULTS[SERVER]['XPMultiplier']
+        settings_store.set(SERVER, 'XPMultiplier', default)
+        assert not settings_store.is_dirty(SERVER, 'XPMultiplier')
+        assert settings_store.changes() == {SERVER: {'MaxPlayers': 20}}
+
+    def test_type_changes_count(self):
+        settings_store = store.SettingsStore()
+        default = store.DEFAULTS[SERVER]['MaxPlayers']
+        assert settings_store.set(SERVER, 'MaxPlayers', float(default))
+        assert settings_store.is_dirty(SERVER, 'MaxPlayers')
+
+    def test_transaction_notifies_once(self):
+        settings_store = store.SettingsStore()
+        calls = observed(settings_store)
+        with settings_store.transaction('Import'):
+            settings_store.update({SERVER: {'MaxPlayers': 20, 'XPMultiplier': 3.0}})
+            with settings_store.transaction('Nested'):
+                settings_store.set(GAME, 'MaxTamedDinos', 6000)
+            assert calls == []
+        assert calls == [({(SERVER, 'MaxPlayers'), (SERVER, 'XPMultiplier'), (GAME, 'MaxTamedDinos')}, 'Import')]
+
+        with settings_store.transaction('Nothing'):
+            settings_store.set(SERVER, 'MaxPlayers', 20)
+        assert len(calls) == 1
+
+    def test_transaction_notifies_after_error(self):
+        settings_store = store.SettingsStore()
+        calls = observed(settings_store)
+        with pytest.raises(ValueError):
+            with settings_store.transaction('Import'):
+                settings_store.set(SERVER, 'MaxPlayers', 20)
+                raise ValueError('bad file')
+        assert calls == [({(SERVER, 'MaxPlayers')}, 'Import')]
+
+    def test_reset_restores_defaults_and_drops_extras(self):
+        settings_store = store.SettingsStore()
+        settings_store.set(SERVER, 'MaxPlayers', 20)
+        settings_store.set(SERVER, 'CustomFromProfile', 'x')
+        calls = observed(settings_store)
+        with settings_store.transaction('Reset'):
+            changed = settings_store.reset()
+        assert set(changed) == {(SERVER, 'MaxPlayers'), (SERVER, 'CustomFromProfile')}
+        assert calls == [(set(changed), 'Reset')]
+        assert settings_store.values == {section: dict(keys) for section, keys in store.DEFAULTS.items()}
+        assert not settings_store.dirty
+
+    def test_mark_changed_reports_direct_writes(self):
+        settings_store = store.SettingsStore()
+        calls = observed(settings_store)
+        settings_store.values[GAME]['MaxTamedDinos'] = 6000
+        settings_store.mark_changed([(GAME, 'MaxTamedDinos')])
+        settings_store.mark_changed([])
+        assert calls == [({(GAME, 'MaxTamedDinos')}, None)]
+        assert settings_store.is_dirty(GAME, 'MaxTamedDinos')
+
+    def test_reset_cost_follows_dirty_keys(self):
+        # A large table with a few edits: reset must not walk every key
+        defaults = store.freeze({SERVER: {f'Key{i}': i for i in range(200_000)}})
+        settings_store = store.SettingsStore(defaults=defaults)
+        for i in range(10):
+            settings_store.set(SERVER, f'Key{i}', -1)
+        start = time.perf_counter()
+        with settings_store.transaction('Reset'):
+            assert len(settings_store.reset()) == 10
+        assert (time.perf_counter() - start) * 1000 < 5
+        assert settings_store.get(SERVER, 'Key3') == 3
@@ -0,0 +1,114 @@
+"""
+Tests for structured value formatting and incremental highlighting
+"""
+
+import time
+
+import structured
+
+
+def crate_value(item_sets):
+    """A ConfigOverrideSupplyCrateItems value with item_sets item sets"""
+    sets = []
+    for i in range(item_sets):
+        entries = ','.join(
+            f'(ItemClassStrings=("PrimalItemResource_Stone_C{j}"),ItemsWeights=(1.0),'
+            f'MinQuantity={j},MaxQuantity={j * 2}.5,bForceBlueprint=false)' for j in range(5))
+        sets.append(f'(ItemSetName="Set {i}, (rare)",MinNumItems=1,MaxNumItems=3,SetWeight=1.0,'
+                    f'ItemEntries=({entries}))')
+    return ('(SupplyCrateClassString="SupplyCrate_Level03_C",MinItemSets=1,MaxItemSets=3,'
+            f'ItemSets=({",".join(sets)}))')
+
+
+class TestFormatting:
+    """Test breaking values into lines and joining them back"""
+
+    def test_round_trip(self):
+        value = crate_value(20)
+        text = structured.format_value(value)
+        assert '\n' in text
+        assert structured.compact_value(text) == value
+
+    def test_short_groups_stay_inline_and_quotes_are_not_split(self):
+        text = structured.format_value('(A=1, B=(X="a,(b)",Y=2))', width=20)
+        assert text.split('\n') == ['(', '  A=1,', '  B=(X="a,(b)",Y=2)', ')']
+
+    def test_repeated_values(self):
+        values = [crate_value(2), '(NPCSpawnEntriesContainerClassString="DinoSpawnEntries_Beach_C")']
+        assert structured.parse_values(structured.format_values(values)) == values
+        assert structured.parse_values('') == []
+
+    def test_unedited_text_keeps_the_original_value(self):
+        value = '(A=1, B=(X="a,(b)", Y=2))'
+        text = structured.format_value(value, width=10)
+        assert structured.compact_value(text) != value
+        assert structured.edited_value(text, value) is value
+        edited = text.replace('A=1', 'A=2')
+        assert structured.edited_value(edited, value) == structured.compact_value(edited)
+        values = ['A=1, B=2', '(C=3)']
+        text = structured.format_values(values, width=5)
+        assert structured.edited_values(text, values) == values
+        assert structured.edited_values(text.replace('C=3', 'C=4'), values) == ['A=1, B=2', '(C=4)']
+
+    def test_one_megabyte_value(self):
+        value = crate_value(1500)
+        assert len(value) > 1_000_000
+        start = time.perf_counter()
+        text = structured.format_value(value)
+        assert structured.compact_value(text) == value
+        assert time.perf_counter() - start < 2.0
+
+
+class TestHighlighting:
+    """Test tokenizing and bracket depth tracking"""
+
+    def test_tokenize(self):
+        spans, depth = structured.tokenize('Name="x(y)",Weights=(1.5)),', 1)
+        tags = [tag for tag, _, _ in spans]
+        assert tags == ['key', 'string', 'key', 'bracket1', 'number', 'bracket1', 'bracket0']
+        assert depth == 0
+        spans, depth = structured.tokenize(')', 0)
+        assert spans == [('unmatched', 0, 1)] and depth == -1
+
+    def test_line_depths_are_lazy(self):
+        lines = structured.format_value(crate_value(50)).split('\n')
+        fetched = []
+
+        def fetch(first, stop):
+            fetched.append((first, stop))
+            return lines[first:stop]
+
+        depths = structured.LineDepths(fetch)
+        assert depths.depth(1) == 1
+        assert depths.depth(len(lines) - 1) == 1
+        assert fetched == [(0, 1), (1, len(lines) - 1)]
+
+    def test_edit_keeps_depths_below_when_balance_is_unchanged(self):
+        lines = structured.format_value(crate_value(50)).split('\n')
+        depths = structured.LineDepths(lambda first, stop: lines[first:stop])
+        expected = [depths.depth(line) for line in range(len(lines))]
+
+        lines[10] = lines[10].replace('=1', '=(2)')
+        assert depths.edited(10, 10, 10)
+        assert depths.depths == expected
+
+        lines.insert(11, 'Extra=(')
+        assert not depths.edited(10, 10, 11)
+        fresh = structured.LineDepths(lambda first, stop: lines[first:stop])
+        assert [depths.depth(line) for line in range(len(lines))] == \
+            [fresh.depth(line) for line in range(len(lines))]
+
+    def test_keystrokes_stay_fast_on_one_megabyte(self):
+        lines = structured.format_value(crate_value(1500)).split('\n')
+        depths = structured.LineDepths(lambda first, stop: lines[first:stop])
+        middle = len(lines) // 2
+        depths.depth(middle + 60)
+        start = time.perf_counter()
+        for _ in range(200):
+            lines[middle] += 'x'
+            depths.edited(middle - 1, middle + 1, middle + 1)
+            depth = depths.depth(middle - 1)
+            for line in range(middle - 1, middle + 2):
+                _, depth = structured.tokenize(lines[line], depth)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        assert elapsed_ms / 200 < 1
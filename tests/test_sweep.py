@@ -0,0 +1,65 @@
+"""
+Tests for species x multiplier calculation sweeps
+"""
+
+import csv
+import time
+
+import pytest
+
+import engine
+import species
+import sweep
+
+
+class TestSweep:
+    """Test that sweeps match update_calculations and export cleanly"""
+
+    def test_cells_match_single_calculation(self):
+        ranges = {
+            'TamingSpeedMultiplier': (1.0, 2.0, 4.0),
+            'BabyMatureSpeedMultiplier': (1.0, 10.0),
+            'BabyImprintingStatScaleMultiplier': (0.5, 2.0),
+        }
+        result = sweep.run_sweep(ranges, ['Rex', 'Giga'])
+        assert len(result) == 2 * 3 * 2 * 2
+        for row in result.iter_rows():
+            dino, taming, mature, hatch, mating, imprint = row[:6]
+            expected = engine.calculate({
+                'TamingSpeedMultiplier': taming,
+                'BabyMatureSpeedMultiplier': mature,
+                'EggHatchSpeedMultiplier': hatch,
+                'MatingIntervalMultiplier': mating,
+                'BabyImprintingStatScaleMultiplier': imprint,
+            }, dino)
+            for name, value in zip(sweep.RESULT_COLUMNS, row[6:]):
+                assert value == pytest.approx(expected[name], rel=1e-6)
+
+    def test_rejects_non_positive_multipliers(self):
+        with pytest.raises(ValueError):
+            sweep.run_sweep({'TamingSpeedMultiplier': (0.0, 1.0)})
+        with pytest.raises(ValueError):
+            sweep.run_sweep({'NotAMultiplier': (1.0,)})
+
+    def test_million_cell_grid_is_fast(self, tmp_path):
+        ranges = {key: sweep.multiplier_range(0.5, 10.0, 10) for key in sweep.SWEEP_KEYS}
+        start = time.perf_counter()
+        result = sweep.run_sweep(ranges)
+        result.to_binary(str(tmp_path / 'sweep.bin'))
+        elapsed = time.perf_counter() - start
+        assert len(result) == len(species.get_catalog()) * 10 ** 5
+        assert elapsed < 1.0
+
+    def test_binary_and_csv_round_trip(self, tmp_path):
+        result = sweep.run_sweep({'EggHatchSpeedMultiplier': (1.0, 3.0)}, ['Rex'])
+        result.to_binary(str(tmp_path / 'sweep.bin'))
+        result.to_csv(str(tmp_path / 'sweep.csv'))
+
+        header, columns = sweep.load_binary(str(tmp_path / 'sweep.bin'))
+        assert header['shape'] == [1, 1, 1, 2, 1, 1]
+        assert list(columns['incubation_time']) == pytest.approx([180.0, 60.0])
+
+        with open(tmp_path / 'sweep.csv', newline='') as f:
+            rows = list(csv.reader(f))
+        assert rows[0][0] == 'species'
+        assert len(rows) == 3
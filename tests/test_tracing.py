@@ -0,0 +1,82 @@
+"""
+Tests for phase tracing and Chrome trace export
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import engine
+import tracing
+from conftest import SOURCE_DIR
+
+
+@pytest.fixture
+def recording():
+    tracing.clear()
+    tracing.enable()
+    yield
+    tracing.disable()
+    tracing.clear()
+
+
+class TestTracing:
+    """Test span recording and export"""
+
+    def test_disabled_records_nothing(self):
+        tracing.clear()
+        assert not tracing.is_enabled()
+        with tracing.span('idle') as span:
+            span.set(ignored=True)
+        engine.render_game_ini(engine.load_defaults())
+        assert tracing.events() == []
+
+    def test_generate_and_import_phases(self, recording, tmp_path):
+        engine.emit_files(engine.load_defaults(), 'advanced', str(tmp_path))
+        engine.load_ini_files(engine.load_defaults(), str(tmp_path / engine.GAME_USER_SETTINGS_FILE),
+                              str(tmp_path / engine.GAME_INI_FILE))
+        names = [event['name'] for event in tracing.events()]
+        assert names.count('render') == 2
+        assert names.count('write') == 2
+        assert names.count('import.parse') == 2
+        assert names.count('import.coerce') == 2
+        assert 'emit_files' in names and 'load_ini_files' in names
+
+        writes = [event for event in tracing.events() if event['name'] == 'write']
+        assert all(event['args']['changed'] for event in writes)
+
+    def test_spans_nest_in_time(self, recording, tmp_path):
+        engine.emit_files(engine.load_defaults(), 'advanced', str(tmp_path))
+        by_name = {event['name']: event for event in tracing.events()}
+        outer, inner = by_name['emit_files'], by_name['write']
+        assert outer['ts'] <= inner['ts']
+        assert inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur']
+
+    def test_errors_are_tagged(self, recording):
+        with pytest.raises(KeyError):
+            with tracing.span('failing'):
+                raise KeyError('x')
+        assert tracing.events()[-1]['args']['error'] == 'KeyError'
+
+    def test_chrome_trace_export(self, recording, tmp_path):
+        with tracing.span('phase', 'test', size=3):
+            pass
+        path = tracing.write_trace(str(tmp_path / 'trace.json'))
+        with open(path) as f:
+            document = json.load(f)
+        complete = [event for event in document['traceEvents'] if event['ph'] == 'X']
+        assert complete[0]['name'] == 'phase'
+        assert complete[0]['args'] == {'size': 3}
+        assert {'ts', 'dur', 'pid', 'tid', 'cat'} <= set(complete[0])
+
+    def test_env_var_writes_trace_at_exit(self, tmp_path):
+        trace = tmp_path / 'trace.json'
+        env = dict(os.environ, **{tracing.ENV_VAR: str(trace)})
+        subprocess.run([sys.executable, 'cli.py', 'generate', '--output', str(tmp_path / 'out')],
+                       cwd=SOURCE_DIR, env=env, check=True, capture_output=True)
+        with open(trace) as f:
+            names = {event['name'] for event in json.load(f)['traceEvents']}
+        assert {'schema.build', 'render', 'write', 'emit_files'} <= names
@@ -0,0 +1,125 @@
+"""
+Tests for the validation engine
+"""
+
+import engine
+import validate
+
+
+def write_pair(folder, server_lines, game_lines):
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / engine.GAME_USER_SETTINGS_FILE).write_text('[ServerSettings]\n' + '\n'.join(server_lines) + '\n')
+    (folder / engine.GAME_INI_FILE).write_text('[/Script/ShooterGame.ShooterGameMode]\n' + '\n'.join(game_lines) + '\n')
+    return folder
+
+
+def codes(findings):
+    return sorted((finding.code, finding.key) for finding in findings)
+
+
+def validate_pair(folder):
+    return validate.get_rules().validate_files(str(folder / engine.GAME_USER_SETTINGS_FILE),
+                                               str(folder / engine.GAME_INI_FILE))
+
+
+class TestSettings:
+    """Test validating settings mappings"""
+
+    def test_defaults_are_clean(self):
+        assert validate.get_rules().validate_settings(engine.load_defaults()) == []
+
+    def test_type_and_range_rules(self):
+        settings = engine.load_defaults()
+        settings[engine.SERVER_SECTION].update(XPMultiplier='fast', RCONPort=70000, TamingSpeedMultiplier=50.0)
+        settings[engine.SERVER_SECTION]['MaxPlayers'] = 40.5
+        findings = validate.get_rules().validate_settings(settings)
+        assert codes(findings) == [('range', 'RCONPort'), ('range', 'TamingSpeedMultiplier'),
+                                   ('type', 'MaxPlayers'), ('type', 'XPMultiplier')]
+        severities = {finding.key: finding.severity for finding in findings}
+        assert severities['RCONPort'] == validate.ERROR
+        assert severities['TamingSpeedMultiplier'] == validate.WARNING
+
+    def test_float_text_for_whole_numbers_is_valid(self, tmp_path):
+        folder = write_pair(tmp_path / 'server', ['MaxTamedDinos=5000.000000', 'MaxPlayers=70.000000'], [])
+        assert [finding for finding in validate_pair(folder) if finding.severity == validate.ERROR] == []
+
+    def test_cross_field_rules(self):
+        settings = engine.load_defaults()
+        settings[engine.SERVER_SECTION].update(
+            OverrideOfficialDifficulty=5.0, DifficultyOffset=0.5,
+            MaxTamedDinos_SoftTameLimit=6000, ActiveMods='123,abc,123')
+        assert codes(validate.get_rules().validate_settings(settings)) == [
+            ('duplicate', 'ActiveMods'), ('limit', 'MaxTamedDinos_SoftTameLimit'),
+            ('overridden', 'DifficultyOffset'), ('type', 'ActiveMods')]
+
+
+class TestFiles:
+    """Test validating config pairs on disk"""
+
+    def test_generated_files_only_warn_about_admin_password(self, tmp_path):
+        settings = engine.load_defaults()
+        engine.emit_files(settings, 'advanced', str(tmp_path))
+        assert codes(validate_pair(tmp_path)) == [('required', 'ServerAdminPassword')]
+        settings[engine.SERVER_SECTION]['ServerAdminPassword'] = 'secret'
+        engine.emit_files(settings, 'advanced', str(tmp_path))
+        assert validate_pair(tmp_path) == []
+
+    def test_duplicate_misplaced_and_conflicting_keys(self, tmp_path):
+        folder = write_pair(tmp_path, [
+            'XPMultiplier=2.0',
+            'xpmultiplier=3.0',
+            'MatingIntervalMultiplier=0.5',
+            'MaxTamedDinos=6000',
+            'RCONEnabled=maybe',
+            'ServerAdminPassword=secret',
+        ], [
+            'ConfigOverrideNPCSpawnEntriesContainer=(A)',
+            'ConfigOverrideNPCSpawnEntriesContainer=(B)',
+            'MaxTamedDinos=2000',
+        ])
+        findings = validate_pair(folder)
+        assert codes(findings) == [('conflict', 'MaxTamedDinos'), ('duplicate', 'xpmultiplier'),
+                                   ('misplaced', 'MatingIntervalMultiplier'), ('type', 'RCONEnabled')]
+        duplicate = [finding for finding in findings if finding.code == 'duplicate'][0]
+        assert duplicate.line == 3
+        assert 'line 2' in duplicate.message
+        conflict = [finding for finding in findings if finding.code == 'conflict'][0]
+        assert conflict.path.endswith(engine.GAME_INI_FILE)
+        assert conflict.line == 4
+        assert 'here but 6000 in' in conflict.message
+
+    def test_missing_game_ini_is_skipped(self, tmp_path):
+        (tmp_path / engine.GAME_USER_SETTINGS_FILE).write_text('[ServerSettings]\nRCONPort=0\n')
+        assert codes(validate_pair(tmp_path)) == [('range', 'RCONPort')]
+
+
+class TestBatch:
+    """Test batch validation and the report"""
+
+    def make_fleet(self, tmp_path, count):
+        for i in range(count):
+            lines = ['ServerAdminPassword=x', f'XPMultiplier={"bad" if i % 10 == 0 else 2.0}']
+            write_pair(tmp_path / f'server{i:03d}', lines, [])
+        return validate.find_config_folders([str(tmp_path)])
+
+    def test_workers_match_in_process_results(self, tmp_path):
+        folders = self.make_fleet(tmp_path, 40)
+        assert len(folders) == 40
+        single = validate.validate_folders(folders, workers=1)
+        pooled = validate.validate_folders(folders, workers=2)
+        assert pooled.workers == 2
+        assert single.results == pooled.results
+        assert sum(len(result.findings) for result in single.results) == 4
+
+    def test_compact_report_groups_findings(self, tmp_path):
+        report = validate.validate_folders(self.make_fleet(tmp_path, 30), workers=1)
+        text = validate.format_report(report)
+        assert 'x3' in text
+        assert '30 config folder(s) (0 unreadable): 3 error(s), 0 warning(s)' in text
+        assert len(validate.format_report(report, verbose=True).splitlines()) == 4
+
+    def test_cli_exit_code(self, tmp_path, capsys):
+        import cli
+        self.make_fleet(tmp_path, 3)
+        assert cli.main(['validate', str(tmp_path), '--workers', '1']) == 1
+        assert '1 error(s)' in capsys.readouterr().out
@@ -0,0 +1,210 @@
+"""
+Tests for watch mode
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import pytest
+
+import batch
+import watch
+
+WATCHERS = [True] + ([False] if sys.platform.startswith('linux') else [])
+
+
+def write_json(path, data):
+    # Save the way editors do: temp file, then rename over the original
+    temp = str(path) + '.tmp'
+    with open(temp, 'w') as f:
+        json.dump(data, f)
+    os.replace(temp, str(path))
+
+
+def write_cluster(tmp_path, count):
+    profiles = tmp_path / 'profiles'
+    profiles.mkdir()
+    for i in range(count):
+        write_json(profiles / f'map{i}.json', {'ServerName': f'Map {i}'})
+    manifest = {
+        'output_dir': 'out',
+        'base': {'XPMultiplier': 2.0},
+        'servers': [{'name': f'map{i}', 'profile': f'profiles/map{i}.json'} for i in range(count)],
+    }
+    path = tmp_path / 'cluster.json'
+    write_json(path, manifest)
+    return path
+
+
+class TestWatchers:
+    """Test change detection and debouncing"""
+
+    @pytest.mark.parametrize('polling', WATCHERS)
+    def test_detects_rename_saves(self, tmp_path, polling):
+        path = tmp_path / 'a.json'
+        other = tmp_path / 'b.json'
+        write_json(path, {})
+        write_json(other, {})
+        watcher = watch.make_watcher([str(path), str(other)], polling)
+        try:
+            assert watcher.poll(0.05) == set()
+            time.sleep(0.01)
+            write_json(path, {'ServerName': 'x'})
+            assert watcher.poll(1.0) == {str(path)}
+        finally:
+            watcher.close()
+
+    @pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux only")
+    def test_inotify_follows_folder_changes(self, tmp_path):
+        first = tmp_path / 'a' / 'x.json'
+        later = tmp_path / 'later' / 'y.json'
+        first.parent.mkdir()
+        watcher = watch.InotifyWatcher([str(first)])
+        try:
+            assert watcher.set_paths([str(later)]) == [str(later.parent)]
+            # The folder of the dropped path is no longer watched
+            assert list(watcher._folders.values()) == []
+            later.parent.mkdir()
+            write_json(later, {})
+            assert watcher.poll(1.0) == {str(later)}
+            assert watcher.set_paths([str(later)]) == []
+            assert list(watcher._folders.values()) == [str(later.parent)]
+        finally:
+            watcher.close()
+
+    def test_burst_is_collected_once(self, tmp_path):
+        path = tmp_path / 'a.json'
+        write_json(path, {})
+        watcher = watch.PollingWatcher([str(path)], interval_ms=10)
+
+        def burst():
+            for i in range(5):
+                write_json(path, {'n': i})
+                time.sleep(0.02)
+        thread = threading.Thread(target=burst)
+        thread.start()
+        changed = watch.collect_changes(watcher, 1.0, debounce_ms=100)
+        thread.join()
+        assert changed == {str(path)}
+        assert watcher.poll(0.05) == set()
+
+
+class TestWatchManifest:
+    """Test that only affected servers are regenerated"""
+
+    def run_watch(self, manifest_path, polling=False):
+        events = queue.Queue()
+        stop = threading.Event()
+        thread = threading.Thread(target=watch.watch_manifest, args=(str(manifest_path),),
+                                  kwargs={'on_event': events.put, 'stop': stop, 'timeout': 0.05,
+                                          'polling': polling},
+                                  daemon=True)
+        thread.start()
+        initial = events.get(timeout=5)
+        return events, stop, thread, initial
+
+    def test_profile_edit_regenerates_one_server(self, tmp_path):
+        manifest_path = write_cluster(tmp_path, 20)
+        events, stop, thread, initial = self.run_watch(manifest_path)
+        try:
+            assert len(initial.servers) == 20
+            untouched = os.stat(tmp_path / 'out' / 'map3' / 'GameUserSettings.ini').st_ino
+
+            start = time.perf_counter()
+            write_json(tmp_path / 'profiles' / 'map7.json', {'ServerName': 'Edited'})
+            event = events.get(timeout=5)
+            latency = time.perf_counter() - start
+
+            assert event.servers == {'map7'}
+            assert latency < 1.0
+            content = (tmp_path / 'out' / 'map7' / 'GameUserSettings.ini').read_text()
+            assert 'ServerName = Edited' in content
+            assert os.stat(tmp_path / 'out' / 'map3' / 'GameUserSettings.ini').st_ino == untouched
+        finally:
+            stop.set()
+            thread.join(5)
+
+    def test_manifest_edit_regenerates_changed_entries(self, tmp_path):
+        manifest_path = write_cluster(tmp_path, 3)
+        events, stop, thread, _ = self.run_watch(manifest_path)
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            manifest['servers'][1]['overrides'] = {'MaxPlayers': 12}
+            manifest['servers'].append({'name': 'new', 'overrides': {'ServerName': 'New'}})
+            write_json(manifest_path, manifest)
+            event = events.get(timeout=5)
+            assert event.servers == {'map1', 'new'}
+            assert (tmp_path / 'out' / 'new' / 'Game.ini').exists()
+        finally:
+            stop.set()
+            thread.join(5)
+
+    def test_profile_edits_survive_a_broken_manifest(self, tmp_path):
+        manifest_path = write_cluster(tmp_path, 3)
+        # Polling sees both saves in one pass, so they always land in the same burst
+        events, stop, thread, _ = self.run_watch(manifest_path, polling=True)
+        try:
+            good = manifest_path.read_text()
+            manifest_path.write_text('{"servers": ')
+            write_json(tmp_path / 'profiles' / 'map1.json', {'ServerName': 'Edited'})
+            event = events.get(timeout=5)
+            assert event.error and event.servers == set()
+            assert str(tmp_path / 'profiles' / 'map1.json') in event.changed
+            manifest_path.write_text(good)
+            event = events.get(timeout=5)
+            assert event.servers == {'map1'}
+            content = (tmp_path / 'out' / 'map1' / 'GameUserSettings.ini').read_text()
+            assert 'ServerName = Edited' in content
+        finally:
+            stop.set()
+            thread.join(5)
+
+    def test_profile_in_a_new_folder_is_polled(self, tmp_path):
+        manifest_path = write_cluster(tmp_path, 1)
+        events, stop, thread, _ = self.run_watch(manifest_path)
+        try:
+            manifest = json.loads(manifest_path.read_text())
+            manifest['servers'].append({'name': 'new', 'profile': 'later/new.json'})
+            write_json(manifest_path, manifest)
+            event = events.get(timeout=5)
+            assert 'polling instead' in event.error
+            event = events.get(timeout=5)
+            assert event.servers == {'new'}
+            (tmp_path / 'later').mkdir()
+            write_json(tmp_path / 'later' / 'new.json', {'ServerName': 'Later'})
+            event = events.get(timeout=5)
+            assert event.servers == {'new'}
+            content = (tmp_path / 'out' / 'new' / 'GameUserSettings.ini').read_text()
+            assert 'ServerName = Later' in content
+        finally:
+            stop.set()
+            thread.join(5)
+
+    def test_broken_profile_is_reported_per_server(self, tmp_path):
+        manifest_path = write_cluster(tmp_path, 2)
+        events, stop, thread, _ = self.run_watch(manifest_path)
+        try:
+            (tmp_path / 'profiles' / 'map0.json').write_text('{"ServerName": ')
+            event = events.get(timeout=5)
+            assert [result.name for result in event.report.results if result.error] == ['map0']
+        finally:
+            stop.set()
+            thread.join(5)
+
+
+class TestManifestProfiles:
+    """Test profile files in batch manifests"""
+
+    def test_inline_overrides_win_over_profile(self, tmp_path):
+        manifest_path = write_cluster(tmp_path, 1)
+        manifest = json.loads(manifest_path.read_text())
+        manifest['servers'][0]['overrides'] = {'ServerName': 'Inline'}
+        write_json(manifest_path, manifest)
+        report = batch.run_batch(batch.load_manifest(str(manifest_path)), 1)
+        content = (tmp_path / 'out' / 'map0' / 'GameUserSettings.ini').read_text()
+        assert report.results[0].error is None
+        assert 'ServerName = Inline' in content
@@ -0,0 +1,187 @@
+"""
+Tests for the widget helpers
+
+The row and view tests need a display; they are skipped when Tk cannot open
+one (set DISPLAY, e.g. under xvfb-run, to run them headless).
+"""
+
+import pytest
+
+import journal
+import schema
+import widgets
+
+tk = widgets.tk
+
+COLORS = {'bg_dark': '#1a1a1a', 'text_primary': '#ffffff', 'text_secondary': '#b0b0b0'}
+
+
+@pytest.fixture
+def root():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    root.geometry('1200x900')
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def app(root, tmp_path, monkeypatch):
+    monkeypatch.setenv(journal.ENV_VAR, str(tmp_path))
+    import main
+    app = main.ArkSettingsGenerator(root)
+    root.update()
+    yield app
+    app.journal.close()
+
+
+def shown_value(row):
+    """Return the text or flag a row's editor shows"""
+    if row.kind == 'bool':
+        return row.bool_var.get()
+    if row.kind == 'float':
+        return row.entry_var.get()
+    if row.kind == 'choice':
+        return dict(row.owner.choices[row.key]).get(row.combo.get())
+    return row.text_var.get()
+
+
+def expected_value(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, float):
+        return widgets.format_slider_value(value)
+    return str(value)
+
+
+def assert_rows_bound(settings_list):
+    visible = [row for row in settings_list._rows if row.visible]
+    assert visible
+    for row in visible:
+        assert row.key == settings_list.keys[row.index]
+        assert row.name_label.cget('text') == f"ℹ️ {row.key}"
+        assert shown_value(row) == expected_value(settings_list.values[row.key])
+    return visible
+
+
+class TestVirtualListHelpers:
+    """Test the row math behind the virtualized settings list"""
+
+    def test_visible_range_covers_viewport(self):
+        assert widgets.visible_range(0, 300, 72, 300) == (0, 5)
+        assert widgets.visible_range(720, 300, 72, 300) == (10, 15)
+
+    def test_visible_range_clamps_to_row_count(self):
+        assert widgets.visible_range(0, 1000, 72, 3) == (0, 3)
+        assert widgets.visible_range(0, 1, 72, 0) == (0, 0)
+
+    def test_visible_range_is_independent_of_schema_size(self):
+        small = widgets.visible_range(7200, 600, 72, 200)
+        large = widgets.visible_range(7200, 600, 72, 200000)
+        assert small == large
+
+    def test_value_kind(self):
+        assert widgets.value_kind(True) == 'bool'
+        assert widgets.value_kind(5) == 'int'
+        assert widgets.value_kind(1.0) == 'float'
+        assert widgets.value_kind('') == 'str'
+        assert widgets.value_kind(['a', 'b']) == 'multi'
+
+    def test_format_slider_value(self):
+        assert widgets.format_slider_value(1) == "1.000"
+        assert widgets.format_slider_value("x") == "0.000"
+
+    def test_integer_fields_reject_fractions(self):
+        for text in ('', '-', '42', '-1'):
+            assert widgets.validate_integer_only(text)
+        for text in ('1.5', '1e3', 'x'):
+            assert not widgets.validate_integer_only(text)
+
+    def test_editor_text_per_kind(self):
+        def text(key, value, section=schema.SERVER_SECTION):
+            setting = schema.get(section, key)
+            return widgets.editor_text(widgets.value_kind(value), setting, value)
+
+        assert text('MaxPlayers', 70) == ('70', False)
+        assert text('XPMultiplier', 2.5) == ('2.500', False)
+        assert text('ServerName', 'Island') == ('Island', False)
+        assert text('serverPVE', True) == (None, False)
+        crates = 'ConfigOverrideSupplyCrateItems'
+        assert text(crates, '(' * 300, schema.GAME_SECTION) == ('300 characters', True)
+        assert text(crates, ['(A)', '(B)'], schema.GAME_SECTION) == ('2 imported values', True)
+
+
+class TestRowPool:
+    """Test that pooled rows are rebound to the setting now at their position"""
+
+    def make_list(self, root):
+        settings = schema.section_settings(schema.SERVER_SECTION)
+        values = schema.defaults()[schema.SERVER_SECTION]
+        # One row of each kind that differs from the schema default
+        values.update(MaxPlayers=42, XPMultiplier=3.25, ServerName='Island', serverPVE=True)
+        settings_list = widgets.VirtualSettingsList(root, settings, values, COLORS)
+        settings_list.pack(fill='both', expand=True)
+        root.update()
+        settings_list.layout()
+        return settings_list
+
+    def test_scrolling_rebinds_rows_without_new_widgets(self, root):
+        settings_list = self.make_list(root)
+        first = assert_rows_bound(settings_list)
+        pool = list(settings_list._rows)
+        for fraction in (0.25, 0.5, 0.999, 0.0):
+            settings_list.yview('moveto', fraction)
+            root.update()
+            assert_rows_bound(settings_list)
+        assert settings_list._rows == pool
+        assert [row.key for row in first] == settings_list.keys[:len(first)]
+
+    def test_filter_and_edits_rebind_rows(self, root):
+        settings_list = self.make_list(root)
+        ids = [setting.id for setting in settings_list.all_settings
+               if setting.key in ('ServerName', 'XPMultiplier', 'MaxPlayers', 'serverPVE')]
+        settings_list.set_filter(list(reversed(ids)))
+        root.update()
+        rows = assert_rows_bound(settings_list)
+        assert len(rows) == 4
+        settings_list.values['MaxPlayers'] = 12
+        settings_list.refresh_keys({'MaxPlayers'})
+        assert_rows_bound(settings_list)
+        settings_list.set_filter(None)
+        root.update()
+        assert_rows_bound(settings_list)
+
+
+class TestViewCache:
+    """Test that mode switches reuse the settings views built before"""
+
+    def test_switching_back_reuses_views(self, app):
+        basic = (app.server_list, app.game_list)
+        app.mode.set('advanced')
+        app.switch_mode()
+        app.root.update()
+        advanced = (app.server_list, app.game_list)
+        assert advanced[0] is not basic[0]
+        app.mode.set('basic')
+        app.switch_mode()
+        app.root.update()
+        assert (app.server_list, app.game_list) == basic
+        assert len(app._settings_views) == 4
+        app.mode.set('advanced')
+        app.switch_mode()
+        assert (app.server_list, app.game_list) == advanced
+
+    def test_hidden_view_rereads_only_stale_rows(self, app):
+        basic = app.server_list
+        app.mode.set('advanced')
+        app.switch_mode()
+        app.root.update()
+        app.store.set(schema.SERVER_SECTION, 'MaxPlayers', 33)
+        app.scheduler.flush()
+        app.mode.set('basic')
+        app.switch_mode()
+        app.root.update()
+        assert app.server_list is basic
+        assert_rows_bound(basic)